@@ -136,7 +136,8 @@ def migrate_entities_and_relationships():
                 session.run(
                     """
                     MERGE (n:MedicalEntity {name: $name})
-                    SET n.type = $type,
+                    SET n.name_lc = toLower(trim($name)),
+                        n.type = $type,
                         n.description = $description,
                         n.confidence = $confidence,
                         n.source_document = $source_document,
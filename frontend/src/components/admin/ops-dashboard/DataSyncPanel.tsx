@@ -64,7 +64,9 @@ export function DataSyncPanel() {
                 </div>
                 <div className="text-right">
                   <span className="text-xs text-slate-400">
-                    Neo4j: {dt.neo4j_count} / PG: {dt.postgres_count}
+                    Pending: {dt.pending}
+                    {dt.pending > 0 && ` (${Math.round(dt.lag_seconds)}s)`}
+                    {dt.dead > 0 && ` / Dead: ${dt.dead}`}
                   </span>
                   <span
                     className={`ml-2 text-xs ${
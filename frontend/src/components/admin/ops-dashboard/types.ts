@@ -102,13 +102,18 @@ export interface ScannerStatus {
 export interface DualWriteDataType {
   dual_write_enabled: boolean;
   use_postgres: boolean;
-  neo4j_count: number;
-  postgres_count: number;
+  pending: number;
+  retrying: number;
+  dead: number;
+  lag_seconds: number;
+  delivered: number;
+  last_delivered_at: string | null;
   sync_status: 'unknown' | 'synced' | 'minor_drift' | 'out_of_sync' | 'disabled';
 }
 
 export interface DualWriteHealth {
   status: 'healthy' | 'warning';
+  relay_running: boolean;
   data_types: {
     sessions: DualWriteDataType;
     feedback: DualWriteDataType;
@@ -64,3 +64,84 @@ ON (n.query_frequency);
 
 // Show all indexes
 SHOW INDEXES;
+
+// ============================================================
+// NODE IDENTITY (index-backed id/name lookups)
+// ============================================================
+
+// Every backend-written node carries :Entity; id lookups use this constraint
+CREATE CONSTRAINT entity_id_unique IF NOT EXISTS
+FOR (n:Entity)
+REQUIRE n.id IS UNIQUE;
+
+// Name lookups (get_entity/promote_entity accept an id or a name)
+CREATE INDEX idx_entity_name IF NOT EXISTS
+FOR (n:Entity)
+ON (n.name);
+
+// DDA nodes written without :Entity are identified by name
+CREATE INDEX idx_table_name IF NOT EXISTS
+FOR (n:Table)
+ON (n.name);
+
+CREATE INDEX idx_column_name IF NOT EXISTS
+FOR (n:Column)
+ON (n.name);
+
+CREATE INDEX idx_message_id IF NOT EXISTS
+FOR (n:Message)
+ON (n.id);
+
+// Normalized name key recorded by DeduplicationService; incremental
+// duplicate detection looks up previously checked entities through it
+CREATE INDEX idx_entity_dedup_key IF NOT EXISTS
+FOR (n:Entity)
+ON (n._dedup_key);
+
+// Merge records written by DeduplicationService.execute_merge; resuming a
+// run looks up its committed merges by batch_id
+CREATE INDEX idx_dedup_merge_batch IF NOT EXISTS
+FOR (m:DedupMerge)
+ON (m.batch_id);
+
+// ============================================================
+// CASE-INSENSITIVE NAME LOOKUP AND SEARCH
+// ============================================================
+
+// name_lc = toLower(trim(name)) is maintained by Neo4jBackend on write;
+// backfill existing graphs with scripts/migration/backfill_name_keys.py
+CREATE INDEX idx_entity_name_lc IF NOT EXISTS
+FOR (n:Entity)
+ON (n.name_lc);
+
+CREATE INDEX idx_medical_entity_name_lc IF NOT EXISTS
+FOR (n:MedicalEntity)
+ON (n.name_lc);
+
+// Substring search for CrossGraphQueryBuilder (no stop words, so every word is searchable)
+CREATE FULLTEXT INDEX medical_entity_search IF NOT EXISTS
+FOR (n:MedicalEntity)
+ON EACH [n.name, n.description]
+OPTIONS {indexConfig: {`fulltext.analyzer`: 'standard-no-stop-words'}};
+
+// ============================================================
+// PDF INGESTION (Document -> Chunk -> ExtractedEntity)
+// ============================================================
+
+// MERGE keys used by Neo4jPDFIngestionService.persist_to_neo4j
+CREATE INDEX idx_document_name IF NOT EXISTS
+FOR (d:Document)
+ON (d.name);
+
+CREATE INDEX idx_chunk_id IF NOT EXISTS
+FOR (c:Chunk)
+ON (c.id);
+
+CREATE INDEX idx_extracted_entity_name IF NOT EXISTS
+FOR (e:ExtractedEntity)
+ON (e.name);
+
+// Relationship endpoints are matched by id
+CREATE INDEX idx_extracted_entity_id IF NOT EXISTS
+FOR (e:ExtractedEntity)
+ON (e.id);
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Ingest the PDF corpus into Neo4j in parallel.
+
+Converts PDFs in a process pool, runs LLM extraction with bounded concurrency
+and writes to Neo4j through a single writer (see IngestionOrchestrator).
+Status is kept in data/document_tracking.sqlite3, so re-running the script
+resumes after the last completed document. With --changed-only, only PDFs
+added or modified since the last clean --changed-only run are considered.
+
+Usage:
+    uv run python scripts/ingest_corpus.py
+    uv run python scripts/ingest_corpus.py --limit 10
+    uv run python scripts/ingest_corpus.py --workers 8 --extraction-concurrency 6
+    uv run python scripts/ingest_corpus.py --no-retry-failed
+    uv run python scripts/ingest_corpus.py --changed-only
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dotenv import load_dotenv
+
+from application.services.document_tracker import DocumentTracker
+from application.services.ingestion_orchestrator import IngestionOrchestrator
+from application.services.neo4j_pdf_ingestion import Neo4jPDFIngestionService
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+
+CURSOR_NAME = "ingest_corpus"
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Parallel PDF ingestion into Neo4j")
+    parser.add_argument("--pdf-dir", default="PDFs")
+    parser.add_argument("--markdown-dir", default="markdown_output")
+    parser.add_argument("--tracking-file", default="data/document_tracking.sqlite3")
+    parser.add_argument("--limit", type=int, default=None, help="Ingest at most N pending documents")
+    parser.add_argument("--workers", type=int, default=None, help="Conversion processes (default: CPU count)")
+    parser.add_argument("--extraction-concurrency", type=int, default=4, help="LLM extractions in flight")
+    parser.add_argument("--no-retry-failed", action="store_true", help="Skip documents that failed before")
+    parser.add_argument("--changed-only", action="store_true", help="Only PDFs new or modified since the last run")
+    parser.add_argument("--model", default="gpt-4o-mini")
+    args = parser.parse_args()
+
+    openai_api_key = os.getenv("OPENAI_API_KEY")
+    if not openai_api_key:
+        print("OPENAI_API_KEY not set")
+        return 1
+
+    tracker = DocumentTracker(
+        tracking_file=Path(args.tracking_file),
+        pdf_directory=Path(args.pdf_dir),
+        markdown_directory=Path(args.markdown_dir),
+    )
+    service = Neo4jPDFIngestionService(
+        pdf_directory=Path(args.pdf_dir),
+        openai_api_key=openai_api_key,
+        model=args.model,
+    )
+    orchestrator = IngestionOrchestrator(
+        service,
+        tracker,
+        conversion_workers=args.workers,
+        extraction_concurrency=args.extraction_concurrency,
+    )
+
+    try:
+        report = await orchestrator.run(
+            max_documents=args.limit,
+            retry_failed=not args.no_retry_failed,
+            since=tracker.get_cursor(CURSOR_NAME) if args.changed_only else 0,
+        )
+    finally:
+        await service.close()
+
+    # Failed documents keep the cursor back so the next run retries them; a run
+    # cut short by --limit reports the cursor it started from
+    if args.changed_only and not report.failures:
+        tracker.save_cursor(CURSOR_NAME, report.cursor)
+    summary = report.to_dict()
+    summary.pop("results")
+    print(json.dumps(summary, indent=2))
+    return 1 if report.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
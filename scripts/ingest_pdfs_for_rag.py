@@ -26,6 +26,7 @@ import argparse
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from application.services.document_service import DocumentService
+from application.services.dual_write_outbox import get_dual_write_outbox
 from infrastructure.neo4j_backend import Neo4jBackend
 
 load_dotenv()
@@ -76,7 +77,9 @@ async def main():
             kg_backend=backend,
             chunk_size=1500,
             chunk_overlap=300,
-            faiss_index_path="data/faiss_index"
+            faiss_index_path="data/faiss_index",
+            # Queued for the API's outbox relay, which owns PostgreSQL delivery
+            outbox=get_dual_write_outbox(),
         )
         print("✓ Document service initialized")
     except Exception as e:
@@ -138,12 +141,13 @@ async def main():
     print(f"  Failed: {failed}/{len(pdfs)}")
 
     # Show FAISS index stats
-    print("\n📊 FAISS Index Statistics:")
-    print(f"  - Total chunks: {len(doc_service._chunk_store)}")
-    print(f"  - Index path: {doc_service.faiss_index_path}.index")
+    print("\n📊 Vector Store Statistics:")
+    print(f"  - Total chunks: {len(doc_service.vector_store)}")
+    print(f"  - Segments: {doc_service.vector_store.segment_count}")
+    print(f"  - Store path: {doc_service.faiss_index_path}")
 
     # Test search
-    if doc_service._faiss_index is not None:
+    if len(doc_service.vector_store):
         print("\n🔍 Testing search...")
         try:
             results = await doc_service.search_similar("Crohn's disease", top_k=3)
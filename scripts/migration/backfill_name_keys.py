@@ -0,0 +1,153 @@
+"""
+Migration script to backfill the normalized ``name_lc`` property.
+
+Neo4jBackend sets ``name_lc = toLower(trim(name))`` on every entity write, and
+CrossGraphQueryBuilder matches names through it (and through the
+``medical_entity_search`` full-text index) instead of applying ``toLower`` to
+every node. Graphs written before that change need this one-off backfill:
+
+1. Create the ``name_lc`` range indexes and the full-text index
+2. Set ``name_lc`` on every ``MedicalEntity``/``Entity`` node whose value is
+   missing or stale, in batches so no single transaction grows unbounded
+
+The script is idempotent; re-running it only touches nodes renamed since.
+
+Run with: uv run python scripts/migration/backfill_name_keys.py [--dry-run]
+"""
+
+import asyncio
+import logging
+import os
+import sys
+from datetime import datetime
+from typing import Dict
+
+sys.path.insert(0, "src")
+
+from neo4j import AsyncGraphDatabase
+
+from infrastructure.node_identity import NAME_KEY_PROPERTY, NAME_SEARCH_SCHEMA
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class NameKeyBackfill:
+    """Backfills ``name_lc`` on existing nodes and creates its indexes."""
+
+    # Labels whose nodes are looked up by normalized name
+    LABELS = ["MedicalEntity", "Entity"]
+
+    def __init__(self, uri: str, username: str, password: str, batch_size: int = 10_000):
+        self.driver = AsyncGraphDatabase.driver(uri, auth=(username, password))
+        self.batch_size = batch_size
+        self.stats = {
+            "nodes_updated": 0,
+            "indexes_created": 0,
+            "errors": [],
+        }
+
+    async def close(self):
+        await self.driver.close()
+
+    async def run_migration(self, dry_run: bool = False) -> Dict:
+        """
+        Create the indexes and backfill ``name_lc``.
+
+        Args:
+            dry_run: If True, only report how many nodes would change.
+
+        Returns:
+            Dictionary with migration statistics.
+        """
+        logger.info(f"Starting name key backfill (dry_run={dry_run})")
+        start_time = datetime.now()
+
+        await self._create_indexes(dry_run)
+        for label in self.LABELS:
+            await self._backfill_label(label, dry_run)
+
+        self.stats["elapsed_seconds"] = (datetime.now() - start_time).total_seconds()
+        logger.info(f"Backfill completed in {self.stats['elapsed_seconds']:.2f}s")
+        return self.stats
+
+    async def _create_indexes(self, dry_run: bool):
+        """Create the name_lc range indexes and the full-text search index."""
+        async with self.driver.session() as session:
+            for index_name, index_query in NAME_SEARCH_SCHEMA:
+                if dry_run:
+                    logger.info(f"[DRY RUN] Would create index: {index_name}")
+                    continue
+                try:
+                    await session.run(index_query)
+                    self.stats["indexes_created"] += 1
+                    logger.info(f"Created/verified index: {index_name}")
+                except Exception as e:
+                    logger.warning(f"Failed to create index {index_name}: {e}")
+                    self.stats["errors"].append(f"{index_name}: {e}")
+
+    async def _backfill_label(self, label: str, dry_run: bool):
+        """Set name_lc on nodes of ``label`` in batches until none are stale."""
+        stale_filter = f"""
+            WHERE n.name IS NOT NULL
+              AND (n.{NAME_KEY_PROPERTY} IS NULL
+                   OR n.{NAME_KEY_PROPERTY} <> toLower(trim(n.name)))
+        """
+
+        async with self.driver.session() as session:
+            if dry_run:
+                result = await session.run(
+                    f"MATCH (n:`{label}`) {stale_filter} RETURN count(n) AS count"
+                )
+                record = await result.single()
+                logger.info(f"[DRY RUN] Would update {record['count']} {label} nodes")
+                return
+
+            while True:
+                result = await session.run(
+                    f"""
+                    MATCH (n:`{label}`)
+                    {stale_filter}
+                    WITH n LIMIT $batch_size
+                    SET n.{NAME_KEY_PROPERTY} = toLower(trim(n.name))
+                    RETURN count(n) AS updated
+                    """,
+                    batch_size=self.batch_size,
+                )
+                record = await result.single()
+                updated = record["updated"] if record else 0
+                if updated == 0:
+                    break
+                self.stats["nodes_updated"] += updated
+                logger.info(f"Updated {updated} {label} nodes")
+
+
+async def main():
+    """Main entry point for the migration script."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Backfill name_lc and its indexes")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would be done without making changes")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="Nodes updated per transaction")
+    args = parser.parse_args()
+
+    uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
+    username = os.getenv("NEO4J_USERNAME", "neo4j")
+    password = os.getenv("NEO4J_PASSWORD", "password")
+
+    migration = NameKeyBackfill(uri, username, password, batch_size=args.batch_size)
+
+    try:
+        stats = await migration.run_migration(dry_run=args.dry_run)
+        print("\n=== Backfill Statistics ===")
+        print(f"Nodes updated: {stats['nodes_updated']}")
+        print(f"Indexes created: {stats['indexes_created']}")
+        print(f"Elapsed time: {stats.get('elapsed_seconds', 0):.2f}s")
+        if stats["errors"]:
+            print(f"Errors: {stats['errors']}")
+    finally:
+        await migration.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -23,16 +23,15 @@ import sys
 import asyncio
 import argparse
 from pathlib import Path
-from datetime import datetime
 from dotenv import load_dotenv
 import os
-import json
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from infrastructure.neo4j_backend import Neo4jBackend
 from application.services.entity_extractor import EntityExtractor
+from application.services.document_tracker import DocumentTracker
 
 load_dotenv()
 
@@ -77,21 +76,10 @@ class PDFReprocessor:
         )
 
         # Load document tracker
-        self.tracker_path = Path("data/document_tracking.json")
-        self.tracker = self._load_tracker()
-
-    def _load_tracker(self) -> dict:
-        """Load document tracking data."""
-        if self.tracker_path.exists():
-            with open(self.tracker_path) as f:
-                return json.load(f)
-        return {}
-
-    def _save_tracker(self):
-        """Save document tracking data."""
-        self.tracker_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.tracker_path, "w") as f:
-            json.dump(self.tracker, f, indent=2, default=str)
+        self.tracker = DocumentTracker(
+            pdf_directory=self.pdf_dir,
+            markdown_directory=self.markdown_dir,
+        )
 
     def discover_pdfs(self) -> list[Path]:
         """Find all PDFs in the directory."""
@@ -180,11 +168,13 @@ class PDFReprocessor:
             result["status"] = "completed"
 
             # Update tracker
-            doc_id = self._get_doc_id(doc_name)
-            if doc_id in self.tracker:
-                self.tracker[doc_id]["entity_count"] = result["entities"]
-                self.tracker[doc_id]["relationship_count"] = result["relationships"]
-                self.tracker[doc_id]["updated_at"] = datetime.now().isoformat()
+            record = self.tracker.get_document_by_filename(doc_name)
+            if record:
+                self.tracker.update_document(
+                    record.id,
+                    entity_count=result["entities"],
+                    relationship_count=result["relationships"],
+                )
 
         except Exception as e:
             result["status"] = "error"
@@ -192,13 +182,6 @@ class PDFReprocessor:
 
         return result
 
-    def _get_doc_id(self, filename: str) -> str:
-        """Find document ID from tracker by filename."""
-        for doc_id, doc in self.tracker.items():
-            if doc.get("filename") == filename:
-                return doc_id
-        return ""
-
     def _chunk_text(
         self,
         text: str,
@@ -392,9 +375,6 @@ async def main():
             print(f"  -> Error: {result['error']}")
             results["errors"] += 1
 
-    # Save tracker
-    processor._save_tracker()
-
     # Summary
     print_header("Summary")
     print(f"\n  Completed: {results['completed']}")
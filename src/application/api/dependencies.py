@@ -341,6 +341,7 @@ async def get_layer_transition_service():
 
     if _layer_transition_service is None:
         from application.services.automatic_layer_transition import AutomaticLayerTransitionService
+        from application.services.query_frequency_tracker import QueryFrequencyTracker
 
         backend = await get_kg_backend()
         event_bus = await get_event_bus()
@@ -351,6 +352,11 @@ async def get_layer_transition_service():
             backend=backend,
             event_bus=event_bus,
             enable_auto_promotion=enable_auto,
+            query_tracker=QueryFrequencyTracker(
+                backend,
+                max_entries=int(os.getenv("QUERY_TRACKER_MAX_ENTRIES", "50000")),
+                flush_interval_seconds=float(os.getenv("QUERY_TRACKER_FLUSH_INTERVAL", "60")),
+            ),
         )
 
         print(f"✅ AutomaticLayerTransitionService initialized (auto_promotion={enable_auto})")
@@ -519,3 +525,17 @@ async def initialize_crystallization_pipeline():
             print("✅ Crystallization pipeline initialized")
         else:
             print("⚠️ Crystallization pipeline failed to initialize")
+
+
+async def shutdown_event_bus():
+    """
+    Finish queued event deliveries on shutdown.
+
+    Call this from the FastAPI shutdown event so background subscribers
+    (crystallization, layer transitions) process what was already published
+    and the query counts they gathered are persisted.
+    """
+    if _event_bus_instance is not None and hasattr(_event_bus_instance, "close"):
+        await _event_bus_instance.close()
+    if _layer_transition_service is not None:
+        await _layer_transition_service.flush_query_counts()
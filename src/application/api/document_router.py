@@ -23,7 +23,7 @@ router = APIRouter(prefix="/api/admin/documents", tags=["Document Management"])
 # Configuration
 PDF_DIRECTORY = Path("PDFs")
 MARKDOWN_DIRECTORY = Path("markdown_output")
-TRACKING_FILE = Path("data/document_tracking.json")
+TRACKING_FILE = Path("data/document_tracking.sqlite3")
 
 # Global instances — legacy tracker kept as fallback until full migration
 document_tracker = DocumentTracker(
@@ -1210,9 +1210,12 @@ async def _run_kg_ingestion(job, pdf_path, filename, category, size_bytes, use_n
     job["message"] = "Converting PDF to markdown..."
     job["progress"] = 0.2
 
-    result = await service.ingest_document(
-        pdf_doc,
-        save_markdown=save_markdown,
-        markdown_output_dir=MARKDOWN_DIRECTORY if save_markdown else None
-    )
-    return result
+    try:
+        return await service.ingest_document(
+            pdf_doc,
+            save_markdown=save_markdown,
+            markdown_output_dir=MARKDOWN_DIRECTORY if save_markdown else None
+        )
+    finally:
+        if use_neo4j:
+            await service.close()
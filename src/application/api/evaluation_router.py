@@ -243,7 +243,7 @@ async def _capture_mem0_snapshot(
         return Mem0LayerSnapshot()
 
     try:
-        mem0_result = patient_memory.mem0.get_all(
+        mem0_result = await patient_memory.memories.get_all(
             user_id=patient_id,
             limit=100  # Get more memories for evaluation
         )
@@ -589,17 +589,10 @@ async def _reset_patient_memory(
     # 2. Clear Mem0 memories
     try:
         if hasattr(patient_memory, 'mem0') and patient_memory.mem0:
-            # Mem0 doesn't have a delete_all_for_user method,
-            # so we need to get all memories and delete individually
-            memories = patient_memory.mem0.get_all(user_id=patient_id, limit=1000)
-            for mem in memories.get("results", []) if memories else []:
-                mem_id = mem.get("id")
-                if mem_id:
-                    try:
-                        patient_memory.mem0.delete(mem_id)
-                        memories_deleted += 1
-                    except Exception:
-                        pass
+            memories = await patient_memory.memories.get_all(user_id=patient_id, limit=1000)
+            memories_deleted = len(memories.get("results", [])) if memories else 0
+            # Both Memory and IsolatedPatientMemoryManager scope delete_all to the user
+            await patient_memory.memories.delete_all(user_id=patient_id)
             layers_cleared.append("mem0")
             logger.debug(f"Mem0: deleted {memories_deleted} memories")
     except Exception as e:
@@ -637,6 +630,10 @@ async def _reset_patient_memory(
         logger.error(f"Failed to clear Graphiti: {e}")
         errors.append(f"Graphiti: {str(e)}")
 
+    # Memories were deleted behind PatientMemoryService's back
+    if hasattr(patient_memory, 'invalidate_patient_context'):
+        await patient_memory.invalidate_patient_context(patient_id)
+
     success = len(layers_cleared) > 0 and len(errors) == 0
 
     return ResetPatientResponse(
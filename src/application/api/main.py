@@ -19,6 +19,8 @@ from pydantic import BaseModel, Field
 from typing import Optional as OptionalType
 from enum import Enum as PyEnum
 
+from application.services.dual_write_outbox import get_dual_write_outbox
+
 # Allow uploads up to 200MB (default is 1MB, causes 413 on PDF uploads)
 MultiPartParser.max_part_size = 200 * 1024 * 1024
 
@@ -35,6 +37,7 @@ from .dependencies import (
     get_event_bus,
     initialize_layer_services,
     initialize_crystallization_pipeline,
+    shutdown_event_bus,
 )
 from .remediation_router import set_deduplication_service
 
@@ -200,6 +203,15 @@ async def startup_event():
         except Exception as e:
             logger.warning(f"⚠️ Failed to configure routers with PostgreSQL: {e}")
 
+        # Deliver queued dual-writes to PostgreSQL in the background
+        try:
+            from infrastructure.database.session import is_initialized, db_session
+            if is_initialized():
+                await start_outbox_relay(db_session)
+                logger.info("✅ Dual-write outbox relay started")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to start dual-write outbox relay: {e}")
+
         # Initialize document storage backend (local or Azure Blob)
         try:
             from infrastructure.document_storage import create_document_storage
@@ -227,6 +239,14 @@ async def startup_event():
         # Don't fail startup - deduplication is optional
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Deliver queued dual-writes and events before the process exits."""
+    if _outbox_relay is not None:
+        await _outbox_relay.stop()
+    await shutdown_event_bus()
+
+
 # ========================================
 # WebSocket Connection Manager
 # ========================================
@@ -610,7 +630,7 @@ async def get_patient_memories(
     """
     try:
         # Get memories from Mem0 (using the isolated manager)
-        memories_result = patient_memory.mem0.get_all(
+        memories_result = await patient_memory.memories.get_all(
             user_id=patient_id,
             limit=limit
         )
@@ -931,6 +951,23 @@ async def get_system_metrics(kg_backend = Depends(get_kg_backend)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/admin/memory-metrics")
+async def get_memory_metrics(patient_memory = Depends(get_patient_memory)):
+    """Get Mem0 call latencies and patient context cache statistics."""
+    return {
+        "mem0": patient_memory.memories.stats(),
+        "context_cache": patient_memory.context_cache.stats(),
+    }
+
+
+@app.get("/api/admin/event-bus-metrics")
+async def get_event_bus_metrics(event_bus = Depends(get_event_bus)):
+    """Get per-subscriber queue depths and handler latencies of the event bus."""
+    if hasattr(event_bus, "stats"):
+        return {"handlers": event_bus.stats()}
+    return {"handlers": {}, "health": await event_bus.health_check()}
+
+
 @app.get("/api/admin/agents")
 async def get_agent_status(status: Optional[str] = None):
     """Get status of all agents for admin dashboard via agent discovery service."""
@@ -1198,44 +1235,67 @@ def _get_migration_recommendations(service) -> list:
     return recommendations
 
 
+_outbox_relay = None
+
+
+async def start_outbox_relay(db_session_factory):
+    """Start the background task draining the outbox into PostgreSQL."""
+    global _outbox_relay
+    if _outbox_relay is None:
+        from application.services.dual_write_outbox import OutboxRelay
+        _outbox_relay = OutboxRelay(get_dual_write_outbox(), db_session_factory)
+        await _outbox_relay.start()
+
+
 @app.get("/api/admin/dual-write-health")
-async def get_dual_write_health(kg_backend = Depends(get_kg_backend)):
-    """Get dual-write health metrics comparing Neo4j and PostgreSQL counts.
+async def get_dual_write_health():
+    """Get dual-write health metrics from the dual-write outbox.
 
-    Returns comparison of record counts and any detected sync issues.
+    Returns per data type backlog, lag and dead letters, plus any sync issues.
     """
     from application.services.dual_write_health_service import DualWriteHealthService
 
-    db_session_factory = None
-    try:
-        from infrastructure.database.session import is_initialized, db_session
-        if is_initialized():
-            db_session_factory = db_session
-    except ImportError:
-        pass
-
     service = DualWriteHealthService(
-        kg_backend=kg_backend,
-        db_session_factory=db_session_factory,
+        outbox=get_dual_write_outbox(),
+        relay_running=_outbox_relay is not None,
     )
     return await service.get_health()
 
 
+@app.post("/api/admin/dual-write-outbox/requeue")
+async def requeue_dual_write_outbox(data_type: Optional[str] = None):
+    """Retry dead-lettered dual-write changes, optionally for one data type."""
+    requeued = get_dual_write_outbox().requeue_dead(data_type)
+    return {"requeued": requeued, "data_type": data_type}
+
+
 @app.get("/api/admin/patients")
 async def list_patients(kg_backend = Depends(get_kg_backend)):
     """List all patients for admin dashboard."""
     try:
         query = """
         MATCH (p:Patient)
-        OPTIONAL MATCH (p)-[:HAS_DIAGNOSIS]->(dx)
-        OPTIONAL MATCH (p)-[:CURRENT_MEDICATION]->(med)
-        OPTIONAL MATCH (p)-[:HAS_SESSION]->(session)
+        CALL {
+            WITH p
+            OPTIONAL MATCH (p)-[:HAS_DIAGNOSIS]->(dx)
+            RETURN count(DISTINCT dx) as diagnoses_count
+        }
+        CALL {
+            WITH p
+            OPTIONAL MATCH (p)-[:CURRENT_MEDICATION]->(med)
+            RETURN count(DISTINCT med) as medications_count
+        }
+        CALL {
+            WITH p
+            OPTIONAL MATCH (p)-[:HAS_SESSION]->(session)
+            RETURN count(DISTINCT session) as sessions_count
+        }
         RETURN
             p.id as patient_id,
             p.created_at as created_at,
-            count(DISTINCT dx) as diagnoses_count,
-            count(DISTINCT med) as medications_count,
-            count(DISTINCT session) as sessions_count,
+            diagnoses_count,
+            medications_count,
+            sessions_count,
             p.consent_given as consent_given
         """
         result = await kg_backend.query_raw(query, {})
@@ -1824,6 +1884,7 @@ async def get_feedback_service():
             backend=backend,
             event_bus=event_bus,
             db_session_factory=db_session_factory,
+            outbox=get_dual_write_outbox() if db_session_factory else None,
         )
     return _feedback_service_instance
 
@@ -2333,6 +2394,7 @@ async def get_chat_history_service():
             intent_service=intent_service,
             openai_api_key=os.getenv("OPENAI_API_KEY"),
             db_session_factory=db_session_factory,
+            outbox=get_dual_write_outbox() if db_session_factory else None,
         )
 
         logger.info("ChatHistoryService initialized")
@@ -3185,7 +3247,7 @@ async def trigger_quality_scan(
     try:
         # Initialize scanner with dependencies if not already done
         document_tracker = DocumentTracker(
-            tracking_file=Path("data/document_tracking.json"),
+            tracking_file=Path("data/document_tracking.sqlite3"),
             pdf_directory=Path("PDFs"),
             markdown_directory=Path("markdown_output")
         )
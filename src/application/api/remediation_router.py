@@ -11,7 +11,7 @@ Prefix: /api/ontology/remediation
 """
 
 import logging
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
@@ -119,11 +119,14 @@ async def list_orphans(
 
 
 @router.post("/deduplication/dry-run")
-async def deduplication_dry_run(service=Depends(get_deduplication)):
+async def deduplication_dry_run(
+    incremental: bool = Query(False, description="Only check entities new or renamed since the last execute"),
+    service=Depends(get_deduplication),
+):
     """Preview categorized merge plan for duplicate entities without modifying data."""
     try:
-        # Same-type detection (Neo4j fast path)
-        pairs = await service.detect_duplicates()
+        # Same-type detection (streamed key grouping)
+        pairs = await service.detect_duplicates(incremental=incremental)
         plan = service.create_merge_plan(pairs)
 
         # Cross-type detection (Python normalizer)
@@ -158,13 +161,17 @@ async def deduplication_dry_run(service=Depends(get_deduplication)):
 
 
 @router.post("/deduplication/execute")
-async def deduplication_execute(service=Depends(get_deduplication)):
+async def deduplication_execute(
+    incremental: bool = Query(False, description="Only check entities new or renamed since the last execute"),
+    batch_id: Optional[str] = Query(None, description="Resume an interrupted run with this batch ID"),
+    service=Depends(get_deduplication),
+):
     """Execute deduplication — merge same-type duplicate pairs only."""
     try:
-        # Only merge same-type pairs
-        pairs = await service.detect_duplicates()
+        # Only merge same-type pairs; record keys so later incremental runs skip them
+        pairs = await service.detect_duplicates(incremental=incremental, record_keys=True)
         plan = service.create_merge_plan(pairs)
-        summary = await service.execute_merge(plan)
+        summary = await service.execute_merge(plan, batch_id=batch_id)
 
         # Count cross-type groups (not merged, just reported)
         cross_type_groups = await service.detect_cross_type_duplicates()
@@ -174,6 +181,8 @@ async def deduplication_execute(service=Depends(get_deduplication)):
             "total_relationships_transferred": summary.total_relationships_transferred,
             "batch_id": summary.batch_id,
             "details": summary.details,
+            "skipped_already_merged": summary.skipped,
+            "failures": summary.failures,
             "skipped_cross_type": len(cross_type_groups),
         }
     except Exception as e:
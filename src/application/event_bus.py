@@ -2,47 +2,245 @@
 
 The event bus allows publishers to emit events identified by an action
 string.  Subscribers register callback coroutines for specific actions.
-When an event is published the bus awaits each subscriber in turn.  This
-implementation stores subscribers in memory and is suitable for unit
+When an event is published the bus runs the action's subscribers
+concurrently, so a publisher waits for the slowest handler rather than
+the sum of all of them.  A handler failure is logged and counted; it
+neither reaches the publisher nor stops the other handlers.
+
+Handlers that should not hold up publishers at all can subscribe with a
+background ``DeliveryPolicy``.  Each such handler gets a bounded queue and
+a worker that processes its events in order; ``publish`` only enqueues.
+When the queue is full the policy's overflow setting decides whether the
+publisher waits (``block``) or an event is dropped (``drop_newest`` or
+``drop_oldest``).
+
+This implementation stores subscribers in memory and is suitable for unit
 testing and small deployments.  A production system would integrate
 RabbitMQ or a similar message broker and support delivery guarantees,
 retry policies and dead‑letter queues.
 """
 
-from typing import Awaitable, Callable, Dict, List
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
 
 from domain.event import KnowledgeEvent
 
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[KnowledgeEvent], Awaitable[None]]
+
+OVERFLOW_POLICIES = ("block", "drop_newest", "drop_oldest")
+
+
+@dataclass(frozen=True)
+class DeliveryPolicy:
+    """How events reach one subscriber.
+
+    Attributes:
+        background: Deliver through the handler's queue instead of awaiting
+            the handler inside ``publish``.
+        max_queue_size: Capacity of the handler's queue (background only).
+        overflow: What a full queue does: ``block`` the publisher, drop the
+            new event (``drop_newest``) or evict the oldest queued one
+            (``drop_oldest``).
+    """
+
+    background: bool = False
+    max_queue_size: int = 1000
+    overflow: str = "block"
+
+    def __post_init__(self) -> None:
+        if self.overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {self.overflow}")
+        if self.max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+
+
+INLINE = DeliveryPolicy()
+BACKGROUND = DeliveryPolicy(background=True)
+
+
+@dataclass
+class HandlerMetrics:
+    """Delivery counters and latencies of one subscriber."""
+
+    delivered: int = 0
+    failed: int = 0
+    dropped: int = 0
+    max_queue_depth: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def to_dict(self, queue_depth: int) -> Dict[str, Any]:
+        handled = self.delivered + self.failed
+        return {
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "queue_depth": queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "avg_latency_ms": round(self.total_seconds / handled * 1000, 2) if handled else 0.0,
+            "max_latency_ms": round(self.max_seconds * 1000, 2),
+        }
+
+
+@dataclass
+class _Subscription:
+    action: str
+    handler: Handler
+    policy: DeliveryPolicy
+    metrics: HandlerMetrics = field(default_factory=HandlerMetrics)
+    queue: Optional[asyncio.Queue] = None
+    worker: Optional[asyncio.Task] = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.action}:{getattr(self.handler, '__qualname__', repr(self.handler))}"
+
+    def queue_depth(self) -> int:
+        return self.queue.qsize() if self.queue is not None else 0
+
 
 class EventBus:
     """In‑memory event bus for knowledge events."""
 
-    def __init__(self) -> None:
-        # Map event action names to lists of subscriber coroutines
-        self._subscribers: Dict[str, List[Callable[[KnowledgeEvent], Awaitable[None]]]] = {}
+    def __init__(self, policies: Optional[Dict[str, DeliveryPolicy]] = None) -> None:
+        """Create an event bus.
+
+        Args:
+            policies: Default delivery policy per action, used for
+                subscriptions that do not pass their own.  Actions not
+                listed are delivered inline.
+        """
+        # Map event action names to lists of subscriptions
+        self._subscribers: Dict[str, List[_Subscription]] = {}
+        self._policies: Dict[str, DeliveryPolicy] = dict(policies or {})
 
-    async def subscribe(self, action: str, handler: Callable[[KnowledgeEvent], Awaitable[None]]) -> None:
+    async def subscribe(
+        self,
+        action: str,
+        handler: Handler,
+        policy: Optional[DeliveryPolicy] = None,
+    ) -> None:
         """Subscribe a coroutine to a specific action.
 
         Args:
             action: The name of the event action to subscribe to.
             handler: An async callable that accepts a ``KnowledgeEvent``.
+            policy: How events reach the handler; defaults to the bus policy
+                for ``action``.
         """
-        if action not in self._subscribers:
-            self._subscribers[action] = []
-        self._subscribers[action].append(handler)
+        policy = policy or self._policies.get(action, INLINE)
+        self._subscribers.setdefault(action, []).append(_Subscription(action, handler, policy))
 
     async def publish(self, event: KnowledgeEvent) -> None:
         """Publish an event to all subscribed handlers.
 
-        Subscribers are awaited sequentially.  Errors raised by one handler
-        will propagate to the publisher and prevent subsequent handlers
-        from running.  This behaviour is deliberate for simplicity but may
-        need to be adjusted for production use.
+        Inline subscribers run concurrently and are awaited; background
+        subscribers only have the event queued.  Handler errors are logged
+        and counted in ``stats()`` instead of propagating to the publisher.
 
         Args:
             event: The event to publish.
         """
-        handlers = self._subscribers.get(event.action, [])
-        for handler in handlers:
-            await handler(event)
\ No newline at end of file
+        inline = []
+        for subscription in self._subscribers.get(event.action, []):
+            if subscription.policy.background:
+                await self._enqueue(subscription, event)
+            else:
+                inline.append(self._deliver(subscription, event))
+        if len(inline) == 1:
+            await inline[0]
+        elif inline:
+            await asyncio.gather(*inline)
+
+    async def drain(self) -> None:
+        """Wait until every background queue has been processed."""
+        await asyncio.gather(*(s.queue.join() for s in self._background_subscriptions()))
+
+    async def close(self, drain: bool = True) -> None:
+        """Stop the background workers.
+
+        Args:
+            drain: Process the events already queued first; otherwise they
+                are discarded.
+        """
+        if drain:
+            await self.drain()
+        subscriptions = list(self._background_subscriptions())
+        for subscription in subscriptions:
+            subscription.worker.cancel()
+        await asyncio.gather(*(s.worker for s in subscriptions), return_exceptions=True)
+        for subscription in subscriptions:
+            subscription.queue = None
+            subscription.worker = None
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Delivery metrics per subscriber, keyed by ``action:handler``."""
+        return {
+            s.name: {
+                "background": s.policy.background,
+                **s.metrics.to_dict(s.queue_depth()),
+            }
+            for subscriptions in self._subscribers.values()
+            for s in subscriptions
+        }
+
+    def _background_subscriptions(self) -> Iterable[_Subscription]:
+        for subscriptions in self._subscribers.values():
+            for subscription in subscriptions:
+                if subscription.worker is not None:
+                    yield subscription
+
+    async def _deliver(self, subscription: _Subscription, event: KnowledgeEvent) -> None:
+        metrics = subscription.metrics
+        start = time.perf_counter()
+        try:
+            await subscription.handler(event)
+            metrics.delivered += 1
+        except Exception as e:
+            metrics.failed += 1
+            logger.error(f"Error in event handler {subscription.name}: {e}", exc_info=True)
+        finally:
+            elapsed = time.perf_counter() - start
+            metrics.total_seconds += elapsed
+            metrics.max_seconds = max(metrics.max_seconds, elapsed)
+
+    async def _enqueue(self, subscription: _Subscription, event: KnowledgeEvent) -> None:
+        if subscription.worker is None:
+            # Workers start lazily: subscribe() may run before the loop that publishes
+            subscription.queue = asyncio.Queue(maxsize=subscription.policy.max_queue_size)
+            subscription.worker = asyncio.create_task(self._work(subscription), name=f"event-bus:{subscription.name}")
+
+        queue = subscription.queue
+        if queue.full():
+            overflow = subscription.policy.overflow
+            if overflow == "drop_newest":
+                subscription.metrics.dropped += 1
+                logger.warning(f"Event queue of {subscription.name} is full, dropping {event.action} event")
+                return
+            if overflow == "drop_oldest":
+                queue.get_nowait()
+                queue.task_done()
+                subscription.metrics.dropped += 1
+                logger.warning(f"Event queue of {subscription.name} is full, dropping its oldest event")
+        await queue.put(event)
+        subscription.metrics.max_queue_depth = max(subscription.metrics.max_queue_depth, queue.qsize())
+
+    async def _work(self, subscription: _Subscription) -> None:
+        queue = subscription.queue
+        while True:
+            event = await queue.get()
+            try:
+                await self._deliver(subscription, event)
+            finally:
+                queue.task_done()
+
+
+def background_policies(actions: Iterable[str], max_queue_size: int = 1000, overflow: str = "block") -> Dict[str, DeliveryPolicy]:
+    """Build an ``EventBus`` policy map delivering ``actions`` in the background."""
+    policy = DeliveryPolicy(background=True, max_queue_size=max_queue_size, overflow=overflow)
+    return {action.strip(): policy for action in actions if action.strip()}
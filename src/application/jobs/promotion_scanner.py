@@ -2,6 +2,8 @@
 
 This job periodically scans entities in PERCEPTION and SEMANTIC layers,
 checking if they meet promotion criteria, and automatically promotes them.
+Both layers are scanned concurrently; each streams its candidates in pages
+and promotes a page at a time through the transition service.
 
 Run standalone: uv run python -m application.jobs.promotion_scanner
 """
@@ -112,18 +114,18 @@ class PromotionScannerJob:
 
         logger.debug(f"Starting promotion scan {results['scan_id']}")
 
+        layers = []
+        if self.enable_perception_scan:
+            layers.append("PERCEPTION")
+        if self.enable_semantic_scan:
+            layers.append("SEMANTIC")
+
         try:
-            # Scan PERCEPTION layer
-            if self.enable_perception_scan:
-                perception_results = await self._scan_layer("PERCEPTION")
-                results["perception_candidates"] = perception_results.get("candidates", 0)
-                results["promotions"] += perception_results.get("promotions", 0)
-
-            # Scan SEMANTIC layer
-            if self.enable_semantic_scan:
-                semantic_results = await self._scan_layer("SEMANTIC")
-                results["semantic_candidates"] = semantic_results.get("candidates", 0)
-                results["promotions"] += semantic_results.get("promotions", 0)
+            # Layers are independent, so scan them concurrently
+            layer_results = await asyncio.gather(*(self._scan_layer(layer) for layer in layers))
+            for layer, layer_result in zip(layers, layer_results):
+                results[f"{layer.lower()}_candidates"] = layer_result.get("candidates", 0)
+                results["promotions"] += layer_result.get("promotions", 0)
 
             self.stats["total_promotions"] += results["promotions"]
 
@@ -171,55 +173,22 @@ class PromotionScannerJob:
         result = {"layer": layer, "candidates": 0, "promotions": 0}
 
         try:
-            # Use transition service to scan and promote
-            candidates = await self.transition_service.scan_for_promotion_candidates(layer)
-            result["candidates"] = len(candidates)
+            # Stream candidate pages and promote each page in batches
+            async for page in self.transition_service.iter_promotion_candidates(layer):
+                result["candidates"] += len(page)
+                result["promotions"] += await self.transition_service.promote_candidates(
+                    page, layer, reason="Background scan promotion"
+                )
 
-            if len(candidates) == 0:
+            if result["candidates"] == 0:
                 logger.debug(
                     f"No promotion candidates found in {layer} layer. "
                     f"Entities need confidence >= threshold, validation_count >= 3, or ontology_codes to qualify."
                 )
             else:
-                logger.info(f"Found {len(candidates)} promotion candidates in {layer} layer")
-
-            for candidate in candidates:
-                # Handle both dict candidates (from Neo4j) and string IDs
-                if isinstance(candidate, dict):
-                    entity_id = candidate.get("id") or candidate.get("name")
-                    entity_data = candidate  # Use candidate data directly
-                else:
-                    entity_id = candidate
-                    entity_data = await self.transition_service._get_entity_data(entity_id)
-
-                if entity_id and entity_data:
-                    # Get entity's ACTUAL layer from data, not the scan parameter
-                    # This prevents trying to "promote" entities that are already at a higher layer
-                    entity_props = entity_data.get("properties", entity_data)
-                    actual_layer = entity_props.get("layer", layer)
-
-                    # Skip if entity is not at the expected layer (already promoted)
-                    if actual_layer != layer:
-                        logger.debug(
-                            f"Skipping entity {entity_id}: expected layer {layer}, actual {actual_layer}"
-                        )
-                        continue
-
-                    to_layer = "SEMANTIC" if actual_layer == "PERCEPTION" else "REASONING"
-
-                    # Import Layer enum
-                    from application.services.layer_transition import Layer
-
-                    record = await self.transition_service._promote_entity(
-                        entity_id=entity_id,
-                        entity_data=entity_data,
-                        from_layer=Layer(actual_layer),
-                        to_layer=Layer(to_layer),
-                        reason="Background scan promotion"
-                    )
-
-                    if record and record.status.value == "completed":
-                        result["promotions"] += 1
+                logger.info(
+                    f"Promoted {result['promotions']} of {result['candidates']} candidates in {layer} layer"
+                )
 
         except Exception as e:
             result["error"] = str(e)
@@ -16,9 +16,11 @@ Publishes:
 - layer_transition_completed: Audit trail for promotions
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, AsyncIterator, Optional, List
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+import asyncio
+import inspect
 import logging
 
 from domain.event import KnowledgeEvent
@@ -31,9 +33,13 @@ from application.services.layer_transition import (
     Layer,
     TransitionStatus,
 )
+from application.services.query_frequency_tracker import QueryFrequencyTracker, QueryTracker
 
 logger = logging.getLogger(__name__)
 
+PROMOTION_SCAN_LAYERS = ["PERCEPTION", "SEMANTIC"]
+DEFAULT_SCAN_PAGE_SIZE = 1000
+
 
 @dataclass
 class PromotionThresholds:
@@ -55,22 +61,6 @@ class PromotionThresholds:
     reasoning_cache_hit_rate: float = 0.50
 
 
-@dataclass
-class QueryTracker:
-    """Tracks query patterns for APPLICATION layer promotion."""
-    entity_id: str
-    query_count: int = 0
-    first_query_at: Optional[datetime] = None
-    last_query_at: Optional[datetime] = None
-    cache_hits: int = 0
-    cache_misses: int = 0
-
-    @property
-    def cache_hit_rate(self) -> float:
-        total = self.cache_hits + self.cache_misses
-        return self.cache_hits / total if total > 0 else 0.0
-
-
 class AutomaticLayerTransitionService:
     """
     Service for automatic promotion of entities between knowledge layers.
@@ -85,6 +75,7 @@ class AutomaticLayerTransitionService:
         event_bus: EventBus,
         thresholds: Optional[PromotionThresholds] = None,
         enable_auto_promotion: bool = True,
+        query_tracker: Optional[QueryFrequencyTracker] = None,
     ):
         """
         Initialize automatic layer transition service.
@@ -94,6 +85,8 @@ class AutomaticLayerTransitionService:
             event_bus: Event bus for subscribing to and publishing events
             thresholds: Promotion thresholds (uses defaults if not provided)
             enable_auto_promotion: Whether to automatically promote entities
+            query_tracker: Bounded, persisted query counts (a default
+                tracker over ``backend`` if not provided)
         """
         self.backend = backend
         self.event_bus = event_bus
@@ -108,7 +101,7 @@ class AutomaticLayerTransitionService:
         )
 
         # Track queries for APPLICATION promotion
-        self._query_trackers: Dict[str, QueryTracker] = {}
+        self._query_trackers = query_tracker or QueryFrequencyTracker(backend)
 
         # Promotion statistics
         self.stats = {
@@ -194,38 +187,32 @@ class AutomaticLayerTransitionService:
             return
 
         query_data = event.data
-        entities_involved = query_data.get("entities_involved", [])
         cache_hit = query_data.get("cache_hit", False)
 
-        for entity_ref in entities_involved:
+        refs: Dict[str, Optional[str]] = {}
+        for entity_ref in query_data.get("entities_involved", []):
             entity_id = entity_ref.get("id") if isinstance(entity_ref, dict) else entity_ref
-            entity_layer = entity_ref.get("layer") if isinstance(entity_ref, dict) else None
-
-            # Only track REASONING layer entities
-            if entity_layer != "REASONING":
-                # Try to get layer from backend if not provided
-                if entity_layer is None and hasattr(self.backend, "get_entity"):
-                    try:
-                        entity = await self.backend.get_entity(entity_id)
-                        if entity:
-                            entity_layer = entity.get("layer")
-                    except Exception:
-                        pass
+            if entity_id:
+                refs[entity_id] = entity_ref.get("layer") if isinstance(entity_ref, dict) else None
+
+        # Only REASONING entities are tracked. One lookup covers the layers the
+        # event did not carry and the persisted counts of untracked entities.
+        states = await self._query_trackers.load_states(
+            entity_id for entity_id, layer in refs.items()
+            if layer is None or (layer == "REASONING" and entity_id not in self._query_trackers)
+        )
+        if not self._query_trackers.persistent:
+            states = await self._get_entity_layers([e for e, layer in refs.items() if layer is None])
 
+        for entity_id, entity_layer in refs.items():
+            state = states.get(entity_id)
+            if entity_layer is None and state:
+                entity_layer = state.get("layer")
             if entity_layer != "REASONING":
                 continue
 
-            # Update query tracker
-            tracker = self._get_or_create_tracker(entity_id)
-            tracker.query_count += 1
-            tracker.last_query_at = datetime.now()
-            if tracker.first_query_at is None:
-                tracker.first_query_at = tracker.last_query_at
-
-            if cache_hit:
-                tracker.cache_hits += 1
-            else:
-                tracker.cache_misses += 1
+            tracker = self._query_trackers.get_or_create(entity_id, state)
+            self._query_trackers.record(tracker, cache_hit)
 
             # Check if entity should be promoted to APPLICATION
             if await self._check_reasoning_promotion(entity_id, tracker):
@@ -241,13 +228,27 @@ class AutomaticLayerTransitionService:
                                f"{tracker.cache_hit_rate:.2%} cache hit rate"
                     )
                     # Clear tracker after promotion
-                    del self._query_trackers[entity_id]
+                    self._query_trackers.reset(entity_id)
+
+        await self._query_trackers.maybe_flush()
+
+    async def flush_query_counts(self) -> int:
+        """Persist pending query counts now (e.g. on shutdown)."""
+        return await self._query_trackers.flush()
+
+    async def _get_entity_layers(self, entity_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Layer lookup for backends without ``query_raw``, one entity at a time."""
+        states = {}
+        for entity_id in entity_ids:
+            entity = await self._get_entity_data(entity_id)
+            if entity:
+                props = entity.get("properties", entity)
+                states[entity_id] = {"layer": props.get("layer", entity.get("layer"))}
+        return states
 
     def _get_or_create_tracker(self, entity_id: str) -> QueryTracker:
         """Get or create a query tracker for an entity."""
-        if entity_id not in self._query_trackers:
-            self._query_trackers[entity_id] = QueryTracker(entity_id=entity_id)
-        return self._query_trackers[entity_id]
+        return self._query_trackers.get_or_create(entity_id)
 
     async def _get_entity_data(self, entity_id: str) -> Optional[Dict[str, Any]]:
         """Fetch entity data from backend."""
@@ -409,21 +410,7 @@ class AutomaticLayerTransitionService:
             enriched_data = self._enrich_for_layer(entity_data, to_layer)
 
             # Create transition request
-            request = LayerTransitionRequest(
-                entity_id=entity_id,
-                from_layer=from_layer,
-                to_layer=to_layer,
-                reason=reason,
-                requested_by="auto_promotion_service",
-                metadata={
-                    "entity_name": entity_data.get("name", entity_id),
-                    "auto_promoted": True,
-                    "thresholds_used": {
-                        "confidence": self.thresholds.perception_confidence_threshold,
-                        "validation_count": self.thresholds.perception_validation_count,
-                    }
-                }
-            )
+            request = self._promotion_request(entity_id, entity_data, from_layer, to_layer, reason)
 
             # Request and execute transition
             record = self._transition_service.request_transition(request)
@@ -461,6 +448,31 @@ class AutomaticLayerTransitionService:
             logger.error(f"Failed to promote {entity_id}: {e}")
             return None
 
+    def _promotion_request(
+        self,
+        entity_id: str,
+        entity_data: Dict[str, Any],
+        from_layer: Layer,
+        to_layer: Layer,
+        reason: str
+    ) -> LayerTransitionRequest:
+        """Build the transition request for an automatic promotion."""
+        return LayerTransitionRequest(
+            entity_id=entity_id,
+            from_layer=from_layer,
+            to_layer=to_layer,
+            reason=reason,
+            requested_by="auto_promotion_service",
+            metadata={
+                "entity_name": entity_data.get("name", entity_id),
+                "auto_promoted": True,
+                "thresholds_used": {
+                    "confidence": self.thresholds.perception_confidence_threshold,
+                    "validation_count": self.thresholds.perception_validation_count,
+                }
+            }
+        )
+
     def _enrich_for_layer(
         self,
         entity_data: Dict[str, Any],
@@ -615,10 +627,203 @@ class AutomaticLayerTransitionService:
             logger.error(f"Failed to scan for candidates: {e}")
             return []
 
+    async def iter_promotion_candidates(
+        self,
+        layer: str = "PERCEPTION",
+        page_size: int = DEFAULT_SCAN_PAGE_SIZE,
+    ) -> AsyncIterator[List[Any]]:
+        """
+        Stream promotion candidates of a layer page by page.
+
+        Uses the backend's keyset-paginated ``iter_promotion_candidates``
+        when it has one; otherwise yields the single page returned by
+        :meth:`scan_for_promotion_candidates`.
+
+        Args:
+            layer: Layer to scan
+            page_size: Candidates per page
+
+        Yields:
+            Lists of candidates (dicts or entity IDs)
+        """
+        if not inspect.isasyncgenfunction(getattr(self.backend, "iter_promotion_candidates", None)):
+            candidates = await self.scan_for_promotion_candidates(layer)
+            if candidates:
+                yield candidates
+            return
+
+        thresholds = {
+            "PERCEPTION": self.thresholds.perception_confidence_threshold,
+            "SEMANTIC": self.thresholds.semantic_confidence_threshold,
+        }
+        if layer not in thresholds:
+            return
+        async for page in self.backend.iter_promotion_candidates(
+            from_layer=layer,
+            confidence_threshold=thresholds[layer],
+            page_size=page_size,
+        ):
+            yield page
+
+    async def promote_candidates(
+        self,
+        candidates: List[Any],
+        layer: str,
+        reason: str = "Batch promotion scan",
+    ) -> int:
+        """
+        Promote a page of scan candidates out of ``layer``.
+
+        With a backend offering ``promote_entities_bulk`` the page is
+        validated in memory and written in UNWIND batches, and the written
+        promotions are recorded with the transition service in one call;
+        candidates the bulk write cannot match by ID go through
+        :meth:`_promote_entity`.
+        Other backends promote every candidate with :meth:`_promote_entity`.
+
+        Args:
+            candidates: Candidate dicts or entity IDs from a scan
+            layer: Layer the candidates were scanned from
+            reason: Promotion reason
+
+        Returns:
+            Number of entities promoted
+        """
+        entities = []
+        for candidate in candidates:
+            # Handle both dict candidates (from Neo4j) and string IDs
+            if isinstance(candidate, dict):
+                entity_id = candidate.get("id") or candidate.get("name")
+                entity_data = candidate
+            else:
+                entity_id = candidate
+                entity_data = await self._get_entity_data(entity_id)
+
+            if not entity_id or not entity_data:
+                continue
+
+            # Get entity's ACTUAL layer from data, not the scan parameter
+            # This prevents trying to "promote" entities that are already at a higher layer
+            entity_props = entity_data.get("properties", entity_data)
+            actual_layer = entity_props.get("layer", layer)
+            if actual_layer != layer:
+                logger.debug(
+                    f"Skipping entity {entity_id}: expected layer {layer}, actual {actual_layer}"
+                )
+                continue
+            entities.append((entity_id, entity_data))
+
+        if not entities:
+            return 0
+
+        from_layer = Layer(layer)
+        to_layer = Layer.SEMANTIC if layer == "PERCEPTION" else Layer.REASONING
+
+        if not inspect.iscoroutinefunction(getattr(self.backend, "promote_entities_bulk", None)):
+            return await self._promote_each(entities, from_layer, to_layer, reason)
+
+        rows = []
+        by_id = {}
+        for entity_id, entity_data in entities:
+            enriched = self._enrich_for_layer(entity_data, to_layer)
+            is_valid, errors = self._transition_service.validate_transition(enriched, from_layer, to_layer)
+            if not is_valid:
+                self.stats["promotions_attempted"] += 1
+                self.stats["promotions_rejected"] += 1
+                logger.warning(f"Promotion rejected for {entity_id}: {'; '.join(errors)}")
+                continue
+            current = entity_data.get("properties", entity_data)
+            properties = {
+                key: value for key, value in enriched["properties"].items()
+                if key not in ("id", "layer", "labels") and current.get(key) != value
+            }
+            rows.append({
+                "entity_id": entity_id,
+                "from_layer": from_layer.value,
+                "to_layer": to_layer.value,
+                "properties": properties,
+            })
+            by_id[entity_id] = entity_data
+
+        if not rows:
+            return 0
+        try:
+            outcome = await self.backend.promote_entities_bulk(rows, trigger_type="auto_promotion")
+        except Exception as e:
+            self.stats["promotions_attempted"] += len(rows)
+            self.stats["promotions_rejected"] += len(rows)
+            logger.error(f"Failed to promote {len(rows)} {layer} entities: {e}")
+            return 0
+
+        promoted = outcome.get("promoted", [])
+        skipped = set(outcome.get("skipped", []))
+        # Skipped entities are counted by _promote_entity below
+        self.stats["promotions_attempted"] += len(rows) - len(skipped)
+        self.stats["promotions_rejected"] += len(outcome.get("failed", []))
+        layer_key = f"{from_layer.value}_TO_{to_layer.value}"
+        self.stats["promotions_completed"] += len(promoted)
+        self.stats["by_layer"][layer_key] += len(promoted)
+        records = self._transition_service.record_applied_transitions(
+            [
+                (self._promotion_request(entity_id, by_id[entity_id], from_layer, to_layer, reason), by_id[entity_id])
+                for entity_id in promoted
+            ],
+            outcome.get("transition_ids", {}),
+        )
+        for record in records:
+            await self._publish_transition_event(record, by_id[record.entity_id])
+
+        # Nodes without an ``id`` match (e.g. keyed by name) take the per-entity path
+        if skipped:
+            fallback = [(entity_id, by_id[entity_id]) for entity_id in by_id if entity_id in skipped]
+            return len(promoted) + await self._promote_each(fallback, from_layer, to_layer, reason)
+        return len(promoted)
+
+    async def _promote_each(
+        self,
+        entities: List[Any],
+        from_layer: Layer,
+        to_layer: Layer,
+        reason: str,
+    ) -> int:
+        """Promote ``(entity_id, entity_data)`` pairs one at a time."""
+        promoted = 0
+        for entity_id, entity_data in entities:
+            record = await self._promote_entity(
+                entity_id=entity_id,
+                entity_data=entity_data,
+                from_layer=from_layer,
+                to_layer=to_layer,
+                reason=reason
+            )
+            if record and record.status == TransitionStatus.COMPLETED:
+                promoted += 1
+        return promoted
+
+    async def scan_layer(self, layer: str, reason: str = "Batch promotion scan") -> Dict[str, int]:
+        """
+        Stream a layer's candidates and promote them page by page.
+
+        Args:
+            layer: Layer to scan
+            reason: Promotion reason
+
+        Returns:
+            ``candidates`` seen and ``promotions`` executed
+        """
+        result = {"candidates": 0, "promotions": 0}
+        async for page in self.iter_promotion_candidates(layer):
+            result["candidates"] += len(page)
+            result["promotions"] += await self.promote_candidates(page, layer, reason)
+        return result
+
     async def run_promotion_scan(self) -> Dict[str, Any]:
         """
         Run a full scan for promotion candidates and promote them.
 
+        Layers are scanned concurrently, each streaming its candidates in
+        pages and promoting every page in batches.
+
         Returns:
             Scan results with promotion statistics
         """
@@ -629,52 +834,21 @@ class AutomaticLayerTransitionService:
             "errors": []
         }
 
-        for layer in ["PERCEPTION", "SEMANTIC"]:
-            try:
-                candidates = await self.scan_for_promotion_candidates(layer)
-                results["scanned_layers"].append(layer)
-                results["candidates_found"] += len(candidates)
-
-                for candidate in candidates:
-                    # Handle both dict candidates (from Neo4j) and string IDs
-                    if isinstance(candidate, dict):
-                        entity_id = candidate.get("id")
-                        # Use candidate data directly if we have it
-                        entity_data = candidate
-                    else:
-                        entity_id = candidate
-                        entity_data = await self._get_entity_data(entity_id)
-
-                    if entity_id and entity_data:
-                        # Get entity's ACTUAL layer from data, not the scan parameter
-                        # This prevents trying to "promote" entities that are already at a higher layer
-                        entity_props = entity_data.get("properties", entity_data)
-                        actual_layer = entity_props.get("layer", layer)
-
-                        # Skip if entity is not at the expected layer (already promoted)
-                        if actual_layer != layer:
-                            logger.debug(
-                                f"Skipping entity {entity_id}: expected layer {layer}, actual {actual_layer}"
-                            )
-                            continue
-
-                        from_layer = Layer(actual_layer)
-                        to_layer = Layer.SEMANTIC if actual_layer == "PERCEPTION" else Layer.REASONING
-
-                        record = await self._promote_entity(
-                            entity_id=entity_id,
-                            entity_data=entity_data,
-                            from_layer=from_layer,
-                            to_layer=to_layer,
-                            reason="Batch promotion scan"
-                        )
-
-                        if record and record.status == TransitionStatus.COMPLETED:
-                            results["promotions_executed"] += 1
+        layer_results = await asyncio.gather(
+            *(self.scan_layer(layer) for layer in PROMOTION_SCAN_LAYERS),
+            return_exceptions=True,
+        )
+        for layer, layer_result in zip(PROMOTION_SCAN_LAYERS, layer_results):
+            if isinstance(layer_result, Exception):
+                results["errors"].append(f"{layer}: {str(layer_result)}")
+                logger.error(f"Error scanning {layer}: {layer_result}")
+                continue
+            results["scanned_layers"].append(layer)
+            results["candidates_found"] += layer_result["candidates"]
+            results["promotions_executed"] += layer_result["promotions"]
 
-            except Exception as e:
-                results["errors"].append(f"{layer}: {str(e)}")
-                logger.error(f"Error scanning {layer}: {e}")
+        # Persist query counts even when no query events arrive to trigger it
+        results["query_counts_flushed"] = await self.flush_query_counts()
 
         return results
 
@@ -691,5 +865,6 @@ class AutomaticLayerTransitionService:
                 "reasoning_time_window_hours": self.thresholds.reasoning_time_window_hours,
             },
             "active_trackers": len(self._query_trackers),
+            "query_tracking": self._query_trackers.get_statistics(),
             "auto_promotion_enabled": self.enable_auto_promotion,
         }
@@ -6,7 +6,8 @@ and integration with Phase 6 conversational layer for auto-titles
 and intent-aware session metadata.
 
 Supports dual-write to PostgreSQL for migration via feature flags.
-Uses per-request database sessions for safe concurrent access.
+PostgreSQL changes go through the dual-write outbox when one is configured,
+so requests only wait for Neo4j; otherwise they are applied inline.
 """
 
 import logging
@@ -27,6 +28,14 @@ from application.services.feature_flag_service import (
     dual_write_enabled,
     use_postgres_sessions,
 )
+from application.services.dual_write_outbox import (
+    MESSAGE_INSERT,
+    SESSION_CREATE,
+    SESSION_DELETE,
+    SESSION_UPDATE,
+    DualWriteOutbox,
+    submit_change,
+)
 from openai import AsyncOpenAI
 import os
 
@@ -41,7 +50,8 @@ class ChatHistoryService:
     - dual_write_sessions: Write to both Neo4j and PostgreSQL
     - use_postgres_sessions: Read from PostgreSQL (migration complete)
 
-    Uses a db_session_factory for per-request database sessions.
+    Uses a db_session_factory for per-request database sessions, and an
+    optional DualWriteOutbox to take PostgreSQL writes off the request path.
     """
 
     def __init__(
@@ -50,11 +60,13 @@ class ChatHistoryService:
         intent_service: Optional[ConversationalIntentService] = None,
         openai_api_key: Optional[str] = None,
         db_session_factory: Optional[Callable] = None,
+        outbox: Optional[DualWriteOutbox] = None,
     ):
         self.memory = patient_memory_service
         self.intent_service = intent_service
         self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
         self._db_session = db_session_factory
+        self._outbox = outbox
 
         if self.openai_api_key:
             self.openai_client = AsyncOpenAI(api_key=self.openai_api_key)
@@ -65,7 +77,7 @@ class ChatHistoryService:
             logger.info(
                 "ChatHistoryService initialized with PostgreSQL support "
                 f"(dual_write={dual_write_enabled('sessions')}, "
-                f"use_postgres={use_postgres_sessions()})"
+                f"use_postgres={use_postgres_sessions()}, outbox={outbox is not None})"
             )
         else:
             logger.info("ChatHistoryService initialized (Neo4j only)")
@@ -275,27 +287,21 @@ class ChatHistoryService:
     async def _create_session_postgres(
         self, session_uuid: uuid.UUID, patient_id: str, title: str, device: str, neo4j_id: str
     ) -> None:
-        try:
-            from sqlalchemy import text
-
-            async with self._db_session() as session:
-                # Use INSERT ... ON CONFLICT DO NOTHING for idempotency
-                await session.execute(
-                    text("""
-                        INSERT INTO sessions (id, patient_id, title, status, metadata)
-                        VALUES (:id, :patient_id, :title, 'active', :metadata)
-                        ON CONFLICT (id) DO NOTHING
-                    """),
-                    {
-                        "id": session_uuid,
-                        "patient_id": patient_id,
-                        "title": title,
-                        "metadata": f'{{"device": "{device}", "neo4j_id": "{neo4j_id}"}}',
-                    }
-                )
-            logger.debug(f"Postgres: Created session {neo4j_id}")
-        except Exception as e:
-            logger.error(f"Postgres session creation failed for {neo4j_id}: {e}")
+        # Applied with INSERT ... ON CONFLICT DO NOTHING, so repeats are harmless
+        await submit_change(
+            self._outbox,
+            self._db_session,
+            SESSION_CREATE,
+            str(session_uuid),
+            {
+                "id": str(session_uuid),
+                "patient_id": patient_id,
+                "title": title,
+                "status": "active",
+                "metadata": {"device": device, "neo4j_id": neo4j_id},
+            },
+        )
+        logger.debug(f"Postgres: Queued session {neo4j_id}")
 
     # ------------------------------------------------------------------
     # Store message
@@ -353,33 +359,41 @@ class ChatHistoryService:
         timestamp: datetime,
         metadata: Optional[Dict[str, Any]],
     ) -> None:
-        try:
-            from infrastructure.database.models import Message as PgMessage
-            from infrastructure.database.repositories import MessageRepository, SessionRepository
-
-            pg_uuid = self._extract_uuid_from_session_id(session_id)
-            if not pg_uuid:
-                return
-
-            async with self._db_session() as session:
-                msg_repo = MessageRepository(session)
-                pg_message = PgMessage(
-                    session_id=pg_uuid,
-                    patient_id=patient_id,
-                    role=role,
-                    content=content,
-                    created_at=timestamp,
-                    response_id=message_id,
-                    extra_data=metadata or {}
-                )
-                await msg_repo.create(pg_message)
+        pg_uuid = self._extract_uuid_from_session_id(session_id)
+        if not pg_uuid:
+            return
 
-                sess_repo = SessionRepository(session)
-                await sess_repo.increment_message_count(pg_uuid)
+        await self._queue_message(pg_uuid, patient_id, role, content, message_id, timestamp, metadata)
+        logger.debug(f"Postgres: Queued {role} message in session {session_id}")
 
-            logger.debug(f"Postgres: Stored {role} message in session {session_id}")
-        except Exception as e:
-            logger.error(f"Postgres message write failed for session {session_id}: {e}")
+    async def _queue_message(
+        self,
+        pg_uuid: uuid.UUID,
+        patient_id: str,
+        role: str,
+        content: str,
+        response_id: str,
+        timestamp: datetime,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        # The row ID is fixed here and doubles as the idempotency key
+        row_id = str(uuid.uuid4())
+        return await submit_change(
+            self._outbox,
+            self._db_session,
+            MESSAGE_INSERT,
+            row_id,
+            {
+                "id": row_id,
+                "session_id": str(pg_uuid),
+                "patient_id": patient_id,
+                "role": role,
+                "content": content,
+                "created_at": timestamp.isoformat(),
+                "response_id": response_id,
+                "metadata": metadata or {},
+            },
+        )
 
     async def dual_write_messages(
         self,
@@ -390,7 +404,8 @@ class ChatHistoryService:
     ) -> None:
         """Write a user+assistant message pair to PostgreSQL.
 
-        Non-blocking: failures are logged but do not raise.
+        Non-blocking: the pair is queued on the outbox when one is
+        configured, and failures are logged but do not raise.
         Called by external callers (e.g. ConversationNodes) that need
         to persist messages without duplicating dual-write logic.
         """
@@ -401,29 +416,10 @@ class ChatHistoryService:
         if not pg_uuid:
             return
 
-        try:
-            from infrastructure.database.models import Message as PgMessage
-            from infrastructure.database.repositories import MessageRepository, SessionRepository
-
-            async with self._db_session() as session:
-                msg_repo = MessageRepository(session)
-                for role, content in [("user", user_msg), ("assistant", assistant_msg)]:
-                    pg_message = PgMessage(
-                        session_id=pg_uuid,
-                        patient_id=patient_id,
-                        role=role,
-                        content=content,
-                        response_id=f"msg:{uuid.uuid4()}",
-                    )
-                    await msg_repo.create(pg_message)
+        for role, content in [("user", user_msg), ("assistant", assistant_msg)]:
+            await self._queue_message(pg_uuid, patient_id, role, content, f"msg:{uuid.uuid4()}", datetime.now())
 
-                sess_repo = SessionRepository(session)
-                await sess_repo.increment_message_count(pg_uuid)
-                await sess_repo.increment_message_count(pg_uuid)
-
-            logger.debug(f"Postgres: Persisted message pair for session {session_id}")
-        except Exception as e:
-            logger.warning(f"Dual-write messages failed for session {session_id}: {e}")
+        logger.debug(f"Postgres: Queued message pair for session {session_id}")
 
     # ------------------------------------------------------------------
     # End session
@@ -437,20 +433,15 @@ class ChatHistoryService:
         )
 
         if self._has_postgres and dual_write_enabled("sessions"):
-            try:
-                from infrastructure.database.repositories import SessionRepository
-
-                pg_uuid = self._extract_uuid_from_session_id(session_id)
-                if pg_uuid:
-                    async with self._db_session() as session:
-                        repo = SessionRepository(session)
-                        pg_session = await repo.get_by_id(pg_uuid)
-                        if pg_session:
-                            pg_session.status = "ended"
-                            await repo.update(pg_session)
-                            logger.debug(f"Postgres: Ended session {session_id}")
-            except Exception as e:
-                logger.error(f"Postgres end_session failed for {session_id}: {e}")
+            pg_uuid = self._extract_uuid_from_session_id(session_id)
+            if pg_uuid:
+                await submit_change(
+                    self._outbox,
+                    self._db_session,
+                    SESSION_UPDATE,
+                    f"{pg_uuid}:status",
+                    {"id": str(pg_uuid), "status": "ended"},
+                )
 
         return success
 
@@ -463,17 +454,11 @@ class ChatHistoryService:
         success = await self.memory.delete_session(session_id)
 
         if self._has_postgres and dual_write_enabled("sessions"):
-            try:
-                from infrastructure.database.repositories import SessionRepository
-
-                pg_uuid = self._extract_uuid_from_session_id(session_id)
-                if pg_uuid:
-                    async with self._db_session() as session:
-                        repo = SessionRepository(session)
-                        await repo.delete_by_id(pg_uuid)
-                        logger.debug(f"Postgres: Deleted session {session_id}")
-            except Exception as e:
-                logger.error(f"Postgres delete failed for {session_id}: {e}")
+            pg_uuid = self._extract_uuid_from_session_id(session_id)
+            if pg_uuid:
+                await submit_change(
+                    self._outbox, self._db_session, SESSION_DELETE, str(pg_uuid), {"id": str(pg_uuid)}
+                )
 
         return success
 
@@ -485,22 +470,16 @@ class ChatHistoryService:
         """Update session title in PostgreSQL only."""
         if not self._has_postgres:
             return
-        try:
-            from infrastructure.database.repositories import SessionRepository
 
-            pg_uuid = self._extract_uuid_from_session_id(session_id)
-            if not pg_uuid:
-                return
-
-            async with self._db_session() as session:
-                repo = SessionRepository(session)
-                pg_session = await repo.get_by_id(pg_uuid)
-                if pg_session:
-                    pg_session.title = title
-                    await repo.update(pg_session)
-                    logger.debug(f"Postgres: Updated title for {session_id} to '{title}'")
-        except Exception as e:
-            logger.error(f"Postgres title update failed for {session_id}: {e}")
+        pg_uuid = self._extract_uuid_from_session_id(session_id)
+        if pg_uuid:
+            await submit_change(
+                self._outbox,
+                self._db_session,
+                SESSION_UPDATE,
+                f"{pg_uuid}:title",
+                {"id": str(pg_uuid), "title": title},
+            )
 
     # ------------------------------------------------------------------
     # Search sessions
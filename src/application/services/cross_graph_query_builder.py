@@ -9,14 +9,25 @@ Supports common query patterns:
 - Data entities → Medical concepts
 - Multi-hop traversals across SEMANTIC layer
 - Layer-filtered queries
+
+CrossGraphQueryBuilder owns a synchronous driver for scripts and CLI use.
+AsyncCrossGraphQueryBuilder runs the same queries on a shared AsyncDriver
+(typically the one owned by a Neo4jBackend) so async callers never block
+the event loop on Bolt I/O.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from neo4j import GraphDatabase
 import os
 
+from infrastructure.node_identity import (
+    MEDICAL_ENTITY_SEARCH_INDEX,
+    fulltext_prefix_query,
+    name_key,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,44 +40,43 @@ class QueryResult:
     record_count: int
 
 
-class CrossGraphQueryBuilder:
-    """Builds and executes cross-graph queries in Neo4j."""
-
-    def __init__(
-        self,
-        neo4j_uri: Optional[str] = None,
-        neo4j_user: Optional[str] = None,
-        neo4j_password: Optional[str] = None
-    ):
-        """Initialize with Neo4j connection."""
-        self.uri = neo4j_uri or os.getenv("NEO4J_URI", "bolt://localhost:7687")
-        if '\n' in self.uri:
-            self.uri = self.uri.split('\n')[-1].strip()
-
-        self.user = neo4j_user or os.getenv("NEO4J_USERNAME", "neo4j")
-        self.password = neo4j_password or os.getenv("NEO4J_PASSWORD", "")
-
-        logger.info(f"Connecting to Neo4j at {self.uri}")
-        self.driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
-
-    def __del__(self):
-        """Close Neo4j connection."""
-        if hasattr(self, 'driver'):
-            self.driver.close()
-
-    def find_tables_for_disease(self, disease_name: str) -> QueryResult:
-        """
-        Find all data tables containing information about a specific disease.
-
-        Args:
-            disease_name: Name of the disease (case-insensitive)
-
-        Returns:
-            QueryResult with tables linked to the disease
+class CrossGraphQueries:
+    """Cypher templates shared by the sync and async query builders.
+
+    Each ``_<name>_query`` method returns the query text and its parameters
+    for the public method of the same name. Case-insensitive matches go
+    through the ``name_lc`` range index and word-prefix search through the
+    ``medical_entity_search`` full-text index, so neither scans every
+    ``MedicalEntity``.
+    """
+
+    @staticmethod
+    def _match_medical_entities(
+        variable: str,
+        term: str,
+        params: Dict[str, Any],
+        field: Optional[str] = None
+    ) -> str:
+        """Build the clause that yields MedicalEntity nodes with words starting with those of ``term``.
+
+        See :func:`fulltext_prefix_query` for where this differs from
+        ``CONTAINS``. Adds ``search_query`` to ``params``. A term without words matches
+        every entity, as ``CONTAINS ''`` would.
         """
+        search_query = fulltext_prefix_query(term, field=field)
+        if not search_query:
+            return f"MATCH ({variable}:MedicalEntity)"
+        params["search_query"] = search_query
+        return (
+            f"CALL db.index.fulltext.queryNodes('{MEDICAL_ENTITY_SEARCH_INDEX}', $search_query) "
+            f"YIELD node AS {variable}"
+        )
+
+    def _find_tables_for_disease_query(self, disease_name: str) -> Tuple[str, Dict[str, Any]]:
+        """Build the Cypher and parameters for ``find_tables_for_disease``."""
         query = """
         MATCH (disease:MedicalEntity)
-        WHERE toLower(disease.name) = toLower($disease_name)
+        WHERE disease.name_lc = $disease_name_lc
           AND disease.type = 'Disease'
         OPTIONAL MATCH (disease)-[r:APPLICABLE_TO]->(table)
         WHERE r.layer = 'SEMANTIC' AND table:Table
@@ -81,31 +91,13 @@ class CrossGraphQueryBuilder:
                 linking_strategy: r.linking_strategy
             }) as tables
         """
+        return query, {"disease_name": disease_name, "disease_name_lc": name_key(disease_name)}
 
-        with self.driver.session() as session:
-            result = session.run(query, disease_name=disease_name)
-            records = [dict(record) for record in result]
-
-            return QueryResult(
-                query=query,
-                parameters={"disease_name": disease_name},
-                records=records,
-                record_count=len(records)
-            )
-
-    def find_medical_concepts_in_data(
+    def _find_medical_concepts_in_data_query(
         self,
         confidence_threshold: float = 0.75
-    ) -> QueryResult:
-        """
-        Find all medical concepts that are represented in the data catalog.
-
-        Args:
-            confidence_threshold: Minimum confidence for SEMANTIC relationships
-
-        Returns:
-            QueryResult with medical concepts and their data entities
-        """
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build the Cypher and parameters for ``find_medical_concepts_in_data``."""
         query = """
         MATCH (m:MedicalEntity)-[r:APPLICABLE_TO|RELATES_TO]->(d)
         WHERE r.layer = 'SEMANTIC' AND r.confidence >= $threshold
@@ -120,28 +112,10 @@ class CrossGraphQueryBuilder:
             d.description as data_description
         ORDER BY r.confidence DESC, m.type, m.name
         """
+        return query, {"threshold": confidence_threshold}
 
-        with self.driver.session() as session:
-            result = session.run(query, threshold=confidence_threshold)
-            records = [dict(record) for record in result]
-
-            return QueryResult(
-                query=query,
-                parameters={"threshold": confidence_threshold},
-                records=records,
-                record_count=len(records)
-            )
-
-    def find_treatments_for_disease(self, disease_name: str) -> QueryResult:
-        """
-        Find treatments for a specific disease and related data tables.
-
-        Args:
-            disease_name: Name of the disease
-
-        Returns:
-            QueryResult with treatments and data context
-        """
+    def _find_treatments_for_disease_query(self, disease_name: str) -> Tuple[str, Dict[str, Any]]:
+        """Build the Cypher and parameters for ``find_treatments_for_disease``."""
         query = """
         MATCH (disease:MedicalEntity {name: $disease_name})
         WHERE disease.type = 'Disease'
@@ -168,33 +142,14 @@ class CrossGraphQueryBuilder:
                 data_type: labels(data_entity)[0]
             }) as treatment_data
         """
+        return query, {"disease_name": disease_name}
 
-        with self.driver.session() as session:
-            result = session.run(query, disease_name=disease_name)
-            records = [dict(record) for record in result]
-
-            return QueryResult(
-                query=query,
-                parameters={"disease_name": disease_name},
-                records=records,
-                record_count=len(records)
-            )
-
-    def find_full_context_for_entity(
+    def _find_full_context_for_entity_query(
         self,
         entity_name: str,
         max_depth: int = 2
-    ) -> QueryResult:
-        """
-        Find full context around a medical entity (multi-hop traversal).
-
-        Args:
-            entity_name: Name of the medical entity
-            max_depth: Maximum relationship depth to traverse
-
-        Returns:
-            QueryResult with entity context
-        """
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build the Cypher and parameters for ``find_full_context_for_entity``."""
         query = f"""
         MATCH (entity:MedicalEntity {{name: $entity_name}})
         OPTIONAL MATCH path = (entity)-[*1..{max_depth}]-(related)
@@ -210,88 +165,52 @@ class CrossGraphQueryBuilder:
                 layer: [r in relationships(path) | r.layer]
             }}) as context
         """
+        return query, {"entity_name": entity_name, "max_depth": max_depth}
 
-        with self.driver.session() as session:
-            result = session.run(query, entity_name=entity_name)
-            records = [dict(record) for record in result]
-
-            return QueryResult(
-                query=query,
-                parameters={"entity_name": entity_name, "max_depth": max_depth},
-                records=records,
-                record_count=len(records)
-            )
-
-    def find_columns_for_medical_concept(
+    def _find_columns_for_medical_concept_query(
         self,
         concept_name: str
-    ) -> QueryResult:
-        """
-        Find data columns that represent a medical concept.
-
-        Args:
-            concept_name: Name of the medical concept
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build the Cypher and parameters for ``find_columns_for_medical_concept``."""
+        params = {"concept_name": concept_name}
+        match_concepts = self._match_medical_entities("concept", concept_name, params, field="name")
 
-        Returns:
-            QueryResult with columns and their tables
-        """
-        query = """
-        MATCH (concept:MedicalEntity)
-        WHERE toLower(concept.name) CONTAINS toLower($concept_name)
+        query = f"""
+        {match_concepts}
         OPTIONAL MATCH (concept)-[r:RELATES_TO]->(col:Column)
         WHERE r.layer = 'SEMANTIC'
         OPTIONAL MATCH (col)<-[:HAS_COLUMN]-(table:Table)
         RETURN
             concept.name as medical_concept,
             concept.type as concept_type,
-            collect(DISTINCT {
+            collect(DISTINCT {{
                 column_name: col.name,
                 column_type: col.data_type,
                 table_name: table.name,
                 domain: table.domain,
                 confidence: r.confidence
-            }) as columns
+            }}) as columns
         """
+        return query, params
 
-        with self.driver.session() as session:
-            result = session.run(query, concept_name=concept_name)
-            records = [dict(record) for record in result]
-
-            return QueryResult(
-                query=query,
-                parameters={"concept_name": concept_name},
-                records=records,
-                record_count=len(records)
-            )
-
-    def search_medical_entities(
+    def _search_medical_entities_query(
         self,
         search_term: str,
         entity_types: Optional[List[str]] = None
-    ) -> QueryResult:
-        """
-        Search for medical entities by name or description.
-
-        Args:
-            search_term: Term to search for (case-insensitive)
-            entity_types: Optional list of entity types to filter (e.g., ['Disease', 'Treatment'])
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build the Cypher and parameters for ``search_medical_entities``."""
+        params = {"search_term": search_term}
+        match_entities = self._match_medical_entities("m", search_term, params)
 
-        Returns:
-            QueryResult with matching entities
-        """
         # Build type filter
         type_filter = ""
-        params = {"search_term": search_term}
-
         if entity_types:
-            type_filter = "AND m.type IN $entity_types"
+            type_filter = "WHERE m.type IN $entity_types"
             params["entity_types"] = entity_types
 
         query = f"""
-        MATCH (m:MedicalEntity)
-        WHERE (toLower(m.name) CONTAINS toLower($search_term)
-           OR toLower(m.description) CONTAINS toLower($search_term))
-          {type_filter}
+        {match_entities}
+        {type_filter}
         RETURN
             m.name as name,
             m.type as type,
@@ -301,25 +220,10 @@ class CrossGraphQueryBuilder:
         ORDER BY m.name
         LIMIT 50
         """
+        return query, params
 
-        with self.driver.session() as session:
-            result = session.run(query, **params)
-            records = [dict(record) for record in result]
-
-            return QueryResult(
-                query=query,
-                parameters=params,
-                records=records,
-                record_count=len(records)
-            )
-
-    def get_cross_graph_statistics(self) -> QueryResult:
-        """
-        Get statistics about the unified graph.
-
-        Returns:
-            QueryResult with entity and relationship counts by type and layer
-        """
+    def _get_cross_graph_statistics_query(self) -> Tuple[str, Dict[str, Any]]:
+        """Build the Cypher and parameters for ``get_cross_graph_statistics``."""
         query = """
         // Medical entities
         MATCH (m:MedicalEntity)
@@ -345,35 +249,15 @@ class CrossGraphQueryBuilder:
             count(r2) as total_relationships,
             medical_count + data_count as total_entities
         """
+        return query, {}
 
-        with self.driver.session() as session:
-            result = session.run(query)
-            records = [dict(record) for record in result]
-
-            return QueryResult(
-                query=query,
-                parameters={},
-                records=records,
-                record_count=len(records)
-            )
-
-    def find_related_entities(
+    def _find_related_entities_query(
         self,
         entity_name: str,
         relationship_types: Optional[List[str]] = None,
         max_results: int = 20
-    ) -> QueryResult:
-        """
-        Find entities directly related to a given entity.
-
-        Args:
-            entity_name: Name of the entity
-            relationship_types: Optional list of relationship types to filter
-            max_results: Maximum number of results
-
-        Returns:
-            QueryResult with related entities
-        """
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build the Cypher and parameters for ``find_related_entities``."""
         # Build relationship filter
         rel_filter = ""
         params = {"entity_name": entity_name, "max_results": max_results}
@@ -397,17 +281,165 @@ class CrossGraphQueryBuilder:
         ORDER BY r.confidence DESC
         LIMIT $max_results
         """
+        return query, params
+
+
+
+class CrossGraphQueryBuilder(CrossGraphQueries):
+    """Builds and executes cross-graph queries in Neo4j."""
+
+    def __init__(
+        self,
+        neo4j_uri: Optional[str] = None,
+        neo4j_user: Optional[str] = None,
+        neo4j_password: Optional[str] = None
+    ):
+        """Initialize with Neo4j connection."""
+        self.uri = neo4j_uri or os.getenv("NEO4J_URI", "bolt://localhost:7687")
+        if '\n' in self.uri:
+            self.uri = self.uri.split('\n')[-1].strip()
 
+        self.user = neo4j_user or os.getenv("NEO4J_USERNAME", "neo4j")
+        self.password = neo4j_password or os.getenv("NEO4J_PASSWORD", "")
+
+        logger.info(f"Connecting to Neo4j at {self.uri}")
+        self.driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
+
+    def __del__(self):
+        """Close Neo4j connection."""
+        if hasattr(self, 'driver'):
+            self.driver.close()
+
+    def _execute(self, query: str, params: Dict[str, Any]) -> QueryResult:
+        """Run a query on the synchronous driver and collect its records."""
         with self.driver.session() as session:
             result = session.run(query, **params)
             records = [dict(record) for record in result]
 
-            return QueryResult(
-                query=query,
-                parameters=params,
-                records=records,
-                record_count=len(records)
-            )
+        return QueryResult(
+            query=query,
+            parameters=params,
+            records=records,
+            record_count=len(records)
+        )
+
+    def find_tables_for_disease(self, disease_name: str) -> QueryResult:
+        """
+        Find all data tables containing information about a specific disease.
+
+        Args:
+            disease_name: Name of the disease (case-insensitive)
+
+        Returns:
+            QueryResult with tables linked to the disease
+        """
+        return self._execute(*self._find_tables_for_disease_query(disease_name))
+
+    def find_medical_concepts_in_data(
+        self,
+        confidence_threshold: float = 0.75
+    ) -> QueryResult:
+        """
+        Find all medical concepts that are represented in the data catalog.
+
+        Args:
+            confidence_threshold: Minimum confidence for SEMANTIC relationships
+
+        Returns:
+            QueryResult with medical concepts and their data entities
+        """
+        return self._execute(*self._find_medical_concepts_in_data_query(confidence_threshold))
+
+    def find_treatments_for_disease(self, disease_name: str) -> QueryResult:
+        """
+        Find treatments for a specific disease and related data tables.
+
+        Args:
+            disease_name: Name of the disease
+
+        Returns:
+            QueryResult with treatments and data context
+        """
+        return self._execute(*self._find_treatments_for_disease_query(disease_name))
+
+    def find_full_context_for_entity(
+        self,
+        entity_name: str,
+        max_depth: int = 2
+    ) -> QueryResult:
+        """
+        Find full context around a medical entity (multi-hop traversal).
+
+        Args:
+            entity_name: Name of the medical entity
+            max_depth: Maximum relationship depth to traverse
+
+        Returns:
+            QueryResult with entity context
+        """
+        return self._execute(*self._find_full_context_for_entity_query(entity_name, max_depth))
+
+    def find_columns_for_medical_concept(
+        self,
+        concept_name: str
+    ) -> QueryResult:
+        """
+        Find data columns that represent a medical concept.
+
+        Args:
+            concept_name: Name of the medical concept
+
+        Returns:
+            QueryResult with columns and their tables
+        """
+        return self._execute(*self._find_columns_for_medical_concept_query(concept_name))
+
+    def search_medical_entities(
+        self,
+        search_term: str,
+        entity_types: Optional[List[str]] = None
+    ) -> QueryResult:
+        """
+        Search for medical entities by name or description.
+
+        Args:
+            search_term: Term to search for (case-insensitive)
+            entity_types: Optional list of entity types to filter (e.g., ['Disease', 'Treatment'])
+
+        Returns:
+            QueryResult with matching entities
+        """
+        return self._execute(*self._search_medical_entities_query(search_term, entity_types))
+
+    def get_cross_graph_statistics(self) -> QueryResult:
+        """
+        Get statistics about the unified graph.
+
+        Returns:
+            QueryResult with entity and relationship counts by type and layer
+        """
+        return self._execute(*self._get_cross_graph_statistics_query())
+
+    def find_related_entities(
+        self,
+        entity_name: str,
+        relationship_types: Optional[List[str]] = None,
+        max_results: int = 20
+    ) -> QueryResult:
+        """
+        Find entities directly related to a given entity.
+
+        Args:
+            entity_name: Name of the entity
+            relationship_types: Optional list of relationship types to filter
+            max_results: Maximum number of results
+
+        Returns:
+            QueryResult with related entities
+        """
+        return self._execute(
+            *self._find_related_entities_query(entity_name, relationship_types, max_results)
+        )
 
     def execute_custom_query(
         self,
@@ -424,15 +456,113 @@ class CrossGraphQueryBuilder:
         Returns:
             QueryResult with query results
         """
-        params = parameters or {}
+        return self._execute(query, parameters or {})
 
-        with self.driver.session() as session:
-            result = session.run(query, **params)
-            records = [dict(record) for record in result]
 
-            return QueryResult(
-                query=query,
-                parameters=params,
-                records=records,
-                record_count=len(records)
-            )
+class AsyncCrossGraphQueryBuilder(CrossGraphQueries):
+    """Async cross-graph queries on a shared Neo4j AsyncDriver.
+
+    The builder does not own a connection pool: it borrows ``driver`` or,
+    if only ``backend`` is given, the backend's lazily created driver.
+    """
+
+    def __init__(
+        self,
+        driver=None,
+        backend=None,
+        database: Optional[str] = None
+    ):
+        """
+        Initialize with an async driver or a backend that provides one.
+
+        Args:
+            driver: Shared neo4j AsyncDriver
+            backend: Neo4jBackend whose driver is used when ``driver`` is None
+            database: Database name (defaults to the backend's database)
+        """
+        if driver is None and backend is None:
+            raise ValueError("AsyncCrossGraphQueryBuilder requires a driver or a backend")
+        self._driver = driver
+        self._backend = backend
+        self.database = database or getattr(backend, "database", None)
+
+    async def _get_driver(self):
+        """Return the shared driver, resolving it from the backend on first use."""
+        if self._driver is None:
+            self._driver = await self._backend._get_driver()
+        return self._driver
+
+    async def _execute(self, query: str, params: Dict[str, Any]) -> QueryResult:
+        """Run a query on the shared async driver and collect its records."""
+        driver = await self._get_driver()
+        async with driver.session(database=self.database) as session:
+            result = await session.run(query, params)
+            records = [dict(record) async for record in result]
+
+        return QueryResult(
+            query=query,
+            parameters=params,
+            records=records,
+            record_count=len(records)
+        )
+
+    async def find_tables_for_disease(self, disease_name: str) -> QueryResult:
+        """Async variant of :meth:`CrossGraphQueryBuilder.find_tables_for_disease`."""
+        return await self._execute(*self._find_tables_for_disease_query(disease_name))
+
+    async def find_medical_concepts_in_data(
+        self,
+        confidence_threshold: float = 0.75
+    ) -> QueryResult:
+        """Async variant of :meth:`CrossGraphQueryBuilder.find_medical_concepts_in_data`."""
+        return await self._execute(*self._find_medical_concepts_in_data_query(confidence_threshold))
+
+    async def find_treatments_for_disease(self, disease_name: str) -> QueryResult:
+        """Async variant of :meth:`CrossGraphQueryBuilder.find_treatments_for_disease`."""
+        return await self._execute(*self._find_treatments_for_disease_query(disease_name))
+
+    async def find_full_context_for_entity(
+        self,
+        entity_name: str,
+        max_depth: int = 2
+    ) -> QueryResult:
+        """Async variant of :meth:`CrossGraphQueryBuilder.find_full_context_for_entity`."""
+        return await self._execute(*self._find_full_context_for_entity_query(entity_name, max_depth))
+
+    async def find_columns_for_medical_concept(
+        self,
+        concept_name: str
+    ) -> QueryResult:
+        """Async variant of :meth:`CrossGraphQueryBuilder.find_columns_for_medical_concept`."""
+        return await self._execute(*self._find_columns_for_medical_concept_query(concept_name))
+
+    async def search_medical_entities(
+        self,
+        search_term: str,
+        entity_types: Optional[List[str]] = None
+    ) -> QueryResult:
+        """Async variant of :meth:`CrossGraphQueryBuilder.search_medical_entities`."""
+        return await self._execute(*self._search_medical_entities_query(search_term, entity_types))
+
+    async def get_cross_graph_statistics(self) -> QueryResult:
+        """Async variant of :meth:`CrossGraphQueryBuilder.get_cross_graph_statistics`."""
+        return await self._execute(*self._get_cross_graph_statistics_query())
+
+    async def find_related_entities(
+        self,
+        entity_name: str,
+        relationship_types: Optional[List[str]] = None,
+        max_results: int = 20
+    ) -> QueryResult:
+        """Async variant of :meth:`CrossGraphQueryBuilder.find_related_entities`."""
+        return await self._execute(
+            *self._find_related_entities_query(entity_name, relationship_types, max_results)
+        )
+
+    async def execute_custom_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> QueryResult:
+        """Async variant of :meth:`CrossGraphQueryBuilder.execute_custom_query`."""
+        return await self._execute(query, parameters or {})
@@ -0,0 +1,89 @@
+"""Durable Crystallization Buffer.
+
+Keeps the entity mentions waiting for the next crystallization batch in a
+local SQLite file instead of only in process memory. ``CrystallizationService``
+appends every mention of an ``episode_added`` event in one transaction
+before acknowledging it, and removes mentions only once the batch holding
+them has been crystallized. Mentions still in the file when the process
+dies are replayed on the next start.
+
+Delivery is at least once: a crash after a batch reached Neo4j but before
+it was acknowledged crystallizes that batch again, which only adds to the
+observation counts of the entities involved.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List
+
+logger = logging.getLogger(__name__)
+
+# Key under which buffered mentions carry their sequence number
+SEQ_KEY = "buffer_seq"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mentions (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+class CrystallizationBuffer:
+    """Append-only log of pending entity mentions, stored in SQLite."""
+
+    def __init__(self, path: str = "data/crystallization_buffer.sqlite3"):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT count(*) FROM mentions").fetchone()[0]
+
+    def close(self) -> None:
+        self._db.close()
+
+    def append(self, mentions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Persist mentions in one transaction.
+
+        Returns:
+            Copies of the mentions carrying their sequence number under
+            ``SEQ_KEY``, to pass to :meth:`ack` once crystallized
+        """
+        now = time.time()
+        stored = []
+        with self._lock, self._db:
+            for mention in mentions:
+                cursor = self._db.execute(
+                    "INSERT INTO mentions (payload, created_at) VALUES (?, ?)",
+                    (json.dumps(mention, default=str), now),
+                )
+                stored.append({**mention, SEQ_KEY: cursor.lastrowid})
+        return stored
+
+    def pending(self) -> List[Dict[str, Any]]:
+        """Every unacknowledged mention, oldest first."""
+        with self._lock:
+            rows = self._db.execute("SELECT seq, payload FROM mentions ORDER BY seq").fetchall()
+        return [{**json.loads(payload), SEQ_KEY: seq} for seq, payload in rows]
+
+    def ack(self, mentions: Iterable[Dict[str, Any]]) -> int:
+        """Remove crystallized mentions; returns how many were removed."""
+        seqs = [(m[SEQ_KEY],) for m in mentions if isinstance(m, dict) and SEQ_KEY in m]
+        if not seqs:
+            return 0
+        with self._lock, self._db:
+            self._db.executemany("DELETE FROM mentions WHERE seq = ?", seqs)
+        return len(seqs)
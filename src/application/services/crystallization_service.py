@@ -16,17 +16,23 @@ Pipeline Flow:
 Supports both:
 - Event-driven: Real-time crystallization on episode_added
 - Batch processing: Periodic crystallization of accumulated entities
+
+With a CrystallizationBuffer, mentions waiting for a batch are also written
+to local disk and replayed on the next start, so a crash loses none of them.
+Each batch collapses repeated mentions of an entity (same normalized name and
+type) before resolving them, one batched resolver call per entity type.
 """
 
 import asyncio
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from enum import Enum
 
 from domain.event import KnowledgeEvent
 from domain.roles import Role
+from application.services.crystallization_buffer import CrystallizationBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +57,8 @@ class CrystallizationResult:
     errors: List[str] = field(default_factory=list)
     batch_id: str = ""
     timestamp: datetime = field(default_factory=datetime.utcnow)
+    entities_deduplicated: int = 0  # Repeated mentions collapsed before resolution
+    unresolved: List[Any] = field(default_factory=list)  # Mentions neither merged nor created
 
 
 @dataclass
@@ -90,6 +98,19 @@ class CrystallizedEntity:
     crystallized_at: datetime = field(default_factory=datetime.utcnow)
 
 
+@dataclass
+class _MentionGroup:
+    """Mentions of one entity (same normalized name and type) within a batch."""
+    name: str
+    entity_type: str
+    normalized_name: str
+    confidence: float
+    graphiti_id: Optional[str]
+    source_data: Dict[str, Any]
+    mentions: int = 1
+    sources: List[Any] = field(default_factory=list)  # Mentions as passed in
+
+
 @dataclass
 class CrystallizationConfig:
     """Configuration for crystallization pipeline."""
@@ -122,6 +143,7 @@ class CrystallizationService:
         event_bus: Any,
         graphiti_client: Optional[Any] = None,
         config: Optional[CrystallizationConfig] = None,
+        buffer: Optional[CrystallizationBuffer] = None,
     ):
         """
         Initialize crystallization service.
@@ -132,6 +154,8 @@ class CrystallizationService:
             event_bus: EventBus for event-driven processing
             graphiti_client: Graphiti client for querying FalkorDB
             config: Crystallization configuration
+            buffer: Durable store for pending mentions (in memory only if
+                not provided); mentions left in it are replayed
         """
         self.neo4j_backend = neo4j_backend
         self.entity_resolver = entity_resolver
@@ -141,10 +165,12 @@ class CrystallizationService:
 
         # State tracking
         self._last_crystallization: Optional[datetime] = None
-        self._pending_entities: List[Dict[str, Any]] = []
+        self._buffer = buffer
+        self._pending_entities: List[Dict[str, Any]] = buffer.pending() if buffer else []
         self._batch_counter = 0
         self._running = False
         self._scheduled_task: Optional[asyncio.Task] = None
+        self._replay_task: Optional[asyncio.Task] = None
 
         # Statistics
         self._stats = {
@@ -173,10 +199,24 @@ class CrystallizationService:
             self._scheduled_task = asyncio.create_task(self._periodic_crystallization())
             logger.info(f"Started periodic crystallization (every {self.config.batch_interval_minutes} min)")
 
+        # Crystallize mentions recovered from the buffer without delaying startup
+        if self._pending_entities:
+            logger.info(f"Replaying {len(self._pending_entities)} buffered entity mentions")
+            self._replay_task = asyncio.create_task(self._process_pending_batch())
+
     async def stop(self) -> None:
         """Stop the crystallization service."""
         self._running = False
 
+        if self._replay_task and not self._replay_task.done():
+            # Unfinished mentions stay buffered for the next start
+            self._replay_task.cancel()
+            try:
+                await self._replay_task
+            except asyncio.CancelledError:
+                pass
+        self._replay_task = None
+
         if self._scheduled_task:
             self._scheduled_task.cancel()
             try:
@@ -203,19 +243,33 @@ class CrystallizationService:
 
         logger.debug(f"Received episode_added with {len(entities)} entities")
 
-        if self.config.mode == CrystallizationMode.EVENT_DRIVEN:
+        if self.config.mode == CrystallizationMode.EVENT_DRIVEN and self._buffer is None:
             # Immediate crystallization
             await self.crystallize_entities(entities, source="event")
+            return
+
+        mentions = [
+            {
+                "name": entity_name,
+                "source_episode": episode_data.get("episode_id"),
+                "patient_id": episode_data.get("patient_id"),
+                "timestamp": datetime.utcnow(),
+            }
+            for entity_name in entities
+        ]
+        if self._buffer is not None:
+            # Durable before the event is acknowledged
+            mentions = await asyncio.to_thread(self._buffer.append, mentions)
+
+        if self.config.mode == CrystallizationMode.EVENT_DRIVEN:
+            # Immediate crystallization, retrying mentions an earlier event
+            # left unresolved
+            self._pending_entities.extend(mentions)
+            await self._process_pending_batch(source="event")
 
         else:
             # Queue for batch processing
-            for entity_name in entities:
-                self._pending_entities.append({
-                    "name": entity_name,
-                    "source_episode": episode_data.get("episode_id"),
-                    "patient_id": episode_data.get("patient_id"),
-                    "timestamp": datetime.utcnow(),
-                })
+            self._pending_entities.extend(mentions)
 
             # Check batch threshold in HYBRID mode
             if (
@@ -246,7 +300,7 @@ class CrystallizationService:
                 logger.error(f"Error in periodic crystallization: {e}", exc_info=True)
                 self._stats["errors"] += 1
 
-    async def _process_pending_batch(self) -> CrystallizationResult:
+    async def _process_pending_batch(self, source: str = "batch") -> CrystallizationResult:
         """Process accumulated pending entities."""
         if not self._pending_entities:
             return CrystallizationResult(
@@ -263,7 +317,32 @@ class CrystallizationService:
         entities_to_process = self._pending_entities.copy()
         self._pending_entities.clear()
 
-        return await self.crystallize_entities(entities_to_process, source="batch")
+        try:
+            result = await self.crystallize_entities(entities_to_process, source=source)
+        except (Exception, asyncio.CancelledError):
+            # Put the batch back in front of mentions queued meanwhile
+            self._pending_entities[:0] = entities_to_process
+            raise
+
+        await self._settle(entities_to_process, result)
+        return result
+
+    async def _settle(self, mentions: List[Any], result: CrystallizationResult) -> None:
+        """
+        Acknowledge crystallized mentions and re-queue the rest.
+
+        Mentions whose entity could not be merged or created (e.g. while
+        Neo4j is unreachable) stay in the buffer and go back in front of
+        the pending queue for the next batch.
+        """
+        if result.unresolved:
+            logger.warning(f"{len(result.unresolved)} mentions not crystallized, re-queued")
+            self._pending_entities[:0] = result.unresolved
+        if self._buffer is not None:
+            unresolved = {id(mention) for mention in result.unresolved}
+            await asyncio.to_thread(
+                self._buffer.ack, [m for m in mentions if id(m) not in unresolved]
+            )
 
     async def crystallize_entities(
         self,
@@ -293,7 +372,11 @@ class CrystallizationService:
 
         logger.info(f"Starting crystallization {batch_id}: {len(entities)} entities from {source}")
 
-        for entity_data in entities:
+        # Collapse repeated mentions so each distinct entity is resolved once
+        groups: Dict[Tuple[str, str], _MentionGroup] = {}
+        unresolved: List[Any] = []
+        for mention in entities:
+            entity_data = mention
             try:
                 # Normalize entity data
                 if isinstance(entity_data, str):
@@ -308,83 +391,75 @@ class CrystallizationService:
                     skipped += 1
                     continue
 
-                # Resolve against existing entities
-                match = await self.entity_resolver.find_existing_for_crystallization(
-                    name=name,
-                    entity_type=entity_type,
-                    layer="ANY",  # Check all layers
+                key = (
+                    self.entity_resolver.normalize_entity_type(entity_type),
+                    self.entity_resolver.normalize_entity_name(name),
                 )
-
-                if match.found:
-                    # Merge with existing entity
-                    merge_result = await self.entity_resolver.merge_for_crystallization(
-                        existing_id=match.entity_id,
-                        new_data={
-                            "confidence": confidence,
-                            "graphiti_entity_id": graphiti_id,
-                            "last_seen_in_episodic": datetime.utcnow().isoformat(),
-                        }
-                    )
-
-                    if merge_result.success:
-                        merged += 1
-                        self._stats["total_merged"] += 1
-
-                        # Check if eligible for promotion after merge
-                        is_promotion_eligible = (
-                            merge_result.observation_count >= self.config.perception_to_semantic_min_observations
-                            and confidence >= self.config.perception_to_semantic_min_confidence
-                        )
-
-                        if is_promotion_eligible:
-                            promotion_candidates += 1
-
-                        crystallized.append(CrystallizedEntity(
-                            neo4j_id=match.entity_id,
-                            graphiti_id=graphiti_id,
-                            name=name,
-                            entity_type=entity_type,
-                            layer=match.entity_data.get("layer", "PERCEPTION"),
-                            confidence=confidence,
-                            observation_count=merge_result.observation_count,
-                            is_new=False,
-                            promotion_eligible=is_promotion_eligible,
-                        ))
-                    else:
-                        errors.append(f"Failed to merge entity: {name}")
-
-                else:
-                    # Create new PERCEPTION entity
-                    new_entity = await self._create_perception_entity(
+                group = groups.get(key)
+                if group is None:
+                    groups[key] = _MentionGroup(
                         name=name,
                         entity_type=entity_type,
+                        normalized_name=key[1],
                         confidence=confidence,
                         graphiti_id=graphiti_id,
                         source_data=entity_data,
+                        sources=[mention],
                     )
-
-                    if new_entity:
-                        created += 1
-                        self._stats["total_crystallized"] += 1
-
-                        crystallized.append(CrystallizedEntity(
-                            neo4j_id=new_entity["id"],
-                            graphiti_id=graphiti_id,
-                            name=name,
-                            entity_type=entity_type,
-                            layer="PERCEPTION",
-                            confidence=confidence,
-                            observation_count=1,
-                            is_new=True,
-                            promotion_eligible=False,  # New entities start at 1 observation
-                        ))
-                    else:
-                        errors.append(f"Failed to create entity: {name}")
+                else:
+                    group.mentions += 1
+                    group.confidence = max(group.confidence, confidence)
+                    group.graphiti_id = group.graphiti_id or graphiti_id
+                    group.sources.append(mention)
 
             except Exception as e:
                 logger.error(f"Error crystallizing entity {entity_data}: {e}")
                 errors.append(f"Error processing {entity_data}: {str(e)}")
                 self._stats["errors"] += 1
+                unresolved.append(mention)
+
+        by_type: Dict[str, List[_MentionGroup]] = {}
+        for (normalized_type, _), group in groups.items():
+            by_type.setdefault(normalized_type, []).append(group)
+
+        for normalized_type, type_groups in by_type.items():
+            try:
+                # Resolve against existing entities, one call per type
+                matches = await self.entity_resolver.find_existing_for_crystallization_batch(
+                    names=[group.name for group in type_groups],
+                    entity_type=normalized_type,
+                    layer="ANY",  # Check all layers
+                )
+            except Exception as e:
+                logger.error(f"Error resolving {normalized_type} entities: {e}")
+                errors.extend(f"Error processing {group.name}: {str(e)}" for group in type_groups)
+                self._stats["errors"] += len(type_groups)
+                for group in type_groups:
+                    unresolved.extend(group.sources)
+                continue
+
+            for group in type_groups:
+                try:
+                    crystallized_entity = await self._crystallize_group(
+                        group, matches.get(group.normalized_name), errors
+                    )
+                except Exception as e:
+                    logger.error(f"Error crystallizing entity {group.source_data}: {e}")
+                    errors.append(f"Error processing {group.source_data}: {str(e)}")
+                    self._stats["errors"] += 1
+                    unresolved.extend(group.sources)
+                    continue
+
+                if crystallized_entity is None:
+                    unresolved.extend(group.sources)
+                    continue
+                crystallized.append(crystallized_entity)
+                if crystallized_entity.is_new:
+                    created += 1
+                else:
+                    merged += 1
+                if crystallized_entity.promotion_eligible:
+                    promotion_candidates += 1
 
         processing_time = (datetime.now() - start_time).total_seconds() * 1000
         self._last_crystallization = datetime.utcnow()
@@ -408,10 +483,13 @@ class CrystallizationService:
             processing_time_ms=processing_time,
             errors=errors,
             batch_id=batch_id,
+            entities_deduplicated=len(entities) - skipped - len(groups),
+            unresolved=unresolved,
         )
 
         logger.info(
             f"Crystallization {batch_id} complete: "
+            f"{len(groups)} distinct of {len(entities)} mentions, "
             f"{created} created, {merged} merged, {skipped} skipped, "
             f"{promotion_candidates} promotion candidates, "
             f"{len(errors)} errors, {processing_time:.1f}ms"
@@ -419,6 +497,91 @@ class CrystallizationService:
 
         return result
 
+    async def _crystallize_group(
+        self,
+        group: _MentionGroup,
+        match: Any,
+        errors: List[str],
+    ) -> Optional[CrystallizedEntity]:
+        """
+        Merge a group of mentions into its matched entity or create it.
+
+        Args:
+            group: Mentions of one entity
+            match: CrystallizationMatch from the batch resolution, if any
+            errors: Batch error list to append failures to
+
+        Returns:
+            The crystallized entity, or None on failure
+        """
+        name = group.name
+        confidence = group.confidence
+
+        if match is not None and match.found:
+            # Merge with existing entity
+            merge_result = await self.entity_resolver.merge_for_crystallization(
+                existing_id=match.entity_id,
+                new_data={
+                    "confidence": confidence,
+                    "graphiti_entity_id": group.graphiti_id,
+                    "last_seen_in_episodic": datetime.utcnow().isoformat(),
+                },
+                observations=group.mentions,
+            )
+
+            if not merge_result.success:
+                errors.append(f"Failed to merge entity: {name}")
+                return None
+
+            self._stats["total_merged"] += 1
+            observation_count = merge_result.observation_count
+            return CrystallizedEntity(
+                neo4j_id=match.entity_id,
+                graphiti_id=group.graphiti_id,
+                name=name,
+                entity_type=group.entity_type,
+                layer=match.entity_data.get("layer", "PERCEPTION"),
+                confidence=confidence,
+                observation_count=observation_count,
+                is_new=False,
+                promotion_eligible=self._is_promotion_eligible(observation_count, confidence),
+            )
+
+        # Create new PERCEPTION entity
+        new_entity = await self._create_perception_entity(
+            name=name,
+            entity_type=group.entity_type,
+            confidence=confidence,
+            graphiti_id=group.graphiti_id,
+            source_data=group.source_data,
+            observation_count=group.mentions,
+        )
+
+        if not new_entity:
+            errors.append(f"Failed to create entity: {name}")
+            return None
+
+        self._stats["total_crystallized"] += 1
+        return CrystallizedEntity(
+            neo4j_id=new_entity["id"],
+            graphiti_id=group.graphiti_id,
+            name=name,
+            entity_type=group.entity_type,
+            layer="PERCEPTION",
+            confidence=confidence,
+            observation_count=group.mentions,
+            is_new=True,
+            # A single mention never qualifies; repeated ones in one batch may
+            promotion_eligible=self._is_promotion_eligible(group.mentions, confidence),
+        )
+
+    def _is_promotion_eligible(self, observation_count: int, confidence: float) -> bool:
+        """Whether an entity qualifies for PERCEPTION → SEMANTIC promotion."""
+        return (
+            observation_count >= self.config.perception_to_semantic_min_observations
+            and confidence >= self.config.perception_to_semantic_min_confidence
+        )
+
     async def _create_perception_entity(
         self,
         name: str,
@@ -426,6 +589,7 @@ class CrystallizationService:
         confidence: float,
         graphiti_id: Optional[str],
         source_data: Dict[str, Any],
+        observation_count: int = 1,
     ) -> Optional[Dict[str, Any]]:
         """
         Create a new PERCEPTION layer entity in Neo4j.
@@ -436,6 +600,7 @@ class CrystallizationService:
             confidence: Initial confidence score
             graphiti_id: Optional Graphiti entity ID
             source_data: Additional source data
+            observation_count: Mentions the entity is created from
 
         Returns:
             Created entity dict or None on failure
@@ -451,7 +616,7 @@ class CrystallizationService:
             "entity_type": normalized_type,
             "dikw_layer": "PERCEPTION",
             "confidence": confidence,
-            "observation_count": 1,
+            "observation_count": observation_count,
             "first_observed": datetime.utcnow().isoformat(),
             "last_observed": datetime.utcnow().isoformat(),
             "source": "graphiti_episodic",
@@ -473,6 +638,9 @@ class CrystallizationService:
                 labels=labels,
             )
 
+            # Make the new entity matchable by the next lookups in this batch
+            self.entity_resolver.register_entity(entity_id, name, normalized_type, properties)
+
             logger.debug(f"Created PERCEPTION entity: {name} ({entity_id})")
             return properties
 
@@ -619,6 +787,7 @@ class CrystallizationService:
             "running": self._running,
             "last_crystallization": self._last_crystallization.isoformat() if self._last_crystallization else None,
             "pending_entities": len(self._pending_entities),
+            "durable_buffer": self._buffer is not None,
             "batch_counter": self._batch_counter,
             "total_crystallized": self._stats["total_crystallized"],
             "total_merged": self._stats["total_merged"],
@@ -3,12 +3,24 @@
 Detects and merges duplicate entities in the knowledge graph
 by case-insensitive exact name matching within the same type,
 plus cross-type detection via semantic normalization.
+
+Same-type detection streams ``(id, type, name_key)`` rows in a single scan
+ordered by type and key, so only the group being read is held in memory.
+The key is persisted on ``:Entity`` nodes as ``_dedup_key`` (indexed), which
+lets incremental runs check only entities that are new or renamed since the
+key was last recorded.  Keys of entities with duplicates are recorded only
+by the merge transaction that resolves them.
 """
 
+import asyncio
+import logging
 from collections import defaultdict
+from contextlib import AsyncExitStack
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, AsyncIterator, Callable, Optional
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -46,6 +58,9 @@ class MergeSummary:
     total_relationships_transferred: int = 0
     batch_id: str = ""
     details: list[dict[str, Any]] = field(default_factory=list)
+    # Merges already committed by an earlier run with the same batch_id
+    skipped: int = 0
+    failures: list[dict[str, Any]] = field(default_factory=list)
 
 
 @dataclass
@@ -79,118 +94,345 @@ RETURN count(n) AS dismissed
 UNDISMISS_ENTITIES_QUERY = """
 UNWIND $entity_ids AS eid
 MATCH (n {id: eid})
-REMOVE n._dedup_skip
+REMOVE n._dedup_skip, n._dedup_key
 RETURN count(n) AS undismissed
 """
 
-DETECT_DUPLICATES_QUERY = """
-MATCH (a), (b)
-WHERE a.type = b.type
-  AND a.type IS NOT NULL
-  AND toLower(trim(a.name)) = toLower(trim(b.name))
-  AND a.name IS NOT NULL
-  AND id(a) < id(b)
-  AND NOT coalesce(a._merged_into, '') <> ''
-  AND NOT coalesce(b._merged_into, '') <> ''
-  AND NOT coalesce(a._is_structural, false)
-  AND NOT coalesce(b._is_structural, false)
-  AND NOT coalesce(a._dedup_skip, false)
-  AND NOT coalesce(b._dedup_skip, false)
-WITH a, b,
-     size([(a)-[]-() | 1]) AS a_rels,
-     size([(b)-[]-() | 1]) AS b_rels
-RETURN a.id AS a_id, a.name AS a_name,
-       b.id AS b_id, b.name AS b_name,
-       a.type AS type,
-       a_rels, b_rels,
-       coalesce(a.confidence, 0.0) AS a_confidence,
-       coalesce(b.confidence, 0.0) AS b_confidence
-ORDER BY type, a.name
+# Normalized name; the type check keeps non-string names from raising
+NAME_KEY = "CASE WHEN n.name IS :: STRING THEN toLower(trim(n.name)) END"
+
+ENTITY_KEY_PROJECTION = f"""
+RETURN n.id AS id, n.name AS name, n.type AS type,
+       {NAME_KEY} AS name_key,
+       n._dedup_key AS stored_key,
+       size([(n)-[]-() | 1]) AS rel_count,
+       coalesce(n.confidence, 0.0) AS confidence
+"""
+
+STREAM_ENTITY_KEYS_QUERY = """
+MATCH (n)
+WHERE n.name IS :: STRING NOT NULL
+  AND n.type IS NOT NULL
+  AND NOT coalesce(n._merged_into, '') <> ''
+  AND NOT coalesce(n._is_structural, false)
+  AND NOT coalesce(n._dedup_skip, false)
+""" + ENTITY_KEY_PROJECTION + """
+ORDER BY type, name_key
+"""
+
+CHANGED_ENTITY_KEYS_QUERY = f"""
+MATCH (n:Entity)
+WHERE n.name IS :: STRING NOT NULL
+  AND n.type IS NOT NULL
+  AND (n._dedup_key IS NULL OR n._dedup_key <> {NAME_KEY})
+  AND NOT coalesce(n._merged_into, '') <> ''
+  AND NOT coalesce(n._is_structural, false)
+  AND NOT coalesce(n._dedup_skip, false)
+""" + ENTITY_KEY_PROJECTION
+
+MATCH_ENTITY_KEYS_QUERY = f"""
+UNWIND $keys AS key
+MATCH (n:Entity {{_dedup_key: key.name_key}})
+WHERE n.type = key.type
+  AND n._dedup_key = {NAME_KEY}
+  AND NOT coalesce(n._merged_into, '') <> ''
+  AND NOT coalesce(n._is_structural, false)
+  AND NOT coalesce(n._dedup_skip, false)
+""" + ENTITY_KEY_PROJECTION
+
+RECORD_ENTITY_KEYS_QUERY = """
+UNWIND $rows AS row
+MATCH (n:Entity {id: row.id})
+SET n._dedup_key = row.name_key
+RETURN count(n) AS recorded
 """
 
+CREATE_ENTITY_KEY_INDEX_QUERY = (
+    "CREATE INDEX idx_entity_dedup_key IF NOT EXISTS FOR (n:Entity) ON (n._dedup_key)"
+)
+
 TRANSFER_INCOMING_RELS_QUERY = """
-MATCH (source)-[r]->(loser:Entity {id: $loser_id})
-WHERE source.id <> $winner_id
-WITH source, r, type(r) AS rel_type
-MATCH (winner:Entity {id: $winner_id})
-WHERE NOT EXISTS {
-    MATCH (source)-[existing]->(winner)
-    WHERE type(existing) = rel_type
+UNWIND $merges AS m
+CALL {
+    WITH m
+    MATCH (source)-[r]->(loser:Entity {id: m.loser_id})
+    WHERE source.id <> m.winner_id
+    WITH source, r, type(r) AS rel_type
+    MATCH (winner:Entity {id: m.winner_id})
+    WHERE NOT EXISTS {
+        MATCH (source)-[existing]->(winner)
+        WHERE type(existing) = rel_type
+    }
+    CALL apoc.create.relationship(source, rel_type, properties(r), winner) YIELD rel
+    DELETE r
+    RETURN count(rel) AS transferred
 }
-CALL apoc.create.relationship(source, rel_type, properties(r), winner) YIELD rel
-DELETE r
-RETURN count(rel) AS transferred
+RETURN m.loser_id AS loser_id, transferred
 """
 
 TRANSFER_OUTGOING_RELS_QUERY = """
-MATCH (loser:Entity {id: $loser_id})-[r]->(target)
-WHERE target.id <> $winner_id
-WITH target, r, type(r) AS rel_type
-MATCH (winner:Entity {id: $winner_id})
-WHERE NOT EXISTS {
-    MATCH (winner)-[existing]->(target)
-    WHERE type(existing) = rel_type
+UNWIND $merges AS m
+CALL {
+    WITH m
+    MATCH (loser:Entity {id: m.loser_id})-[r]->(target)
+    WHERE target.id <> m.winner_id
+    WITH target, r, type(r) AS rel_type
+    MATCH (winner:Entity {id: m.winner_id})
+    WHERE NOT EXISTS {
+        MATCH (winner)-[existing]->(target)
+        WHERE type(existing) = rel_type
+    }
+    CALL apoc.create.relationship(winner, rel_type, properties(r), target) YIELD rel
+    DELETE r
+    RETURN count(rel) AS transferred
 }
-CALL apoc.create.relationship(winner, rel_type, properties(r), target) YIELD rel
-DELETE r
-RETURN count(rel) AS transferred
+RETURN m.loser_id AS loser_id, transferred
 """
 
-DELETE_REMAINING_RELS_QUERY = """
-MATCH (loser:Entity {id: $loser_id})-[r]-()
-DELETE r
-RETURN count(r) AS deleted
-"""
-
-MARK_MERGED_QUERY = """
-MATCH (loser:Entity {id: $loser_id})
-SET loser._merged_into = $winner_id,
+# Marks each loser, records the merge for resumption and the winner's key
+# for incremental detection, then deletes the loser with its remaining
+# (duplicate) relationships.  Losers whose winner no longer exists are left
+# untouched.
+FINALIZE_MERGES_QUERY = """
+UNWIND $merges AS m
+MATCH (loser:Entity {id: m.loser_id})
+MATCH (winner:Entity {id: m.winner_id})
+SET loser._merged_into = m.winner_id,
     loser._merged_date = datetime(),
-    loser._dedup_batch = $batch_id
-RETURN loser.id AS marked
+    loser._dedup_batch = $batch_id,
+    winner._dedup_key = CASE WHEN winner.name IS :: STRING THEN toLower(trim(winner.name)) END
+CREATE (:DedupMerge {
+    batch_id: $batch_id,
+    winner_id: m.winner_id,
+    loser_id: m.loser_id,
+    loser_name: loser.name,
+    entity_type: m.entity_type,
+    relationships_transferred: m.transferred,
+    merged_at: datetime()
+})
+WITH m, loser
+WHERE loser._merged_into IS NOT NULL
+DETACH DELETE loser
+RETURN m.loser_id AS loser_id
 """
 
-DELETE_LOSER_QUERY = """
-MATCH (loser:Entity {id: $loser_id})
-WHERE loser._merged_into IS NOT NULL
-DELETE loser
-RETURN count(loser) AS deleted
+COMPLETED_MERGES_QUERY = """
+MATCH (record:DedupMerge {batch_id: $batch_id})
+RETURN record.loser_id AS loser_id
 """
 
+CREATE_MERGE_RECORD_INDEX_QUERY = (
+    "CREATE INDEX idx_dedup_merge_batch IF NOT EXISTS FOR (m:DedupMerge) ON (m.batch_id)"
+)
+
 
 class DeduplicationService:
     """Batch entity deduplication for the knowledge graph."""
 
-    def __init__(self, driver):
+    def __init__(
+        self,
+        driver,
+        page_size: int = 5000,
+        merge_batch_size: int = 500,
+        merge_concurrency: int = 4,
+    ):
         """Initialize with a Neo4j async driver.
 
         Args:
             driver: Neo4j async driver instance.
+            page_size: Rows handled per batch while streaming detection
+                results (key lookups and key writes are batched by this).
+            merge_batch_size: Merges applied per write transaction.
+            merge_concurrency: Merge transactions allowed in flight at once.
         """
         self.driver = driver
-
-    async def detect_duplicates(self, database: str = "neo4j") -> list[DuplicatePair]:
+        self.page_size = page_size
+        self.merge_batch_size = merge_batch_size
+        self.merge_concurrency = merge_concurrency
+        self._key_index_ready = False
+        self._merge_index_ready = False
+
+    async def detect_duplicates(
+        self,
+        database: str = "neo4j",
+        incremental: bool = False,
+        record_keys: bool = False,
+    ) -> list[DuplicatePair]:
         """Detect case-insensitive exact name duplicates within the same type.
 
+        Args:
+            database: Neo4j database name.
+            incremental: Only check entities that are new or renamed since
+                their key was last recorded.
+            record_keys: Persist ``_dedup_key`` on checked entities without
+                duplicates so the next incremental run skips them; merged
+                winners get theirs from execute_merge().
+
         Returns:
             List of DuplicatePair objects.
         """
-        async with self.driver.session(database=database) as session:
-            result = await session.run(DETECT_DUPLICATES_QUERY)
-            pairs = []
-            async for record in result:
-                pairs.append(DuplicatePair(
-                    entity_a_id=record["a_id"],
-                    entity_a_name=record["a_name"],
-                    entity_b_id=record["b_id"],
-                    entity_b_name=record["b_name"],
-                    entity_type=record["type"],
-                    a_relationship_count=record["a_rels"],
-                    b_relationship_count=record["b_rels"],
-                    a_confidence=record["a_confidence"],
-                    b_confidence=record["b_confidence"],
-                ))
-            return pairs
+        return [
+            pair
+            async for pair in self.iter_duplicates(
+                database, incremental=incremental, record_keys=record_keys
+            )
+        ]
+
+    async def iter_duplicates(
+        self,
+        database: str = "neo4j",
+        incremental: bool = False,
+        record_keys: bool = False,
+    ) -> AsyncIterator[DuplicatePair]:
+        """Stream same-type duplicate pairs as they are found.
+
+        A full run reads every eligible node once, ordered by
+        ``(type, name_key)``, and pairs each row with the earlier rows of its
+        group; only the current group is kept in memory.  An incremental run
+        reads only ``:Entity`` nodes whose recorded key is missing or stale,
+        looks up previously recorded entities sharing their keys through the
+        ``_dedup_key`` index, and emits only pairs that involve a changed
+        entity.
+
+        With ``record_keys``, keys are persisted only for checked entities
+        that turned out to have no duplicate.  Entities in a pair keep a
+        missing or stale key until execute_merge() commits their merge, so a
+        run whose merge fails finds them again.
+
+        Args:
+            database: Neo4j database name.
+            incremental: Only check new or renamed entities.
+            record_keys: Persist ``_dedup_key`` on checked entities without duplicates.
+
+        Yields:
+            DuplicatePair objects.
+        """
+        async with self.driver.session(database=database) as read_session, \
+                self.driver.session(database=database) as write_session:
+            if record_keys or incremental:
+                await self._ensure_key_index(write_session)
+
+            pairs = (
+                self._iter_changed_duplicates(read_session, write_session, record_keys)
+                if incremental
+                else self._iter_all_duplicates(read_session, write_session, record_keys)
+            )
+            async for pair in pairs:
+                yield pair
+
+    async def _iter_all_duplicates(
+        self, read_session, write_session, record_keys: bool
+    ) -> AsyncIterator[DuplicatePair]:
+        """Pair rows of a full scan, which arrive grouped by key."""
+        group: list[dict[str, Any]] = []
+        result = await read_session.run(STREAM_ENTITY_KEYS_QUERY)
+        async for page in self._read_pages(result):
+            unique: list[dict[str, Any]] = []
+            for row in page:
+                if group and (group[0]["type"], group[0]["name_key"]) != (row["type"], row["name_key"]):
+                    if len(group) == 1:
+                        unique.append(group[0])
+                    group = []
+                for other in group:
+                    yield self._pair_from_rows(other, row)
+                group.append(row)
+
+            if record_keys:
+                await self._record_keys(write_session, unique)
+
+        if record_keys and len(group) == 1:
+            await self._record_keys(write_session, group)
+
+    async def _iter_changed_duplicates(
+        self, read_session, write_session, record_keys: bool
+    ) -> AsyncIterator[DuplicatePair]:
+        """Pair new or renamed entities with each other and with recorded ones."""
+        # (type, name_key) -> rows seen so far, flagged with whether they changed
+        groups: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
+        seen_ids: set[str] = set()
+        paired_ids: set[str] = set()
+
+        result = await read_session.run(CHANGED_ENTITY_KEYS_QUERY)
+        async for page in self._read_pages(result):
+            changed = [row for row in page if row["id"] not in seen_ids]
+            if not changed:
+                continue
+            # Previously recorded entities go first so they become entity A
+            changed_ids = {row["id"] for row in changed}
+            matches = await self._match_recorded_keys(write_session, changed)
+            rows = [
+                {**row, "changed": False}
+                for row in matches
+                if row["id"] not in seen_ids and row["id"] not in changed_ids
+            ] + [{**row, "changed": True} for row in changed]
+
+            for row in rows:
+                seen_ids.add(row["id"])
+                group = groups[(row["type"], row["name_key"])]
+                for other in group:
+                    if other["changed"] or row["changed"]:
+                        paired_ids.update((other["id"], row["id"]))
+                        yield self._pair_from_rows(other, row)
+                group.append(row)
+
+            if record_keys:
+                await self._record_keys(
+                    write_session, [row for row in changed if row["id"] not in paired_ids]
+                )
+
+    async def _record_keys(self, session, rows: list[dict[str, Any]]) -> None:
+        """Persist ``_dedup_key`` for rows whose stored key is missing or stale."""
+        stale = [
+            {"id": row["id"], "name_key": row["name_key"]}
+            for row in rows
+            if row.get("stored_key") != row["name_key"]
+        ]
+        if stale:
+            await session.run(RECORD_ENTITY_KEYS_QUERY, {"rows": stale})
+
+    async def _read_pages(self, result) -> AsyncIterator[list[dict[str, Any]]]:
+        """Split a streamed Neo4j result into lists of at most page_size rows."""
+        page: list[dict[str, Any]] = []
+        async for record in result:
+            page.append(record.data())
+            if len(page) >= self.page_size:
+                yield page
+                page = []
+        if page:
+            yield page
+
+    async def _match_recorded_keys(
+        self, session, rows: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Fetch entities whose recorded key matches one of the given rows."""
+        keys = list({
+            (row["type"], row["name_key"]): {"type": row["type"], "name_key": row["name_key"]}
+            for row in rows
+        }.values())
+        result = await session.run(MATCH_ENTITY_KEYS_QUERY, {"keys": keys})
+        return [record.data() async for record in result]
+
+    async def _ensure_key_index(self, session) -> None:
+        """Create the ``_dedup_key`` index once per service instance."""
+        if self._key_index_ready:
+            return
+        await session.run(CREATE_ENTITY_KEY_INDEX_QUERY)
+        self._key_index_ready = True
+
+    @staticmethod
+    def _pair_from_rows(a: dict[str, Any], b: dict[str, Any]) -> DuplicatePair:
+        """Build a DuplicatePair from two streamed entity rows."""
+        return DuplicatePair(
+            entity_a_id=a["id"],
+            entity_a_name=a["name"],
+            entity_b_id=b["id"],
+            entity_b_name=b["name"],
+            entity_type=a["type"],
+            a_relationship_count=a["rel_count"],
+            b_relationship_count=b["rel_count"],
+            a_confidence=a["confidence"],
+            b_confidence=b["confidence"],
+        )
 
     def create_merge_plan(self, pairs: list[DuplicatePair]) -> list[MergePlan]:
         """Create a merge plan selecting winner/loser for each pair.
@@ -247,61 +489,211 @@ class DeduplicationService:
         return plans
 
     async def execute_merge(
-        self, plan: list[MergePlan], database: str = "neo4j"
+        self,
+        plan: list[MergePlan],
+        database: str = "neo4j",
+        batch_id: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
     ) -> MergeSummary:
         """Execute the merge plan — transfer relationships and delete losers.
 
+        Merges are applied in UNWIND batches, each inside one write
+        transaction, so a failure never leaves a half-merged entity.
+        Batches sharing no entity (as winner or loser) run concurrently.
+        Every batch checkpoints its merges as ``:DedupMerge`` nodes under
+        ``batch_id`` in the same transaction; passing the ``batch_id`` of an
+        interrupted or partly failed run re-applies only the batches that
+        did not commit.
+
         Args:
             plan: List of MergePlan objects from create_merge_plan().
             database: Neo4j database name.
+            batch_id: ID of the run to resume; a new one is generated if omitted.
+            batch_size: Merges per transaction (defaults to merge_batch_size).
+            concurrency: Transactions in flight (defaults to merge_concurrency).
+            progress_callback: Called as ``(processed, total)`` after each
+                batch, committed or failed.
 
         Returns:
             MergeSummary with counts and details.
         """
-        batch_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        batch_id = batch_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        batch_size = batch_size or self.merge_batch_size
+        concurrency = concurrency or self.merge_concurrency
         summary = MergeSummary(batch_id=batch_id)
 
+        merges = self.resolve_merge_chains(plan)
         async with self.driver.session(database=database) as session:
-            for merge in plan:
-                params = {
-                    "winner_id": merge.winner_id,
-                    "loser_id": merge.loser_id,
-                    "batch_id": batch_id,
-                }
-                transferred = 0
-
-                # Transfer incoming relationships
-                result = await session.run(TRANSFER_INCOMING_RELS_QUERY, params)
-                record = await result.single()
-                if record:
-                    transferred += record["transferred"]
-
-                # Transfer outgoing relationships
-                result = await session.run(TRANSFER_OUTGOING_RELS_QUERY, params)
-                record = await result.single()
-                if record:
-                    transferred += record["transferred"]
-
-                # Delete remaining duplicate relationships
-                await session.run(DELETE_REMAINING_RELS_QUERY, params)
-
-                # Mark loser as merged
-                await session.run(MARK_MERGED_QUERY, params)
-
-                # Delete loser node
-                await session.run(DELETE_LOSER_QUERY, params)
-
+            await self._ensure_merge_index(session)
+            result = await session.run(COMPLETED_MERGES_QUERY, {"batch_id": batch_id})
+            completed_losers = {record["loser_id"] async for record in result}
+
+        pending = [merge for merge in merges if merge.loser_id not in completed_losers]
+        summary.skipped = len(merges) - len(pending)
+        total = len(merges)
+        completed = summary.skipped
+
+        # Batches touching the same entity must not run concurrently: one
+        # could move relationships onto a node the other is deleting.  Locks
+        # are taken in sorted order so batches cannot deadlock.
+        entity_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_batch(batch: list[MergePlan]) -> None:
+            nonlocal completed
+            entity_ids = sorted(
+                {merge.winner_id for merge in batch} | {merge.loser_id for merge in batch}
+            )
+            async with semaphore, AsyncExitStack() as stack:
+                for entity_id in entity_ids:
+                    await stack.enter_async_context(entity_locks[entity_id])
+                try:
+                    transferred, merged = await self._apply_merge_batch(
+                        batch, batch_id, database
+                    )
+                except Exception as e:
+                    logger.error(f"Merge batch of {len(batch)} failed (batch_id={batch_id}): {e}")
+                    summary.failures.append({
+                        "losers": [merge.loser_id for merge in batch],
+                        "error": str(e),
+                    })
+                    # Rolled back and not checkpointed; a resume retries it
+                    completed += len(batch)
+                    if progress_callback:
+                        progress_callback(completed, total)
+                    return
+
+            for merge in batch:
+                if merge.loser_id not in merged:
+                    continue
                 summary.total_merged += 1
-                summary.total_relationships_transferred += transferred
+                summary.total_relationships_transferred += transferred[merge.loser_id]
                 summary.details.append({
                     "winner": merge.winner_id,
                     "loser": merge.loser_id,
                     "type": merge.entity_type,
-                    "relationships_transferred": transferred,
+                    "relationships_transferred": transferred[merge.loser_id],
                 })
+            completed += len(batch)
+            if progress_callback:
+                progress_callback(completed, total)
 
+        await asyncio.gather(*(
+            run_batch(batch) for batch in self._pack_merge_batches(pending, batch_size)
+        ))
         return summary
 
+    @staticmethod
+    def resolve_merge_chains(plan: list[MergePlan]) -> list[MergePlan]:
+        """Point every loser at its final winner and drop redundant merges.
+
+        Pairwise plans for a group of three or more duplicates overlap: an
+        entity can lose in one plan and win in another, or lose twice.
+        Merges are resolved in plan order; each loser is merged once, into
+        the entity its winner ultimately merges into.
+
+        Returns:
+            Merge plans in which no winner is also a loser.
+        """
+        merged_into: dict[str, str] = {}
+
+        def root(entity_id: str) -> str:
+            while entity_id in merged_into:
+                entity_id = merged_into[entity_id]
+            return entity_id
+
+        accepted: dict[str, MergePlan] = {}
+        names: dict[str, str] = {}
+        for merge in plan:
+            names.setdefault(merge.winner_id, merge.winner_name)
+            if merge.loser_id in merged_into:
+                continue
+            winner_id = root(merge.winner_id)
+            if winner_id == merge.loser_id:
+                continue
+            merged_into[merge.loser_id] = winner_id
+            accepted[merge.loser_id] = merge
+
+        resolved = []
+        for loser_id, merge in accepted.items():
+            winner_id = root(loser_id)
+            resolved.append(MergePlan(
+                winner_id=winner_id,
+                winner_name=names.get(winner_id, merge.winner_name),
+                loser_id=loser_id,
+                loser_name=merge.loser_name,
+                entity_type=merge.entity_type,
+                rationale=merge.rationale,
+            ))
+        return resolved
+
+    @staticmethod
+    def _pack_merge_batches(
+        merges: list[MergePlan], batch_size: int
+    ) -> list[list[MergePlan]]:
+        """Pack merges into batches, keeping each winner's merges together.
+
+        A winner with more than ``batch_size`` losers gets batches of its
+        own; the entity locks in execute_merge() serialize them.
+        """
+        by_winner: dict[str, list[MergePlan]] = defaultdict(list)
+        for merge in merges:
+            by_winner[merge.winner_id].append(merge)
+
+        batches: list[list[MergePlan]] = []
+        current: list[MergePlan] = []
+        for group in by_winner.values():
+            if len(group) > batch_size:
+                for start in range(0, len(group), batch_size):
+                    batches.append(group[start:start + batch_size])
+                continue
+            if len(current) + len(group) > batch_size:
+                batches.append(current)
+                current = []
+            current.extend(group)
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _apply_merge_batch(
+        self, batch: list[MergePlan], batch_id: str, database: str
+    ) -> tuple[dict[str, int], set[str]]:
+        """Apply one batch of merges in a single write transaction.
+
+        Returns:
+            Relationships transferred per loser, and the losers deleted.
+        """
+        rows = [
+            {"winner_id": m.winner_id, "loser_id": m.loser_id, "entity_type": m.entity_type}
+            for m in batch
+        ]
+
+        async def work(tx):
+            # Managed transactions may be retried, so counts are rebuilt per attempt
+            transferred: dict[str, int] = defaultdict(int)
+            for query in (TRANSFER_INCOMING_RELS_QUERY, TRANSFER_OUTGOING_RELS_QUERY):
+                result = await tx.run(query, {"merges": rows})
+                async for record in result:
+                    transferred[record["loser_id"]] += record["transferred"]
+            result = await tx.run(FINALIZE_MERGES_QUERY, {
+                "merges": [{**row, "transferred": transferred[row["loser_id"]]} for row in rows],
+                "batch_id": batch_id,
+            })
+            merged = {record["loser_id"] async for record in result}
+            return transferred, merged
+
+        async with self.driver.session(database=database) as session:
+            return await session.execute_write(work)
+
+    async def _ensure_merge_index(self, session) -> None:
+        """Create the ``:DedupMerge(batch_id)`` index once per service instance."""
+        if self._merge_index_ready:
+            return
+        await session.run(CREATE_MERGE_RECORD_INDEX_QUERY)
+        self._merge_index_ready = True
+
     async def detect_cross_type_duplicates(
         self, database: str = "neo4j"
     ) -> list[CrossTypeDuplicateGroup]:
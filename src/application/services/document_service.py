@@ -7,14 +7,23 @@ embedding generation, storage, and quality assessment.
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
+import asyncio
 import os
 import hashlib
-import pickle
+from uuid import uuid4
 
 from application.services.markitdown_wrapper import MarkItDownWrapper
 from application.services.text_chunker import TextChunker, TextChunk
 from application.services.entity_extractor import EntityExtractor, ExtractedEntity
 from application.services.document_quality_service import DocumentQualityService
+from application.services.embedding_pipeline import (
+    EmbeddingCache,
+    EmbeddingPipeline,
+    HashEmbedder,
+    OpenAIEmbedder,
+)
+from application.services.vector_store import SegmentedVectorStore
+from application.services.dual_write_outbox import DOCUMENT_UPSERT, submit_change
 from domain.quality_models import DocumentQualityReport
 
 
@@ -45,9 +54,15 @@ class DocumentService:
         chunk_size: int = 1500,  # Larger for technical docs
         chunk_overlap: int = 300,
         faiss_index_path: str = "data/faiss_index",
+        vector_index_type: str = "flat",
         enable_quality_assessment: bool = True,
         pg_document_repo=None,
         db_session_factory=None,
+        embedder=None,
+        embedding_cache_path: Optional[str] = None,
+        embedding_batch_size: int = 128,
+        embedding_concurrency: int = 4,
+        outbox=None,
     ):
         """Initialize the document service.
 
@@ -55,10 +70,18 @@ class DocumentService:
             kg_backend: Knowledge graph backend for storing document metadata
             chunk_size: Target chunk size (larger for technical/medical docs)
             chunk_overlap: Overlap between chunks
-            faiss_index_path: Path to store FAISS index
+            faiss_index_path: Directory of the segmented vector store
+            vector_index_type: FAISS index built per segment (``flat``, ``ivf`` or ``hnsw``)
             enable_quality_assessment: Whether to run quality assessment during ingestion
             pg_document_repo: Optional PostgreSQL document repository for dual-write
             db_session_factory: Optional async context manager for PostgreSQL sessions
+            embedder: Embedding backend; OpenAI when ``OPENAI_API_KEY`` is set,
+                otherwise the offline ``HashEmbedder``
+            embedding_cache_path: SQLite file caching vectors by model and text hash
+            embedding_batch_size: Chunks sent per embedding request
+            embedding_concurrency: Embedding requests in flight at once
+            outbox: Optional DualWriteOutbox for the PostgreSQL dual-write;
+                without it the write is applied inline
         """
         self.kg_backend = kg_backend
         self.converter = MarkItDownWrapper()
@@ -68,20 +91,27 @@ class DocumentService:
         self.enable_quality_assessment = enable_quality_assessment
         self.pg_document_repo = pg_document_repo
         self._db_session = db_session_factory
+        self._outbox = outbox
 
         # Initialize quality service
         self.quality_service = DocumentQualityService()
 
-        # Initialize FAISS and embedding model
-        self._embedding_model = None
-        self._faiss_index = None
-        self._chunk_store = {}  # Map chunk_id -> chunk text
-
-        # Ensure data directory exists
-        os.makedirs(os.path.dirname(faiss_index_path) or "data", exist_ok=True)
+        # Initialize embedding pipeline and vector store
+        if embedder is None:
+            embedder = OpenAIEmbedder() if os.environ.get("OPENAI_API_KEY") else HashEmbedder()
+        cache_path = embedding_cache_path or os.path.join(
+            os.path.dirname(faiss_index_path) or "data", "embedding_cache.sqlite3"
+        )
+        self.embeddings = EmbeddingPipeline(
+            embedder,
+            cache=EmbeddingCache(cache_path),
+            batch_size=embedding_batch_size,
+            max_concurrency=embedding_concurrency,
+        )
+        self.vector_store = SegmentedVectorStore(faiss_index_path, index_type=vector_index_type)
 
-        # Load existing index if available
-        self._load_faiss_index()
+        # Import a pre-segment index/pickle pair if one is still around
+        self._import_legacy_index()
     
     async def ingest_document(
         self,
@@ -123,9 +153,9 @@ class DocumentService:
         )
         print(f"    Created {len(chunks)} chunks")
         
-        # 4. Generate embeddings and store in FAISS
+        # 4. Generate embeddings and store them, replacing any earlier version
         print("  → Generating embeddings...")
-        await self._embed_and_store_chunks(chunks)
+        await self._embed_and_store_chunks(chunks, doc_id, source_path=file_path)
         
         # 5. Extract entities from chunks
         print("  → Extracting entities...")
@@ -146,10 +176,7 @@ class DocumentService:
         if self.kg_backend:
             await self._store_in_graph(doc_id, source_name, file_path, chunks, all_entities, metadata)
 
-        # 8. Save FAISS index
-        self._save_faiss_index()
-
-        # 9. Run quality assessment
+        # 8. Run quality assessment
         quality_report = None
         if self.enable_quality_assessment:
             print("  → Assessing document quality...")
@@ -197,7 +224,7 @@ class DocumentService:
             quality_report=quality_report,
         )
 
-        # 10. Dual-write to PostgreSQL if enabled
+        # 9. Dual-write to PostgreSQL if enabled
         await self._dual_write_to_postgres(
             doc_id=doc_id,
             name=source_name,
@@ -225,7 +252,7 @@ class DocumentService:
         Returns:
             List of matching chunks with scores
         """
-        if self._faiss_index is None:
+        if not len(self.vector_store):
             return []
         
         # Embed the query
@@ -233,89 +260,56 @@ class DocumentService:
         if query_embedding is None:
             return []
         
-        import numpy as np
-        query_vector = np.array([query_embedding]).astype('float32')
-        
-        # Search FAISS
-        distances, indices = self._faiss_index.search(query_vector, top_k)
-        
-        results = []
-        for i, (distance, idx) in enumerate(zip(distances[0], indices[0])):
-            if idx >= 0 and idx < len(self._chunk_ids):
-                chunk_id = self._chunk_ids[idx]
-                results.append({
-                    "chunk_id": chunk_id,
-                    "text": self._chunk_store.get(chunk_id, ""),
-                    "score": float(1 / (1 + distance)),  # Convert distance to similarity
-                    "rank": i + 1
-                })
-        
-        return results
+        hits = await asyncio.to_thread(self.vector_store.search, query_embedding, top_k)
+        return [
+            {
+                "chunk_id": hit.chunk_id,
+                "text": hit.text,
+                "score": float(1 / (1 + hit.distance)),  # Convert distance to similarity
+                "rank": i + 1
+            }
+            for i, hit in enumerate(hits)
+        ]
+
+    async def delete_document_vectors(self, doc_id: str) -> int:
+        """Remove a document's chunks from the vector store.
+
+        Returns:
+            Number of chunks removed
+        """
+        return await asyncio.to_thread(self.vector_store.delete_document, doc_id)
     
-    async def _embed_and_store_chunks(self, chunks: List[TextChunk]) -> None:
-        """Generate embeddings for chunks and store in FAISS."""
-        import numpy as np
-        
-        embeddings = []
-        chunk_ids = []
-        
-        for chunk in chunks:
-            embedding = await self._get_embedding(chunk.text)
-            if embedding:
-                embeddings.append(embedding)
-                chunk_ids.append(chunk.id)
-                self._chunk_store[chunk.id] = chunk.text
-        
-        if not embeddings:
-            return
-        
-        # Initialize FAISS index if needed
-        if self._faiss_index is None:
-            import faiss
-            dimension = len(embeddings[0])
-            self._faiss_index = faiss.IndexFlatL2(dimension)
-            self._chunk_ids = []
-        
-        # Add to FAISS
-        vectors = np.array(embeddings).astype('float32')
-        self._faiss_index.add(vectors)
-        self._chunk_ids.extend(chunk_ids)
+    async def _embed_and_store_chunks(
+        self,
+        chunks: List[TextChunk],
+        doc_id: str,
+        source_path: Optional[str] = None
+    ) -> None:
+        """Generate embeddings for chunks and write them as one vector store segment.
+
+        Chunks stored earlier for ``doc_id`` or ``source_path`` are replaced.
+        """
+        stored = [chunk for chunk in chunks if chunk.text.strip()]
+        embeddings = await self.embeddings.embed([chunk.text for chunk in stored])
+
+        # Segment writes and merges touch SQLite and FAISS; keep them off the event loop
+        await asyncio.to_thread(
+            self.vector_store.add_document,
+            doc_id,
+            [chunk.id for chunk in stored],
+            [chunk.text for chunk in stored],
+            embeddings,
+            source=source_path,
+            metadata=[chunk.metadata for chunk in stored],
+        )
     
     async def _get_embedding(self, text: str) -> Optional[List[float]]:
-        """Get embedding for text using OpenAI."""
-        api_key = os.environ.get("OPENAI_API_KEY")
-        
-        if not api_key:
-            # Fallback: use simple hash-based pseudo-embedding
-            return self._simple_embedding(text)
-        
+        """Embed a single text (e.g. a search query) through the shared pipeline."""
         try:
-            import openai
-            client = openai.AsyncOpenAI(api_key=api_key)
-            
-            response = await client.embeddings.create(
-                model="text-embedding-3-small",
-                input=text[:8000]  # Truncate to avoid token limits
-            )
-            
-            return response.data[0].embedding
-            
+            return await self.embeddings.embed_one(text, use_cache=False)
         except Exception as e:
             print(f"Warning: Embedding failed: {e}")
-            return self._simple_embedding(text)
-    
-    def _simple_embedding(self, text: str, dim: int = 256) -> List[float]:
-        """Simple fallback embedding using hashing."""
-        import hashlib
-        
-        # Create a deterministic pseudo-embedding
-        hash_bytes = hashlib.sha256(text.encode()).digest()
-        # Extend hash to desired dimension
-        result = []
-        for i in range(dim):
-            idx = i % len(hash_bytes)
-            result.append((hash_bytes[idx] - 128) / 128.0)
-        return result
+            return None
     
     async def _store_in_graph(
         self,
@@ -326,75 +320,86 @@ class DocumentService:
         entities: List[ExtractedEntity],
         metadata: Dict[str, Any]
     ) -> None:
-        """Store document structure in Neo4j."""
-        # Store Document node
-        await self.kg_backend.add_entity(
-            doc_id,
-            {
+        """Store document structure in Neo4j.
+
+        Nodes and relationships are collected first and written through the
+        backend's bulk API, so a document costs a handful of round trips
+        instead of several per chunk and entity.
+        """
+        entity_rows: List[Dict[str, Any]] = [{
+            "id": doc_id,
+            "properties": {
                 "name": name,
                 "source_path": source_path,
                 "ingested_at": datetime.now().isoformat(),
                 "chunk_count": len(chunks),
                 **metadata
             },
-            labels=["Document"]
-        )
-        
-        # Store Chunk nodes and relationships
+            "labels": ["Document"],
+        }]
+        relationship_rows: List[Dict[str, Any]] = []
+
+        # Chunk nodes and relationships
         for chunk in chunks:
-            await self.kg_backend.add_entity(
-                chunk.id,
-                {
+            entity_rows.append({
+                "id": chunk.id,
+                "properties": {
                     "text": chunk.text[:500],  # Truncate for storage
                     "sequence": chunk.sequence,
                     "start_char": chunk.start_char,
                     "end_char": chunk.end_char
                 },
-                labels=["Chunk"]
-            )
-            
-            await self.kg_backend.add_relationship(
-                doc_id,
-                "HAS_CHUNK",
-                chunk.id,
-                {"sequence": chunk.sequence}
-            )
-        
-        # Store ExtractedEntity nodes
+                "labels": ["Chunk"],
+            })
+            relationship_rows.append({
+                "source_id": doc_id,
+                "type": "HAS_CHUNK",
+                "target_id": chunk.id,
+                "properties": {"sequence": chunk.sequence},
+            })
+
+        # ExtractedEntity nodes
         for entity in entities:
             entity_id = f"extracted:{entity.name.lower().replace(' ', '_')}"
-            
+
             # Sanitize entity type for Neo4j label (remove spaces, special chars)
             safe_type = entity.entity_type.replace(" ", "").replace("-", "_")
             safe_type = ''.join(c for c in safe_type if c.isalnum() or c == '_')
-            
-            await self.kg_backend.add_entity(
-                entity_id,
-                {
+
+            entity_rows.append({
+                "id": entity_id,
+                "properties": {
                     "name": entity.name,
                     "type": entity.entity_type,
                     "confidence": entity.confidence,
                     "context": entity.context
                 },
-                labels=["ExtractedEntity", safe_type] if safe_type else ["ExtractedEntity"]
-            )
-            
+                "labels": ["ExtractedEntity", safe_type] if safe_type else ["ExtractedEntity"],
+            })
+
             # Link chunk -> entity (MENTIONS)
-            await self.kg_backend.add_relationship(
-                entity.source_chunk_id,
-                "MENTIONS",
-                entity_id,
-                {"confidence": entity.confidence}
-            )
-            
+            relationship_rows.append({
+                "source_id": entity.source_chunk_id,
+                "type": "MENTIONS",
+                "target_id": entity_id,
+                "properties": {"confidence": entity.confidence},
+            })
+
             # Link to existing graph node if found
             if entity.linked_node_id:
-                await self.kg_backend.add_relationship(
-                    entity_id,
-                    "LINKS_TO",
-                    entity.linked_node_id,
-                    {"confidence": entity.confidence}
-                )
+                relationship_rows.append({
+                    "source_id": entity_id,
+                    "type": "LINKS_TO",
+                    "target_id": entity.linked_node_id,
+                    "properties": {"confidence": entity.confidence},
+                })
+
+        entity_stats = await self.kg_backend.add_entities_bulk(entity_rows)
+        rel_stats = await self.kg_backend.add_relationships_bulk(relationship_rows)
+        print(
+            f"    Wrote {entity_stats['rows']} nodes and {rel_stats['rows']} relationships "
+            f"in {len(entity_stats['batches']) + len(rel_stats['batches'])} batches"
+        )
 
     async def _store_quality_metrics(
         self,
@@ -466,91 +471,57 @@ class DocumentService:
             quality_report: Optional quality assessment report
 
         Returns:
-            True if successful, False otherwise
+            True if the change was queued (or written inline), False otherwise
         """
         from application.services.feature_flag_service import dual_write_enabled
 
         if not dual_write_enabled("documents"):
             return False
 
-        if self._db_session is None:
+        if self._outbox is None and self._db_session is None:
             return False
 
-        try:
-            from infrastructure.database.repositories import DocumentRepository
-            from infrastructure.database.models import (
-                Document as PgDocument,
-                DocumentQuality as PgDocumentQuality,
-            )
-            from uuid import uuid4
-
-            async with self._db_session() as session:
-                repo = DocumentRepository(session)
-
-                # Check if document already exists
-                existing = await repo.get_by_external_id(doc_id)
-                if existing:
-                    # Update existing document
-                    existing.filename = name
-                    existing.source_path = source_path
-                    existing.chunk_count = chunk_count
-                    existing.entity_count = entity_count
-                    existing.extra_data = metadata
-                    existing.status = "ingested"
-                    existing.ingested_at = datetime.now()
-                    await repo.update(existing)
-                    pg_doc = existing
-                    print(f"    📝 Updated PostgreSQL document: {doc_id}")
-                else:
-                    # Create new document
-                    pg_doc = PgDocument(
-                        id=uuid4(),
-                        external_id=doc_id,
-                        filename=name,
-                        source_path=source_path,
-                        category=metadata.get("category"),
-                        status="ingested",
-                        chunk_count=chunk_count,
-                        entity_count=entity_count,
-                        ingested_at=datetime.now(),
-                        extra_data=metadata,
-                    )
-                    pg_doc = await repo.create(pg_doc)
-                    print(f"    📝 Created PostgreSQL document: {doc_id}")
-
-                # Store quality report if available
-                if quality_report:
-                    quality_entry = PgDocumentQuality(
-                        id=uuid4(),
-                        document_id=pg_doc.id,
-                        overall_score=quality_report.overall_score,
-                        quality_level=quality_report.quality_level.value,
-                        context_precision=quality_report.contextual_relevancy.context_precision,
-                        context_recall=quality_report.contextual_relevancy.context_recall,
-                        context_f1=quality_report.contextual_relevancy.f1_score,
-                        topic_coverage=quality_report.context_sufficiency.topic_coverage,
-                        completeness=quality_report.context_sufficiency.completeness,
-                        facts_per_chunk=quality_report.information_density.unique_facts_per_chunk,
-                        redundancy_ratio=quality_report.information_density.redundancy_ratio,
-                        signal_to_noise=quality_report.information_density.signal_to_noise,
-                        heading_hierarchy_score=quality_report.structural_clarity.heading_hierarchy_score,
-                        section_coherence=quality_report.structural_clarity.section_coherence,
-                        entity_extraction_rate=quality_report.entity_density.entity_extraction_rate,
-                        entity_consistency=quality_report.entity_density.entity_consistency,
-                        boundary_coherence=quality_report.chunking_quality.boundary_coherence,
-                        retrieval_quality=quality_report.chunking_quality.retrieval_quality,
-                        recommendations=quality_report.recommendations[:5],
-                        assessed_at=quality_report.assessed_at,
-                    )
-                    session.add(quality_entry)
-                    print("    📊 Stored quality metrics in PostgreSQL")
-
-                await session.commit()
-                return True
-
-        except Exception as e:
-            print(f"    ⚠️ PostgreSQL dual-write failed: {e}")
-            return False
+        payload = {
+            "external_id": doc_id,
+            "filename": name,
+            "source_path": source_path,
+            "category": metadata.get("category"),
+            "status": "ingested",
+            "chunk_count": chunk_count,
+            "entity_count": entity_count,
+            "ingested_at": datetime.now().isoformat(),
+            "metadata": metadata,
+        }
+        if quality_report:
+            payload["quality"] = {
+                "id": str(uuid4()),
+                "overall_score": quality_report.overall_score,
+                "quality_level": quality_report.quality_level.value,
+                "context_precision": quality_report.contextual_relevancy.context_precision,
+                "context_recall": quality_report.contextual_relevancy.context_recall,
+                "context_f1": quality_report.contextual_relevancy.f1_score,
+                "topic_coverage": quality_report.context_sufficiency.topic_coverage,
+                "completeness": quality_report.context_sufficiency.completeness,
+                "facts_per_chunk": quality_report.information_density.unique_facts_per_chunk,
+                "redundancy_ratio": quality_report.information_density.redundancy_ratio,
+                "signal_to_noise": quality_report.information_density.signal_to_noise,
+                "heading_hierarchy_score": quality_report.structural_clarity.heading_hierarchy_score,
+                "section_coherence": quality_report.structural_clarity.section_coherence,
+                "entity_extraction_rate": quality_report.entity_density.entity_extraction_rate,
+                "entity_consistency": quality_report.entity_density.entity_consistency,
+                "boundary_coherence": quality_report.chunking_quality.boundary_coherence,
+                "retrieval_quality": quality_report.chunking_quality.retrieval_quality,
+                "recommendations": quality_report.recommendations[:5],
+                "assessed_at": quality_report.assessed_at.isoformat(),
+            }
+
+        # Upserted on external_id, so a replay updates rather than duplicates
+        queued = await submit_change(self._outbox, self._db_session, DOCUMENT_UPSERT, doc_id, payload)
+        if queued:
+            print(f"    📝 Queued PostgreSQL document: {doc_id}")
+        else:
+            print(f"    ⚠️ PostgreSQL dual-write failed: {doc_id}")
+        return queued
 
     async def get_document_quality(self, doc_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve quality metrics for a document.
@@ -642,39 +613,14 @@ class DocumentService:
             print(f"Error reassessing document quality: {e}")
             return None
 
-    def _load_faiss_index(self) -> None:
-        """Load FAISS index from disk."""
+    def _import_legacy_index(self) -> None:
+        """Move a legacy ``{path}.index``/``{path}.meta`` pair into the vector store."""
         index_file = f"{self.faiss_index_path}.index"
         meta_file = f"{self.faiss_index_path}.meta"
-        
+
         if os.path.exists(index_file) and os.path.exists(meta_file):
             try:
-                import faiss
-                self._faiss_index = faiss.read_index(index_file)
-                with open(meta_file, 'rb') as f:
-                    data = pickle.load(f)
-                    self._chunk_ids = data.get('chunk_ids', [])
-                    self._chunk_store = data.get('chunk_store', {})
-                print(f"📂 Loaded FAISS index with {len(self._chunk_ids)} chunks")
+                imported = self.vector_store.import_legacy(index_file, meta_file)
+                print(f"📂 Imported {imported} chunks from legacy FAISS index")
             except Exception as e:
-                print(f"Warning: Could not load FAISS index: {e}")
-    
-    def _save_faiss_index(self) -> None:
-        """Save FAISS index to disk."""
-        if self._faiss_index is None:
-            return
-        
-        try:
-            import faiss
-            index_file = f"{self.faiss_index_path}.index"
-            meta_file = f"{self.faiss_index_path}.meta"
-            
-            faiss.write_index(self._faiss_index, index_file)
-            with open(meta_file, 'wb') as f:
-                pickle.dump({
-                    'chunk_ids': self._chunk_ids,
-                    'chunk_store': self._chunk_store
-                }, f)
-            print(f"💾 Saved FAISS index with {len(self._chunk_ids)} chunks")
-        except Exception as e:
-            print(f"Warning: Could not save FAISS index: {e}")
+                print(f"Warning: Could not import legacy FAISS index: {e}")
@@ -1,14 +1,22 @@
 """Document Tracking Service.
 
 Tracks PDF document status for ingestion management.
-Stores tracking data in a JSON file for simplicity.
+Records are kept in a local SQLite database so status changes update a
+single row. Directory scans compare each PDF's (mtime, size) fingerprint
+with the stored one and only write new, modified or removed files; every
+such change is stamped with an increasing sequence number that
+``changed_since`` uses as a cursor.
 """
 
 import json
 import hashlib
-from dataclasses import dataclass, asdict
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, asdict, fields
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from datetime import datetime
 import logging
 
@@ -45,39 +53,128 @@ class DocumentRecord:
         return cls(**data)
 
 
+RECORD_FIELDS = [f.name for f in fields(DocumentRecord)]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id TEXT PRIMARY KEY,
+    filename TEXT NOT NULL,
+    path TEXT NOT NULL,
+    category TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'not_started',
+    ingested_at TEXT,
+    entity_count INTEGER NOT NULL DEFAULT 0,
+    relationship_count INTEGER NOT NULL DEFAULT 0,
+    error_message TEXT,
+    markdown_path TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    quality_score REAL,
+    quality_level TEXT,
+    quality_assessed_at TEXT,
+    mtime_ns INTEGER,
+    change_seq INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_documents_status ON documents (status);
+CREATE INDEX IF NOT EXISTS idx_documents_category ON documents (category);
+CREATE INDEX IF NOT EXISTS idx_documents_filename ON documents (filename);
+CREATE INDEX IF NOT EXISTS idx_documents_change_seq ON documents (change_seq);
+CREATE TABLE IF NOT EXISTS cursors (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# Sequence counter for changed_since, kept in the cursors table
+_CHANGE_SEQ = "__change_seq__"
+
+
 class DocumentTracker:
-    """Tracks document ingestion status using a JSON file."""
+    """Tracks document ingestion status in an indexed SQLite store."""
 
     def __init__(
         self,
-        tracking_file: Path = Path("data/document_tracking.json"),
+        tracking_file: Path = Path("data/document_tracking.sqlite3"),
         pdf_directory: Path = Path("PDFs"),
-        markdown_directory: Path = Path("markdown_output")
+        markdown_directory: Path = Path("markdown_output"),
+        scan_interval: float = 5.0,
     ):
-        self.tracking_file = tracking_file
+        """Initialize the tracker.
+
+        Args:
+            tracking_file: SQLite database. A legacy ``.json`` path is accepted;
+                the database is then created next to it and the JSON imported once.
+            pdf_directory: Root of the tracked PDFs
+            markdown_directory: Where converted Markdown is written
+            scan_interval: Seconds during which read methods reuse the last scan
+        """
+        tracking_file = Path(tracking_file)
+        self.legacy_file = tracking_file.with_suffix(".json")
+        self.tracking_file = tracking_file.with_suffix(".sqlite3") if tracking_file.suffix == ".json" else tracking_file
         self.pdf_directory = pdf_directory
         self.markdown_directory = markdown_directory
-        self._ensure_tracking_file()
-
-    def _ensure_tracking_file(self):
-        """Ensure tracking file exists."""
-        if not self.tracking_file.exists():
-            self.tracking_file.parent.mkdir(parents=True, exist_ok=True)
-            self._save({})
-            logger.info(f"Created tracking file: {self.tracking_file}")
-
-    def _load(self) -> Dict[str, dict]:
-        """Load tracking data from file."""
+        self.scan_interval = scan_interval
+        self._last_scan: Optional[float] = None
+        self._lock = threading.Lock()
+        self._db = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating it (and importing legacy JSON) if needed."""
+        self.tracking_file.parent.mkdir(parents=True, exist_ok=True)
+        created = not self.tracking_file.exists()
+        db = sqlite3.connect(self.tracking_file, check_same_thread=False)
+        db.row_factory = sqlite3.Row
+        db.execute("PRAGMA journal_mode=WAL")
+        db.executescript(_SCHEMA)
+        if created:
+            logger.info(f"Created tracking database: {self.tracking_file}")
+            if self.legacy_file.exists():
+                self._import_legacy(db)
+        return db
+
+    def _import_legacy(self, db: sqlite3.Connection):
+        """Import records from the JSON file used by earlier versions."""
         try:
-            with open(self.tracking_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {}
-
-    def _save(self, data: Dict[str, dict]):
-        """Save tracking data to file."""
-        with open(self.tracking_file, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+            with open(self.legacy_file, 'r') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Could not import {self.legacy_file}: {e}")
+            return
+        with db:
+            for seq, record_data in enumerate(data.values(), start=1):
+                record = DocumentRecord.from_dict(record_data)
+                db.execute(
+                    f"INSERT OR REPLACE INTO documents ({', '.join(RECORD_FIELDS)}, change_seq) "
+                    f"VALUES ({', '.join('?' * len(RECORD_FIELDS))}, ?)",
+                    [*self._values(record), seq],
+                )
+            db.execute(
+                "INSERT OR REPLACE INTO cursors (name, value) VALUES (?, ?)", (_CHANGE_SEQ, len(data))
+            )
+        logger.info(f"Imported {len(data)} records from {self.legacy_file}")
+
+    def close(self):
+        self._db.close()
+
+    @staticmethod
+    def _values(record: DocumentRecord) -> list:
+        return [getattr(record, name) for name in RECORD_FIELDS]
+
+    @staticmethod
+    def _to_record(row: sqlite3.Row) -> DocumentRecord:
+        return DocumentRecord(**{name: row[name] for name in RECORD_FIELDS})
+
+    def _next_seq(self) -> int:
+        """Allocate the next change sequence number (call inside a transaction)."""
+        self._db.execute(
+            "INSERT INTO cursors (name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+            (_CHANGE_SEQ,),
+        )
+        return self._db.execute(
+            "SELECT value FROM cursors WHERE name = ?", (_CHANGE_SEQ,)
+        ).fetchone()[0]
 
     def _generate_id(self, path: Path) -> str:
         """Generate a unique ID for a document based on path."""
@@ -91,116 +188,210 @@ class DocumentTracker:
             return str(relative.parent)
         return "general"
 
-    def _get_markdown_path(self, pdf_path: Path) -> Optional[str]:
+    def _get_markdown_path(self, pdf_path: Path, markdown_stems: Optional[Set[str]] = None) -> Optional[str]:
         """Get the corresponding markdown file path if it exists."""
         md_path = self.markdown_directory / f"{pdf_path.stem}.md"
-        if md_path.exists():
-            return str(md_path)
-        return None
+        exists = pdf_path.stem in markdown_stems if markdown_stems is not None else md_path.exists()
+        return str(md_path) if exists else None
+
+    def _markdown_stems(self) -> Set[str]:
+        """List the converted Markdown files once per scan."""
+        if not self.markdown_directory.exists():
+            return set()
+        with os.scandir(self.markdown_directory) as entries:
+            return {entry.name[:-3] for entry in entries if entry.name.endswith(".md")}
+
+    def _walk_pdfs(self, directory: Path) -> Iterator[Tuple[Path, os.stat_result]]:
+        """Yield every PDF under ``directory`` with its stat result."""
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._walk_pdfs(Path(entry.path))
+                elif entry.name.endswith(".pdf") and entry.is_file():
+                    yield Path(entry.path), entry.stat()
 
     def scan_pdf_directory(self) -> List[DocumentRecord]:
-        """Scan PDF directory and sync with tracking data."""
+        """Sync the store with the PDF directory and return all records.
+
+        Only new files, files whose (mtime, size) fingerprint changed and
+        removed files are written. A modified file is reset to ``not_started``
+        so it is ingested again.
+        """
+        self.refresh(force=True)
+        return self._query("SELECT * FROM documents ORDER BY filename")
+
+    def refresh(self, force: bool = False) -> int:
+        """Rescan the PDF directory unless it was scanned within ``scan_interval``.
+
+        Returns:
+            Number of records added, modified or removed
+        """
+        if (
+            not force
+            and self._last_scan is not None
+            and time.monotonic() - self._last_scan < self.scan_interval
+        ):
+            return 0
         if not self.pdf_directory.exists():
             logger.warning(f"PDF directory not found: {self.pdf_directory}")
-            return []
-
-        tracking_data = self._load()
-        documents = []
-        found_ids = set()
-
-        # Find all PDFs
-        for pdf_path in self.pdf_directory.rglob("*.pdf"):
-            doc_id = self._generate_id(pdf_path)
-            found_ids.add(doc_id)
-
-            if doc_id in tracking_data:
-                # Update existing record with current file info
-                record = DocumentRecord.from_dict(tracking_data[doc_id])
-                record.size_bytes = pdf_path.stat().st_size
-                record.markdown_path = self._get_markdown_path(pdf_path)
-            else:
-                # Create new record
-                record = DocumentRecord(
-                    id=doc_id,
-                    filename=pdf_path.name,
-                    path=str(pdf_path),
-                    category=self._get_category(pdf_path),
-                    size_bytes=pdf_path.stat().st_size,
-                    markdown_path=self._get_markdown_path(pdf_path),
-                    created_at=datetime.now().isoformat()
-                )
-                tracking_data[doc_id] = record.to_dict()
-
-            documents.append(record)
-
-        # Remove tracking entries for deleted files
-        deleted_ids = set(tracking_data.keys()) - found_ids
-        for doc_id in deleted_ids:
-            del tracking_data[doc_id]
-            logger.info(f"Removed tracking for deleted file: {doc_id}")
-
-        # Save updated tracking data
-        self._save(tracking_data)
-
-        return sorted(documents, key=lambda d: d.filename)
+            return 0
+
+        with self._lock:
+            known = {
+                row["id"]: (row["mtime_ns"], row["size_bytes"], row["markdown_path"])
+                for row in self._db.execute("SELECT id, mtime_ns, size_bytes, markdown_path FROM documents")
+            }
+            markdown_stems = self._markdown_stems()
+            now = datetime.now().isoformat()
+            changes = 0
+
+            with self._db:
+                found_ids = set()
+                for pdf_path, stat in self._walk_pdfs(self.pdf_directory):
+                    doc_id = self._generate_id(pdf_path)
+                    found_ids.add(doc_id)
+                    markdown_path = self._get_markdown_path(pdf_path, markdown_stems)
+                    previous = known.get(doc_id)
+
+                    if previous is None:
+                        record = DocumentRecord(
+                            id=doc_id,
+                            filename=pdf_path.name,
+                            path=str(pdf_path),
+                            category=self._get_category(pdf_path),
+                            size_bytes=stat.st_size,
+                            markdown_path=markdown_path,
+                            created_at=now
+                        )
+                        self._db.execute(
+                            f"INSERT INTO documents ({', '.join(RECORD_FIELDS)}, mtime_ns, change_seq) "
+                            f"VALUES ({', '.join('?' * len(RECORD_FIELDS))}, ?, ?)",
+                            [*self._values(record), stat.st_mtime_ns, self._next_seq()],
+                        )
+                        changes += 1
+                    elif previous[:2] != (stat.st_mtime_ns, stat.st_size):
+                        # Records imported from JSON have no fingerprint yet; adopt it silently
+                        modified = previous[0] is not None
+                        self._db.execute(
+                            "UPDATE documents SET size_bytes = ?, mtime_ns = ?, markdown_path = ?"
+                            + (", status = 'not_started', error_message = NULL, updated_at = ?, change_seq = ?"
+                               if modified else "")
+                            + " WHERE id = ?",
+                            [stat.st_size, stat.st_mtime_ns, markdown_path,
+                             *((now, self._next_seq()) if modified else ()), doc_id],
+                        )
+                        changes += modified
+                    elif previous[2] != markdown_path:
+                        self._db.execute(
+                            "UPDATE documents SET markdown_path = ? WHERE id = ?", (markdown_path, doc_id)
+                        )
+
+                # Remove tracking entries for deleted files
+                deleted_ids = set(known) - found_ids
+                for doc_id in deleted_ids:
+                    self._db.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
+                    logger.info(f"Removed tracking for deleted file: {doc_id}")
+                changes += len(deleted_ids)
+
+            self._last_scan = time.monotonic()
+        return changes
+
+    def _query(self, sql: str, params=()) -> List[DocumentRecord]:
+        with self._lock:
+            return [self._to_record(row) for row in self._db.execute(sql, params)]
+
+    def changed_since(self, cursor: int = 0) -> Tuple[List[DocumentRecord], int]:
+        """Return documents added or modified after ``cursor``, and the new cursor.
+
+        Pass 0 to get every document. Status updates do not advance a
+        document's position; only a new or changed PDF file does.
+        """
+        self.refresh()
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT * FROM documents WHERE change_seq > ? ORDER BY change_seq", (cursor,)
+            ).fetchall()
+            latest = self._db.execute(
+                "SELECT value FROM cursors WHERE name = ?", (_CHANGE_SEQ,)
+            ).fetchone()
+        return [self._to_record(row) for row in rows], latest[0] if latest else 0
+
+    def get_cursor(self, name: str) -> int:
+        """Return a cursor saved with ``save_cursor`` (0 if never saved)."""
+        with self._lock:
+            row = self._db.execute("SELECT value FROM cursors WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else 0
+
+    def save_cursor(self, name: str, cursor: int):
+        """Persist a consumer's ``changed_since`` position."""
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO cursors (name, value) VALUES (?, ?)", (name, cursor)
+            )
 
     def get_document(self, doc_id: str) -> Optional[DocumentRecord]:
         """Get a specific document by ID."""
-        tracking_data = self._load()
-        if doc_id in tracking_data:
-            return DocumentRecord.from_dict(tracking_data[doc_id])
-        return None
+        records = self._query("SELECT * FROM documents WHERE id = ?", (doc_id,))
+        return records[0] if records else None
 
     def get_document_by_filename(self, filename: str) -> Optional[DocumentRecord]:
         """Get a document by filename."""
-        tracking_data = self._load()
-        for record_data in tracking_data.values():
-            if record_data.get("filename") == filename:
-                return DocumentRecord.from_dict(record_data)
-        return None
+        records = self._query("SELECT * FROM documents WHERE filename = ? LIMIT 1", (filename,))
+        return records[0] if records else None
 
     def update_document(self, doc_id: str, **updates) -> Optional[DocumentRecord]:
         """Update a document record."""
-        tracking_data = self._load()
-        if doc_id not in tracking_data:
-            return None
-
-        record_data = tracking_data[doc_id]
-        record_data.update(updates)
-        record_data["updated_at"] = datetime.now().isoformat()
-        tracking_data[doc_id] = record_data
-        self._save(tracking_data)
-
-        return DocumentRecord.from_dict(record_data)
+        updated = self.update_documents({doc_id: updates})
+        return updated[0] if updated else None
+
+    def update_documents(self, updates: Dict[str, dict]) -> List[DocumentRecord]:
+        """Apply updates to several records in one transaction."""
+        now = datetime.now().isoformat()
+        updated = []
+        with self._lock, self._db:
+            for doc_id, changes in updates.items():
+                unknown = set(changes) - set(RECORD_FIELDS)
+                if unknown:
+                    raise ValueError(f"Unknown document fields: {sorted(unknown)}")
+                columns = {**changes, "updated_at": now}
+                cursor = self._db.execute(
+                    f"UPDATE documents SET {', '.join(f'{name} = ?' for name in columns)} WHERE id = ?",
+                    [*columns.values(), doc_id],
+                )
+                if cursor.rowcount:
+                    row = self._db.execute("SELECT * FROM documents WHERE id = ?", (doc_id,)).fetchone()
+                    updated.append(self._to_record(row))
+        return updated
 
     def register_document(self, pdf_path: Path, category: str = "general") -> DocumentRecord:
         """Register a new document."""
         doc_id = self._generate_id(pdf_path)
-        tracking_data = self._load()
+        stat = pdf_path.stat()
 
         record = DocumentRecord(
             id=doc_id,
             filename=pdf_path.name,
             path=str(pdf_path),
             category=category,
-            size_bytes=pdf_path.stat().st_size,
+            size_bytes=stat.st_size,
             markdown_path=self._get_markdown_path(pdf_path),
             created_at=datetime.now().isoformat()
         )
 
-        tracking_data[doc_id] = record.to_dict()
-        self._save(tracking_data)
+        with self._lock, self._db:
+            self._db.execute(
+                f"INSERT OR REPLACE INTO documents ({', '.join(RECORD_FIELDS)}, mtime_ns, change_seq) "
+                f"VALUES ({', '.join('?' * len(RECORD_FIELDS))}, ?, ?)",
+                [*self._values(record), stat.st_mtime_ns, self._next_seq()],
+            )
 
         return record
 
     def remove_document(self, doc_id: str) -> bool:
         """Remove a document from tracking."""
-        tracking_data = self._load()
-        if doc_id in tracking_data:
-            del tracking_data[doc_id]
-            self._save(tracking_data)
-            return True
-        return False
+        with self._lock, self._db:
+            cursor = self._db.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
+        return cursor.rowcount > 0
 
     def list_documents(
         self,
@@ -209,39 +400,47 @@ class DocumentTracker:
         search: Optional[str] = None
     ) -> List[DocumentRecord]:
         """List documents with optional filters."""
-        documents = self.scan_pdf_directory()
+        self.refresh()
+        clauses, params = [], []
 
         if status:
-            documents = [d for d in documents if d.status == status]
+            clauses.append("status = ?")
+            params.append(status)
 
         if category:
-            documents = [d for d in documents if d.category == category]
+            clauses.append("category = ?")
+            params.append(category)
 
         if search:
-            search_lower = search.lower()
-            documents = [d for d in documents if search_lower in d.filename.lower()]
+            clauses.append("instr(lower(filename), ?) > 0")
+            params.append(search.lower())
 
-        return documents
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._query(f"SELECT * FROM documents{where} ORDER BY filename", params)
 
     def get_categories(self) -> List[str]:
         """Get all unique categories."""
-        documents = self.scan_pdf_directory()
-        categories = set(d.category for d in documents)
-        return sorted(categories)
+        self.refresh()
+        with self._lock:
+            rows = self._db.execute("SELECT DISTINCT category FROM documents ORDER BY category")
+            return [row[0] for row in rows]
 
     def get_statistics(self) -> dict:
         """Get overall statistics."""
-        documents = self.scan_pdf_directory()
-
-        stats = {
-            "total": len(documents),
-            "not_started": len([d for d in documents if d.status == "not_started"]),
-            "processing": len([d for d in documents if d.status == "processing"]),
-            "completed": len([d for d in documents if d.status == "completed"]),
-            "failed": len([d for d in documents if d.status == "failed"]),
-            "total_entities": sum(d.entity_count for d in documents),
-            "total_relationships": sum(d.relationship_count for d in documents),
-            "with_markdown": len([d for d in documents if d.markdown_path]),
-        }
-
-        return stats
+        self.refresh()
+        with self._lock:
+            row = self._db.execute(
+                """
+                SELECT count(*) AS total,
+                       coalesce(sum(status = 'not_started'), 0) AS not_started,
+                       coalesce(sum(status = 'processing'), 0) AS processing,
+                       coalesce(sum(status = 'completed'), 0) AS completed,
+                       coalesce(sum(status = 'failed'), 0) AS failed,
+                       coalesce(sum(entity_count), 0) AS total_entities,
+                       coalesce(sum(relationship_count), 0) AS total_relationships,
+                       count(markdown_path) AS with_markdown
+                FROM documents
+                """
+            ).fetchone()
+
+        return dict(row)
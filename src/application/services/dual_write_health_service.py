@@ -1,11 +1,14 @@
 """Dual-Write Health Service.
 
-Compares Neo4j and PostgreSQL record counts to assess migration sync health.
+Reports dual-write migration health from the dual-write outbox: how many
+changes are waiting for PostgreSQL, how old the oldest one is, and how
+many were dead-lettered. This replaces counting every row on both sides.
 """
 
 import logging
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Dict, Optional
 
+from application.services.dual_write_outbox import DualWriteOutbox
 from application.services.feature_flag_service import (
     dual_write_enabled,
     is_flag_enabled,
@@ -14,57 +17,73 @@ from application.services.feature_flag_service import (
 logger = logging.getLogger(__name__)
 
 
-def _compute_sync_status(neo4j_count: int, pg_count: int) -> str:
-    """Compute sync status from Neo4j vs PostgreSQL counts.
+def _compute_sync_status(
+    lag_seconds: float,
+    dead: int,
+    lag_warning_seconds: float,
+    lag_critical_seconds: float,
+) -> str:
+    """Compute sync status from the outbox lag of one data type.
 
-    Since PostgreSQL is the migration target, only flag issues when
-    Neo4j has data that PG is missing (neo4j > pg). PG having more
-    data than Neo4j is expected and healthy.
+    Dead-lettered changes will not reach PostgreSQL without intervention,
+    so any of them mark the data type as out of sync.
     """
-    if neo4j_count == 0:
-        return "synced"
-    missing_in_pg = neo4j_count - pg_count
-    if missing_in_pg <= 0:
-        return "synced"
-    missing_pct = missing_in_pg / neo4j_count
-    if missing_pct <= 0.05:
-        return "synced"
-    elif missing_pct <= 0.20:
+    if dead or lag_seconds > lag_critical_seconds:
+        return "out_of_sync"
+    if lag_seconds > lag_warning_seconds:
         return "minor_drift"
-    return "out_of_sync"
+    return "synced"
 
 
 class DualWriteHealthService:
     """Service for checking dual-write migration health."""
 
+    DATA_TYPES = ("sessions", "feedback", "documents")
+
     def __init__(
         self,
-        kg_backend=None,
-        db_session_factory: Optional[Callable] = None,
+        outbox: Optional[DualWriteOutbox] = None,
+        relay_running: bool = False,
+        lag_warning_seconds: float = 30.0,
+        lag_critical_seconds: float = 300.0,
     ):
-        self.kg_backend = kg_backend
-        self._db_session = db_session_factory
+        self.outbox = outbox
+        self.relay_running = relay_running
+        self.lag_warning_seconds = lag_warning_seconds
+        self.lag_critical_seconds = lag_critical_seconds
 
     async def get_health(self) -> Dict[str, Any]:
-        """Get dual-write health metrics comparing Neo4j and PostgreSQL counts."""
+        """Get dual-write health metrics from the outbox backlog."""
         health: Dict[str, Any] = {
             "status": "healthy",
+            "relay_running": self.relay_running,
             "data_types": {},
             "sync_issues": [],
             "recommendations": [],
         }
 
-        health["data_types"]["sessions"] = await self._check_sessions()
-        health["data_types"]["feedback"] = await self._check_feedback()
-        health["data_types"]["documents"] = await self._check_documents()
+        outbox_stats: Dict[str, Dict[str, Any]] = {}
+        if self.outbox is not None:
+            try:
+                outbox_stats = self.outbox.stats()
+            except Exception as e:
+                logger.warning(f"Failed to read dual-write outbox stats: {e}")
+
+        for name in self.DATA_TYPES:
+            health["data_types"][name] = self._check(name, outbox_stats.get(name, {}))
 
         # Collect sync issues
         for name, dt in health["data_types"].items():
-            if dt["sync_status"] == "out_of_sync":
-                missing = dt["neo4j_count"] - dt["postgres_count"]
+            if dt["dead"]:
+                health["sync_issues"].append(
+                    f"{name.capitalize()}: {dt['dead']} changes dead-lettered in the outbox"
+                )
+            if dt["sync_status"] in ("minor_drift", "out_of_sync") and dt["pending"]:
                 health["sync_issues"].append(
-                    f"{name.capitalize()}: {missing} Neo4j records missing from PostgreSQL"
+                    f"{name.capitalize()}: {dt['pending']} changes pending, "
+                    f"oldest {dt['lag_seconds']:.0f}s"
                 )
+            if dt["sync_status"] == "out_of_sync":
                 health["status"] = "warning"
 
         # Generate recommendations
@@ -72,9 +91,22 @@ class DualWriteHealthService:
             health["recommendations"].append(
                 "Enable dual-write for at least one data type to begin migration"
             )
+        elif self.outbox is None:
+            health["recommendations"].append(
+                "Configure the dual-write outbox to take PostgreSQL writes off the request path"
+            )
+        elif any(dt["dead"] for dt in health["data_types"].values()):
+            health["recommendations"].append(
+                "Fix the cause of the dead-lettered changes, then requeue them via "
+                "POST /api/admin/dual-write-outbox/requeue"
+            )
+        elif health["sync_issues"] and not self.relay_running:
+            health["recommendations"].append(
+                "The outbox relay is not running; check PostgreSQL initialization at startup"
+            )
         elif health["sync_issues"]:
             health["recommendations"].append(
-                "Run sync_data_to_postgres.py to reconcile differences"
+                "PostgreSQL is falling behind; check its availability and the relay logs"
             )
         elif all(
             dt["sync_status"] == "synced"
@@ -87,117 +119,27 @@ class DualWriteHealthService:
 
         return health
 
-    async def _check_sessions(self) -> Dict[str, Any]:
+    def _check(self, name: str, stats: Dict[str, Any]) -> Dict[str, Any]:
         result = {
-            "dual_write_enabled": dual_write_enabled("sessions"),
-            "use_postgres": is_flag_enabled("use_postgres_sessions"),
-            "neo4j_count": 0,
-            "postgres_count": 0,
-            "neo4j_message_count": 0,
-            "postgres_message_count": 0,
+            "dual_write_enabled": dual_write_enabled(name),
+            "use_postgres": is_flag_enabled(f"use_postgres_{name}"),
+            "pending": stats.get("pending", 0),
+            "retrying": stats.get("retrying", 0),
+            "dead": stats.get("dead", 0),
+            "lag_seconds": stats.get("lag_seconds", 0.0),
+            "delivered": stats.get("delivered", 0),
+            "last_delivered_at": stats.get("last_delivered_at"),
             "sync_status": "unknown",
         }
 
-        if self.kg_backend:
-            try:
-                query = "MATCH (s:ConversationSession) RETURN count(s) as count"
-                data = await self.kg_backend.query_raw(query, {})
-                if data:
-                    result["neo4j_count"] = data[0].get("count", 0)
-                msg_query = "MATCH (m:Message) RETURN count(m) as count"
-                msg_data = await self.kg_backend.query_raw(msg_query, {})
-                if msg_data:
-                    result["neo4j_message_count"] = msg_data[0].get("count", 0)
-            except Exception as e:
-                logger.warning(f"Failed to get Neo4j session/message count: {e}")
-
-        if self._db_session:
-            try:
-                from infrastructure.database.repositories import SessionRepository, MessageRepository
-
-                async with self._db_session() as session:
-                    result["postgres_count"] = await SessionRepository(session).count()
-                    result["postgres_message_count"] = await MessageRepository(session).count()
-            except Exception as e:
-                logger.warning(f"Failed to get PostgreSQL session/message count: {e}")
-
-        if result["dual_write_enabled"]:
-            result["sync_status"] = _compute_sync_status(
-                result["neo4j_count"], result["postgres_count"]
-            )
-        else:
+        if not result["dual_write_enabled"]:
             result["sync_status"] = "disabled"
-
-        return result
-
-    async def _check_feedback(self) -> Dict[str, Any]:
-        result = {
-            "dual_write_enabled": dual_write_enabled("feedback"),
-            "use_postgres": is_flag_enabled("use_postgres_feedback"),
-            "neo4j_count": 0,
-            "postgres_count": 0,
-            "sync_status": "unknown",
-        }
-
-        if self.kg_backend:
-            try:
-                query = "MATCH (f:UserFeedback) RETURN count(f) as count"
-                data = await self.kg_backend.query_raw(query, {})
-                if data:
-                    result["neo4j_count"] = data[0].get("count", 0)
-            except Exception as e:
-                logger.warning(f"Failed to get Neo4j feedback count: {e}")
-
-        if self._db_session:
-            try:
-                from infrastructure.database.repositories import FeedbackRepository
-
-                async with self._db_session() as session:
-                    result["postgres_count"] = await FeedbackRepository(session).count()
-            except Exception as e:
-                logger.warning(f"Failed to get PostgreSQL feedback count: {e}")
-
-        if result["dual_write_enabled"]:
+        elif self.outbox is not None:
             result["sync_status"] = _compute_sync_status(
-                result["neo4j_count"], result["postgres_count"]
+                result["lag_seconds"],
+                result["dead"],
+                self.lag_warning_seconds,
+                self.lag_critical_seconds,
             )
-        else:
-            result["sync_status"] = "disabled"
-
-        return result
-
-    async def _check_documents(self) -> Dict[str, Any]:
-        result = {
-            "dual_write_enabled": dual_write_enabled("documents"),
-            "use_postgres": is_flag_enabled("use_postgres_documents"),
-            "neo4j_count": 0,
-            "postgres_count": 0,
-            "sync_status": "unknown",
-        }
-
-        if self.kg_backend:
-            try:
-                query = "MATCH (d:Document) RETURN count(d) as count"
-                data = await self.kg_backend.query_raw(query, {})
-                if data:
-                    result["neo4j_count"] = data[0].get("count", 0)
-            except Exception as e:
-                logger.warning(f"Failed to get Neo4j document count: {e}")
-
-        if self._db_session:
-            try:
-                from infrastructure.database.repositories import DocumentRepository
-
-                async with self._db_session() as session:
-                    result["postgres_count"] = await DocumentRepository(session).count()
-            except Exception as e:
-                logger.warning(f"Failed to get PostgreSQL document count: {e}")
-
-        if result["dual_write_enabled"]:
-            result["sync_status"] = _compute_sync_status(
-                result["neo4j_count"], result["postgres_count"]
-            )
-        else:
-            result["sync_status"] = "disabled"
 
         return result
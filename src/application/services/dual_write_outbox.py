@@ -0,0 +1,563 @@
+"""Dual-Write Outbox.
+
+Moves the PostgreSQL side of the Neo4j → PostgreSQL dual-write out of the
+request path. Services append a compact change record to a local SQLite
+outbox right after their Neo4j write (a local WAL append instead of a
+round trip to a second database), and ``OutboxRelay`` drains the outbox in
+the background:
+
+- records are grouped by kind and applied with one multi-row
+  ``INSERT ... ON CONFLICT`` per group, in a single PostgreSQL transaction
+- every record carries an idempotency key (the target row's primary or
+  unique key), so replaying a batch after a partial failure is harmless
+- failed groups are retried record by record with exponential backoff;
+  records that keep failing are dead-lettered for inspection
+- claiming a batch leases its records for ``lease_seconds``, so several
+  relays (or processes) sharing one outbox never deliver the same record
+  concurrently; a relay that dies mid-batch lets its lease expire
+
+Every service in a process shares the outbox returned by
+``get_dual_write_outbox()``.
+
+Without an outbox, ``submit_change`` applies the same change inline, so
+both delivery modes share one set of SQL statements.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+
+# Change kinds, in the order a drain applies them (sessions before their messages)
+SESSION_CREATE = "session.create"
+MESSAGE_INSERT = "message.insert"
+FEEDBACK_INSERT = "feedback.insert"
+DOCUMENT_UPSERT = "document.upsert"
+SESSION_UPDATE = "session.update"
+SESSION_DELETE = "session.delete"
+
+KIND_ORDER = [
+    SESSION_CREATE,
+    MESSAGE_INSERT,
+    FEEDBACK_INSERT,
+    DOCUMENT_UPSERT,
+    SESSION_UPDATE,
+    SESSION_DELETE,
+]
+
+# Feature-flag data type each kind belongs to (see dual_write_enabled)
+DATA_TYPES = {
+    SESSION_CREATE: "sessions",
+    MESSAGE_INSERT: "sessions",
+    SESSION_UPDATE: "sessions",
+    SESSION_DELETE: "sessions",
+    FEEDBACK_INSERT: "feedback",
+    DOCUMENT_UPSERT: "documents",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    data_type TEXT NOT NULL,
+    key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    dead INTEGER NOT NULL DEFAULT 0,
+    leased_until REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox (dead, next_attempt_at);
+CREATE TABLE IF NOT EXISTS delivery (
+    data_type TEXT PRIMARY KEY,
+    delivered INTEGER NOT NULL DEFAULT 0,
+    last_delivered_at REAL
+);
+"""
+
+
+@dataclass
+class OutboxRecord:
+    """One pending change."""
+    seq: int
+    kind: str
+    key: str
+    payload: Dict[str, Any]
+    created_at: float
+    attempts: int = 0
+
+
+class DualWriteOutbox:
+    """Durable queue of PostgreSQL changes, stored in SQLite."""
+
+    def __init__(self, path: str = "data/dual_write_outbox.sqlite3"):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(outbox)")}
+        if "leased_until" not in columns:
+            # Outbox files written before claims were leased
+            self._db.execute("ALTER TABLE outbox ADD COLUMN leased_until REAL NOT NULL DEFAULT 0")
+        self._db.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT count(*) FROM outbox WHERE dead = 0").fetchone()[0]
+
+    def close(self) -> None:
+        self._db.close()
+
+    def append(self, kind: str, key: str, payload: Dict[str, Any]) -> int:
+        """Queue a change; returns its sequence number."""
+        if kind not in DATA_TYPES:
+            raise ValueError(f"Unknown outbox change kind: {kind}")
+        now = time.time()
+        with self._lock, self._db:
+            cursor = self._db.execute(
+                "INSERT INTO outbox (kind, data_type, key, payload, created_at, next_attempt_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (kind, DATA_TYPES[kind], key, json.dumps(payload, default=str), now, now),
+            )
+        return cursor.lastrowid
+
+    def claim(self, limit: int, lease_seconds: float = 60.0) -> List[OutboxRecord]:
+        """Lease up to ``limit`` due records, oldest first.
+
+        Selecting and leasing happen in one ``UPDATE``, so a record is handed
+        to one claimer until it is acked, retried or its lease runs out.
+        """
+        now = time.time()
+        with self._lock, self._db:
+            rows = self._db.execute(
+                "UPDATE outbox SET leased_until = ? WHERE seq IN ("
+                "SELECT seq FROM outbox WHERE dead = 0 AND next_attempt_at <= ? AND leased_until <= ? "
+                "ORDER BY seq LIMIT ?) "
+                "RETURNING seq, kind, key, payload, created_at, attempts",
+                (now + lease_seconds, now, now, limit),
+            ).fetchall()
+        return [
+            OutboxRecord(seq, kind, key, json.loads(payload), created_at, attempts)
+            for seq, kind, key, payload, created_at, attempts in sorted(rows)
+        ]
+
+    def ack(self, records: List[OutboxRecord]) -> None:
+        """Remove delivered records and count them per data type."""
+        if not records:
+            return
+        now = time.time()
+        delivered = Counter(DATA_TYPES[r.kind] for r in records)
+        with self._lock, self._db:
+            self._db.executemany("DELETE FROM outbox WHERE seq = ?", [(r.seq,) for r in records])
+            self._db.executemany(
+                "INSERT INTO delivery (data_type, delivered, last_delivered_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(data_type) DO UPDATE SET "
+                "delivered = delivered + excluded.delivered, last_delivered_at = excluded.last_delivered_at",
+                [(data_type, count, now) for data_type, count in delivered.items()],
+            )
+
+    def retry(
+        self,
+        records: List[OutboxRecord],
+        error: str,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float,
+    ) -> int:
+        """Reschedule failed records with backoff; returns how many were dead-lettered."""
+        now = time.time()
+        dead = 0
+        with self._lock, self._db:
+            for record in records:
+                attempts = record.attempts + 1
+                is_dead = attempts >= max_attempts
+                dead += is_dead
+                delay = min(max_delay, base_delay * 2 ** record.attempts)
+                self._db.execute(
+                    "UPDATE outbox SET attempts = ?, next_attempt_at = ?, last_error = ?, dead = ?, "
+                    "leased_until = 0 WHERE seq = ?",
+                    (attempts, now + delay, error[:1000], int(is_dead), record.seq),
+                )
+        return dead
+
+    def requeue_dead(self, data_type: Optional[str] = None) -> int:
+        """Make dead-lettered records due again; returns how many were requeued."""
+        query = (
+            "UPDATE outbox SET dead = 0, attempts = 0, next_attempt_at = ?, leased_until = 0 WHERE dead = 1"
+        )
+        params: list = [time.time()]
+        if data_type:
+            query += " AND data_type = ?"
+            params.append(data_type)
+        with self._lock, self._db:
+            return self._db.execute(query, params).rowcount
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Backlog and delivery figures per data type."""
+        now = time.time()
+        result: Dict[str, Dict[str, Any]] = {
+            data_type: {
+                "pending": 0,
+                "retrying": 0,
+                "dead": 0,
+                "lag_seconds": 0.0,
+                "delivered": 0,
+                "last_delivered_at": None,
+            }
+            for data_type in sorted(set(DATA_TYPES.values()))
+        }
+        with self._lock:
+            backlog = self._db.execute(
+                "SELECT data_type, sum(dead = 0), sum(dead = 0 AND attempts > 0), sum(dead), "
+                "min(CASE WHEN dead = 0 THEN created_at END) FROM outbox GROUP BY data_type"
+            ).fetchall()
+            delivery = self._db.execute(
+                "SELECT data_type, delivered, last_delivered_at FROM delivery"
+            ).fetchall()
+        for data_type, pending, retrying, dead, oldest in backlog:
+            result[data_type].update(
+                pending=pending,
+                retrying=retrying,
+                dead=dead,
+                lag_seconds=round(now - oldest, 1) if oldest is not None else 0.0,
+            )
+        for data_type, delivered, last_delivered_at in delivery:
+            result[data_type].update(
+                delivered=delivered,
+                last_delivered_at=(
+                    datetime.fromtimestamp(last_delivered_at).isoformat() if last_delivered_at else None
+                ),
+            )
+        return result
+
+
+# Global instance shared by every service in the process
+_outbox: Optional[DualWriteOutbox] = None
+
+
+def get_dual_write_outbox() -> DualWriteOutbox:
+    """Get the global outbox, stored at ``DUAL_WRITE_OUTBOX_PATH``."""
+    global _outbox
+    if _outbox is None:
+        _outbox = DualWriteOutbox(os.getenv("DUAL_WRITE_OUTBOX_PATH", "data/dual_write_outbox.sqlite3"))
+    return _outbox
+
+
+# ----------------------------------------------------------------------
+# PostgreSQL handlers: apply a group of same-kind payloads in one session
+# ----------------------------------------------------------------------
+
+
+def _uuid(value: Optional[str]) -> Optional[UUID]:
+    return UUID(value) if value else None
+
+
+def _timestamp(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+async def _create_sessions(session, payloads: List[Dict[str, Any]]) -> None:
+    from sqlalchemy.dialects.postgresql import insert
+    from infrastructure.database.models import Session
+
+    rows = [
+        {
+            "id": UUID(p["id"]),
+            "patient_id": p["patient_id"],
+            "title": p["title"],
+            "status": p.get("status", "active"),
+            "extra_data": p.get("metadata") or {},
+        }
+        for p in payloads
+    ]
+    await session.execute(insert(Session).values(rows).on_conflict_do_nothing(index_elements=["id"]))
+
+
+async def _insert_messages(session, payloads: List[Dict[str, Any]]) -> None:
+    from sqlalchemy import func, update
+    from sqlalchemy.dialects.postgresql import insert
+    from infrastructure.database.models import Message, Session
+
+    rows = [
+        {
+            "id": UUID(p["id"]),
+            "session_id": UUID(p["session_id"]),
+            "patient_id": p["patient_id"],
+            "role": p["role"],
+            "content": p["content"],
+            "created_at": _timestamp(p["created_at"]),
+            "response_id": p.get("response_id"),
+            "extra_data": p.get("metadata") or {},
+        }
+        for p in payloads
+    ]
+    result = await session.execute(
+        insert(Message)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["id"])
+        .returning(Message.session_id)
+    )
+    # Only rows actually inserted count, so a replayed batch leaves counts unchanged
+    for session_id, count in Counter(result.scalars().all()).items():
+        await session.execute(
+            update(Session)
+            .where(Session.id == session_id)
+            .values(message_count=Session.message_count + count, last_activity=func.now())
+        )
+
+
+async def _update_sessions(session, payloads: List[Dict[str, Any]]) -> None:
+    from sqlalchemy import update
+    from infrastructure.database.models import Session
+
+    for p in payloads:
+        fields = {name: p[name] for name in ("status", "title") if name in p}
+        await session.execute(update(Session).where(Session.id == UUID(p["id"])).values(**fields))
+
+
+async def _delete_sessions(session, payloads: List[Dict[str, Any]]) -> None:
+    from sqlalchemy import delete
+    from infrastructure.database.models import Session
+
+    await session.execute(delete(Session).where(Session.id.in_([UUID(p["id"]) for p in payloads])))
+
+
+async def _insert_feedback(session, payloads: List[Dict[str, Any]]) -> None:
+    from sqlalchemy.dialects.postgresql import insert
+    from infrastructure.database.models import Feedback
+
+    rows = [
+        {
+            "id": UUID(p["id"]),
+            "response_id": p["response_id"],
+            "session_id": _uuid(p.get("session_id")),
+            "patient_id": p.get("patient_id"),
+            "rating": p.get("rating"),
+            "thumbs_up": p.get("thumbs_up"),
+            "feedback_type": p.get("feedback_type"),
+            "correction_text": p.get("correction_text"),
+            "severity": p.get("severity"),
+            "query_text": p.get("query_text"),
+            "response_text": p.get("response_text"),
+            "entities_involved": p.get("entities_involved") or [],
+            "layers_traversed": p.get("layers_traversed") or [],
+        }
+        for p in payloads
+    ]
+    await session.execute(insert(Feedback).values(rows).on_conflict_do_nothing(index_elements=["id"]))
+
+
+async def _upsert_documents(session, payloads: List[Dict[str, Any]]) -> None:
+    from sqlalchemy.dialects.postgresql import insert
+    from infrastructure.database.models import Document, DocumentQuality
+
+    rows = [
+        {
+            "external_id": p["external_id"],
+            "filename": p["filename"],
+            "source_path": p.get("source_path"),
+            "category": p.get("category"),
+            "status": p.get("status", "ingested"),
+            "chunk_count": p.get("chunk_count", 0),
+            "entity_count": p.get("entity_count", 0),
+            "ingested_at": _timestamp(p.get("ingested_at")),
+            "extra_data": p.get("metadata") or {},
+        }
+        for p in payloads
+    ]
+    statement = insert(Document).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=["external_id"],
+        set_={
+            name: statement.excluded[name]
+            for name in ("filename", "source_path", "status", "chunk_count",
+                         "entity_count", "ingested_at", "extra_data")
+        },
+    ).returning(Document.external_id, Document.id)
+    document_ids = dict((await session.execute(statement)).all())
+
+    quality_rows = [
+        {
+            **p["quality"],
+            "id": UUID(p["quality"]["id"]),
+            "document_id": document_ids[p["external_id"]],
+            "assessed_at": _timestamp(p["quality"].get("assessed_at")),
+        }
+        for p in payloads
+        if p.get("quality")
+    ]
+    if quality_rows:
+        await session.execute(
+            insert(DocumentQuality).values(quality_rows).on_conflict_do_nothing(index_elements=["id"])
+        )
+
+
+Handler = Callable[[Any, List[Dict[str, Any]]], Awaitable[None]]
+
+POSTGRES_HANDLERS: Dict[str, Handler] = {
+    SESSION_CREATE: _create_sessions,
+    MESSAGE_INSERT: _insert_messages,
+    FEEDBACK_INSERT: _insert_feedback,
+    DOCUMENT_UPSERT: _upsert_documents,
+    SESSION_UPDATE: _update_sessions,
+    SESSION_DELETE: _delete_sessions,
+}
+
+
+async def submit_change(
+    outbox: Optional[DualWriteOutbox],
+    db_session_factory: Optional[Callable],
+    kind: str,
+    key: str,
+    payload: Dict[str, Any],
+) -> bool:
+    """Queue a change on the outbox, or apply it inline when there is none.
+
+    Failures are logged, never raised: the Neo4j write has already succeeded.
+    """
+    try:
+        if outbox is not None:
+            outbox.append(kind, key, payload)
+        elif db_session_factory is not None:
+            async with db_session_factory() as session:
+                await POSTGRES_HANDLERS[kind](session, [payload])
+        else:
+            return False
+        return True
+    except Exception as e:
+        logger.error(f"Dual-write {kind} for {key} failed: {e}")
+        return False
+
+
+class OutboxRelay:
+    """Background task draining a DualWriteOutbox into PostgreSQL."""
+
+    def __init__(
+        self,
+        outbox: DualWriteOutbox,
+        db_session_factory: Callable,
+        batch_size: int = 500,
+        poll_interval: float = 0.5,
+        max_attempts: int = 10,
+        base_delay: float = 1.0,
+        max_delay: float = 300.0,
+        lease_seconds: float = 60.0,
+        handlers: Optional[Dict[str, Handler]] = None,
+    ):
+        """Initialize the relay.
+
+        Args:
+            outbox: Source of pending changes
+            db_session_factory: Async context manager yielding a committing AsyncSession
+            batch_size: Records claimed per drain
+            poll_interval: Seconds between drains once the outbox is empty
+            max_attempts: Attempts before a record is dead-lettered
+            base_delay: First retry delay in seconds, doubled per attempt
+            max_delay: Upper bound on a single retry delay
+            lease_seconds: How long a claimed batch stays reserved for this relay
+            handlers: Change kind → handler (defaults to the PostgreSQL handlers)
+        """
+        self.outbox = outbox
+        self._db_session = db_session_factory
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.lease_seconds = lease_seconds
+        self.handlers = handlers or POSTGRES_HANDLERS
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"Outbox relay started ({len(self.outbox)} changes pending)")
+
+    async def stop(self, drain: bool = True) -> None:
+        """Stop the relay, optionally delivering what is already due first."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+        if drain:
+            while await self.drain_once():
+                pass
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                delivered = await self.drain_once()
+            except Exception as e:
+                logger.error(f"Outbox drain failed: {e}")
+                delivered = 0
+            if delivered < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def drain_once(self) -> int:
+        """Deliver one batch of due records; returns how many were delivered."""
+        records = self.outbox.claim(self.batch_size, self.lease_seconds)
+        if not records:
+            return 0
+
+        by_kind: Dict[str, List[OutboxRecord]] = defaultdict(list)
+        for record in records:
+            by_kind[record.kind].append(record)
+
+        delivered: List[OutboxRecord] = []
+        for kind in sorted(by_kind, key=KIND_ORDER.index):
+            group = by_kind[kind]
+            try:
+                await self._apply(kind, group)
+                delivered.extend(group)
+            except Exception as e:
+                logger.warning(f"Outbox batch of {len(group)} {kind} failed, retrying individually: {e}")
+                delivered.extend(await self._apply_individually(kind, group))
+
+        self.outbox.ack(delivered)
+        return len(delivered)
+
+    async def _apply(self, kind: str, group: List[OutboxRecord]) -> None:
+        # Same key twice in one batch: the newest change wins
+        latest = {record.key: record.payload for record in group}
+        async with self._db_session() as session:
+            await self.handlers[kind](session, list(latest.values()))
+
+    async def _apply_individually(self, kind: str, group: List[OutboxRecord]) -> List[OutboxRecord]:
+        by_key: Dict[str, List[OutboxRecord]] = defaultdict(list)
+        for record in group:
+            by_key[record.key].append(record)
+
+        delivered = []
+        for records in by_key.values():
+            try:
+                await self._apply(kind, records)
+                delivered.extend(records)
+            except Exception as e:
+                dead = self.outbox.retry(
+                    records, f"{type(e).__name__}: {e}", self.max_attempts, self.base_delay, self.max_delay
+                )
+                if dead:
+                    logger.error(f"Outbox {kind} {records[0].key} dead-lettered after {self.max_attempts} attempts: {e}")
+        return delivered
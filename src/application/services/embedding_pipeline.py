@@ -0,0 +1,272 @@
+"""Batched, concurrent text embedding with a content-addressed cache.
+
+``EmbeddingPipeline.embed`` takes every text of a document at once:
+
+1. Identical texts are embedded once.
+2. Vectors already in the ``EmbeddingCache`` (keyed by model and the SHA-256
+   of the text) are served from disk, so re-ingesting a document is free.
+3. The remaining texts are split into batches of ``batch_size`` inputs per
+   request; up to ``max_concurrency`` batches are in flight at a time and
+   rate-limited or transient failures are retried with exponential backoff,
+   honouring ``Retry-After`` when the provider sends one.
+
+Embedders share one long-lived client.  ``HashEmbedder`` is a deterministic
+offline embedder used when no API key is configured and in tests.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import random
+import sqlite3
+from typing import Dict, List, Optional, Protocol, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+RETRYABLE_ERROR_NAMES = frozenset({"RateLimitError", "APITimeoutError", "APIConnectionError"})
+
+
+class Embedder(Protocol):
+    """Anything that embeds a batch of texts under a fixed model name."""
+
+    model: str
+
+    async def embed_batch(self, texts: Sequence[str]) -> List[List[float]]:
+        ...
+
+
+class OpenAIEmbedder:
+    """OpenAI embeddings API, many inputs per request, one pooled client."""
+
+    def __init__(
+        self,
+        model: str = "text-embedding-3-small",
+        api_key: Optional[str] = None,
+        max_input_chars: int = 8000,
+    ):
+        """Initialize the embedder.
+
+        Args:
+            model: Embedding model name
+            api_key: OpenAI API key (defaults to ``OPENAI_API_KEY``)
+            max_input_chars: Inputs are truncated to this length to stay under token limits
+        """
+        self.model = model
+        self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
+        self.max_input_chars = max_input_chars
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            import openai
+            # The client keeps an HTTP connection pool; build it once
+            self._client = openai.AsyncOpenAI(api_key=self.api_key, max_retries=0)
+        return self._client
+
+    async def embed_batch(self, texts: Sequence[str]) -> List[List[float]]:
+        response = await self._get_client().embeddings.create(
+            model=self.model,
+            input=[text[:self.max_input_chars] for text in texts],
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+
+class HashEmbedder:
+    """Deterministic pseudo-embeddings derived from SHA-256; no network."""
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+        self.model = f"sha256-hash-{dim}"
+
+    def embed_one(self, text: str) -> List[float]:
+        hash_bytes = hashlib.sha256(text.encode()).digest()
+        return [(hash_bytes[i % len(hash_bytes)] - 128) / 128.0 for i in range(self.dim)]
+
+    async def embed_batch(self, texts: Sequence[str]) -> List[List[float]]:
+        return [self.embed_one(text) for text in texts]
+
+
+class EmbeddingCache:
+    """On-disk vectors keyed by ``(model, sha256(text))``."""
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT NOT NULL, text_hash TEXT NOT NULL, vector BLOB NOT NULL, "
+            "PRIMARY KEY (model, text_hash))"
+        )
+        self._db.commit()
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT count(*) FROM embeddings").fetchone()[0]
+
+    def close(self) -> None:
+        self._db.close()
+
+    def get_many(self, model: str, text_hashes: Sequence[str]) -> Dict[str, List[float]]:
+        """Return the cached vectors among ``text_hashes``, keyed by hash."""
+        found: Dict[str, List[float]] = {}
+        hashes = list(text_hashes)
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(hashes), 500):
+            chunk = hashes[start:start + 500]
+            rows = self._db.execute(
+                f"SELECT text_hash, vector FROM embeddings "
+                f"WHERE model = ? AND text_hash IN ({','.join('?' * len(chunk))})",
+                [model, *chunk],
+            )
+            for text_hash, blob in rows:
+                found[text_hash] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+
+    def put_many(self, model: str, vectors: Dict[str, Sequence[float]]) -> None:
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, vector) VALUES (?, ?, ?)",
+                [
+                    (model, text_hash, np.asarray(vector, dtype=np.float32).tobytes())
+                    for text_hash, vector in vectors.items()
+                ],
+            )
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class EmbeddingPipeline:
+    """Embeds many texts with deduplication, caching, batching and backoff."""
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        cache: Optional[EmbeddingCache] = None,
+        batch_size: int = 128,
+        max_concurrency: int = 4,
+        max_retries: int = 6,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            embedder: Backend that embeds one batch per call
+            cache: Optional on-disk cache shared across ingests
+            batch_size: Inputs sent per embedding request
+            max_concurrency: Embedding requests in flight at once
+            max_retries: Retries per batch for rate-limited or transient errors
+            base_delay: First backoff delay in seconds, doubled per retry
+            max_delay: Upper bound on a single backoff delay
+        """
+        self.embedder = embedder
+        self.cache = cache
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.stats = {"requested": 0, "cache_hits": 0, "embedded": 0, "requests": 0, "retries": 0}
+
+    @property
+    def model(self) -> str:
+        return self.embedder.model
+
+    async def embed(self, texts: Sequence[str], use_cache: bool = True) -> List[List[float]]:
+        """Embed ``texts``, returning vectors aligned with the input.
+
+        Args:
+            texts: Texts to embed
+            use_cache: Read and write the on-disk cache (off for one-off queries)
+
+        Raises:
+            Exception: The embedder's error once a batch exhausts its retries
+                or fails with a non-retryable error
+        """
+        hashes = [text_hash(text) for text in texts]
+        unique: Dict[str, str] = dict(zip(hashes, texts))
+        self.stats["requested"] += len(texts)
+
+        cache = self.cache if use_cache else None
+        vectors = cache.get_many(self.model, list(unique)) if cache is not None else {}
+        self.stats["cache_hits"] += sum(1 for h in hashes if h in vectors)
+
+        missing = [h for h in unique if h not in vectors]
+        if missing:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            batches = [
+                missing[start:start + self.batch_size]
+                for start in range(0, len(missing), self.batch_size)
+            ]
+
+            async def run(batch: List[str]) -> None:
+                async with semaphore:
+                    embedded = await self._embed_with_retry([unique[h] for h in batch])
+                fresh = dict(zip(batch, embedded))
+                vectors.update(fresh)
+                if cache is not None:
+                    cache.put_many(self.model, fresh)
+
+            try:
+                async with asyncio.TaskGroup() as group:
+                    for batch in batches:
+                        group.create_task(run(batch))
+            except ExceptionGroup as failed:
+                # Surface the first batch error itself; the rest were cancelled
+                raise failed.exceptions[0] from None
+            self.stats["embedded"] += len(missing)
+
+        return [vectors[h] for h in hashes]
+
+    async def embed_one(self, text: str, use_cache: bool = True) -> List[float]:
+        return (await self.embed([text], use_cache=use_cache))[0]
+
+    async def _embed_with_retry(self, texts: List[str]) -> List[List[float]]:
+        attempt = 0
+        while True:
+            self.stats["requests"] += 1
+            try:
+                embedded = await self.embedder.embed_batch(texts)
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    raise
+                delay = _retry_after(e)
+                if delay is None:
+                    delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+                    delay *= random.uniform(0.5, 1.0)  # Jitter so batches don't retry in lockstep
+                attempt += 1
+                self.stats["retries"] += 1
+                logger.warning(
+                    "Embedding batch of %d failed (%s); retry %d/%d in %.1fs",
+                    len(texts), e, attempt, self.max_retries, delay,
+                )
+                await asyncio.sleep(delay)
+                continue
+            if len(embedded) != len(texts):
+                raise ValueError(f"Embedder returned {len(embedded)} vectors for {len(texts)} inputs")
+            return embedded
+
+
+def _is_retryable(error: Exception) -> bool:
+    if type(error).__name__ in RETRYABLE_ERROR_NAMES:
+        return True
+    return getattr(error, "status_code", None) in RETRYABLE_STATUS_CODES
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds from a ``Retry-After`` header on the error's response, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("retry-after") if hasattr(headers, "get") else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
@@ -0,0 +1,177 @@
+"""Per-entity-type embedding matrix for entity resolution.
+
+Keeps one row-normalized NumPy matrix of name embeddings per entity type so
+that resolving a name is a single matrix-vector product over every known
+entity of that type, instead of one encode and one ``cosine_similarity``
+call per candidate.  Rows are updated incrementally as entities are added,
+renamed or merged away.
+"""
+
+from dataclasses import dataclass, field
+from typing import Container, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+@dataclass
+class _TypeMatrix:
+    """Embedding rows for one entity type."""
+    vectors: np.ndarray
+    ids: List[str] = field(default_factory=list)
+    names: List[str] = field(default_factory=list)
+    rows: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+
+class EntityEmbeddingIndex:
+    """Normalized embedding matrices keyed by entity type.
+
+    Capacity grows geometrically, so appending a batch of new entities is
+    amortized O(batch); removal swaps the last row into the freed slot.
+    """
+
+    def __init__(self, initial_capacity: int = 256):
+        """Initialize the index.
+
+        Args:
+            initial_capacity: Rows pre-allocated for each new entity type
+        """
+        self.initial_capacity = initial_capacity
+        self._types: Dict[str, _TypeMatrix] = {}
+
+    def __len__(self) -> int:
+        return sum(matrix.size for matrix in self._types.values())
+
+    def contains(self, entity_type: str, entity_id: str, name: Optional[str] = None) -> bool:
+        """Whether ``entity_id`` is indexed (and, if given, still under ``name``)."""
+        matrix = self._types.get(entity_type)
+        if matrix is None or entity_id not in matrix.rows:
+            return False
+        return name is None or matrix.names[matrix.rows[entity_id]] == name
+
+    def add(
+        self,
+        entity_type: str,
+        ids: Sequence[str],
+        names: Sequence[str],
+        vectors: Iterable[Sequence[float]],
+    ) -> None:
+        """Insert or replace embeddings for entities of ``entity_type``.
+
+        Args:
+            entity_type: Entity type the rows belong to
+            ids: Entity IDs
+            names: Entity names, aligned with ``ids``
+            vectors: Raw (unnormalized) embeddings, aligned with ``ids``
+
+        Raises:
+            ValueError: If ``ids``, ``names`` and ``vectors`` differ in length
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1)
+        if not (len(ids) == len(names) == len(vectors)):
+            raise ValueError(
+                f"Got {len(ids)} ids, {len(names)} names and {len(vectors)} vectors"
+            )
+        if not len(ids):
+            return
+
+        vectors = _normalize(vectors)
+        matrix = self._types.get(entity_type)
+        if matrix is None:
+            capacity = max(self.initial_capacity, len(ids))
+            matrix = _TypeMatrix(vectors=np.zeros((capacity, vectors.shape[1]), dtype=np.float32))
+            self._types[entity_type] = matrix
+
+        for entity_id, name, vector in zip(ids, names, vectors):
+            row = matrix.rows.get(entity_id)
+            if row is None:
+                row = matrix.size
+                if row == len(matrix.vectors):
+                    grown = np.zeros((row * 2, matrix.vectors.shape[1]), dtype=np.float32)
+                    grown[:row] = matrix.vectors
+                    matrix.vectors = grown
+                matrix.rows[entity_id] = row
+                matrix.ids.append(entity_id)
+                matrix.names.append(name)
+            else:
+                matrix.names[row] = name
+            matrix.vectors[row] = vector
+
+    def remove(self, entity_id: str, entity_type: Optional[str] = None) -> bool:
+        """Drop an entity (e.g. after it was merged into another).
+
+        Args:
+            entity_id: Entity to remove
+            entity_type: Type to look in; all types are checked when omitted
+
+        Returns:
+            True if a row was removed
+        """
+        types = [entity_type] if entity_type else list(self._types)
+        for type_name in types:
+            matrix = self._types.get(type_name)
+            if matrix is None or entity_id not in matrix.rows:
+                continue
+            row = matrix.rows.pop(entity_id)
+            last = matrix.size - 1
+            if row != last:
+                moved_id = matrix.ids[last]
+                matrix.vectors[row] = matrix.vectors[last]
+                matrix.ids[row] = moved_id
+                matrix.names[row] = matrix.names[last]
+                matrix.rows[moved_id] = row
+            matrix.ids.pop()
+            matrix.names.pop()
+            return True
+        return False
+
+    def search(
+        self,
+        entity_type: str,
+        query_vector: Sequence[float],
+        threshold: float = 0.0,
+        top_k: int = 10,
+        allowed: Optional[Container[str]] = None,
+    ) -> List[Tuple[str, str, float]]:
+        """Return the ``top_k`` most similar entities with cosine >= ``threshold``.
+
+        Args:
+            entity_type: Entity type to search
+            query_vector: Raw query embedding
+            threshold: Minimum cosine similarity
+            top_k: Maximum number of results
+            allowed: If given, only these entity IDs are returned; rows outside
+                it are dropped before the top ``top_k`` are selected
+
+        Returns:
+            ``(entity_id, name, similarity)`` tuples, most similar first
+        """
+        matrix = self._types.get(entity_type)
+        if matrix is None or matrix.size == 0:
+            return []
+
+        query = _normalize(np.asarray(query_vector, dtype=np.float32).reshape(1, -1))[0]
+        scores = matrix.vectors[:matrix.size] @ query
+
+        candidates = np.flatnonzero(scores >= threshold)
+        if allowed is not None:
+            candidates = np.array(
+                [i for i in candidates if matrix.ids[i] in allowed], dtype=np.intp
+            )
+        if len(candidates) > top_k:
+            best = np.argpartition(scores[candidates], -top_k)[-top_k:]
+            candidates = candidates[best]
+        ordered = candidates[np.argsort(scores[candidates])[::-1]]
+        return [(matrix.ids[i], matrix.names[i], float(scores[i])) for i in ordered]
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows, leaving all-zero rows untouched."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
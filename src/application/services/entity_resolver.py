@@ -16,12 +16,16 @@ Enhanced for Crystallization Pipeline:
 - Observation count tracking for entity merging
 """
 
-from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
+from typing import List, Dict, Any, Awaitable, Callable, Optional, Set, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import logging
 
+from application.services.entity_embedding_index import EntityEmbeddingIndex
+from application.services.ngram_blocking_index import NGramBlockingIndex
+from infrastructure.cypher_utils import validate_cypher_identifier
+
 if TYPE_CHECKING:
     from domain.kg_backends import KnowledgeGraphBackend
 
@@ -98,7 +102,11 @@ class EntityResolver:
         exact_threshold: float = 1.0,
         fuzzy_threshold: float = 0.85,
         semantic_threshold: float = 0.90,
-        structure_threshold: float = 0.75
+        structure_threshold: float = 0.75,
+        candidate_page_size: int = 5000,
+        embedding_batch_size: int = 256,
+        max_embedding_matches: int = 10,
+        max_fuzzy_candidates: int = 200
     ):
         """
         Initialize the EntityResolver.
@@ -110,19 +118,40 @@ class EntityResolver:
             fuzzy_threshold: Threshold for fuzzy string matching
             semantic_threshold: Threshold for embedding similarity
             structure_threshold: Threshold for graph structure similarity
+            candidate_page_size: Entities fetched per page when loading candidates
+            embedding_batch_size: Names encoded per embedding model call
+            max_embedding_matches: Top-k returned by embedding matching
+            max_fuzzy_candidates: Candidates kept by n-gram blocking before fuzzy scoring
         """
         self.backend = backend
         self.exact_threshold = exact_threshold
         self.fuzzy_threshold = fuzzy_threshold
         self.semantic_threshold = semantic_threshold
         self.structure_threshold = structure_threshold
+        self.candidate_page_size = candidate_page_size
+        self.embedding_batch_size = embedding_batch_size
+        self.max_embedding_matches = max_embedding_matches
 
         # Lazy load embedding model to avoid import overhead
         self._embedding_model = None
         self._embedding_model_name = embedding_model
 
-        # Cache for entity embeddings
-        self._embedding_cache: Dict[str, List[float]] = {}
+        # Candidates for resolve_entity(), keyed by entity type and ID; each type
+        # is read from the graph once and then kept current from writes
+        self._candidates: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+        # Normalized entity embeddings, one matrix per entity type; a type is
+        # encoded in full on its first embedding match, then row by row
+        self._embedding_cache = EntityEmbeddingIndex()
+        self._embedded_types: Set[str] = set()
+
+        # Trigram blocking indexes for fuzzy matching: lowercased names keyed by
+        # entity type for resolve_entity(), and normalized names keyed by DIKW
+        # type for crystallization (plus the row data returned for matches)
+        self._fuzzy_index = NGramBlockingIndex(max_candidates=max_fuzzy_candidates)
+        self._crystallization_index = NGramBlockingIndex(max_candidates=max_fuzzy_candidates)
+        self._crystallization_rows: Dict[str, Dict[str, Any]] = {}
+        self._crystallization_loaded: Set[str] = set()
 
     @property
     def embedding_model(self):
@@ -184,13 +213,15 @@ class EntityResolver:
         if strategy == ResolutionStrategy.EXACT_MATCH:
             matches = self._exact_match(entity_name, existing_entities)
         elif strategy == ResolutionStrategy.FUZZY_MATCH:
-            matches = self._fuzzy_match(entity_name, existing_entities)
+            matches = self._fuzzy_match(entity_name, existing_entities, entity_type)
         elif strategy == ResolutionStrategy.EMBEDDING_SIMILARITY:
-            matches = await self._embedding_match(entity_name, existing_entities)
+            matches = await self._embedding_match(entity_name, existing_entities, entity_type)
         elif strategy == ResolutionStrategy.GRAPH_STRUCTURE:
             matches = await self._structure_match(entity_name, properties, existing_entities, context)
         else:  # HYBRID
-            matches = await self._hybrid_match(entity_name, properties, existing_entities, context)
+            matches = await self._hybrid_match(
+                entity_name, properties, existing_entities, context, entity_type
+            )
 
         # Determine action based on matches
         return self._determine_action(matches)
@@ -201,7 +232,13 @@ class EntityResolver:
         context: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
         """
-        Retrieve existing entities from the knowledge graph.
+        Retrieve all existing entities of a type.
+
+        The first call for a type pages through it with keyset pagination on
+        ``id`` so every entity is a candidate, not just the first page. Later
+        calls are answered from memory: :meth:`register_entity`,
+        :meth:`merge_entities` and the events handled after
+        :meth:`subscribe_to_graph_events` keep the loaded types current.
 
         Args:
             entity_type: Type of entity to retrieve
@@ -210,32 +247,74 @@ class EntityResolver:
         Returns:
             List of existing entity dictionaries
         """
-        # Query the graph for entities of this type
-        # This is backend-specific; we'll use a generic interface
+        candidates = self._candidates.get(entity_type)
+        if candidates is not None:
+            return list(candidates.values())
+
         try:
-            # Assuming backend has a query method
+            label = validate_cypher_identifier(entity_type, "entity_type", allow_reserved=True)
             query = f"""
-            MATCH (e:{entity_type})
-            RETURN e.id AS id, e.name AS name, e AS properties
-            LIMIT 100
+            MATCH (e:`{label}`)
+            WHERE e.id > $after_id
+            RETURN e.id AS id, e.name AS name, properties(e) AS properties
+            ORDER BY e.id
+            LIMIT $page_size
             """
+            records = await self._query_all_pages(query, {}, self.backend.query_raw)
+        except Exception as e:
+            # Not cached, so the next call retries the load
+            logger.error(f"Error querying existing entities: {e}")
+            return []
 
-            results = await self.backend.query(query)
+        self._candidates[entity_type] = {
+            record.get("id"): {
+                "id": record.get("id"),
+                "name": record.get("name"),
+                "properties": dict(record.get("properties", {}))
+            }
+            for record in records
+        }
+        logger.info(f"Loaded {len(records)} existing {entity_type} entities")
+        return list(self._candidates[entity_type].values())
 
-            entities = []
-            for record in results:
-                entities.append({
-                    "id": record.get("id"),
-                    "name": record.get("name"),
-                    "properties": dict(record.get("properties", {}))
-                })
+    async def _query_all_pages(
+        self,
+        query: str,
+        params: Dict[str, Any],
+        fetch: Callable[..., Awaitable[List[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run a keyset-paginated query until every page has been read.
 
-            logger.info(f"Found {len(entities)} existing {entity_type} entities")
-            return entities
+        The query must filter on ``id > $after_id``, order by ``id`` and
+        limit to ``$page_size``.
 
-        except Exception as e:
-            logger.error(f"Error querying existing entities: {e}")
-            return []
+        Args:
+            query: Cypher query
+            params: Query parameters besides the paging ones
+            fetch: Backend method returning a page as a list of records
+
+        Returns:
+            All rows across pages
+        """
+        rows: List[Dict[str, Any]] = []
+        after_id = ""
+        while True:
+            page = list(await fetch(
+                query, {**params, "after_id": after_id, "page_size": self.candidate_page_size}
+            ) or [])
+            last_id = page[-1].get("id") if page else None
+            if after_id and (last_id is None or last_id <= after_id):
+                # Backend ignored the cursor and repeated a page
+                break
+
+            rows.extend(page)
+
+            if len(page) < self.candidate_page_size or last_id is None:
+                break
+            after_id = last_id
+
+        return rows
 
     def _exact_match(
         self,
@@ -262,30 +341,50 @@ class EntityResolver:
     def _fuzzy_match(
         self,
         entity_name: str,
-        existing_entities: List[Dict[str, Any]]
+        existing_entities: List[Dict[str, Any]],
+        entity_type: str = "Entity"
     ) -> List[EntityMatch]:
-        """Fuzzy string matching using Levenshtein distance."""
+        """Fuzzy string matching using Levenshtein distance.
+
+        Candidates are narrowed with the trigram blocking index and scored
+        in a single ``rapidfuzz.process.extract`` call. The index is filled
+        on the first match for a type and then updated entity by entity as
+        writes arrive (see :meth:`_remember_candidate`).
+        """
         matches = []
 
         try:
-            from rapidfuzz import fuzz
-
-            for entity in existing_entities:
-                # Calculate similarity ratio
-                ratio = fuzz.ratio(
-                    entity_name.lower(),
-                    entity["name"].lower()
-                ) / 100.0
-
-                if ratio >= self.fuzzy_threshold:
-                    matches.append(EntityMatch(
-                        entity_id=entity["id"],
-                        entity_name=entity["name"],
-                        similarity_score=ratio,
-                        strategy=ResolutionStrategy.FUZZY_MATCH,
-                        properties=entity["properties"],
-                        confidence=ratio
-                    ))
+            from rapidfuzz import fuzz, process
+
+            candidates = self._candidates.get(entity_type)
+            if candidates is None:
+                candidates = {entity["id"]: entity for entity in existing_entities}
+            if not self._fuzzy_index.has_block(entity_type):
+                for entity in existing_entities:
+                    if entity.get("id") and entity.get("name"):
+                        self._fuzzy_index.add(entity_type, entity["id"], entity["name"].lower())
+
+            query = entity_name.lower()
+            choices = self._fuzzy_index.candidates(entity_type, query)
+            for _, score, entity_id in process.extract(
+                query,
+                choices,
+                scorer=fuzz.ratio,
+                score_cutoff=self.fuzzy_threshold * 100,
+                limit=None,
+            ):
+                entity = candidates.get(entity_id)
+                if entity is None:
+                    continue
+                ratio = score / 100.0
+                matches.append(EntityMatch(
+                    entity_id=entity_id,
+                    entity_name=entity["name"],
+                    similarity_score=ratio,
+                    strategy=ResolutionStrategy.FUZZY_MATCH,
+                    properties=entity["properties"],
+                    confidence=ratio
+                ))
 
             logger.info(f"Fuzzy match: Found {len(matches)} matches above threshold {self.fuzzy_threshold}")
 
@@ -297,9 +396,17 @@ class EntityResolver:
     async def _embedding_match(
         self,
         entity_name: str,
-        existing_entities: List[Dict[str, Any]]
+        existing_entities: List[Dict[str, Any]],
+        entity_type: str = "Entity"
     ) -> List[EntityMatch]:
-        """Semantic matching using sentence embeddings."""
+        """Semantic matching using sentence embeddings.
+
+        The first match for a type encodes its candidates in batches; after
+        that the matrix is updated row by row as entities are written. The
+        query is scored against every indexed entity of ``entity_type`` with
+        one matrix-vector product, skipping rows of entities that are no
+        longer candidates before the top-k are taken.
+        """
         if self.embedding_model is None:
             logger.warning("Embedding model not available. Skipping embedding match.")
             return []
@@ -307,44 +414,166 @@ class EntityResolver:
         matches = []
 
         try:
-            from sklearn.metrics.pairwise import cosine_similarity
+            if entity_type not in self._embedded_types:
+                self._index_embeddings(entity_type, existing_entities)
+                self._embedded_types.add(entity_type)
 
-            # Generate embedding for query entity
             query_embedding = self.embedding_model.encode([entity_name])[0]
-
-            # Generate or retrieve embeddings for existing entities
-            for entity in existing_entities:
-                entity_id = entity["id"]
-
-                # Check cache
-                if entity_id in self._embedding_cache:
-                    entity_embedding = self._embedding_cache[entity_id]
-                else:
-                    entity_embedding = self.embedding_model.encode([entity["name"]])[0]
-                    self._embedding_cache[entity_id] = entity_embedding
-
-                # Calculate cosine similarity
-                similarity = cosine_similarity(
-                    query_embedding.reshape(1, -1),
-                    entity_embedding.reshape(1, -1)
-                )[0][0]
-
-                if similarity >= self.semantic_threshold:
-                    matches.append(EntityMatch(
-                        entity_id=entity_id,
-                        entity_name=entity["name"],
-                        similarity_score=float(similarity),
-                        strategy=ResolutionStrategy.EMBEDDING_SIMILARITY,
-                        properties=entity["properties"],
-                        confidence=float(similarity)
-                    ))
+            candidates = self._candidates.get(entity_type)
+            if candidates is None:
+                candidates = {entity["id"]: entity for entity in existing_entities}
+
+            for entity_id, name, similarity in self._embedding_cache.search(
+                entity_type,
+                query_embedding,
+                threshold=self.semantic_threshold,
+                top_k=self.max_embedding_matches,
+                allowed=candidates,
+            ):
+                entity = candidates[entity_id]
+                matches.append(EntityMatch(
+                    entity_id=entity_id,
+                    entity_name=name,
+                    similarity_score=similarity,
+                    strategy=ResolutionStrategy.EMBEDDING_SIMILARITY,
+                    properties=entity["properties"],
+                    confidence=similarity
+                ))
 
             logger.info(f"Embedding match: Found {len(matches)} matches above threshold {self.semantic_threshold}")
 
         except Exception as e:
             logger.error(f"Error in embedding match: {e}")
 
-        return sorted(matches, key=lambda x: x.similarity_score, reverse=True)
+        return matches
+
+    def _index_embeddings(self, entity_type: str, entities: List[Dict[str, Any]]) -> int:
+        """Encode entities missing from (or renamed in) the embedding matrix.
+
+        Args:
+            entity_type: Type the entities belong to
+            entities: Entity dictionaries with ``id`` and ``name``
+
+        Returns:
+            Number of entities encoded
+        """
+        missing = [
+            entity for entity in entities
+            if entity.get("id") and entity.get("name")
+            and not self._embedding_cache.contains(entity_type, entity["id"], entity["name"])
+        ]
+        for start in range(0, len(missing), self.embedding_batch_size):
+            batch = missing[start:start + self.embedding_batch_size]
+            names = [entity["name"] for entity in batch]
+            self._embedding_cache.add(
+                entity_type,
+                [entity["id"] for entity in batch],
+                names,
+                self.embedding_model.encode(names, batch_size=self.embedding_batch_size),
+            )
+        return len(missing)
+
+    def register_entity(
+        self,
+        entity_id: str,
+        entity_name: str,
+        entity_type: str,
+        properties: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Add a newly created (or renamed) entity to the in-memory indexes.
+
+        Keeps the loaded candidates, the embedding matrix (if the model is
+        already loaded) and the crystallization fuzzy index in sync with
+        writes, so the entity is matchable without reloading from the graph.
+
+        Args:
+            entity_id: ID of the entity
+            entity_name: Current name of the entity
+            entity_type: Type/label of the entity as stored (already normalized)
+            properties: Entity properties (``dikw_layer``, ``confidence``, ...)
+        """
+        properties = properties or {}
+        self._remember_candidate(entity_type, entity_id, entity_name, properties)
+
+        self._remember_crystallization_row({
+            "id": entity_id,
+            "name": entity_name,
+            "entity_type": properties.get("entity_type", entity_type),
+            "layer": properties.get("dikw_layer"),
+            "confidence": properties.get("confidence"),
+            "observation_count": properties.get("observation_count", 1),
+        })
+
+    def _remember_candidate(
+        self,
+        entity_type: str,
+        entity_id: str,
+        entity_name: str,
+        properties: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Add or update a resolve_entity() candidate and its match indexes."""
+        if not entity_id or not entity_name:
+            return
+        if self._embedding_model is not None:
+            self._index_embeddings(entity_type, [{"id": entity_id, "name": entity_name}])
+        if self._fuzzy_index.has_block(entity_type):
+            self._fuzzy_index.add(entity_type, entity_id, entity_name.lower())
+
+        candidates = self._candidates.get(entity_type)
+        if candidates is not None:
+            candidates[entity_id] = {
+                "id": entity_id,
+                "name": entity_name,
+                "properties": dict(properties or {})
+            }
+
+    def _forget_entity(self, entity_id: str) -> None:
+        """Drop an entity that no longer exists from every in-memory index."""
+        for candidates in self._candidates.values():
+            candidates.pop(entity_id, None)
+        self._embedding_cache.remove(entity_id)
+        self._fuzzy_index.remove(entity_id)
+        self._crystallization_index.remove(entity_id)
+        self._crystallization_rows.pop(entity_id, None)
+
+    async def subscribe_to_graph_events(self, event_bus: Any) -> None:
+        """Keep loaded candidates current from entity write events.
+
+        Args:
+            event_bus: EventBus carrying ``create_entity``, ``update_entity``,
+                ``entity_created`` and ``delete_entity`` events
+        """
+        for action in ("create_entity", "update_entity", "entity_created"):
+            await event_bus.subscribe(action, self._handle_entity_written)
+        await event_bus.subscribe("delete_entity", self._handle_entity_deleted)
+
+    async def _handle_entity_written(self, event: Any) -> None:
+        """Apply a created or updated entity to the loaded candidate types."""
+        data = event.data
+        entity_id = data.get("id") or data.get("entity_id")
+        properties = dict(data.get("properties") or {})
+        entity_types = data.get("labels") or [data.get("entity_type")]
+
+        for entity_type in entity_types:
+            candidates = self._candidates.get(entity_type)
+            if candidates is None:
+                continue  # Not loaded yet; the first lookup reads it from the graph
+            previous = candidates.get(entity_id, {})
+            entity_name = (
+                data.get("entity_name") or properties.get("name") or previous.get("name")
+            )
+            self._remember_candidate(
+                entity_type,
+                entity_id,
+                entity_name,
+                {**previous.get("properties", {}), **properties}
+            )
+
+    async def _handle_entity_deleted(self, event: Any) -> None:
+        """Remove a deleted entity from the in-memory indexes."""
+        entity_id = event.data.get("id") or event.data.get("entity_id")
+        if entity_id:
+            self._forget_entity(entity_id)
 
     async def _structure_match(
         self,
@@ -391,7 +620,8 @@ class EntityResolver:
         entity_name: str,
         properties: Dict[str, Any],
         existing_entities: List[Dict[str, Any]],
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        entity_type: str = "Entity"
     ) -> List[EntityMatch]:
         """
         Hybrid matching combining all strategies.
@@ -409,8 +639,8 @@ class EntityResolver:
             return exact_matches
 
         # Collect matches from all strategies
-        fuzzy_matches = self._fuzzy_match(entity_name, existing_entities)
-        embedding_matches = await self._embedding_match(entity_name, existing_entities)
+        fuzzy_matches = self._fuzzy_match(entity_name, existing_entities, entity_type)
+        embedding_matches = await self._embedding_match(entity_name, existing_entities, entity_type)
         structure_matches = await self._structure_match(entity_name, properties, existing_entities, context)
 
         # Combine matches by entity_id
@@ -547,6 +777,9 @@ class EntityResolver:
         """
         logger.info(f"Merging entity {source_entity_id} into {target_entity_id}")
 
+        # The source no longer exists as a separate candidate
+        self._forget_entity(source_entity_id)
+
         # Implementation would:
         # 1. Get both entities
         # 2. Merge properties
@@ -677,18 +910,17 @@ class EntityResolver:
 
         exact_query = f"""
         MATCH (n:Entity)
-        WHERE toLower(n.name) = $normalized_name
+        WHERE n.name_lc = $normalized_name
           AND n.entity_type = $entity_type
           {layer_filter}
-        RETURN n.id as id, n.name as name, n as properties, labels(n) as labels
+        RETURN n.id as id, n.name as name, properties(n) as properties, labels(n) as labels
         LIMIT 1
         """
 
         try:
-            result = await self.backend.query(exact_query, params)
+            rows = await self.backend.query_raw(exact_query, params)
 
             # Check if we have results
-            rows = result.get("rows", [])
             if rows:
                 row = rows[0]
                 match_result = CrystallizationMatch(
@@ -737,6 +969,102 @@ class EntityResolver:
         # No match found
         return CrystallizationMatch(found=False)
 
+    async def find_existing_for_crystallization_batch(
+        self,
+        names: List[str],
+        entity_type: str,
+        layer: str = "PERCEPTION"
+    ) -> Dict[str, CrystallizationMatch]:
+        """
+        Resolve many names of one entity type for the crystallization pipeline.
+
+        Same matching as :meth:`find_existing_for_crystallization`, but all
+        exact matches come from a single ``UNWIND`` query and only the misses
+        go on to fuzzy matching, which runs against the in-memory index.
+
+        Args:
+            names: Entity names to search for
+            entity_type: Entity type shared by all names (will be normalized)
+            layer: DIKW layer to search in (or "ANY" for all layers)
+
+        Returns:
+            Mapping of normalized name to its CrystallizationMatch
+
+        Raises:
+            Exception: If the exact-match query fails
+        """
+        normalized_type = self.normalize_entity_type(entity_type)
+        originals: Dict[str, str] = {}
+        for name in names:
+            normalized_name = self.normalize_entity_name(name)
+            if normalized_name:
+                originals.setdefault(normalized_name, name)
+
+        matches = {normalized_name: CrystallizationMatch(found=False) for normalized_name in originals}
+        if not originals:
+            return matches
+
+        layer_filter = ""
+        params = {
+            "names": list(originals),
+            "entity_type": normalized_type,
+        }
+
+        if layer != "ANY":
+            layer_filter = "AND (n.dikw_layer = $layer OR $layer IN labels(n))"
+            params["layer"] = layer
+
+        exact_query = f"""
+        UNWIND $names AS normalized_name
+        MATCH (n:Entity)
+        WHERE n.name_lc = normalized_name
+          AND n.entity_type = $entity_type
+          {layer_filter}
+        WITH normalized_name, collect(n)[0] AS n
+        RETURN normalized_name, n.id as id, n.name as name, properties(n) as properties, labels(n) as labels
+        """
+
+        # Not caught: a failed lookup must not be mistaken for "no match",
+        # which would make the caller create duplicates
+        for row in await self.backend.query_raw(exact_query, params):
+            matches[row["normalized_name"]] = CrystallizationMatch(
+                found=True,
+                entity_id=row.get("id"),
+                entity_data={
+                    "id": row.get("id"),
+                    "name": row.get("name"),
+                    "properties": row.get("properties") or {},
+                    "labels": row.get("labels") or []
+                },
+                match_type="exact",
+                similarity_score=1.0,
+                match_details={"query": "exact_name_type", "layer": layer}
+            )
+
+        for normalized_name, match in matches.items():
+            if match.found:
+                continue
+            fuzzy_matches = await self._find_similar_for_crystallization(
+                originals[normalized_name],
+                entity_type=normalized_type,
+                threshold=self.fuzzy_threshold,
+                limit=1
+            )
+            if fuzzy_matches:
+                best_match = fuzzy_matches[0]
+                matches[normalized_name] = CrystallizationMatch(
+                    found=True,
+                    entity_id=best_match["id"],
+                    entity_data=best_match,
+                    match_type="fuzzy",
+                    similarity_score=best_match.get("similarity", 0.0),
+                    match_details={"matched_name": best_match.get("name")}
+                )
+
+        found = sum(1 for match in matches.values() if match.found)
+        logger.info(f"Resolved {len(originals)} {normalized_type} names in one batch: {found} matched")
+        return matches
+
     async def _find_similar_for_crystallization(
         self,
         name: str,
@@ -747,6 +1075,10 @@ class EntityResolver:
         """
         Find similar entities using fuzzy matching for crystallization.
 
+        Searches every ``:Entity`` of the type (not just a page of rows):
+        names are loaded once into a trigram blocking index, which narrows
+        candidates before they are scored with ``rapidfuzz``.
+
         Args:
             name: Name to search for
             entity_type: Optional entity type filter
@@ -757,64 +1089,113 @@ class EntityResolver:
             List of matching entities with similarity scores
         """
         try:
-            from difflib import SequenceMatcher
+            from rapidfuzz import fuzz, process
         except ImportError:
             return []
 
-        # Query candidates from Neo4j
-        type_filter = ""
-        params = {"limit": limit * 10}  # Get more candidates for filtering
+        block = self.normalize_entity_type(entity_type) if entity_type else "*"
+
+        try:
+            await self._load_crystallization_block(block)
+
+            normalized_search = self.normalize_entity_name(name)
+            choices = self._crystallization_index.candidates(block, normalized_search)
+
+            candidates = []
+            for _, score, entity_id in process.extract(
+                normalized_search,
+                choices,
+                scorer=fuzz.ratio,
+                score_cutoff=threshold * 100,
+                limit=limit,
+            ):
+                candidates.append({
+                    **self._crystallization_rows[entity_id],
+                    "similarity": score / 100.0
+                })
+            return candidates
+
+        except Exception as e:
+            logger.error(f"Error in fuzzy search for '{name}': {e}")
+            return []
+
+    async def _load_crystallization_block(self, block: str) -> None:
+        """
+        Load all entity names of a DIKW type into the crystallization index.
 
-        if entity_type:
-            type_filter = "WHERE n.entity_type = $entity_type"
-            params["entity_type"] = self.normalize_entity_type(entity_type)
+        Runs once per type; afterwards the index is kept current by
+        :meth:`register_entity` and :meth:`merge_for_crystallization`.
+        A failed read propagates and leaves the block unloaded, so the next
+        lookup retries it.
+
+        Args:
+            block: Normalized entity type, or ``"*"`` for every entity
+        """
+        if block in self._crystallization_loaded:
+            return
+
+        type_filter = ""
+        params: Dict[str, Any] = {}
+        if block != "*":
+            type_filter = "AND n.entity_type = $entity_type"
+            params["entity_type"] = block
 
         query = f"""
         MATCH (n:Entity)
-        {type_filter}
+        WHERE n.id > $after_id {type_filter}
         RETURN n.id as id, n.name as name, n.entity_type as entity_type,
                n.dikw_layer as layer, n.confidence as confidence,
                n.observation_count as observation_count
-        LIMIT $limit
+        ORDER BY n.id
+        LIMIT $page_size
         """
 
-        try:
-            result = await self.backend.query(query, params)
-            normalized_search = self.normalize_entity_name(name)
+        rows = await self._query_all_pages(query, params, self.backend.query_raw)
+        for row in rows:
+            self._remember_crystallization_row(row, blocks=[block])
+        self._crystallization_loaded.add(block)
+        logger.info(f"Indexed {len(rows)} entities for crystallization matching ({block})")
 
-            candidates = []
-            for row in result.get("rows", []):
-                candidate_name = row.get("name", "")
-                normalized_candidate = self.normalize_entity_name(candidate_name)
-
-                # Calculate similarity
-                similarity = SequenceMatcher(
-                    None, normalized_search, normalized_candidate
-                ).ratio()
+    def _remember_crystallization_row(
+        self,
+        row: Dict[str, Any],
+        blocks: Optional[List[str]] = None
+    ) -> None:
+        """Store a crystallization row and index its normalized name.
 
-                if similarity >= threshold:
-                    candidates.append({
-                        "id": row.get("id"),
-                        "name": candidate_name,
-                        "entity_type": row.get("entity_type"),
-                        "layer": row.get("layer"),
-                        "confidence": row.get("confidence"),
-                        "observation_count": row.get("observation_count", 1),
-                        "similarity": similarity
-                    })
-
-            # Sort by similarity and limit
-            candidates.sort(key=lambda x: x["similarity"], reverse=True)
-            return candidates[:limit]
+        Args:
+            row: Row with ``id``, ``name``, ``entity_type`` and match metadata
+            blocks: Blocks to index into; defaults to the row's type and
+                ``"*"``, restricted to blocks that have already been loaded
+        """
+        entity_id = row.get("id")
+        entity_name = row.get("name")
+        if not entity_id or not entity_name:
+            return
+
+        self._crystallization_rows[entity_id] = {
+            "id": entity_id,
+            "name": entity_name,
+            "entity_type": row.get("entity_type"),
+            "layer": row.get("layer"),
+            "confidence": row.get("confidence"),
+            "observation_count": row.get("observation_count") or 1,
+        }
 
-        except Exception as e:
-            logger.error(f"Error in fuzzy search for '{name}': {e}")
-            return []
+        if blocks is None:
+            blocks = [
+                b for b in (row.get("entity_type"), "*")
+                if b in self._crystallization_loaded
+            ]
+        normalized_name = self.normalize_entity_name(entity_name)
+        for block in blocks:
+            self._crystallization_index.add(block, entity_id, normalized_name)
 
     async def merge_for_crystallization(
         self,
         existing_id: str,
-        new_data: Dict[str, Any]
+        new_data: Dict[str, Any],
+        observations: int = 1
     ) -> MergeResult:
         """
         Merge new Graphiti data into an existing Neo4j entity.
@@ -825,6 +1206,7 @@ class EntityResolver:
         Args:
             existing_id: ID of existing entity in Neo4j
             new_data: New properties from Graphiti to merge
+            observations: Mentions being merged (added to observation_count)
 
         Returns:
             MergeResult with details of merged properties
@@ -833,11 +1215,9 @@ class EntityResolver:
             # Get existing entity
             existing_query = """
             MATCH (n:Entity {id: $entity_id})
-            RETURN n as properties
+            RETURN properties(n) as properties
             """
-            result = await self.backend.query(existing_query, {"entity_id": existing_id})
-
-            rows = result.get("rows", [])
+            rows = await self.backend.query_raw(existing_query, {"entity_id": existing_id})
             if not rows:
                 logger.warning(f"Entity not found for merge: {existing_id}")
                 return MergeResult(success=False, entity_id=existing_id)
@@ -864,7 +1244,7 @@ class EntityResolver:
 
             # Always update observation tracking
             current_count = existing_props.get("observation_count", 1)
-            updates["observation_count"] = current_count + 1
+            updates["observation_count"] = current_count + observations
             updates["last_observed"] = datetime.utcnow().isoformat()
 
             # Update in Neo4j
@@ -874,11 +1254,17 @@ class EntityResolver:
                 SET n += $updates
                 RETURN n.observation_count as observation_count
                 """
-                await self.backend.query(
+                await self.backend.query_raw(
                     update_query,
                     {"entity_id": existing_id, "updates": updates}
                 )
 
+                cached_row = self._crystallization_rows.get(existing_id)
+                if cached_row is not None:
+                    cached_row["observation_count"] = updates["observation_count"]
+                    if "confidence" in updates:
+                        cached_row["confidence"] = updates["confidence"]
+
             logger.info(
                 f"Merged entity {existing_id}: "
                 f"+{len(properties_added)} added, ~{len(properties_updated)} updated, "
@@ -901,6 +1287,7 @@ class EntityResolver:
         """Get statistics about entity resolution for crystallization."""
         return {
             "embedding_cache_size": len(self._embedding_cache),
+            "fuzzy_index_size": len(self._crystallization_index),
             "fuzzy_threshold": self.fuzzy_threshold,
             "semantic_threshold": self.semantic_threshold,
             "type_mappings_count": len(self.GRAPHITI_TO_DIKW_TYPES),
@@ -23,6 +23,11 @@ from application.services.feature_flag_service import (
     dual_write_enabled,
     use_postgres_feedback,
 )
+from application.services.dual_write_outbox import (
+    FEEDBACK_INSERT,
+    DualWriteOutbox,
+    submit_change,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -92,6 +97,7 @@ class FeedbackTracerService:
         confidence_decay_on_negative: float = 0.05,
         confidence_boost_on_positive: float = 0.02,
         db_session_factory: Optional[Callable] = None,
+        outbox: Optional[DualWriteOutbox] = None,
     ):
         """
         Initialize feedback tracer service.
@@ -102,12 +108,14 @@ class FeedbackTracerService:
             confidence_decay_on_negative: How much to reduce confidence on negative feedback
             confidence_boost_on_positive: How much to increase confidence on positive feedback
             db_session_factory: Optional async context manager yielding AsyncSession for PostgreSQL
+            outbox: Optional dual-write outbox; PostgreSQL writes are applied inline without it
         """
         self.backend = backend
         self.event_bus = event_bus
         self.confidence_decay = confidence_decay_on_negative
         self.confidence_boost = confidence_boost_on_positive
         self._db_session = db_session_factory
+        self._outbox = outbox
 
         # In-memory storage (would be persisted in production)
         self._feedbacks: List[UserFeedback] = []
@@ -228,8 +236,11 @@ class FeedbackTracerService:
                 response_id=response_id,
                 patient_id=patient_id,
                 session_id=session_id,
+                query_text=query_text,
+                response_text=response_text,
                 rating=rating,
                 feedback_type=feedback_type.value if isinstance(feedback_type, FeedbackType) else str(feedback_type),
+                severity=severity.value if isinstance(severity, FeedbackSeverity) else severity,
                 correction_text=correction_text,
                 entities_involved=entities_involved,
                 layers_traversed=layers_traversed,
@@ -892,43 +903,39 @@ class FeedbackTracerService:
         layers_traversed: List[str],
         thumbs_up: Optional[bool] = None,
     ) -> bool:
-        """Dual-write feedback to PostgreSQL."""
+        """Dual-write feedback to PostgreSQL (queued on the outbox when configured)."""
         if not self._has_postgres or not dual_write_enabled("feedback"):
             return False
 
-        try:
-            from infrastructure.database.repositories import FeedbackRepository
-            from infrastructure.database.models import Feedback as PgFeedback
-            from uuid import UUID
-
-            async with self._db_session() as session:
-                repo = FeedbackRepository(session)
-
-                session_uuid = None
-                if session_id and session_id.startswith("session:"):
-                    try:
-                        session_uuid = UUID(session_id[8:])
-                    except ValueError:
-                        pass
-
-                pg_feedback = PgFeedback(
-                    response_id=response_id,
-                    session_id=session_uuid,
-                    patient_id=patient_id,
-                    rating=rating,
-                    thumbs_up=thumbs_up,
-                    feedback_type=feedback_type,
-                    correction_text=correction_text,
-                    severity=severity,
-                    query_text=query_text,
-                    response_text=response_text,
-                    entities_involved=entities_involved,
-                    layers_traversed=layers_traversed,
-                )
-                await repo.create(pg_feedback)
-                logger.debug(f"Dual-write: Stored feedback {feedback_id} in PostgreSQL")
-                return True
-
-        except Exception as e:
-            logger.error(f"Dual-write feedback to PostgreSQL failed: {e}")
-            return False
+        session_uuid = None
+        if session_id and session_id.startswith("session:"):
+            try:
+                session_uuid = str(uuid.UUID(session_id[8:]))
+            except ValueError:
+                pass
+
+        # feedback_id is a UUID, reused as the row ID and idempotency key
+        queued = await submit_change(
+            self._outbox,
+            self._db_session,
+            FEEDBACK_INSERT,
+            feedback_id,
+            {
+                "id": feedback_id,
+                "response_id": response_id,
+                "session_id": session_uuid,
+                "patient_id": patient_id,
+                "rating": rating,
+                "thumbs_up": thumbs_up,
+                "feedback_type": feedback_type,
+                "correction_text": correction_text,
+                "severity": severity,
+                "query_text": query_text,
+                "response_text": response_text,
+                "entities_involved": entities_involved or [],
+                "layers_traversed": layers_traversed or [],
+            },
+        )
+        if queued:
+            logger.debug(f"Dual-write: Queued feedback {feedback_id} for PostgreSQL")
+        return queued
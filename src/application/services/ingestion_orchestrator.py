@@ -0,0 +1,374 @@
+"""Parallel multi-document PDF ingestion.
+
+Runs the Neo4j PDF ingestion pipeline over many documents at once as three
+stages joined by bounded queues:
+
+- convert: PDF→Markdown in a ``ProcessPoolExecutor`` (CPU-bound; each worker
+  process keeps its own converter), or the saved Markdown when it exists
+- extract: LLM entity extraction with ``extraction_concurrency`` requests in flight
+- write: one writer persisting results to Neo4j, so concurrent documents never
+  contend for the same ``MERGE``d entities
+
+A full queue pauses the stage that feeds it, so a slow LLM or database cannot
+make converted documents pile up in memory.  Progress is recorded in the
+``DocumentTracker``: ``completed`` documents are skipped, so an interrupted
+run picks up where it stopped, and passing the tracker cursor from the last
+run as ``since`` limits the run to PDFs added or modified after it.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from application.services.document_tracker import DocumentRecord, DocumentTracker
+from application.services.neo4j_pdf_ingestion import (
+    ExtractionResult,
+    Neo4jPDFIngestionService,
+    PDFDocument,
+    convert_pdf_to_markdown,
+    create_pdf_converter,
+)
+
+logger = logging.getLogger(__name__)
+
+# Converters built inside a worker process, reused for every PDF it converts
+_worker_converters: Dict[str, Any] = {}
+
+
+def convert_in_worker(path: str, converter_name: str) -> str:
+    """Process-pool entry point: convert one PDF to cleaned Markdown."""
+    converter = _worker_converters.get(converter_name)
+    if converter is None:
+        converter = _worker_converters[converter_name] = create_pdf_converter(converter_name)
+    return convert_pdf_to_markdown(converter, converter_name, Path(path))
+
+
+@dataclass
+class StageMetrics:
+    """Throughput of one pipeline stage."""
+    name: str
+    completed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    max_seconds: float = 0.0
+    max_queue_depth: int = 0  # Deepest backlog waiting for this stage
+
+    def record(self, seconds: float) -> None:
+        self.completed += 1
+        self.busy_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    @property
+    def avg_seconds(self) -> float:
+        return self.busy_seconds / self.completed if self.completed else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "avg_seconds": round(self.avg_seconds, 3)}
+
+
+@dataclass
+class IngestionReport:
+    """Outcome of an orchestrated ingestion run."""
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    failures: Dict[str, str] = field(default_factory=dict)  # doc_id -> "stage: error"
+    skipped: int = 0
+    cursor: int = 0  # Tracker change cursor covering every ingested document
+    elapsed_seconds: float = 0.0
+    stages: Dict[str, StageMetrics] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "results": self.results,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "cursor": self.cursor,
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+            "stages": {name: metrics.to_dict() for name, metrics in self.stages.items()},
+        }
+
+
+class IngestionOrchestrator:
+    """Ingests tracked PDFs through concurrent convert/extract/write stages."""
+
+    def __init__(
+        self,
+        service: Neo4jPDFIngestionService,
+        tracker: DocumentTracker,
+        conversion_workers: Optional[int] = None,
+        extraction_concurrency: int = 4,
+        queue_size: int = 8,
+        write_batch_size: int = 16,
+        save_markdown: bool = True,
+        converter_name: Optional[str] = None,
+        convert_fn: Callable[[str, str], str] = convert_in_worker,
+    ):
+        """Initialize the orchestrator.
+
+        Args:
+            service: Provides LLM extraction and Neo4j persistence
+            tracker: Source of documents and their ingestion status
+            conversion_workers: Conversion processes (defaults to the CPU count)
+            extraction_concurrency: LLM extractions in flight at once
+            queue_size: Capacity of each inter-stage queue
+            write_batch_size: Results the writer drains per tracker update
+            save_markdown: Save converted Markdown next to the tracker's other output
+            converter_name: PDF converter (defaults to the service's)
+            convert_fn: Picklable ``(pdf_path, converter_name) -> markdown`` run in the pool
+        """
+        self.service = service
+        self.tracker = tracker
+        self.conversion_workers = conversion_workers or os.cpu_count() or 1
+        self.extraction_concurrency = extraction_concurrency
+        self.queue_size = queue_size
+        self.write_batch_size = write_batch_size
+        self.save_markdown = save_markdown
+        self.converter_name = converter_name or getattr(service, "_converter_name", "docling")
+        self.convert_fn = convert_fn
+
+    def select_documents(
+        self,
+        document_ids: Optional[Sequence[str]] = None,
+        retry_failed: bool = True,
+        since: int = 0,
+    ) -> Tuple[List[DocumentRecord], int, int]:
+        """Return the tracked documents still to ingest, how many were skipped and the tracker cursor.
+
+        Only documents added or modified after the ``since`` cursor are
+        considered. ``processing`` documents left behind by an interrupted
+        run are retried.
+        """
+        self.tracker.refresh(force=True)
+        records, cursor = self.tracker.changed_since(since)
+        if document_ids is not None:
+            wanted = set(document_ids)
+            records = [r for r in records if r.id in wanted]
+        pending = [
+            r for r in records
+            if r.status != "completed" and (retry_failed or r.status != "failed")
+        ]
+        return pending, len(records) - len(pending), cursor
+
+    async def run(
+        self,
+        document_ids: Optional[Sequence[str]] = None,
+        max_documents: Optional[int] = None,
+        retry_failed: bool = True,
+        executor: Optional[Executor] = None,
+        since: int = 0,
+    ) -> IngestionReport:
+        """Ingest every pending document.
+
+        Args:
+            document_ids: Restrict the run to these tracker IDs
+            max_documents: Ingest at most this many pending documents
+            retry_failed: Also retry documents whose last run failed
+            executor: Conversion executor; a spawn-based process pool is created if omitted
+            since: Tracker cursor from an earlier run; only newer changes are ingested.
+                A run truncated by ``max_documents`` reports this cursor unchanged
+
+        Returns:
+            IngestionReport with per-document results, failures and stage metrics
+        """
+        records, skipped, cursor = self.select_documents(document_ids, retry_failed, since)
+        if max_documents and len(records) > max_documents:
+            records = records[:max_documents]
+            # The documents left out are not ingested yet, so keep the cursor in place
+            cursor = since
+
+        report = IngestionReport(
+            skipped=skipped,
+            cursor=cursor,
+            stages={name: StageMetrics(name) for name in ("convert", "extract", "write")},
+        )
+        logger.info(f"Ingesting {len(records)} documents ({skipped} already done or skipped)")
+
+        owns_executor = executor is None
+        if owns_executor:
+            # spawn: converters load native libraries that do not survive fork
+            executor = ProcessPoolExecutor(
+                max_workers=self.conversion_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        converted: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        extracted: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        start = time.perf_counter()
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(self._convert_stage(records, executor, converted, report))
+                group.create_task(self._extract_stage(converted, extracted, report))
+                group.create_task(self._write_stage(extracted, report))
+        finally:
+            if owns_executor:
+                executor.shutdown(cancel_futures=True)
+        report.elapsed_seconds = time.perf_counter() - start
+
+        for metrics in report.stages.values():
+            logger.info(
+                f"Stage {metrics.name}: {metrics.completed} done, {metrics.failed} failed, "
+                f"avg {metrics.avg_seconds:.2f}s, max backlog {metrics.max_queue_depth}"
+            )
+        logger.info(
+            f"Ingestion finished in {report.elapsed_seconds:.1f}s: "
+            f"{len(report.results)} ingested, {len(report.failures)} failed"
+        )
+        return report
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    async def _convert_stage(
+        self,
+        records: List[DocumentRecord],
+        executor: Executor,
+        converted: asyncio.Queue,
+        report: IngestionReport,
+    ) -> None:
+        metrics = report.stages["convert"]
+        # A slot is held until the Markdown is queued, so a full queue stops new conversions
+        slots = asyncio.Semaphore(self.conversion_workers)
+
+        async def convert(record: DocumentRecord) -> None:
+            try:
+                started = time.perf_counter()
+                try:
+                    markdown = await self._load_or_convert(record, executor)
+                except Exception as e:
+                    metrics.failed += 1
+                    self._fail(record, "convert", e, report)
+                    return
+                metrics.record(time.perf_counter() - started)
+                await self._put(converted, (record, markdown), report.stages["extract"])
+            finally:
+                slots.release()
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for record in records:
+                    await slots.acquire()
+                    self.tracker.update_document(record.id, status="processing", error_message=None)
+                    group.create_task(convert(record))
+        finally:
+            for _ in range(self.extraction_concurrency):
+                await converted.put(None)
+
+    async def _extract_stage(
+        self,
+        converted: asyncio.Queue,
+        extracted: asyncio.Queue,
+        report: IngestionReport,
+    ) -> None:
+        metrics = report.stages["extract"]
+
+        async def worker() -> None:
+            while (item := await converted.get()) is not None:
+                record, markdown = item
+                started = time.perf_counter()
+                try:
+                    result = await self.service.extract_knowledge(markdown, self._pdf_document(record))
+                except Exception as e:
+                    metrics.failed += 1
+                    self._fail(record, "extract", e, report)
+                    continue
+                metrics.record(time.perf_counter() - started)
+                await self._put(extracted, (record, len(markdown), result), report.stages["write"])
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for _ in range(self.extraction_concurrency):
+                    group.create_task(worker())
+        finally:
+            await extracted.put(None)
+
+    async def _write_stage(self, extracted: asyncio.Queue, report: IngestionReport) -> None:
+        while True:
+            batch = [await extracted.get()]
+            while batch[-1] is not None and len(batch) < self.write_batch_size and not extracted.empty():
+                batch.append(extracted.get_nowait())
+            finished = batch[-1] is None
+            items = [item for item in batch if item is not None]
+            if items:
+                await self._write_batch(items, report)
+            if finished:
+                return
+
+    async def _write_batch(
+        self,
+        items: List[Tuple[DocumentRecord, int, ExtractionResult]],
+        report: IngestionReport,
+    ) -> None:
+        metrics = report.stages["write"]
+        completed: Dict[str, dict] = {}
+        for record, markdown_chars, result in items:
+            started = time.perf_counter()
+            try:
+                stats = await self.service.persist_to_neo4j(result)
+            except Exception as e:
+                metrics.failed += 1
+                self._fail(record, "write", e, report)
+                continue
+            metrics.record(time.perf_counter() - started)
+
+            report.results.append({
+                "document_id": record.id,
+                "document": record.filename,
+                "category": record.category,
+                "markdown_chars": markdown_chars,
+                "extraction_time_seconds": result.extraction_time_seconds,
+                "entities_added": stats.get("entities_added", 0),
+                "relationships_added": stats.get("relationships_added", 0),
+            })
+            completed[record.id] = {
+                "status": "completed",
+                "ingested_at": datetime.now().isoformat(),
+                "entity_count": stats.get("entities_added", 0),
+                "relationship_count": stats.get("relationships_added", 0),
+                "markdown_path": record.markdown_path,
+                "error_message": None,
+            }
+        if completed:
+            self.tracker.update_documents(completed)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    async def _load_or_convert(self, record: DocumentRecord, executor: Executor) -> str:
+        """Reuse the document's saved Markdown, otherwise convert it in the pool."""
+        if record.markdown_path and os.path.exists(record.markdown_path):
+            return await asyncio.to_thread(Path(record.markdown_path).read_text, encoding="utf-8")
+
+        loop = asyncio.get_running_loop()
+        markdown = await loop.run_in_executor(executor, self.convert_fn, record.path, self.converter_name)
+
+        if self.save_markdown:
+            markdown_path = self.tracker.markdown_directory / f"{Path(record.path).stem}.md"
+            markdown_path.parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(markdown_path.write_text, markdown, encoding="utf-8")
+            record.markdown_path = str(markdown_path)
+        return markdown
+
+    async def _put(self, queue: asyncio.Queue, item: Any, consumer: StageMetrics) -> None:
+        await queue.put(item)
+        consumer.max_queue_depth = max(consumer.max_queue_depth, queue.qsize())
+
+    def _pdf_document(self, record: DocumentRecord) -> PDFDocument:
+        return PDFDocument(
+            path=Path(record.path),
+            filename=record.filename,
+            category=record.category,
+            size_bytes=record.size_bytes,
+        )
+
+    def _fail(self, record: DocumentRecord, stage: str, error: Exception, report: IngestionReport) -> None:
+        logger.error(f"{stage} failed for {record.filename}: {error}")
+        report.failures[record.id] = f"{stage}: {error}"
+        self.tracker.update_document(record.id, status="failed", error_message=f"{stage}: {error}")
@@ -25,16 +25,19 @@ Architecture:
     Response (answer + confidence + sources + reasoning trail)
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+import time
+from typing import Awaitable, List, Dict, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 import os
 from openai import AsyncOpenAI
 
-from application.services.cross_graph_query_builder import CrossGraphQueryBuilder
+from application.services.cross_graph_query_builder import AsyncCrossGraphQueryBuilder
 from application.services.rag_service import RAGService
 from application.services.document_service import DocumentService
+from application.services.dual_write_outbox import get_dual_write_outbox
 from application.services.neurosymbolic_query_service import NeurosymbolicQueryService
 from application.agents.knowledge_manager.reasoning_engine import ReasoningEngine
 from application.agents.knowledge_manager.validation_engine import ValidationEngine
@@ -62,6 +65,20 @@ class Message:
     metadata: Dict[str, Any] = field(default_factory=dict)  # NEW: Additional metadata
 
 
+@dataclass
+class RetrievalTiming:
+    """Latency and outcome of one retrieval source within a chat turn."""
+    source: str
+    elapsed_ms: float
+    status: str  # 'ok', 'timeout' or 'error'
+
+    def to_trail_entry(self) -> str:
+        """Format as a reasoning trail line."""
+        if self.status == "ok":
+            return f"Retrieval {self.source}: {self.elapsed_ms:.0f} ms"
+        return f"Retrieval {self.source}: {self.status} after {self.elapsed_ms:.0f} ms (skipped)"
+
+
 @dataclass
 class ChatResponse:
     """Response from the chat service."""
@@ -150,15 +167,29 @@ If the available information is insufficient, clearly explain what's missing and
 
 Answer:"""
 
+    # Per-source retrieval timeouts in seconds; a source that exceeds its
+    # timeout is cancelled and the answer is built without it
+    DEFAULT_RETRIEVAL_TIMEOUTS = {
+        "patient_context": 3.0,
+        "entities": 10.0,
+        "medical_knowledge": 5.0,
+        "data_context": 5.0,
+        "cross_graph_links": 5.0,
+        "documents": 8.0,
+    }
+
     def __init__(
         self,
         openai_api_key: Optional[str] = None,
         model: str = "gpt-4o-mini",
         patient_memory_service=None,  # NEW: Optional patient memory service
         mem0=None,  # NEW: Mem0 instance for memory context
-        enable_conversational_layer: bool = True  # NEW: Enable conversational personality layer
+        enable_conversational_layer: bool = True,  # NEW: Enable conversational personality layer
+        retrieval_timeouts: Optional[Dict[str, float]] = None
     ):
         """Initialize the chat service."""
+        self.retrieval_timeouts = {**self.DEFAULT_RETRIEVAL_TIMEOUTS, **(retrieval_timeouts or {})}
+
         # Initialize OpenAI client
         api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
         if not api_key:
@@ -188,10 +219,12 @@ Answer:"""
             chunk_overlap=300,
             faiss_index_path="data/faiss_index",
             db_session_factory=doc_db_session_factory,
+            outbox=get_dual_write_outbox() if doc_db_session_factory else None,
         )
 
         # Initialize sub-services
-        self.query_builder = CrossGraphQueryBuilder()
+        # Shares the backend's async driver pool so graph lookups never block the event loop
+        self.query_builder = AsyncCrossGraphQueryBuilder(backend=neo4j_backend)
         self.rag_service = RAGService(
             document_service=self.document_service,
             kg_backend=neo4j_backend,
@@ -314,39 +347,15 @@ Answer:"""
                 intent = None
                 memory_context = None
 
-        # Step 1.5: Retrieve patient context (if patient_id provided)
-        patient_context = None
-        if patient_id and self.patient_memory:
-            try:
-                patient_context = await self.patient_memory.get_patient_context(patient_id)
-                logger.info(f"Patient context loaded: {len(patient_context.diagnoses)} diagnoses, "
-                           f"{len(patient_context.medications)} medications, "
-                           f"{len(patient_context.allergies)} allergies")
-            except Exception as e:
-                logger.warning(f"Failed to load patient context: {e}")
-                patient_context = None
-
-        # Step 1: Extract entities from question
-        entities = await self._extract_entities(question)
-
-        # Add patient's conditions to entity list for better context retrieval
-        if patient_context:
-            patient_entities = [dx["condition"] for dx in patient_context.diagnoses]
-            entities.extend(patient_entities)
-
-        logger.info(f"Extracted entities: {entities}")
-
-        # Step 2: Retrieve medical knowledge
-        medical_context = await self._retrieve_medical_knowledge(entities, question)
-
-        # Step 3: Retrieve data catalog context
-        data_context = await self._retrieve_data_context(entities, question)
-
-        # Step 4: Find cross-graph relationships
-        cross_links = await self._retrieve_cross_graph_links(entities)
-
-        # Step 5: RAG-based document retrieval
-        document_chunks = await self._retrieve_documents(question)
+        # Steps 1-5: Retrieve patient context, entities, knowledge and documents concurrently
+        retrieval = await self._retrieve_context(question, patient_id)
+        patient_context = retrieval["patient_context"]
+        entities = retrieval["entities"]
+        medical_context = retrieval["medical_context"]
+        data_context = retrieval["data_context"]
+        cross_links = retrieval["cross_links"]
+        document_chunks = retrieval["document_chunks"]
+        retrieval_trail = [timing.to_trail_entry() for timing in retrieval["timings"]]
 
         # Step 6: Apply neurosymbolic reasoning
         reasoning_result = await self._apply_reasoning(
@@ -489,7 +498,7 @@ Answer:"""
             confidence=confidence,
             sources=sources,
             related_concepts=related_concepts,
-            reasoning_trail=reasoning_result.get("provenance", []),
+            reasoning_trail=retrieval_trail + reasoning_result.get("provenance", []),
             query_time_seconds=query_time,
             medical_alerts=medical_alerts,
             routing=routing_info,
@@ -497,6 +506,112 @@ Answer:"""
             entities=entity_list,
         )
 
+    async def _retrieve_context(
+        self,
+        question: str,
+        patient_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Run the retrieval stage with independent sources in parallel.
+
+        Patient context, entity extraction and document retrieval start
+        together. Graph retrieval needs the extracted entities (plus the
+        patient's diagnoses), so it starts as soon as those are available.
+        Each source has its own timeout; a source that times out or fails
+        contributes an empty result instead of failing the turn.
+
+        Returns:
+            Dict with patient_context, entities, medical_context, data_context,
+            cross_links, document_chunks and per-source timings
+        """
+        timings: List[RetrievalTiming] = []
+
+        async with asyncio.TaskGroup() as tg:
+            patient_task = None
+            if patient_id and self.patient_memory:
+                patient_task = tg.create_task(self._timed_retrieval(
+                    "patient_context", self._load_patient_context(patient_id), None, timings
+                ))
+            entities_task = tg.create_task(self._timed_retrieval(
+                "entities", self._extract_entities(question), [], timings
+            ))
+            documents_task = tg.create_task(self._timed_retrieval(
+                "documents", self._retrieve_documents(question), [], timings
+            ))
+
+            patient_context = await patient_task if patient_task else None
+            entities = list(await entities_task)
+
+            # Add patient's conditions to entity list for better context retrieval
+            if patient_context:
+                entities.extend(dx["condition"] for dx in patient_context.diagnoses)
+            logger.info(f"Extracted entities: {entities}")
+
+            medical_task = tg.create_task(self._timed_retrieval(
+                "medical_knowledge",
+                self._retrieve_medical_knowledge(entities, question),
+                {"entities": [], "relationships": []},
+                timings
+            ))
+            data_task = tg.create_task(self._timed_retrieval(
+                "data_context",
+                self._retrieve_data_context(entities, question),
+                {"tables": [], "columns": []},
+                timings
+            ))
+            cross_links_task = tg.create_task(self._timed_retrieval(
+                "cross_graph_links", self._retrieve_cross_graph_links(entities), [], timings
+            ))
+
+        return {
+            "patient_context": patient_context,
+            "entities": entities,
+            "medical_context": medical_task.result(),
+            "data_context": data_task.result(),
+            "cross_links": cross_links_task.result(),
+            "document_chunks": documents_task.result(),
+            "timings": timings,
+        }
+
+    async def _timed_retrieval(
+        self,
+        source: str,
+        retrieval: Awaitable[Any],
+        default: Any,
+        timings: List[RetrievalTiming]
+    ) -> Any:
+        """Await one retrieval source under its timeout, recording its latency.
+
+        Returns ``default`` if the source times out or raises.
+        """
+        timeout = self.retrieval_timeouts.get(source)
+        started = time.perf_counter()
+        status = "ok"
+        try:
+            return await asyncio.wait_for(retrieval, timeout=timeout)
+        except asyncio.TimeoutError:
+            status = "timeout"
+            logger.warning(f"Retrieval source '{source}' timed out after {timeout}s")
+            return default
+        except Exception as e:
+            status = "error"
+            logger.warning(f"Retrieval source '{source}' failed: {e}")
+            return default
+        finally:
+            timings.append(RetrievalTiming(
+                source=source,
+                elapsed_ms=(time.perf_counter() - started) * 1000,
+                status=status
+            ))
+
+    async def _load_patient_context(self, patient_id: str):
+        """Load the patient's context from patient memory."""
+        patient_context = await self.patient_memory.get_patient_context(patient_id)
+        logger.info(f"Patient context loaded: {len(patient_context.diagnoses)} diagnoses, "
+                   f"{len(patient_context.medications)} medications, "
+                   f"{len(patient_context.allergies)} allergies")
+        return patient_context
+
     async def _extract_entities(self, question: str) -> List[str]:
         """Extract medical and data entities from the question using LLM."""
         prompt = f"""Extract key medical and data entities from this question.
@@ -742,7 +857,7 @@ Patient message: """ + message
         # Search for each extracted entity
         for entity_name in entities[:5]:  # Limit to 5 entities
             try:
-                result = self.query_builder.search_medical_entities(
+                result = await self.query_builder.search_medical_entities(
                     search_term=entity_name,
                     entity_types=None
                 )
@@ -760,7 +875,7 @@ Patient message: """ + message
 
                 # Get relationships for first entity
                 if result.records:
-                    rel_result = self.query_builder.find_related_entities(
+                    rel_result = await self.query_builder.find_related_entities(
                         entity_name=result.records[0].get("name"),
                         max_results=5
                     )
@@ -791,7 +906,7 @@ Patient message: """ + message
 
         # Find data concepts
         try:
-            result = self.query_builder.find_medical_concepts_in_data(
+            result = await self.query_builder.find_medical_concepts_in_data(
                 confidence_threshold=0.70
             )
 
@@ -824,7 +939,7 @@ Patient message: """ + message
         for entity_name in entities[:3]:  # Top 3 entities
             try:
                 # Find tables for this entity (if it's a disease)
-                result = self.query_builder.find_tables_for_disease(entity_name)
+                result = await self.query_builder.find_tables_for_disease(entity_name)
 
                 for record in result.records:
                     if record.get("tables"):
@@ -225,6 +225,60 @@ class LayerTransitionService:
         self.transition_history.append(record)
         return record
 
+    def record_applied_transitions(
+        self,
+        transitions: List[Tuple[LayerTransitionRequest, Dict[str, Any]]],
+        transition_ids: Optional[Dict[str, str]] = None
+    ) -> List[LayerTransitionRecord]:
+        """
+        Record transitions that were already applied in the graph.
+
+        Bulk promotions validate and write many entities without going
+        through :meth:`execute_transition`; recording them here keeps them
+        in the audit trail, lineage and statistics.
+
+        Args:
+            transitions: Validated requests with the entity data they promoted
+            transition_ids: Graph audit record IDs by entity ID (generated
+                as in :meth:`request_transition` when missing)
+
+        Returns:
+            Completed transition records
+        """
+        transition_ids = transition_ids or {}
+        completed_at = datetime.now()
+        records = []
+
+        for request, entity_data in transitions:
+            transition_id = transition_ids.get(request.entity_id)
+            if transition_id is None:
+                self._transition_counter += 1
+                transition_id = f"transition_{self._transition_counter:06d}"
+
+            records.append(LayerTransitionRecord(
+                transition_id=transition_id,
+                entity_id=request.entity_id,
+                entity_name=request.metadata.get("entity_name", "unknown"),
+                from_layer=request.from_layer,
+                to_layer=request.to_layer,
+                reason=request.reason,
+                status=TransitionStatus.COMPLETED,
+                requested_by=request.requested_by,
+                requested_at=request.requested_at,
+                completed_at=completed_at,
+                approved_by="system",
+                validation_results={
+                    "is_valid": True,
+                    "errors": [],
+                    "validated_at": completed_at.isoformat()
+                },
+                properties_changed=self._compute_property_changes(entity_data, request.to_layer)
+            ))
+
+        self.transition_history.extend(records)
+        logger.info(f"Recorded {len(records)} applied transitions")
+        return records
+
     async def execute_transition(
         self,
         transition_id: str,
@@ -17,6 +17,7 @@ from collections import Counter
 from mem0 import Memory
 
 from domain.conversation_models import MemoryContext
+from infrastructure.async_mem0_client import AsyncMem0Client
 from application.services.patient_memory_service import PatientMemoryService
 
 logger = logging.getLogger(__name__)
@@ -46,6 +47,11 @@ class MemoryContextBuilder:
         """
         self.memory = patient_memory_service
         self.mem0 = mem0
+        # Share the service's Mem0 thread pool and in-flight calls when possible
+        if getattr(patient_memory_service, "mem0", None) is mem0:
+            self.memories = patient_memory_service.memories
+        else:
+            self.memories = AsyncMem0Client(mem0)
         logger.info("MemoryContextBuilder initialized")
 
     async def build_context(
@@ -146,7 +152,7 @@ class MemoryContextBuilder:
         """
         try:
             # Get recent memories (last 20, covering ~5 sessions)
-            memories = self.mem0.get_all(
+            memories = await self.memories.get_all(
                 user_id=patient_id,
                 limit=20
             )
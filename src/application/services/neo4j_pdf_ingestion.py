@@ -14,9 +14,12 @@ This version writes directly to Neo4j with proper layer structure for neurosymbo
 - APPLICATION layer: Query patterns (future)
 """
 
+import hashlib
 import os
 import re
 import json
+import time
+from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
@@ -30,11 +33,133 @@ except ImportError:
     MARKITDOWN_AVAILABLE = False
 
 from openai import AsyncOpenAI
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase
 
 logger = logging.getLogger(__name__)
 
 
+def create_pdf_converter(name: str):
+    """Return the PDF→Markdown converter instance for ``name``."""
+    if name == "docling":
+        from application.services.docling_wrapper import DoclingWrapper
+        converter = DoclingWrapper()
+        logger.info("PDF converter: Docling")
+        return converter
+    elif name == "pymupdf4llm":
+        from application.services.pymupdf4llm_wrapper import PyMuPDF4LLMWrapper
+        converter = PyMuPDF4LLMWrapper()
+        logger.info("PDF converter: PyMuPDF4LLM")
+        return converter
+    else:
+        if not MARKITDOWN_AVAILABLE:
+            raise ImportError("markitdown not available")
+        logger.info("PDF converter: MarkItDown")
+        return MarkItDown()
+
+
+def convert_pdf_to_markdown(converter, converter_name: str, path: Path) -> str:
+    """Convert a PDF with a converter from ``create_pdf_converter`` and clean the result."""
+    # Convert — API differs per converter
+    if converter_name in ("docling", "pymupdf4llm"):
+        # Wrappers expose convert_to_markdown(path) -> str
+        markdown = converter.convert_to_markdown(str(path))
+        if markdown is None:
+            raise RuntimeError(f"{converter_name} conversion returned None for {Path(path).name}")
+    else:
+        # MarkItDown: .convert(path).text_content
+        result = converter.convert(str(path))
+        markdown = result.text_content
+
+    return clean_markdown(markdown)
+
+
+def clean_markdown(markdown: str) -> str:
+    """Clean Markdown content."""
+    # Remove excessive newlines
+    cleaned = re.sub(r'\n{3,}', '\n\n', markdown)
+
+    # Remove trailing whitespace
+    cleaned = re.sub(r'[ \t]+\n', '\n', cleaned)
+
+    # Remove horizontal rules (metadata separators)
+    cleaned = re.sub(r'---+', '', cleaned)
+
+    # Normalize bold/italic
+    cleaned = re.sub(r'\*\*\*(.+?)\*\*\*', r'**\1**', cleaned)
+    cleaned = re.sub(r'__(.+?)__', r'**\1**', cleaned)
+
+    # Remove very short lines (artifacts)
+    lines = cleaned.split('\n')
+    filtered_lines = [
+        line for line in lines
+        if len(line.strip()) > 2 or line.strip() in ['', '#']
+    ]
+    cleaned = '\n'.join(filtered_lines)
+
+    return cleaned.strip()
+
+
+# Indexes backing the MERGE/MATCH keys used by persist_to_neo4j
+INGESTION_INDEX_QUERIES = [
+    "CREATE INDEX idx_document_name IF NOT EXISTS FOR (d:Document) ON (d.name)",
+    "CREATE INDEX idx_chunk_id IF NOT EXISTS FOR (c:Chunk) ON (c.id)",
+    "CREATE INDEX idx_extracted_entity_name IF NOT EXISTS FOR (e:ExtractedEntity) ON (e.name)",
+    "CREATE INDEX idx_extracted_entity_id IF NOT EXISTS FOR (e:ExtractedEntity) ON (e.id)",
+]
+
+MERGE_DOCUMENT_QUERY = """
+MERGE (d:Document {name: $name})
+SET d.path = $path,
+    d.category = $category,
+    d.size_bytes = $size_bytes,
+    d.ingested_at = datetime(),
+    d.entity_count = $entity_count,
+    d.relationship_count = $rel_count
+MERGE (c:Chunk {id: $chunk_id})
+SET c.chunk_num = 0,
+    c.source_document = $name
+MERGE (d)-[:HAS_CHUNK]->(c)
+"""
+
+# Labels cannot be parameterized, so one statement is built per entity label
+MERGE_ENTITIES_QUERY = """
+MATCH (c:Chunk {{id: $chunk_id}})
+UNWIND $rows AS row
+MERGE (e:ExtractedEntity:`{label}` {{name: row.name}})
+SET e.id = row.id,
+    e.type = row.type,
+    e.description = row.description,
+    e.confidence = row.confidence,
+    e.extraction_confidence = row.confidence,
+    e.source_document = $source_document,
+    e.category = $category,
+    e.layer = 'PERCEPTION',
+    e.created_at = $created_at
+MERGE (c)-[:MENTIONS]->(e)
+RETURN count(*) AS written
+"""
+
+MERGE_LINKS_QUERY = """
+UNWIND $rows AS row
+MATCH (source:ExtractedEntity {id: row.source_id})
+MATCH (target:ExtractedEntity {id: row.target_id})
+MERGE (source)-[r:LINKS_TO]->(target)
+SET r.type = row.type,
+    r.description = row.description,
+    r.layer = 'PERCEPTION',
+    r.created_at = $created_at
+RETURN count(DISTINCT row) AS written
+"""
+
+
+def _reverse_abbreviations(abbreviations: Dict[str, str]) -> Dict[str, List[str]]:
+    """Map each lowercased full name to the abbreviations that expand to it."""
+    by_name: Dict[str, List[str]] = defaultdict(list)
+    for abbrev, full_name in abbreviations.items():
+        by_name[full_name.lower()].append(abbrev)
+    return dict(by_name)
+
+
 @dataclass
 class PDFDocument:
     """Represents a PDF document."""
@@ -130,6 +255,7 @@ Extract entities and relationships as JSON:"""
         "ANA": "Antinuclear Antibodies",
         "OADR-ORWH": "Office of Autoimmune Disease Research - Office of Research on Women's Health",
     }
+    ABBREVIATIONS_BY_NAME = _reverse_abbreviations(ABBREVIATION_MAP)
 
     def __init__(
         self,
@@ -138,9 +264,13 @@ Extract entities and relationships as JSON:"""
         neo4j_uri: Optional[str] = None,
         neo4j_user: Optional[str] = None,
         neo4j_password: Optional[str] = None,
-        model: str = "gpt-4o-mini"
+        model: str = "gpt-4o-mini",
+        write_batch_size: int = 1000,
     ):
-        """Initialize the service."""
+        """Initialize the service.
+
+        ``write_batch_size`` caps the rows sent per UNWIND write transaction.
+        """
         import os
         from dotenv import load_dotenv
 
@@ -166,38 +296,25 @@ Extract entities and relationships as JSON:"""
         self.neo4j_user = neo4j_user or os.getenv("NEO4J_USERNAME", "neo4j")
         self.neo4j_password = neo4j_password or os.getenv("NEO4J_PASSWORD", "")
 
-        self.driver = GraphDatabase.driver(
+        self.driver = AsyncGraphDatabase.driver(
             self.neo4j_uri,
             auth=(self.neo4j_user, self.neo4j_password)
         )
+        self.write_batch_size = write_batch_size
+        self._indexes_ensured = False
 
         logger.info(
             f"Neo4jPDFIngestionService initialized: "
             f"pdf_dir={pdf_directory}, model={model}, neo4j={self.neo4j_uri}"
         )
 
-    def __del__(self):
+    async def close(self):
         """Close Neo4j connection."""
-        if hasattr(self, 'driver'):
-            self.driver.close()
+        await self.driver.close()
 
     def _init_converter(self, name: str):
         """Return the configured PDF→Markdown converter instance."""
-        if name == "docling":
-            from application.services.docling_wrapper import DoclingWrapper
-            converter = DoclingWrapper()
-            logger.info("PDF converter: Docling")
-            return converter
-        elif name == "pymupdf4llm":
-            from application.services.pymupdf4llm_wrapper import PyMuPDF4LLMWrapper
-            converter = PyMuPDF4LLMWrapper()
-            logger.info("PDF converter: PyMuPDF4LLM")
-            return converter
-        else:
-            if not MARKITDOWN_AVAILABLE:
-                raise ImportError("markitdown not available")
-            logger.info("PDF converter: MarkItDown")
-            return MarkItDown()
+        return create_pdf_converter(name)
 
     def discover_pdfs(self) -> List[PDFDocument]:
         """Discover all PDF files (same as FalkorDB version)."""
@@ -299,150 +416,175 @@ Extract entities and relationships as JSON:"""
         Creates the standard graph pattern used throughout SynapseFlow:
         - (Document)-[:HAS_CHUNK]->(Chunk)-[:MENTIONS]->(ExtractedEntity)
         - (ExtractedEntity)-[:LINKS_TO]->(ExtractedEntity)
-        """
-        import hashlib
 
-        entities_added = 0
-        relationships_added = 0
-        skipped = 0
+        Entities and relationships are written with UNWIND, at most
+        ``write_batch_size`` rows per managed write transaction. A batch that
+        fails is logged and counted, and the remaining batches still run.
+        """
         doc = extraction_result.document
         doc_name = doc.filename
-
-        with self.driver.session() as session:
-            # Step 1: Create Document node
-            session.run(
-                """
-                MERGE (d:Document {name: $name})
-                SET d.path = $path,
-                    d.category = $category,
-                    d.size_bytes = $size_bytes,
-                    d.ingested_at = datetime(),
-                    d.entity_count = $entity_count,
-                    d.relationship_count = $rel_count
-                """,
-                name=doc_name,
-                path=str(doc.path),
-                category=doc.category or "general",
-                size_bytes=doc.size_bytes,
-                entity_count=len(extraction_result.entities),
-                rel_count=len(extraction_result.relationships)
-            )
-
-            # Step 2: Create a Chunk node for the document content
-            chunk_id = hashlib.sha256(f"{doc_name}:chunk:0".encode()).hexdigest()[:16]
-            session.run(
-                """
-                MATCH (d:Document {name: $doc_name})
-                MERGE (c:Chunk {id: $chunk_id})
-                SET c.chunk_num = 0,
-                    c.source_document = $doc_name
-                MERGE (d)-[:HAS_CHUNK]->(c)
-                """,
-                doc_name=doc_name,
-                chunk_id=chunk_id
+        category = doc.category or "general"
+        created_at = datetime.now().isoformat()
+        chunk_id = hashlib.sha256(f"{doc_name}:chunk:0".encode()).hexdigest()[:16]
+
+        entity_rows, entity_id_map = self._entity_rows(extraction_result.entities)
+        link_rows, skipped = self._link_rows(extraction_result.relationships, entity_id_map)
+
+        stats = {
+            "entities_added": 0,
+            "relationships_added": 0,
+            "relationships_skipped": skipped,
+            "failed_batches": 0,
+        }
+        start = time.perf_counter()
+
+        async with self.driver.session() as session:
+            await self._ensure_indexes(session)
+
+            # Step 1: Document and its Chunk
+            await self._write(
+                session,
+                MERGE_DOCUMENT_QUERY,
+                {
+                    "name": doc_name,
+                    "path": str(doc.path),
+                    "category": category,
+                    "size_bytes": doc.size_bytes,
+                    "entity_count": len(extraction_result.entities),
+                    "rel_count": len(extraction_result.relationships),
+                    "chunk_id": chunk_id,
+                },
             )
 
-            # Step 3: Create ExtractedEntity nodes
-            entity_id_map = {}  # normalized_name -> entity_id
-            for entity in extraction_result.entities:
-                entity_type = entity.get("type", "Entity")
-                entity_name_raw = entity.get("name", "Unknown")
-                entity_name = self._normalize_entity_name(entity_name_raw)
-                sanitized_type = self._sanitize_label(entity_type)
-
-                # Create stable entity ID
-                entity_id = f"extracted:{entity_name.lower().replace(' ', '_')}"
-                entity_id_map[entity_name] = entity_id
-                entity_id_map[entity_name_raw] = entity_id
-                entity_id_map[entity_name.lower()] = entity_id
-
-                # Add abbreviation mappings
-                for abbrev, full_name in self.ABBREVIATION_MAP.items():
-                    if entity_name.lower() == full_name.lower():
-                        entity_id_map[abbrev] = entity_id
-                        entity_id_map[abbrev.lower()] = entity_id
-
-                try:
-                    # Create with ExtractedEntity label + type-specific label
-                    session.run(
-                        f"""
-                        MERGE (e:ExtractedEntity:{sanitized_type} {{name: $name}})
-                        SET e.id = $id,
-                            e.type = $type,
-                            e.description = $description,
-                            e.confidence = $confidence,
-                            e.extraction_confidence = $confidence,
-                            e.source_document = $source_document,
-                            e.category = $category,
-                            e.layer = 'PERCEPTION',
-                            e.created_at = $created_at
-                        """,
-                        name=entity_name.lower().replace(' ', '_'),
-                        id=entity_id,
-                        type=entity_type,
-                        description=entity.get("description", ""),
-                        confidence=entity.get("confidence", 0.5),
-                        source_document=doc_name,
-                        category=doc.category or "general",
-                        created_at=datetime.now().isoformat()
-                    )
-
-                    # Link entity to chunk via MENTIONS
-                    session.run(
-                        """
-                        MATCH (c:Chunk {id: $chunk_id})
-                        MATCH (e:ExtractedEntity {id: $entity_id})
-                        MERGE (c)-[:MENTIONS]->(e)
-                        """,
-                        chunk_id=chunk_id,
-                        entity_id=entity_id
-                    )
-
-                    entities_added += 1
-                except Exception as e:
-                    logger.warning(f"Failed to add entity {entity_name}: {e}")
-
-            # Step 4: Create relationships between entities
-            for rel in extraction_result.relationships:
-                source_name = rel.get("source", "")
-                target_name = rel.get("target", "")
-                rel_type = rel.get("type", "RELATED_TO")
-
-                source_id = entity_id_map.get(source_name) or entity_id_map.get(source_name.lower())
-                target_id = entity_id_map.get(target_name) or entity_id_map.get(target_name.lower())
-
-                if not source_id or not target_id:
-                    logger.debug(f"Skipping relationship {source_name} -> {target_name} (entity not found)")
-                    skipped += 1
-                    continue
-
+            # Step 2: ExtractedEntity nodes and MENTIONS links, one statement per label
+            for label, rows in entity_rows.items():
+                query = MERGE_ENTITIES_QUERY.format(label=label)
+                for batch in self._batches(rows):
+                    try:
+                        stats["entities_added"] += await self._write(
+                            session,
+                            query,
+                            {
+                                "rows": batch,
+                                "chunk_id": chunk_id,
+                                "source_document": doc_name,
+                                "category": category,
+                                "created_at": created_at,
+                            },
+                        )
+                    except Exception as e:
+                        stats["failed_batches"] += 1
+                        logger.warning(f"Failed to add {len(batch)} {label} entities: {e}")
+
+            # Step 3: LINKS_TO relationships between entities
+            for batch in self._batches(link_rows):
                 try:
-                    self._sanitize_label(rel_type)
-                    session.run(
-                        """
-                        MATCH (source:ExtractedEntity {id: $source_id})
-                        MATCH (target:ExtractedEntity {id: $target_id})
-                        MERGE (source)-[r:LINKS_TO]->(target)
-                        SET r.type = $rel_type,
-                            r.description = $description,
-                            r.layer = 'PERCEPTION',
-                            r.created_at = $created_at
-                        """,
-                        source_id=source_id,
-                        target_id=target_id,
-                        rel_type=rel_type,
-                        description=rel.get("description", ""),
-                        created_at=datetime.now().isoformat()
+                    stats["relationships_added"] += await self._write(
+                        session, MERGE_LINKS_QUERY, {"rows": batch, "created_at": created_at}
                     )
-                    relationships_added += 1
                 except Exception as e:
-                    logger.warning(f"Failed to add relationship {source_name} -> {target_name}: {e}")
+                    stats["failed_batches"] += 1
+                    logger.warning(f"Failed to add {len(batch)} relationships: {e}")
+
+        write_seconds = time.perf_counter() - start
+        rows_written = stats["entities_added"] + stats["relationships_added"]
+        stats["rows_written"] = rows_written
+        stats["write_seconds"] = round(write_seconds, 3)
+        stats["rows_per_second"] = round(rows_written / write_seconds, 1) if write_seconds > 0 else 0.0
+        logger.info(
+            f"Persisted {doc_name}: {rows_written} rows in {write_seconds:.2f}s "
+            f"({stats['rows_per_second']} rows/s)"
+        )
+        return stats
 
-        return {
-            "entities_added": entities_added,
-            "relationships_added": relationships_added,
-            "relationships_skipped": skipped
-        }
+    def _entity_rows(
+        self,
+        entities: List[Dict[str, Any]]
+    ) -> "tuple[Dict[str, List[Dict[str, Any]]], Dict[str, str]]":
+        """Group entity rows by label and build the name → entity ID lookup."""
+        rows_by_label: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        entity_id_map: Dict[str, str] = {}  # name variants and abbreviations -> entity_id
+
+        for entity in entities:
+            entity_type = entity.get("type", "Entity")
+            entity_name_raw = entity.get("name", "Unknown")
+            entity_name = self._normalize_entity_name(entity_name_raw)
+            key = entity_name.lower().replace(' ', '_')
+
+            # Create stable entity ID
+            entity_id = f"extracted:{key}"
+            entity_id_map[entity_name] = entity_id
+            entity_id_map[entity_name_raw] = entity_id
+            entity_id_map[entity_name.lower()] = entity_id
+
+            # Add abbreviation mappings
+            for abbrev in self.ABBREVIATIONS_BY_NAME.get(entity_name.lower(), ()):
+                entity_id_map[abbrev] = entity_id
+                entity_id_map[abbrev.lower()] = entity_id
+
+            rows_by_label[self._sanitize_label(entity_type)].append({
+                "name": key,
+                "id": entity_id,
+                "type": entity_type,
+                "description": entity.get("description", ""),
+                "confidence": entity.get("confidence", 0.5),
+            })
+
+        return dict(rows_by_label), entity_id_map
+
+    def _link_rows(
+        self,
+        relationships: List[Dict[str, Any]],
+        entity_id_map: Dict[str, str]
+    ) -> "tuple[List[Dict[str, Any]], int]":
+        """Resolve relationship endpoints to entity IDs; returns rows and the skipped count."""
+        rows = []
+        skipped = 0
+        for rel in relationships:
+            source_name = rel.get("source", "")
+            target_name = rel.get("target", "")
+
+            source_id = entity_id_map.get(source_name) or entity_id_map.get(source_name.lower())
+            target_id = entity_id_map.get(target_name) or entity_id_map.get(target_name.lower())
+
+            if not source_id or not target_id:
+                logger.debug(f"Skipping relationship {source_name} -> {target_name} (entity not found)")
+                skipped += 1
+                continue
+
+            rows.append({
+                "source_id": source_id,
+                "target_id": target_id,
+                "type": rel.get("type", "RELATED_TO"),
+                "description": rel.get("description", ""),
+            })
+        return rows, skipped
+
+    def _batches(self, rows: List[Dict[str, Any]]):
+        for start in range(0, len(rows), self.write_batch_size):
+            yield rows[start:start + self.write_batch_size]
+
+    async def _write(self, session, query: str, params: Dict[str, Any]) -> int:
+        """Run one statement in a managed write transaction; returns its ``written`` count."""
+        async def work(tx):
+            result = await tx.run(query, params)
+            record = await result.single()
+            return record["written"] if record and "written" in record.keys() else 0
+
+        return await session.execute_write(work)
+
+    async def _ensure_indexes(self, session) -> None:
+        if self._indexes_ensured:
+            return
+        ensured = True
+        for query in INGESTION_INDEX_QUERIES:
+            try:
+                await session.run(query)
+            except Exception as e:
+                ensured = False
+                logger.warning(f"Could not create ingestion index: {e}")
+        # Retried on the next persist until every index exists
+        self._indexes_ensured = ensured
 
     def _normalize_entity_name(self, name: str) -> str:
         """Normalize entity name (same as FalkorDB version)."""
@@ -453,7 +595,7 @@ Extract entities and relationships as JSON:"""
 
     def _sanitize_label(self, label: str) -> str:
         """Sanitize label for Neo4j (remove spaces, special chars)."""
-        sanitized = label.replace(" ", "").replace("-", "").replace("_", "")
+        sanitized = label.replace(" ", "").replace("-", "").replace("_", "").replace("`", "")
         if sanitized and not sanitized[0].isalpha():
             sanitized = "Entity" + sanitized
         if not sanitized:
@@ -464,19 +606,7 @@ Extract entities and relationships as JSON:"""
         """Convert PDF to Markdown and clean."""
         logger.info(f"Converting: {document.filename} (converter={self._converter_name})")
 
-        # Convert — API differs per converter
-        if self._converter_name in ("docling", "pymupdf4llm"):
-            # Wrappers expose convert_to_markdown(path) -> str
-            markdown = self.converter.convert_to_markdown(str(document.path))
-            if markdown is None:
-                raise RuntimeError(f"{self._converter_name} conversion returned None for {document.filename}")
-        else:
-            # MarkItDown: .convert(path).text_content
-            result = self.converter.convert(str(document.path))
-            markdown = result.text_content
-
-        # Clean
-        cleaned = self._clean_markdown(markdown)
+        cleaned = convert_pdf_to_markdown(self.converter, self._converter_name, document.path)
 
         logger.info(
             f"Converted {document.filename}: {len(cleaned)} chars, "
@@ -487,28 +617,7 @@ Extract entities and relationships as JSON:"""
 
     def _clean_markdown(self, markdown: str) -> str:
         """Clean Markdown content."""
-        # Remove excessive newlines
-        cleaned = re.sub(r'\n{3,}', '\n\n', markdown)
-
-        # Remove trailing whitespace
-        cleaned = re.sub(r'[ \t]+\n', '\n', cleaned)
-
-        # Remove horizontal rules (metadata separators)
-        cleaned = re.sub(r'---+', '', cleaned)
-
-        # Normalize bold/italic
-        cleaned = re.sub(r'\*\*\*(.+?)\*\*\*', r'**\1**', cleaned)
-        cleaned = re.sub(r'__(.+?)__', r'**\1**', cleaned)
-
-        # Remove very short lines (artifacts)
-        lines = cleaned.split('\n')
-        filtered_lines = [
-            line for line in lines
-            if len(line.strip()) > 2 or line.strip() in ['', '#']
-        ]
-        cleaned = '\n'.join(filtered_lines)
-
-        return cleaned.strip()
+        return clean_markdown(markdown)
 
     async def ingest_document(
         self,
@@ -559,6 +668,7 @@ Extract entities and relationships as JSON:"""
                 "total_time_seconds": total_time,
                 "entities_added": persistence_stats.get("entities_added", 0),
                 "relationships_added": persistence_stats.get("relationships_added", 0),
+                "write_rows_per_second": persistence_stats.get("rows_per_second", 0.0),
             }
 
         except Exception as e:
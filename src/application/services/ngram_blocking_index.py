@@ -0,0 +1,135 @@
+"""Character n-gram blocking index for fuzzy entity resolution.
+
+Scoring a name against every known entity with an edit-distance ratio is
+O(n) string comparisons per lookup.  This index keeps an inverted index
+from character trigrams to entity keys, partitioned into blocks (one per
+entity type), so a lookup only scores the entities that share the most
+n-grams with the query.  Entries are added, replaced and removed
+incrementally as the graph is written to.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Optional, Set
+
+
+def ngrams(text: str, n: int = 3) -> FrozenSet[str]:
+    """Return the padded character n-grams of ``text``.
+
+    The text is padded so that names shorter than ``n`` still produce
+    grams and word boundaries contribute their own grams.
+    """
+    padded = f"{' ' * (n - 1)}{text} "
+    return frozenset(padded[i:i + n] for i in range(len(padded) - n + 1))
+
+
+@dataclass
+class _Block:
+    """Texts and postings for one partition of the index."""
+    texts: Dict[str, str] = field(default_factory=dict)
+    grams: Dict[str, FrozenSet[str]] = field(default_factory=dict)
+    postings: Dict[str, Set[str]] = field(default_factory=dict)
+
+
+class NGramBlockingIndex:
+    """Inverted n-gram index used to narrow fuzzy-match candidates.
+
+    Texts are stored as given; callers normalize them (lowercasing,
+    abbreviation expansion) before adding and querying.
+    """
+
+    def __init__(self, n: int = 3, max_candidates: int = 200):
+        """Initialize the index.
+
+        Args:
+            n: Gram length
+            max_candidates: Default number of candidates returned per lookup
+        """
+        self.n = n
+        self.max_candidates = max_candidates
+        self._blocks: Dict[str, _Block] = {}
+
+    def __len__(self) -> int:
+        return sum(len(block.texts) for block in self._blocks.values())
+
+    def has_block(self, block: str) -> bool:
+        """Whether any entry was ever added to ``block``."""
+        return block in self._blocks
+
+    def keys(self, block: str) -> Set[str]:
+        """Return the keys indexed in ``block``."""
+        entries = self._blocks.get(block)
+        return set(entries.texts) if entries else set()
+
+    def text(self, block: str, key: str) -> Optional[str]:
+        """Return the indexed text for ``key`` in ``block``."""
+        entries = self._blocks.get(block)
+        return entries.texts.get(key) if entries else None
+
+    def add(self, block: str, key: str, text: str) -> None:
+        """Index ``text`` under ``key``, replacing any previous text.
+
+        Args:
+            block: Partition (e.g. entity type)
+            key: Entity ID
+            text: Normalized entity name
+        """
+        entries = self._blocks.setdefault(block, _Block())
+        if entries.texts.get(key) == text:
+            return
+        if key in entries.texts:
+            self._unpost(entries, key)
+
+        grams = ngrams(text, self.n)
+        entries.texts[key] = text
+        entries.grams[key] = grams
+        for gram in grams:
+            entries.postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key: str, block: Optional[str] = None) -> bool:
+        """Remove ``key`` from ``block`` (or from every block when omitted).
+
+        Returns:
+            True if anything was removed
+        """
+        removed = False
+        for name in [block] if block else list(self._blocks):
+            entries = self._blocks.get(name)
+            if entries is not None and key in entries.texts:
+                self._unpost(entries, key)
+                del entries.texts[key]
+                removed = True
+        return removed
+
+    def candidates(self, block: str, text: str, limit: Optional[int] = None) -> Dict[str, str]:
+        """Return the entries sharing the most n-grams with ``text``.
+
+        Args:
+            block: Partition to search
+            text: Normalized query text
+            limit: Maximum number of candidates (defaults to ``max_candidates``)
+
+        Returns:
+            Mapping of key to indexed text, best-overlapping first
+        """
+        entries = self._blocks.get(block)
+        if entries is None:
+            return {}
+
+        overlap: Counter = Counter()
+        for gram in ngrams(text, self.n):
+            overlap.update(entries.postings.get(gram, ()))
+
+        return {
+            key: entries.texts[key]
+            for key, _ in overlap.most_common(limit or self.max_candidates)
+        }
+
+    @staticmethod
+    def _unpost(entries: _Block, key: str) -> None:
+        for gram in entries.grams.pop(key, ()):
+            keys = entries.postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del entries.postings[gram]
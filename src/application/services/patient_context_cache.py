@@ -0,0 +1,180 @@
+"""
+Patient context cache.
+
+``PatientMemoryService.get_patient_context`` reads every Mem0 memory of a
+patient and runs a five-way Neo4j fan-out, and a single chat turn asks for
+the same context several times. This cache keeps built contexts per patient:
+
+1. In-process LRU with a TTL (always on)
+2. Redis tier shared between workers (optional)
+
+Entries are versioned by a per-patient write counter instead of being
+deleted. Every mutator bumps the counter, so a context built before a write
+can never be served after it, even when the build raced with the write.
+With a Redis tier the counter lives in Redis, so a write handled by one
+worker invalidates the contexts cached by all of them.
+"""
+
+from collections import OrderedDict
+from dataclasses import asdict
+from datetime import datetime
+import json
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PatientContextCache:
+    """Versioned LRU cache of ``PatientContext`` objects keyed by patient."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 300.0,
+        redis: Optional[Any] = None,
+        prefix: str = "patient_context",
+    ):
+        """
+        Initialize patient context cache.
+
+        Args:
+            max_entries: Maximum contexts kept in process (least recently used evicted)
+            ttl_seconds: Upper bound on context age, covers writes made outside
+                PatientMemoryService (e.g. conversational Mem0 extraction)
+            redis: Optional redis.asyncio client for the shared tier
+            prefix: Redis key prefix
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.redis = redis
+        self.prefix = prefix
+        self._entries: "OrderedDict[str, Tuple[int, float, Any]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _version_key(self, patient_id: str) -> str:
+        return f"{self.prefix}:version:{patient_id}"
+
+    def _context_key(self, patient_id: str, version: int) -> str:
+        return f"{self.prefix}:{patient_id}:{version}"
+
+    async def version(self, patient_id: str) -> int:
+        """Current write counter of a patient."""
+        if self.redis is not None:
+            try:
+                value = await self.redis.get(self._version_key(patient_id))
+                return int(value or 0)
+            except Exception as e:
+                logger.warning(f"Patient context version lookup failed for {patient_id}: {e}")
+                # -1 never matches a cached entry, so the caller rebuilds
+                return -1
+        return self._versions.get(patient_id, 0)
+
+    async def get(self, patient_id: str, version: int) -> Optional[Any]:
+        """
+        Return the cached context for this version of the patient, if any.
+
+        Args:
+            patient_id: Patient identifier
+            version: Write counter read via ``version()``
+
+        Returns:
+            Cached PatientContext (shared, treat as read-only) or None
+        """
+        if version < 0:
+            self.misses += 1
+            return None
+
+        entry = self._entries.get(patient_id)
+        if entry is not None:
+            cached_version, expires_at, context = entry
+            if cached_version == version and expires_at > time.monotonic():
+                self._entries.move_to_end(patient_id)
+                self.hits += 1
+                return context
+            del self._entries[patient_id]
+
+        if self.redis is not None:
+            try:
+                raw = await self.redis.get(self._context_key(patient_id, version))
+            except Exception as e:
+                logger.warning(f"Patient context read from Redis failed for {patient_id}: {e}")
+                raw = None
+            if raw:
+                context = _deserialize(raw)
+                self._store(patient_id, version, context)
+                self.hits += 1
+                return context
+
+        self.misses += 1
+        return None
+
+    async def put(self, patient_id: str, version: int, context: Any) -> None:
+        """
+        Cache a context built while the patient was at ``version``.
+
+        If a write bumped the counter during the build, the entry is stored
+        under the old version and is simply never read.
+        """
+        if version < 0:
+            return
+        self._store(patient_id, version, context)
+        if self.redis is not None:
+            try:
+                await self.redis.set(
+                    self._context_key(patient_id, version),
+                    _serialize(context),
+                    ex=max(1, int(self.ttl_seconds)),
+                )
+            except Exception as e:
+                logger.warning(f"Patient context write to Redis failed for {patient_id}: {e}")
+
+    async def invalidate(self, patient_id: str) -> int:
+        """
+        Bump the write counter of a patient, retiring every cached context.
+
+        Returns:
+            int: New version
+        """
+        self._entries.pop(patient_id, None)
+        version = self._versions.get(patient_id, 0) + 1
+        self._versions[patient_id] = version
+        if self.redis is not None:
+            try:
+                version = int(await self.redis.incr(self._version_key(patient_id)))
+            except Exception as e:
+                logger.warning(f"Patient context invalidation in Redis failed for {patient_id}: {e}")
+        return version
+
+    def _store(self, patient_id: str, version: int, context: Any) -> None:
+        self._entries[patient_id] = (version, time.monotonic() + self.ttl_seconds, context)
+        self._entries.move_to_end(patient_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "redis_tier": self.redis is not None,
+        }
+
+
+def _serialize(context: Any) -> str:
+    # Neo4j temporal values inside diagnosis dicts become ISO strings
+    return json.dumps(asdict(context), default=str)
+
+
+def _deserialize(raw: str) -> Any:
+    from application.services.patient_memory_service import PatientContext
+
+    data = json.loads(raw)
+    data["last_updated"] = datetime.fromisoformat(data["last_updated"])
+    return PatientContext(**data)
@@ -7,18 +7,71 @@ Manages patient memory across three layers:
 3. Neo4j: Long-term medical history
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+import functools
 import uuid
 import logging
 
 from mem0 import Memory
 from infrastructure.neo4j_backend import Neo4jBackend
 from infrastructure.redis_session_cache import RedisSessionCache
+from infrastructure.async_mem0_client import AsyncMem0Client, Mem0TimeoutError
+from application.services.patient_context_cache import PatientContextCache
 
 logger = logging.getLogger(__name__)
 
+# One aggregating subquery per category: each returns a single row, so the
+# intermediate result stays at one row instead of the product of the list
+# sizes that chained OPTIONAL MATCHes produce for long medical histories.
+PATIENT_RECORD_QUERY = """
+MATCH (p:Patient {id: $patient_id})
+CALL {
+    WITH p
+    OPTIONAL MATCH (p)-[:HAS_DIAGNOSIS]->(dx:Diagnosis)
+    RETURN collect(DISTINCT dx) AS diagnoses
+}
+CALL {
+    WITH p
+    OPTIONAL MATCH (p)-[:CURRENT_MEDICATION]->(med:Medication)
+        WHERE med.status IS NULL OR med.status = 'active'
+    RETURN collect(DISTINCT med) AS medications
+}
+CALL {
+    WITH p
+    OPTIONAL MATCH (p)-[:HAS_ALLERGY]->(allergy:Allergy)
+    RETURN collect(DISTINCT allergy.substance) AS allergies
+}
+CALL {
+    WITH p
+    OPTIONAL MATCH (p)-[:HAS_PROCEDURE]->(proc:Procedure)
+    RETURN collect(DISTINCT proc) AS procedures
+}
+CALL {
+    WITH p
+    OPTIONAL MATCH (p)-[:HAS_DEVICE]->(device:MedicalDevice)
+    RETURN collect(DISTINCT device) AS medical_devices
+}
+RETURN p, diagnoses, medications, allergies, procedures, medical_devices
+"""
+
+
+def _invalidates_patient_context(method):
+    """
+    Bump the patient's context cache version once the wrapped mutator finishes.
+
+    Runs on failure too: a mutator that raised halfway may already have
+    written to one of the layers.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, patient_id, *args, **kwargs):
+        try:
+            return await method(self, patient_id, *args, **kwargs)
+        finally:
+            await self.invalidate_patient_context(patient_id)
+    return wrapper
+
 
 @dataclass
 class PatientContext:
@@ -66,7 +119,9 @@ class PatientMemoryService:
         self,
         mem0: Memory,
         neo4j_backend: Neo4jBackend,
-        redis_cache: RedisSessionCache
+        redis_cache: RedisSessionCache,
+        context_cache: Optional[PatientContextCache] = None,
+        memories: Optional[AsyncMem0Client] = None
     ):
         """
         Initialize patient memory service.
@@ -75,10 +130,16 @@ class PatientMemoryService:
             mem0: Mem0 Memory instance for intelligent memory layer
             neo4j_backend: Neo4j backend for long-term storage
             redis_cache: Redis session cache for short-term storage
+            context_cache: Patient context cache (default: in-process only)
+            memories: Async access layer over ``mem0`` (default: wraps ``mem0``)
         """
         self.mem0 = mem0
+        self.memories = memories or AsyncMem0Client(mem0)
         self.neo4j = neo4j_backend
         self.redis = redis_cache
+        self.context_cache = context_cache or PatientContextCache()
+        # Mem0 writes that outlive their timeout land after our own invalidation
+        self.memories.on_write_finished(self.invalidate_patient_context)
         logger.info("Patient Memory Service initialized with 3-layer architecture")
 
     # ========================================
@@ -122,11 +183,13 @@ class PatientMemoryService:
         )
 
         # Initialize Mem0 memory for patient
-        self.mem0.add(
+        await self.memories.add(
             f"Patient {patient_id} registered in system",
             user_id=patient_id,
             metadata={"event": "patient_registration"}
         )
+        # A "No history" context may have been cached before registration
+        await self.invalidate_patient_context(patient_id)
 
         logger.info(f"Patient created successfully: {patient_id}")
         return patient_id
@@ -138,6 +201,9 @@ class PatientMemoryService:
         """
         Retrieve complete patient context from all layers with temporal awareness.
 
+        Served from the context cache until a mutator of this service bumps
+        the patient's write counter (or the cache TTL expires).
+
         Args:
             patient_id: Patient identifier
 
@@ -145,6 +211,39 @@ class PatientMemoryService:
             PatientContext: Complete patient context including medical history
                            with temporal metadata for freshness filtering
         """
+        # Read the version before building: a write during the build bumps it,
+        # so the context built here is cached under a version nobody asks for
+        version = await self.context_cache.version(patient_id)
+        context = await self.context_cache.get(patient_id, version)
+        if context is not None:
+            logger.debug(f"Patient context cache hit for: {patient_id}")
+            return context
+
+        context, complete = await self._build_patient_context(patient_id)
+        if complete:
+            await self.context_cache.put(patient_id, version, context)
+        return context
+
+    async def invalidate_patient_context(self, patient_id: str) -> None:
+        """
+        Retire cached contexts of a patient.
+
+        Called by every mutator of this service; callers that write patient
+        data directly to Mem0 or Neo4j must call it too.
+        """
+        await self.context_cache.invalidate(patient_id)
+
+    async def _build_patient_context(
+        self,
+        patient_id: str
+    ) -> Tuple[PatientContext, bool]:
+        """
+        Build patient context from Mem0 and Neo4j, bypassing the cache.
+
+        Returns:
+            Tuple of (context, complete). A Mem0 timeout yields a context
+            without memories that must not be cached.
+        """
         logger.debug(f"Retrieving patient context for: {patient_id}")
         now = datetime.now()
 
@@ -152,10 +251,17 @@ class PatientMemoryService:
         # CRITICAL: user_id MUST be the patient_id to ensure data isolation
         # Mem0 stores user_id as metadata in Qdrant and filters on it
         logger.debug(f"[MEM0_ISOLATION] Requesting memories for user_id={patient_id}")
-        mem0_memories = self.mem0.get_all(
-            user_id=patient_id,
-            limit=30  # Get more for better temporal filtering
-        )
+        complete = True
+        try:
+            mem0_memories = await self.memories.get_all(
+                user_id=patient_id,
+                limit=30  # Get more for better temporal filtering
+            )
+        except Mem0TimeoutError as e:
+            # Answer from the Neo4j record rather than stalling the chat turn
+            logger.warning(f"Building context for {patient_id} without Mem0 memories: {e}")
+            mem0_memories = None
+            complete = False
 
         # SECURITY CHECK: Verify all returned memories belong to this patient
         mem0_results_raw = mem0_memories.get("results", []) if mem0_memories else []
@@ -185,28 +291,11 @@ class PatientMemoryService:
         # 3. Get from Neo4j (permanent medical record)
         # Include resolved diagnoses to track recently_resolved
         # Include procedures and medical devices
-        query = """
-        MATCH (p:Patient {id: $patient_id})
-        OPTIONAL MATCH (p)-[:HAS_DIAGNOSIS]->(dx:Diagnosis)
-        OPTIONAL MATCH (p)-[:CURRENT_MEDICATION]->(med:Medication)
-            WHERE med.status IS NULL OR med.status = 'active'
-        OPTIONAL MATCH (p)-[:HAS_ALLERGY]->(allergy:Allergy)
-        OPTIONAL MATCH (p)-[:HAS_PROCEDURE]->(proc:Procedure)
-        OPTIONAL MATCH (p)-[:HAS_DEVICE]->(device:MedicalDevice)
-        RETURN
-            p,
-            collect(DISTINCT dx) as diagnoses,
-            collect(DISTINCT med) as medications,
-            collect(DISTINCT allergy.substance) as allergies,
-            collect(DISTINCT proc) as procedures,
-            collect(DISTINCT device) as medical_devices
-        """
-
-        result = await self.neo4j.query_raw(query, {"patient_id": patient_id})
+        result = await self.neo4j.query_raw(PATIENT_RECORD_QUERY, {"patient_id": patient_id})
 
         if not result:
             logger.warning(f"No patient found in Neo4j: {patient_id}")
-            return PatientContext(
+            context = PatientContext(
                 patient_id=patient_id,
                 diagnoses=[],
                 medications=[],
@@ -219,6 +308,7 @@ class PatientMemoryService:
                 recently_resolved=[],
                 context_timestamp=now.isoformat()
             )
+            return context, complete
 
         record = result[0]
 
@@ -322,7 +412,7 @@ class PatientMemoryService:
                    f"{len(procedures)} procedures, {len(medical_devices)} medical devices, "
                    f"{len(recently_resolved)} recently resolved")
 
-        return context
+        return context, complete
 
     def _parse_diagnosis_with_freshness(
         self,
@@ -544,6 +634,7 @@ class PatientMemoryService:
     # Medical History Management
     # ========================================
 
+    @_invalidates_patient_context
     async def add_diagnosis(
         self,
         patient_id: str,
@@ -590,7 +681,7 @@ class PatientMemoryService:
         )
 
         # Store in Mem0 (intelligent memory)
-        self.mem0.add(
+        await self.memories.add(
             f"Patient diagnosed with {condition} on {diagnosed_date or 'unknown date'}",
             user_id=patient_id,
             metadata={
@@ -603,6 +694,7 @@ class PatientMemoryService:
         logger.info(f"Diagnosis added successfully: {diagnosis_id}")
         return diagnosis_id
 
+    @_invalidates_patient_context
     async def add_medication(
         self,
         patient_id: str,
@@ -664,7 +756,7 @@ class PatientMemoryService:
         )
 
         # Store in Mem0
-        self.mem0.add(
+        await self.memories.add(
             f"Patient started taking {name} ({dosage}) {frequency}",
             user_id=patient_id,
             metadata={
@@ -810,6 +902,7 @@ class PatientMemoryService:
         except Exception as e:
             logger.error(f"Error updating medication: {e}")
 
+    @_invalidates_patient_context
     async def update_medication_status(
         self,
         patient_id: str,
@@ -849,7 +942,7 @@ class PatientMemoryService:
 
             if results:
                 # Update Mem0
-                self.mem0.add(
+                await self.memories.add(
                     f"Patient {new_status} taking {medication_name}" +
                     (f" - {reason}" if reason else ""),
                     user_id=patient_id,
@@ -890,6 +983,7 @@ class PatientMemoryService:
             patient_id, medication_name, "discontinued", reason
         )
 
+    @_invalidates_patient_context
     async def deduplicate_medications(self, patient_id: str) -> int:
         """
         Remove duplicate medications for a patient, keeping only the most recent.
@@ -918,6 +1012,7 @@ class PatientMemoryService:
             logger.error(f"Error deduplicating medications: {e}")
             return 0
 
+    @_invalidates_patient_context
     async def add_allergy(
         self,
         patient_id: str,
@@ -960,7 +1055,7 @@ class PatientMemoryService:
         )
 
         # Store in Mem0 (CRITICAL for contraindication checking)
-        self.mem0.add(
+        await self.memories.add(
             f"Patient has {severity} allergy to {substance}, causes {reaction}",
             user_id=patient_id,
             metadata={
@@ -974,6 +1069,7 @@ class PatientMemoryService:
         logger.info(f"Allergy added successfully: {allergy_id}")
         return allergy_id
 
+    @_invalidates_patient_context
     async def remove_allergy(
         self,
         patient_id: str,
@@ -1028,6 +1124,7 @@ class PatientMemoryService:
     # Procedures and Tests
     # ========================================
 
+    @_invalidates_patient_context
     async def add_procedure(
         self,
         patient_id: str,
@@ -1092,7 +1189,7 @@ class PatientMemoryService:
 
         # Store in Mem0 for conversational recall
         status_text = "is scheduled for" if status == "scheduled" else "had"
-        self.mem0.add(
+        await self.memories.add(
             f"Patient {status_text} a {name} ({procedure_type})" +
             (f" on {scheduled_date}" if scheduled_date else ""),
             user_id=patient_id,
@@ -1107,6 +1204,7 @@ class PatientMemoryService:
         logger.info(f"Procedure added successfully: {procedure_id}")
         return procedure_id
 
+    @_invalidates_patient_context
     async def update_procedure_status(
         self,
         patient_id: str,
@@ -1163,6 +1261,7 @@ class PatientMemoryService:
     # Medical Devices and Implants
     # ========================================
 
+    @_invalidates_patient_context
     async def add_medical_device(
         self,
         patient_id: str,
@@ -1227,7 +1326,7 @@ class PatientMemoryService:
         )
 
         # Store in Mem0 for conversational recall - important for dietary/lifestyle advice
-        self.mem0.add(
+        await self.memories.add(
             f"Patient has a {name} ({device_type})" +
             (f" placed on {placement_date}" if placement_date else "") +
             (f" at {location}" if location else ""),
@@ -1244,6 +1343,7 @@ class PatientMemoryService:
         logger.info(f"Medical device added successfully: {device_id}")
         return device_id
 
+    @_invalidates_patient_context
     async def update_device_status(
         self,
         patient_id: str,
@@ -1353,6 +1453,7 @@ class PatientMemoryService:
             reason=reason or "Patient denied having this condition"
         )
 
+    @_invalidates_patient_context
     async def update_diagnosis_status(
         self,
         patient_id: str,
@@ -1399,7 +1500,7 @@ class PatientMemoryService:
             if results:
                 condition = results[0].get("condition", diagnosis_name)
                 # Update Mem0 with status change
-                self.mem0.add(
+                await self.memories.add(
                     f"Patient's {condition} has been marked as {new_status}" +
                     (f" - {reason}" if reason else ""),
                     user_id=patient_id,
@@ -1416,7 +1517,7 @@ class PatientMemoryService:
             # No formal diagnosis found in Neo4j, but still record in Mem0
             # This handles cases where the condition was only stored in Mem0 memories
             logger.warning(f"No formal diagnosis found for '{diagnosis_name}', recording resolution in memory only")
-            self.mem0.add(
+            await self.memories.add(
                 f"Patient reported that their {diagnosis_name} has {new_status}" +
                 (f" - {reason}" if reason else ""),
                 user_id=patient_id,
@@ -1510,7 +1611,7 @@ class PatientMemoryService:
 
         # 2. Check Mem0 for resolution events (catches informal resolutions)
         try:
-            memories = self.mem0.get_all(
+            memories = await self.memories.get_all(
                 user_id=patient_id,
                 limit=30  # Check recent memories
             )
@@ -1650,28 +1751,8 @@ class PatientMemoryService:
         msg_id = f"msg:{uuid.uuid4().hex[:12]}"
         logger.debug(f"Storing message for patient {message.patient_id}, session {message.session_id}")
 
-        # 1. Store in Mem0 (automatic fact extraction) - ONLY for user messages
-        # We only want to extract facts from what the PATIENT says, not from
-        # assistant responses (which contain generic advice, not patient facts)
-        if message.role == "user":
-            # Add context to help Mem0's LLM extract facts correctly
-            # This prevents confusion between the patient and the assistant "Matucha"
-            context_prefix = (
-                "The following is a message from the PATIENT (user) to the medical assistant named Matucha. "
-                "Extract facts about the PATIENT only, not about Matucha who is the AI assistant. "
-                "Patient message: "
-            )
-            self.mem0.add(
-                context_prefix + message.content,
-                user_id=message.patient_id,
-                metadata={
-                    "role": message.role,
-                    "session_id": message.session_id,
-                    "timestamp": message.timestamp.isoformat()
-                }
-            )
-
-        # 2. Store in Neo4j (full message log) - both user and assistant
+        # 1. Store in Neo4j (full message log) - both user and assistant.
+        # Written first so a slow Mem0 call can never lose the message itself.
         await self.neo4j.add_entity(
             msg_id,
             {
@@ -1691,6 +1772,33 @@ class PatientMemoryService:
             {"timestamp": message.timestamp.isoformat()}
         )
 
+        # 2. Store in Mem0 (automatic fact extraction) - ONLY for user messages
+        # We only want to extract facts from what the PATIENT says, not from
+        # assistant responses (which contain generic advice, not patient facts)
+        if message.role == "user":
+            # Add context to help Mem0's LLM extract facts correctly
+            # This prevents confusion between the patient and the assistant "Matucha"
+            context_prefix = (
+                "The following is a message from the PATIENT (user) to the medical assistant named Matucha. "
+                "Extract facts about the PATIENT only, not about Matucha who is the AI assistant. "
+                "Patient message: "
+            )
+            try:
+                await self.memories.add(
+                    context_prefix + message.content,
+                    user_id=message.patient_id,
+                    metadata={
+                        "role": message.role,
+                        "session_id": message.session_id,
+                        "timestamp": message.timestamp.isoformat()
+                    }
+                )
+            except Mem0TimeoutError as e:
+                # The add keeps running; its write listener invalidates the context when it lands
+                logger.warning(f"Mem0 fact extraction for message {msg_id} still running: {e}")
+            finally:
+                await self.invalidate_patient_context(message.patient_id)
+
         # 3. Update Redis session
         session_data = await self.redis.get_session(message.session_id)
         if session_data:
@@ -1762,6 +1870,7 @@ class PatientMemoryService:
         logger.warning(f"Patient not found for consent check: {patient_id}")
         return False
 
+    @_invalidates_patient_context
     async def delete_patient_data(
         self,
         patient_id: str
@@ -1781,7 +1890,7 @@ class PatientMemoryService:
 
         try:
             # 1. Delete from Mem0
-            self.mem0.delete_all(user_id=patient_id)
+            await self.memories.delete_all(user_id=patient_id)
             logger.debug("Deleted Mem0 memories")
 
             # 2. Delete from Redis sessions
@@ -1871,7 +1980,7 @@ class PatientMemoryService:
 
         try:
             # Get recent memories from Mem0
-            memories = self.mem0.get_all(
+            memories = await self.memories.get_all(
                 user_id=patient_id,
                 limit=limit * 2  # Get more to filter
             )
@@ -1924,7 +2033,7 @@ class PatientMemoryService:
 
         try:
             # Get most recent memories from Mem0
-            memories = self.mem0.get_all(
+            memories = await self.memories.get_all(
                 user_id=patient_id,
                 limit=5
             )
@@ -0,0 +1,279 @@
+"""Bounded query-frequency tracking for APPLICATION layer promotion.
+
+Keeps a ``QueryTracker`` per recently queried entity in an LRU map capped at
+``max_entries``, so memory stays flat however many distinct entities are
+queried. Counts are persisted on the entity nodes themselves:
+
+- ``load_states`` reads the layer and persisted counts of many entities in
+  one query, so trackers evicted from memory or lost in a restart resume
+  from their last flushed values.
+- ``flush`` writes every changed tracker in one batched ``UNWIND`` query.
+  Evicted trackers with unflushed changes wait for the next flush.
+
+Both match ``:Entity`` nodes by ``id`` or ``name`` and hand the keys they
+miss to the backend's per-node ``get_entity``/``update_entity_properties``,
+so nodes without the identity label are tracked as well.
+
+Persisted properties: ``query_count``, ``query_window_start``,
+``last_queried_at``, ``query_cache_hits`` and ``query_cache_misses``.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Entities are located by id, then by name, like ``get_entity``; keys that
+# match neither fall back to the backend's own lookup (see ``load_states``)
+LOAD_QUERY_STATE = """
+UNWIND $ids AS key
+OPTIONAL MATCH (by_id:Entity {id: key})
+OPTIONAL MATCH (by_name:Entity {name: key})
+WITH key, coalesce(head(collect(by_id)), head(collect(by_name))) AS n
+WHERE n IS NOT NULL
+RETURN key AS id,
+       n.layer AS layer,
+       n.query_count AS query_count,
+       n.query_window_start AS query_window_start,
+       n.last_queried_at AS last_queried_at,
+       n.query_cache_hits AS query_cache_hits,
+       n.query_cache_misses AS query_cache_misses
+"""
+
+FLUSH_QUERY_STATE = """
+UNWIND $rows AS row
+OPTIONAL MATCH (by_id:Entity {id: row.id})
+OPTIONAL MATCH (by_name:Entity {name: row.id})
+WITH row, coalesce(head(collect(by_id)), head(collect(by_name))) AS n
+WHERE n IS NOT NULL
+SET n.query_count = row.query_count,
+    n.query_window_start = row.query_window_start,
+    n.last_queried_at = row.last_queried_at,
+    n.query_cache_hits = row.query_cache_hits,
+    n.query_cache_misses = row.query_cache_misses
+RETURN row.id AS id
+"""
+
+
+@dataclass
+class QueryTracker:
+    """Tracks query patterns for APPLICATION layer promotion."""
+    entity_id: str
+    query_count: int = 0
+    first_query_at: Optional[datetime] = None
+    last_query_at: Optional[datetime] = None
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    @property
+    def cache_hit_rate(self) -> float:
+        total = self.cache_hits + self.cache_misses
+        return self.cache_hits / total if total > 0 else 0.0
+
+    def to_row(self) -> Dict[str, Any]:
+        """Persisted form of the tracker (see ``FLUSH_QUERY_STATE``)."""
+        return {
+            "id": self.entity_id,
+            "query_count": self.query_count,
+            "query_window_start": self.first_query_at.isoformat() if self.first_query_at else None,
+            "last_queried_at": self.last_query_at.isoformat() if self.last_query_at else None,
+            "query_cache_hits": self.cache_hits,
+            "query_cache_misses": self.cache_misses,
+        }
+
+    @classmethod
+    def from_row(cls, entity_id: str, row: Dict[str, Any]) -> "QueryTracker":
+        """Rebuild a tracker from persisted node properties."""
+        return cls(
+            entity_id=entity_id,
+            query_count=row.get("query_count") or 0,
+            first_query_at=_parse_datetime(row.get("query_window_start")),
+            last_query_at=_parse_datetime(row.get("last_queried_at")),
+            cache_hits=row.get("query_cache_hits") or 0,
+            cache_misses=row.get("query_cache_misses") or 0,
+        )
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+class QueryFrequencyTracker:
+    """LRU-bounded query trackers with batched persistence."""
+
+    def __init__(
+        self,
+        backend: Any,
+        max_entries: int = 50_000,
+        flush_interval_seconds: float = 60.0,
+        max_pending: int = 5_000,
+    ):
+        """
+        Initialize query frequency tracker.
+
+        Args:
+            backend: Graph backend; persistence needs ``query_raw``
+            max_entries: Trackers kept in memory
+            flush_interval_seconds: Minimum time between automatic flushes
+            max_pending: Unflushed trackers that trigger a flush regardless
+                of the interval
+        """
+        self.backend = backend
+        self.max_entries = max_entries
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending = max_pending
+        self._trackers: "OrderedDict[str, QueryTracker]" = OrderedDict()
+        self._dirty: Dict[str, QueryTracker] = {}
+        self._last_flush = time.monotonic()
+        self.stats = {"evictions": 0, "flushes": 0, "flushed_rows": 0, "flush_errors": 0}
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._trackers
+
+    def __len__(self) -> int:
+        return len(self._trackers)
+
+    @property
+    def persistent(self) -> bool:
+        return hasattr(self.backend, "query_raw")
+
+    def get_or_create(self, entity_id: str, state: Optional[Dict[str, Any]] = None) -> QueryTracker:
+        """
+        Return the in-memory tracker of an entity, creating it if needed.
+
+        Args:
+            entity_id: Entity identifier
+            state: Persisted properties from ``load_states`` to resume from
+        """
+        tracker = self._trackers.get(entity_id)
+        if tracker is not None:
+            self._trackers.move_to_end(entity_id)
+            return tracker
+        tracker = self._dirty.get(entity_id)
+        if tracker is None:
+            tracker = QueryTracker.from_row(entity_id, state) if state else QueryTracker(entity_id=entity_id)
+        self._trackers[entity_id] = tracker
+        while len(self._trackers) > self.max_entries:
+            # Unflushed changes of evicted trackers stay in _dirty until flushed
+            self._trackers.popitem(last=False)
+            self.stats["evictions"] += 1
+        return tracker
+
+    def record(self, tracker: QueryTracker, cache_hit: bool, at: Optional[datetime] = None) -> None:
+        """Count one query of the tracked entity."""
+        tracker.query_count += 1
+        tracker.last_query_at = at or datetime.now()
+        if tracker.first_query_at is None:
+            tracker.first_query_at = tracker.last_query_at
+        if cache_hit:
+            tracker.cache_hits += 1
+        else:
+            tracker.cache_misses += 1
+        self._dirty[tracker.entity_id] = tracker
+
+    def reset(self, entity_id: str) -> None:
+        """Forget an entity's counts, in memory and (on the next flush) in the graph."""
+        self._trackers.pop(entity_id, None)
+        self._dirty[entity_id] = QueryTracker(entity_id=entity_id)
+
+    async def load_states(self, entity_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Read layer and persisted counts of several entities in one query.
+
+        Entities are matched by ``id`` or ``name``. Keys the query does not
+        find, such as nodes without the ``Entity`` label, are looked up one
+        by one through the backend's ``get_entity``.
+
+        Returns:
+            Mapping of entity ID to its properties; missing entities are
+            omitted. Empty when the backend cannot be queried.
+        """
+        ids = list(dict.fromkeys(entity_ids))
+        if not ids or not self.persistent:
+            return {}
+        try:
+            records = await self.backend.query_raw(LOAD_QUERY_STATE, {"ids": ids})
+        except Exception as e:
+            logger.warning(f"Failed to load query state for {len(ids)} entities: {e}")
+            return {}
+        states = {record["id"]: record for record in records}
+
+        if hasattr(self.backend, "get_entity"):
+            for key in ids:
+                if key in states:
+                    continue
+                try:
+                    entity = await self.backend.get_entity(key)
+                except Exception as e:
+                    logger.warning(f"Failed to load query state for {key}: {e}")
+                    continue
+                if entity:
+                    states[key] = {**entity.get("properties", {}), "id": key}
+        return states
+
+    def should_flush(self) -> bool:
+        if not self._dirty:
+            return False
+        return (
+            len(self._dirty) >= self.max_pending
+            or time.monotonic() - self._last_flush >= self.flush_interval_seconds
+        )
+
+    async def flush(self) -> int:
+        """
+        Persist every changed tracker in one batched write.
+
+        Returns:
+            Number of entities written. On failure the changes are kept for
+            the next flush.
+        """
+        self._last_flush = time.monotonic()
+        if not self._dirty or not self.persistent:
+            return 0
+        dirty, self._dirty = self._dirty, {}
+        rows: List[Dict[str, Any]] = [tracker.to_row() for tracker in dirty.values()]
+        try:
+            records = await self.backend.query_raw(FLUSH_QUERY_STATE, {"rows": rows})
+            written = {record["id"] for record in records}
+            if hasattr(self.backend, "update_entity_properties"):
+                # Nodes without the Entity label, located as in load_states
+                for row in rows:
+                    if row["id"] not in written:
+                        properties = {key: value for key, value in row.items() if key != "id"}
+                        await self.backend.update_entity_properties(row["id"], properties)
+        except Exception as e:
+            self.stats["flush_errors"] += 1
+            logger.warning(f"Failed to flush query counts of {len(rows)} entities: {e}")
+            # Newer changes recorded while the write was in flight win
+            self._dirty = {**dirty, **self._dirty}
+            overflow = len(self._dirty) - 2 * self.max_pending
+            if overflow > 0:
+                # Keep memory bounded while the graph is unreachable
+                for entity_id in list(self._dirty)[:overflow]:
+                    del self._dirty[entity_id]
+                logger.warning(f"Dropped unflushed query counts of {overflow} entities")
+            return 0
+        self.stats["flushes"] += 1
+        self.stats["flushed_rows"] += len(rows)
+        return len(rows)
+
+    async def maybe_flush(self) -> int:
+        """Flush if the interval elapsed or too many changes are pending."""
+        return await self.flush() if self.should_flush() else 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "tracked": len(self._trackers),
+            "pending": len(self._dirty),
+            "max_entries": self.max_entries,
+        }
@@ -1,9 +1,19 @@
 """Text Chunker Service.
 
 Splits Markdown/text into semantic chunks for embedding and processing.
+
+``TextChunker`` sizes chunks in characters over an in-memory string.
+``StreamingTextChunker`` sizes them in tokens, consumes text block by block
+(e.g. a memory-mapped file via ``iter_file_blocks``) and records exact
+character offsets, so arbitrarily large documents chunk in bounded memory.
 """
 
-from typing import List, Dict, Any
+import codecs
+import mmap
+import os
+import re
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
 from dataclasses import dataclass
 
 
@@ -155,3 +165,222 @@ class TextChunker:
             "min_chunk_size": min(lengths),
             "max_chunk_size": max(lengths),
         }
+
+
+_TOKEN_ESTIMATE_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def estimate_tokens(text: str) -> int:
+    """Word/punctuation count; a tokenizer-free stand-in for BPE token counts."""
+    return len(_TOKEN_ESTIMATE_RE.findall(text))
+
+
+def default_token_counter() -> Callable[[str], int]:
+    """``tiktoken``'s ``cl100k_base`` when installed, otherwise ``estimate_tokens``."""
+    try:
+        import tiktoken
+        encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return estimate_tokens
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+def iter_file_blocks(path: str, block_size: int = 1 << 20) -> Iterator[str]:
+    """Decode a UTF-8 file block by block through a memory map.
+
+    Multi-byte characters split across block boundaries are carried over by
+    the incremental decoder, so the yielded strings concatenate to the file.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            for offset in range(0, len(mapped), block_size):
+                text = decoder.decode(mapped[offset:offset + block_size])
+                if text:
+                    yield text
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+
+
+class _Unit(NamedTuple):
+    """A run of input text that is never split across chunks."""
+    start: int
+    text: str
+    tokens: int
+
+
+class StreamingTextChunker:
+    """Token-sized chunking over a stream of text blocks.
+
+    The input is cut into units at the most preferred separator that keeps
+    each unit within ``max_tokens`` (paragraphs, then lines, sentences,
+    words, and finally token-bounded slices).  Units tile the input exactly,
+    so every chunk's ``start_char``/``end_char`` are its true offsets:
+    ``source[chunk.start_char:chunk.end_char] == chunk.text``.
+
+    Only the unfinished paragraph and the current chunk window are held in
+    memory; a paragraph longer than ``max_buffer_chars`` is cut at a weaker
+    separator so a file without blank lines cannot grow the buffer unbounded.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 512,
+        overlap_tokens: int = 64,
+        token_counter: Optional[Callable[[str], int]] = None,
+        separators: Optional[List[str]] = None,
+        max_buffer_chars: int = 1 << 20,
+    ):
+        """Initialize the chunker.
+
+        Args:
+            max_tokens: Upper bound on tokens per chunk
+            overlap_tokens: Tokens (in whole units) repeated from the end of the previous chunk
+            token_counter: Callable returning the token count of a string
+                (defaults to ``default_token_counter()``)
+            separators: Split points in order of preference
+            max_buffer_chars: Longest unfinished paragraph buffered before a forced cut
+        """
+        if not 0 <= overlap_tokens < max_tokens:
+            raise ValueError(f"overlap_tokens must be in [0, {max_tokens}), got {overlap_tokens}")
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.count_tokens = token_counter or default_token_counter()
+        self.separators = separators or ["\n\n", "\n", ". ", " "]
+        self.max_buffer_chars = max_buffer_chars
+
+    def iter_chunks(
+        self,
+        source: Union[str, Iterable[str]],
+        doc_id: str = "doc",
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[TextChunk]:
+        """Yield chunks of ``source`` as soon as they are complete.
+
+        Args:
+            source: The text, or an iterable of consecutive text blocks
+            doc_id: Document ID for generating chunk IDs
+            metadata: Optional metadata to attach to each chunk
+
+        Yields:
+            TextChunk objects; ``metadata`` carries ``chunk_index`` and
+            ``token_count`` (the total is unknown while streaming)
+        """
+        metadata = metadata or {}
+        blocks = [source] if isinstance(source, str) else source
+        window: Deque[_Unit] = deque()
+        window_tokens = 0
+        sequence = 0
+
+        for unit in self._iter_units(blocks):
+            if window and window_tokens + unit.tokens > self.max_tokens:
+                chunk = self._make_chunk(window, window_tokens, sequence, doc_id, metadata)
+                if chunk:
+                    yield chunk
+                    sequence += 1
+                while window and (
+                    window_tokens > self.overlap_tokens
+                    or window_tokens + unit.tokens > self.max_tokens
+                ):
+                    window_tokens -= window.popleft().tokens
+            window.append(unit)
+            window_tokens += unit.tokens
+
+        # The last unit appended is never part of a yielded chunk yet
+        if window:
+            chunk = self._make_chunk(window, window_tokens, sequence, doc_id, metadata)
+            if chunk:
+                yield chunk
+
+    def iter_file_chunks(
+        self,
+        path: str,
+        doc_id: str = "doc",
+        metadata: Optional[Dict[str, Any]] = None,
+        block_size: int = 1 << 20,
+    ) -> Iterator[TextChunk]:
+        """Chunk a UTF-8 file read through a memory map, ``block_size`` bytes at a time."""
+        return self.iter_chunks(iter_file_blocks(path, block_size), doc_id=doc_id, metadata=metadata)
+
+    def _make_chunk(
+        self,
+        window: Deque[_Unit],
+        tokens: int,
+        sequence: int,
+        doc_id: str,
+        metadata: Dict[str, Any],
+    ) -> Optional[TextChunk]:
+        raw = "".join(unit.text for unit in window)
+        text = raw.strip()
+        if not text:
+            return None
+        start = window[0].start + len(raw) - len(raw.lstrip())
+        return TextChunk(
+            id=f"{doc_id}_chunk_{sequence}",
+            text=text,
+            sequence=sequence,
+            start_char=start,
+            end_char=start + len(text),
+            metadata={**metadata, "chunk_index": sequence, "token_count": tokens},
+        )
+
+    def _iter_units(self, blocks: Iterable[str]) -> Iterator[_Unit]:
+        """Cut complete paragraphs off the buffer as blocks arrive."""
+        primary = self.separators[0]
+        buffer = ""
+        buffer_start = 0
+        for block in blocks:
+            buffer += block
+            cut = buffer.rfind(primary)
+            cut = cut + len(primary) if cut != -1 else 0
+            if not cut and len(buffer) > self.max_buffer_chars:
+                cut = self._forced_cut(buffer)
+            if cut:
+                yield from self._split(buffer_start, buffer[:cut], 0)
+                buffer_start += cut
+                buffer = buffer[cut:]
+        if buffer:
+            yield from self._split(buffer_start, buffer, 0)
+
+    def _forced_cut(self, buffer: str) -> int:
+        for separator in self.separators[1:]:
+            cut = buffer.rfind(separator)
+            if cut != -1:
+                return cut + len(separator)
+        return len(buffer)
+
+    def _split(self, start: int, text: str, level: int) -> Iterator[_Unit]:
+        """Split ``text`` at ``separators[level]``, recursing into oversized parts."""
+        if level == len(self.separators):
+            yield from self._split_by_tokens(start, text)
+            return
+        separator = self.separators[level]
+        position = 0
+        while position < len(text):
+            end = text.find(separator, position)
+            end = len(text) if end == -1 else end + len(separator)
+            part = text[position:end]
+            tokens = self.count_tokens(part)
+            if tokens > self.max_tokens:
+                yield from self._split(start + position, part, level + 1)
+            else:
+                yield _Unit(start + position, part, tokens)
+            position = end
+
+    def _split_by_tokens(self, start: int, text: str) -> Iterator[_Unit]:
+        """Cut separator-free text into the longest prefixes within ``max_tokens``."""
+        position = 0
+        while position < len(text):
+            low, high = position + 1, len(text)
+            while low < high:
+                middle = (low + high + 1) // 2
+                if self.count_tokens(text[position:middle]) <= self.max_tokens:
+                    low = middle
+                else:
+                    high = middle - 1
+            part = text[position:low]
+            yield _Unit(start + position, part, self.count_tokens(part))
+            position = low
@@ -0,0 +1,523 @@
+"""Segmented on-disk vector store for document chunks.
+
+Replaces the single in-memory ``faiss.IndexFlatL2`` plus pickled chunk dict
+that ``DocumentService`` used to rewrite in full after every ingest:
+
+- Vectors are written as immutable, append-only *segments*: one FAISS index
+  file (flat, IVF or HNSW) plus the raw ``float32`` vectors as ``.npy`` so the
+  segment can be rebuilt without ``reconstruct``.  Segment indexes are loaded
+  with ``IO_FLAG_MMAP`` so opening a large store does not copy it into RAM.
+- Chunk text, its document and its ``(segment, row)`` position live in a
+  SQLite table.  That table is the source of truth for which vectors are
+  live: deleting or re-ingesting a document only touches SQLite, and rows of
+  a segment with no chunk pointing at them are tombstones that search skips.
+- Segments are merged tier by tier: a segment's tier is the power of
+  ``merge_factor`` its live size falls into, and once ``merge_factor``
+  segments share a tier they are merged into one segment of the next tier.
+  Each vector is therefore rewritten about log(N) times over the life of the
+  store instead of on every few ingests.  A segment whose own rows are mostly
+  dead is rewritten on its own; ``compact()`` rewrites everything explicitly.
+
+All methods hold one lock, so the store can be called from worker threads
+(``DocumentService`` runs it through ``asyncio.to_thread``).
+
+Segment files are written before the SQLite transaction that references them
+commits, so a crash leaves at most unreferenced files, removed on next open.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+INDEX_TYPES = ("flat", "ivf", "hnsw")
+
+# FAISS warns when an IVF list gets fewer training points than this
+_IVF_POINTS_PER_LIST = 39
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS segments (
+    name TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    dimension INTEGER NOT NULL,
+    index_type TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    chunk_id TEXT PRIMARY KEY,
+    doc_id TEXT,
+    source TEXT,
+    text TEXT NOT NULL,
+    metadata TEXT,
+    segment TEXT NOT NULL,
+    row INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_chunks_doc ON chunks(doc_id);
+CREATE INDEX IF NOT EXISTS idx_chunks_source ON chunks(source);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_chunks_position ON chunks(segment, row);
+"""
+
+
+def _faiss():
+    import faiss
+    return faiss
+
+
+@dataclass
+class VectorHit:
+    """A live chunk returned by ``SegmentedVectorStore.search``."""
+    chunk_id: str
+    doc_id: Optional[str]
+    text: str
+    distance: float
+    metadata: Dict
+
+
+@dataclass
+class _Segment:
+    """Bookkeeping for one immutable segment."""
+    name: str
+    size: int
+    dimension: int
+    index_type: str
+    live: int = 0
+
+    @property
+    def dead(self) -> int:
+        return self.size - self.live
+
+
+class SegmentedVectorStore:
+    """Append-only FAISS segments with a SQLite chunk table.
+
+    Every ``add_document`` call writes one new segment; searches fan out over
+    all segments whose dimension matches the query and merge by L2 distance.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        index_type: str = "flat",
+        merge_factor: int = 10,
+        compact_dead_ratio: float = 0.3,
+        ivf_nlist: int = 1024,
+        ivf_nprobe: int = 16,
+        hnsw_m: int = 32,
+        hnsw_ef_search: int = 64,
+        mmap: bool = True,
+    ):
+        """Open (or create) a store under ``path``.
+
+        Args:
+            path: Directory holding the segments and ``chunks.sqlite3``
+            index_type: ``flat`` (exact), ``ivf`` or ``hnsw`` (approximate)
+            merge_factor: Merge the segments of a size tier once this many share it
+            compact_dead_ratio: Rewrite a segment once this fraction of its rows is dead
+            ivf_nlist: Upper bound on IVF lists; small segments use fewer or stay flat
+            ivf_nprobe: IVF lists visited per query
+            hnsw_m: HNSW graph degree
+            hnsw_ef_search: HNSW candidate list size per query
+            mmap: Memory-map segment indexes instead of reading them into RAM
+        """
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"index_type must be one of {INDEX_TYPES}, got {index_type!r}")
+        if merge_factor < 2:
+            raise ValueError(f"merge_factor must be at least 2, got {merge_factor}")
+        self.path = path
+        self.index_type = index_type
+        self.merge_factor = merge_factor
+        self.compact_dead_ratio = compact_dead_ratio
+        self.ivf_nlist = ivf_nlist
+        self.ivf_nprobe = ivf_nprobe
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_search = hnsw_ef_search
+        self.mmap = mmap
+
+        os.makedirs(path, exist_ok=True)
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(os.path.join(path, "chunks.sqlite3"), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+
+        self._segments: Dict[str, _Segment] = {}
+        self._indexes: Dict[str, object] = {}
+        self._next_segment = 0
+        self._load_segments()
+        self._remove_orphan_files()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return sum(segment.live for segment in self._segments.values())
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    def close(self) -> None:
+        with self._lock:
+            self._indexes.clear()
+            self._db.close()
+
+    def add_document(
+        self,
+        doc_id: str,
+        chunk_ids: Sequence[str],
+        texts: Sequence[str],
+        vectors: Iterable[Sequence[float]],
+        source: Optional[str] = None,
+        metadata: Optional[Sequence[Dict]] = None,
+    ) -> int:
+        """Store a document's chunks, replacing any earlier version of it.
+
+        Chunks previously stored under ``doc_id`` (or, if given, ``source``)
+        are dropped in the same transaction, so re-ingesting a document never
+        leaves its old vectors searchable.
+
+        Args:
+            doc_id: Document the chunks belong to
+            chunk_ids: Chunk IDs
+            texts: Chunk text, aligned with ``chunk_ids``
+            vectors: Embeddings, aligned with ``chunk_ids``
+            source: Optional source path identifying earlier versions of the document
+            metadata: Optional per-chunk metadata, aligned with ``chunk_ids``
+
+        Returns:
+            Number of chunks stored
+
+        Raises:
+            ValueError: If the inputs differ in length
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1) if vectors.size else vectors.reshape(0, 0)
+        metadata = list(metadata) if metadata is not None else [{}] * len(chunk_ids)
+        if not (len(chunk_ids) == len(texts) == len(vectors) == len(metadata)):
+            raise ValueError(
+                f"Got {len(chunk_ids)} chunk ids, {len(texts)} texts, "
+                f"{len(vectors)} vectors and {len(metadata)} metadata entries"
+            )
+
+        with self._lock:
+            segment = self._write_segment(vectors) if len(chunk_ids) else None
+            rows = [
+                (chunk_id, doc_id, source, text, json.dumps(meta, default=str), segment.name, row)
+                for row, (chunk_id, text, meta) in enumerate(zip(chunk_ids, texts, metadata))
+            ] if segment else []
+
+            with self._db:
+                self._delete_rows("doc_id = ? OR (? IS NOT NULL AND source = ?)", (doc_id, source, source))
+                # Chunk IDs are content-derived, so another document may own one
+                self._db.executemany("DELETE FROM chunks WHERE chunk_id = ?", [(r[0],) for r in rows])
+                if segment:
+                    self._db.execute(
+                        "INSERT INTO segments (name, size, dimension, index_type) VALUES (?, ?, ?, ?)",
+                        (segment.name, segment.size, segment.dimension, segment.index_type),
+                    )
+                    self._db.executemany(
+                        "INSERT INTO chunks (chunk_id, doc_id, source, text, metadata, segment, row) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+            if segment:
+                self._segments[segment.name] = segment
+            self._refresh_live_counts()
+            self._maybe_compact()
+            return len(rows)
+
+    def delete_document(self, doc_id: str) -> int:
+        """Drop every chunk of ``doc_id``.  Returns the number of chunks removed."""
+        with self._lock:
+            with self._db:
+                removed = self._delete_rows("doc_id = ?", (doc_id,))
+            self._refresh_live_counts()
+            self._maybe_compact()
+            return removed
+
+    def get_text(self, chunk_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute("SELECT text FROM chunks WHERE chunk_id = ?", (chunk_id,)).fetchone()
+        return row[0] if row else None
+
+    def chunk_ids(self, doc_id: str) -> List[str]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT chunk_id FROM chunks WHERE doc_id = ? ORDER BY row", (doc_id,)
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def search(self, query: Sequence[float], top_k: int = 5) -> List[VectorHit]:
+        """Return the ``top_k`` live chunks nearest to ``query`` by L2 distance."""
+        with self._lock:
+            return self._search(query, top_k)
+
+    def compact(self) -> None:
+        """Rewrite all live vectors into one segment per dimension and drop the old ones."""
+        with self._lock:
+            self._merge_segments(list(self._segments.values()))
+
+    def _search(self, query: Sequence[float], top_k: int) -> List[VectorHit]:
+        query = np.asarray(query, dtype=np.float32).reshape(1, -1)
+        candidates: List[Tuple[float, str, int]] = []
+        for segment in self._segments.values():
+            if segment.dimension != query.shape[1] or segment.live == 0:
+                continue
+            # Over-fetch by the tombstone count so dead rows cannot crowd out live ones
+            k = min(segment.size, top_k + segment.dead)
+            index = self._index(segment)
+            if segment.index_type == "hnsw":
+                index.hnsw.efSearch = max(self.hnsw_ef_search, k)
+            distances, rows = index.search(query, k)
+            candidates.extend(
+                (float(d), segment.name, int(r)) for d, r in zip(distances[0], rows[0]) if r >= 0
+            )
+
+        candidates.sort()
+        hits: List[VectorHit] = []
+        for offset in range(0, len(candidates), max(top_k, 1) * 4):
+            batch = candidates[offset:offset + max(top_k, 1) * 4]
+            live = self._rows_at([(name, row) for _, name, row in batch])
+            for distance, name, row in batch:
+                record = live.get((name, row))
+                if record is None:
+                    continue
+                chunk_id, doc_id, text, meta = record
+                hits.append(VectorHit(chunk_id, doc_id, text, distance, json.loads(meta or "{}")))
+                if len(hits) == top_k:
+                    return hits
+        return hits
+
+    def _merge_segments(self, old: List[_Segment]) -> None:
+        """Rewrite the live vectors of ``old`` into one segment per dimension."""
+        if not old:
+            return
+
+        by_dimension: Dict[int, List[_Segment]] = {}
+        for segment in old:
+            by_dimension.setdefault(segment.dimension, []).append(segment)
+
+        new_segments: List[_Segment] = []
+        moves: List[Tuple[str, int, str, int]] = []
+        for dimension, segments in by_dimension.items():
+            positions = self._db.execute(
+                f"SELECT segment, row FROM chunks WHERE segment IN ({','.join('?' * len(segments))}) "
+                "ORDER BY segment, row",
+                [s.name for s in segments],
+            ).fetchall()
+            if not positions:
+                continue
+            vectors = np.empty((len(positions), dimension), dtype=np.float32)
+            by_segment: Dict[str, List[Tuple[int, int]]] = {}
+            for new_row, (name, row) in enumerate(positions):
+                by_segment.setdefault(name, []).append((new_row, row))
+            for name, pairs in by_segment.items():
+                stored = np.load(self._file(name, ".npy"), mmap_mode="r")
+                new_rows, rows = zip(*pairs)
+                vectors[list(new_rows)] = stored[list(rows)]
+            segment = self._write_segment(vectors)
+            new_segments.append(segment)
+            moves.extend(
+                (segment.name, new_row, name, row) for new_row, (name, row) in enumerate(positions)
+            )
+
+        with self._db:
+            # Park moved rows on negative positions first so the unique
+            # (segment, row) index never sees two chunks on one slot
+            self._db.executemany(
+                "UPDATE chunks SET segment = ?, row = ? WHERE segment = ? AND row = ?",
+                [(new_name, -1 - new_row, name, row) for new_name, new_row, name, row in moves],
+            )
+            self._db.execute("UPDATE chunks SET row = -1 - row WHERE row < 0")
+            self._db.executemany("DELETE FROM segments WHERE name = ?", [(s.name,) for s in old])
+            self._db.executemany(
+                "INSERT INTO segments (name, size, dimension, index_type) VALUES (?, ?, ?, ?)",
+                [(s.name, s.size, s.dimension, s.index_type) for s in new_segments],
+            )
+
+        for segment in old:
+            self._segments.pop(segment.name, None)
+            self._indexes.pop(segment.name, None)
+            self._unlink(segment.name)
+        for segment in new_segments:
+            self._segments[segment.name] = segment
+        self._refresh_live_counts()
+        logger.info(
+            "Merged %d segments into %d (%d live vectors)",
+            len(old), len(new_segments), sum(s.live for s in new_segments),
+        )
+
+    def import_legacy(self, index_file: str, meta_file: str) -> int:
+        """Import a pre-segment ``.index``/``.meta`` pair written by ``DocumentService``.
+
+        Both files are renamed with a ``.migrated`` suffix afterwards so the
+        import runs once.  Returns the number of chunks imported.
+        """
+        with self._lock:
+            return self._import_legacy(index_file, meta_file)
+
+    def _import_legacy(self, index_file: str, meta_file: str) -> int:
+        import pickle
+
+        legacy_index = _faiss().read_index(index_file)
+        with open(meta_file, "rb") as f:
+            data = pickle.load(f)
+        chunk_ids = data.get("chunk_ids", [])
+        chunk_store = data.get("chunk_store", {})
+        vectors = legacy_index.reconstruct_n(0, legacy_index.ntotal)[:len(chunk_ids)]
+
+        by_doc: Dict[str, List[int]] = {}
+        for position, chunk_id in enumerate(chunk_ids):
+            by_doc.setdefault(chunk_id.rsplit("_chunk_", 1)[0], []).append(position)
+
+        imported = 0
+        for doc_id, positions in by_doc.items():
+            imported += self.add_document(
+                doc_id,
+                [chunk_ids[p] for p in positions],
+                [chunk_store.get(chunk_ids[p], "") for p in positions],
+                vectors[positions],
+            )
+        for path in (index_file, meta_file):
+            os.replace(path, f"{path}.migrated")
+        logger.info("Imported %d chunks from legacy index %s", imported, index_file)
+        return imported
+
+    # ------------------------------------------------------------------
+    # Segments
+    # ------------------------------------------------------------------
+
+    def _file(self, name: str, suffix: str) -> str:
+        return os.path.join(self.path, f"{name}{suffix}")
+
+    def _write_segment(self, vectors: np.ndarray) -> _Segment:
+        """Build and persist an index over ``vectors`` as a new segment."""
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        name = f"seg-{self._next_segment:06d}"
+        self._next_segment += 1
+
+        index, index_type = self._build_index(vectors)
+        np.save(self._file(name, ".npy"), vectors)
+        _faiss().write_index(index, self._file(name, ".index"))
+        self._indexes[name] = index
+        return _Segment(name=name, size=len(vectors), dimension=vectors.shape[1], index_type=index_type)
+
+    def _build_index(self, vectors: np.ndarray):
+        faiss = _faiss()
+        dimension = vectors.shape[1]
+        if self.index_type == "hnsw":
+            index = faiss.IndexHNSWFlat(dimension, self.hnsw_m)
+            index.add(vectors)
+            return index, "hnsw"
+        if self.index_type == "ivf":
+            nlist = min(self.ivf_nlist, len(vectors) // _IVF_POINTS_PER_LIST)
+            if nlist >= 2:
+                quantizer = faiss.IndexFlatL2(dimension)
+                index = faiss.IndexIVFFlat(quantizer, dimension, nlist)
+                index.train(vectors)
+                index.add(vectors)
+                return index, "ivf"
+            # Too few vectors to train IVF lists; compaction rebuilds it later
+        index = faiss.IndexFlatL2(dimension)
+        index.add(vectors)
+        return index, "flat"
+
+    def _index(self, segment: _Segment):
+        index = self._indexes.get(segment.name)
+        if index is None:
+            faiss = _faiss()
+            index_file = self._file(segment.name, ".index")
+            try:
+                index = faiss.read_index(index_file, faiss.IO_FLAG_MMAP) if self.mmap else None
+            except RuntimeError:
+                index = None  # Index type without mmap support in this FAISS build
+            if index is None:
+                index = faiss.read_index(index_file)
+            self._indexes[segment.name] = index
+        if segment.index_type == "ivf":
+            index.nprobe = self.ivf_nprobe
+        return index
+
+    def _load_segments(self) -> None:
+        for name, size, dimension, index_type in self._db.execute(
+            "SELECT name, size, dimension, index_type FROM segments"
+        ):
+            self._segments[name] = _Segment(name, size, dimension, index_type)
+            self._next_segment = max(self._next_segment, int(name.split("-")[1]) + 1)
+        self._refresh_live_counts()
+
+    def _remove_orphan_files(self) -> None:
+        """Delete segment files left behind by an interrupted write or compaction."""
+        for filename in os.listdir(self.path):
+            name, ext = os.path.splitext(filename)
+            if name.startswith("seg-") and ext in (".index", ".npy") and name not in self._segments:
+                self._next_segment = max(self._next_segment, int(name.split("-")[1]) + 1)
+                os.remove(os.path.join(self.path, filename))
+
+    def _unlink(self, name: str) -> None:
+        for suffix in (".index", ".npy"):
+            try:
+                os.remove(self._file(name, suffix))
+            except FileNotFoundError:
+                pass
+
+    def _tier(self, size: int) -> int:
+        tier = 0
+        while size >= self.merge_factor:
+            size //= self.merge_factor
+            tier += 1
+        return tier
+
+    def _maybe_compact(self) -> None:
+        """Merge full size tiers, smallest first, then rewrite mostly-dead segments."""
+        while True:
+            tiers: Dict[Tuple[int, int], List[_Segment]] = {}
+            for segment in self._segments.values():
+                tiers.setdefault((self._tier(segment.live), segment.dimension), []).append(segment)
+            full = [key for key, segments in tiers.items() if len(segments) >= self.merge_factor]
+            if not full:
+                break
+            # A merge can fill the next tier up, so re-tier after each one
+            self._merge_segments(tiers[min(full)])
+
+        dead = [
+            segment for segment in self._segments.values()
+            if segment.dead / segment.size > self.compact_dead_ratio
+        ]
+        if dead:
+            self._merge_segments(dead)
+
+    # ------------------------------------------------------------------
+    # Chunk table
+    # ------------------------------------------------------------------
+
+    def _delete_rows(self, where: str, params: Tuple) -> int:
+        return self._db.execute(f"DELETE FROM chunks WHERE {where}", params).rowcount
+
+    def _refresh_live_counts(self) -> None:
+        counts = dict(self._db.execute("SELECT segment, count(*) FROM chunks GROUP BY segment"))
+        for segment in self._segments.values():
+            segment.live = counts.get(segment.name, 0)
+
+    def _rows_at(self, positions: List[Tuple[str, int]]) -> Dict[Tuple[str, int], Tuple]:
+        """Look up the live chunks at ``(segment, row)`` positions."""
+        found: Dict[Tuple[str, int], Tuple] = {}
+        by_segment: Dict[str, List[int]] = {}
+        for name, row in positions:
+            by_segment.setdefault(name, []).append(row)
+        for name, rows in by_segment.items():
+            for chunk_id, doc_id, text, meta, row in self._db.execute(
+                f"SELECT chunk_id, doc_id, text, metadata, row FROM chunks "
+                f"WHERE segment = ? AND row IN ({','.join('?' * len(rows))})",
+                [name, *rows],
+            ):
+                found[(name, row)] = (chunk_id, doc_id, text, meta)
+        return found
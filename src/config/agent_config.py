@@ -47,6 +47,16 @@ class RabbitMQConfig:
     queue_prefix: str = "kg_"
     max_retries: int = 3
     retry_delay: float = 1.0
+    # Throughput settings (event bus only)
+    prefetch_count: int = 10
+    concurrency: int = 1
+    serializer: str = "json"
+    confirm_batch_size: int = 256
+
+
+# Actions whose in-memory subscribers (layer transitions, crystallization)
+# run from per-handler queues instead of inside the publisher's call
+DEFAULT_BACKGROUND_ACTIONS = ["episode_added", "entity_created", "entity_updated", "query_executed"]
 
 
 @dataclass
@@ -68,6 +78,10 @@ class EventBusConfig:
     """Event bus configuration."""
     type: EventBusType = EventBusType.MEMORY
     rabbitmq: RabbitMQConfig = field(default_factory=RabbitMQConfig)
+    # In-memory bus delivery (see application.event_bus.DeliveryPolicy)
+    background_actions: List[str] = field(default_factory=lambda: list(DEFAULT_BACKGROUND_ACTIONS))
+    queue_size: int = 1000
+    overflow: str = "block"
 
 
 @dataclass
@@ -114,7 +128,10 @@ class AgentInfraConfig:
         eb_data = data.get("event_bus", {})
         event_bus = EventBusConfig(
             type=EventBusType(eb_data.get("type", "memory")),
-            rabbitmq=RabbitMQConfig(**eb_data.get("rabbitmq", {})) if eb_data.get("rabbitmq") else RabbitMQConfig()
+            rabbitmq=RabbitMQConfig(**eb_data.get("rabbitmq", {})) if eb_data.get("rabbitmq") else RabbitMQConfig(),
+            background_actions=eb_data.get("background_actions", list(DEFAULT_BACKGROUND_ACTIONS)),
+            queue_size=eb_data.get("queue_size", 1000),
+            overflow=eb_data.get("overflow", "block"),
         )
 
         # Parse channel config
@@ -196,6 +213,26 @@ class AgentInfraConfig:
             config.event_bus.rabbitmq.url = os.getenv("RABBITMQ_URL")
             config.communication_channel.rabbitmq.url = os.getenv("RABBITMQ_URL")
 
+        if os.getenv("RABBITMQ_PREFETCH"):
+            config.event_bus.rabbitmq.prefetch_count = int(os.getenv("RABBITMQ_PREFETCH"))
+
+        if os.getenv("RABBITMQ_CONCURRENCY"):
+            config.event_bus.rabbitmq.concurrency = int(os.getenv("RABBITMQ_CONCURRENCY"))
+
+        if os.getenv("EVENT_SERIALIZER"):
+            config.event_bus.rabbitmq.serializer = os.getenv("EVENT_SERIALIZER")
+
+        if os.getenv("EVENT_BUS_BACKGROUND_ACTIONS") is not None:
+            config.event_bus.background_actions = [
+                a.strip() for a in os.getenv("EVENT_BUS_BACKGROUND_ACTIONS").split(",") if a.strip()
+            ]
+
+        if os.getenv("EVENT_BUS_QUEUE_SIZE"):
+            config.event_bus.queue_size = int(os.getenv("EVENT_BUS_QUEUE_SIZE"))
+
+        if os.getenv("EVENT_BUS_OVERFLOW"):
+            config.event_bus.overflow = os.getenv("EVENT_BUS_OVERFLOW")
+
         if os.getenv("CHANNEL_TYPE"):
             config.communication_channel.type = ChannelType(os.getenv("CHANNEL_TYPE"))
 
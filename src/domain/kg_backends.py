@@ -8,7 +8,18 @@ technologies or services.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List
+
+# Default number of rows sent per UNWIND statement by bulk writers.
+DEFAULT_BULK_BATCH_SIZE = 1000
+
+
+def iter_batches(rows: List[Any], batch_size: int) -> Iterator[List[Any]]:
+    """Yield consecutive slices of ``rows`` holding at most ``batch_size`` items."""
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    for start in range(0, len(rows), batch_size):
+        yield rows[start:start + batch_size]
 
 
 class KnowledgeGraphBackend(ABC):
@@ -72,3 +83,60 @@ class KnowledgeGraphBackend(ABC):
             An arbitrary result.
         """
         raise NotImplementedError
+
+    async def add_entities_bulk(
+        self,
+        entities: List[Dict[str, Any]],
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    ) -> Dict[str, Any]:
+        """Add many entities in as few round trips as the backend allows.
+
+        Each row is a mapping with ``id``, ``properties`` and an optional
+        ``labels`` list.  The default implementation simply loops over
+        :meth:`add_entity`; backends with a native batch path (e.g. Cypher
+        ``UNWIND``) should override it.
+
+        Args:
+            entities: Entity rows to write.
+            batch_size: Maximum number of rows per backend batch.
+
+        Returns:
+            Write statistics with ``rows`` (total rows written) and
+            ``batches`` (one stats dict per batch).
+        """
+        batches = []
+        for batch in iter_batches(entities, batch_size):
+            for row in batch:
+                if row.get("labels"):
+                    await self.add_entity(row["id"], row.get("properties", {}), labels=row["labels"])
+                else:
+                    await self.add_entity(row["id"], row.get("properties", {}))
+            batches.append({"group": "Entity", "rows": len(batch)})
+        return {"rows": len(entities), "batches": batches}
+
+    async def add_relationships_bulk(
+        self,
+        relationships: List[Dict[str, Any]],
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    ) -> Dict[str, Any]:
+        """Add many relationships in as few round trips as the backend allows.
+
+        Each row is a mapping with ``source_id``, ``type``, ``target_id`` and
+        an optional ``properties`` dict.  The default implementation loops
+        over :meth:`add_relationship`.
+
+        Args:
+            relationships: Relationship rows to write.
+            batch_size: Maximum number of rows per backend batch.
+
+        Returns:
+            Write statistics with ``rows`` and per-batch ``batches``.
+        """
+        batches = []
+        for batch in iter_batches(relationships, batch_size):
+            for row in batch:
+                await self.add_relationship(
+                    row["source_id"], row["type"], row["target_id"], row.get("properties", {})
+                )
+            batches.append({"group": "RELATIONSHIP", "rows": len(batch)})
+        return {"rows": len(relationships), "batches": batches}
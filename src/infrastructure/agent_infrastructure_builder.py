@@ -16,7 +16,7 @@ from config.agent_config import (
     get_agent_config,
 )
 from domain.communication import CommunicationChannel
-from application.event_bus import EventBus
+from application.event_bus import EventBus, background_policies
 
 if TYPE_CHECKING:
     from application.services.agent_discovery import AgentDiscoveryService
@@ -70,7 +70,13 @@ class AgentInfrastructureBuilder:
         if eb_config.type == EventBusType.MEMORY:
             logger.info("Creating in-memory EventBus")
             # EventBus from application.event_bus is already in-memory
-            self._event_bus = EventBus()
+            self._event_bus = EventBus(
+                policies=background_policies(
+                    eb_config.background_actions,
+                    max_queue_size=eb_config.queue_size,
+                    overflow=eb_config.overflow,
+                )
+            )
 
         elif eb_config.type == EventBusType.RABBITMQ:
             logger.info(f"Creating RabbitMQEventBus with URL: {eb_config.rabbitmq.url}")
@@ -82,6 +88,10 @@ class AgentInfrastructureBuilder:
                 queue_prefix=eb_config.rabbitmq.queue_prefix,
                 max_retries=eb_config.rabbitmq.max_retries,
                 retry_delay=eb_config.rabbitmq.retry_delay,
+                prefetch_count=eb_config.rabbitmq.prefetch_count,
+                concurrency=eb_config.rabbitmq.concurrency,
+                serializer=eb_config.rabbitmq.serializer,
+                confirm_batch_size=eb_config.rabbitmq.confirm_batch_size,
             )
             # Connect to RabbitMQ
             await self._event_bus.connect()
@@ -0,0 +1,210 @@
+"""
+Async access layer for the synchronous Mem0 client.
+
+Mem0 (and IsolatedPatientMemoryManager) do Qdrant I/O, embedding calls and
+LLM fact extraction synchronously. Called from a coroutine, each call stalls
+the event loop and every WebSocket chat served by the worker. This adapter:
+
+1. Runs calls on a dedicated, bounded thread pool
+2. Applies a per-call timeout
+3. Coalesces concurrent identical get_all calls into one in-flight call
+4. Records per-operation latency metrics
+5. Notifies write listeners (e.g. context caches) when a write's thread
+   finishes, which after a timeout is later than the awaiting call returns
+"""
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import functools
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class Mem0TimeoutError(TimeoutError):
+    """A Mem0 call did not finish within its timeout."""
+
+
+@dataclass
+class OperationMetrics:
+    """Latency counters for one Mem0 operation."""
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    coalesced: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.calls += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "coalesced": self.coalesced,
+            "avg_ms": round(self.total_seconds / self.calls * 1000, 2) if self.calls else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 2),
+        }
+
+
+class AsyncMem0Client:
+    """
+    Non-blocking wrapper around a Mem0 ``Memory`` or ``IsolatedPatientMemoryManager``.
+
+    Usage:
+        memories = AsyncMem0Client(mem0)
+        result = await memories.get_all(user_id="patient:pablo", limit=30)
+        await memories.add("Patient reports knee pain", user_id="patient:pablo")
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_workers: int = 8,
+        read_timeout_seconds: float = 10.0,
+        write_timeout_seconds: float = 30.0,
+    ):
+        """
+        Initialize async Mem0 client.
+
+        Args:
+            client: Synchronous Mem0 client
+            max_workers: Threads dedicated to Mem0 calls (bounds Qdrant/OpenAI concurrency)
+            read_timeout_seconds: Timeout for get_all and search
+            write_timeout_seconds: Timeout for add and deletes (add runs LLM fact extraction)
+        """
+        self.client = client
+        self.read_timeout_seconds = read_timeout_seconds
+        self.write_timeout_seconds = write_timeout_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mem0")
+        self._inflight: Dict[Tuple[str, int, int], asyncio.Future] = {}
+        # Bumped when a write for the user finishes, so reads issued after a
+        # write never join a get_all that may have run before it
+        self._generations: Dict[str, int] = {}
+        self._write_listeners: List[Callable[[str], Awaitable[None]]] = []
+        self._metrics: Dict[str, OperationMetrics] = {}
+        logger.info(f"AsyncMem0Client initialized: max_workers={max_workers}, "
+                   f"read_timeout={read_timeout_seconds}s, write_timeout={write_timeout_seconds}s")
+
+    async def run(
+        self,
+        operation: str,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Run a synchronous Mem0 call on the Mem0 thread pool.
+
+        Args:
+            operation: Metrics name of the call
+            func: Synchronous callable
+            timeout: Seconds to wait (default: read timeout)
+
+        Returns:
+            The callable's result
+
+        Raises:
+            Mem0TimeoutError: If the call does not finish in time. The thread
+                keeps running until Mem0 returns; the pool bound still holds.
+        """
+        return await self._wait(operation, self._executor.submit(func, *args, **kwargs), timeout)
+
+    async def _wait(self, operation: str, future: Future, timeout: Optional[float]) -> Any:
+        metrics = self._metrics.setdefault(operation, OperationMetrics())
+        timeout = self.read_timeout_seconds if timeout is None else timeout
+        started = time.perf_counter()
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            metrics.timeouts += 1
+            raise Mem0TimeoutError(f"Mem0 {operation} timed out after {timeout}s") from None
+        except Exception:
+            metrics.errors += 1
+            raise
+        finally:
+            metrics.record(time.perf_counter() - started)
+
+    async def get_all(self, user_id: str, limit: int = 100) -> Dict[str, Any]:
+        """
+        Get all memories of a user; concurrent identical calls share one Mem0 call.
+
+        The result is shared between coalesced callers and must not be mutated.
+        """
+        key = (user_id, limit, self._generations.get(user_id, 0))
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                self.run("get_all", self.client.get_all, user_id=user_id, limit=limit)
+            )
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self._metrics.setdefault("get_all", OperationMetrics()).coalesced += 1
+        # A cancelled caller must not cancel the call other callers wait on
+        return await asyncio.shield(future)
+
+    async def search(self, query: str, user_id: str, limit: int = 10) -> Dict[str, Any]:
+        """Semantic search over a user's memories."""
+        return await self.run("search", self.client.search, query, user_id=user_id, limit=limit)
+
+    async def add(
+        self,
+        content: str,
+        user_id: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """Add a memory (runs Mem0 fact extraction)."""
+        return await self._write("add", self.client.add, content, user_id=user_id, metadata=metadata)
+
+    async def delete_all(self, user_id: str) -> Any:
+        """Delete every memory of a user."""
+        return await self._write("delete_all", self.client.delete_all, user_id=user_id)
+
+    def on_write_finished(self, listener: Callable[[str], Awaitable[None]]) -> None:
+        """Call ``listener(user_id)`` whenever a write's Mem0 thread finishes."""
+        self._write_listeners.append(listener)
+
+    async def _write(self, operation: str, func: Callable[..., Any], *args: Any, user_id: str, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = self._executor.submit(func, *args, user_id=user_id, **kwargs)
+        # A timed-out write keeps running, so invalidate again once its thread is done
+        future.add_done_callback(functools.partial(self._notify_write_finished, loop, user_id))
+        try:
+            return await self._wait(operation, future, self.write_timeout_seconds)
+        finally:
+            self._bump_generation(user_id)
+
+    def _bump_generation(self, user_id: str) -> None:
+        self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
+    def _notify_write_finished(self, loop: asyncio.AbstractEventLoop, user_id: str, _: Future) -> None:
+        """Done-callback of a write, run on the Mem0 thread."""
+        try:
+            loop.call_soon_threadsafe(self._write_finished, user_id)
+        except RuntimeError:
+            pass  # Event loop already closed
+
+    def _write_finished(self, user_id: str) -> None:
+        self._bump_generation(user_id)
+        for listener in self._write_listeners:
+            asyncio.ensure_future(listener(user_id))
+
+    def stats(self) -> Dict[str, Any]:
+        """Latency metrics per operation."""
+        return {
+            "in_flight": len(self._inflight),
+            "operations": {name: m.to_dict() for name, m in self._metrics.items()},
+        }
+
+    def close(self) -> None:
+        """Shut down the thread pool without waiting for running calls."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
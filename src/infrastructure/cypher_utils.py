@@ -22,7 +22,9 @@ _CYPHER_RESERVED_WORDS = frozenset({
 })
 
 
-def validate_cypher_identifier(value: str, label: str = "identifier") -> str:
+def validate_cypher_identifier(
+    value: str, label: str = "identifier", allow_reserved: bool = False
+) -> str:
     """Validate that a string is safe to use as a Cypher identifier.
 
     Neo4j does not support parameterized relationship types or labels,
@@ -31,6 +33,8 @@ def validate_cypher_identifier(value: str, label: str = "identifier") -> str:
     Args:
         value: The string to validate.
         label: Descriptive label for error messages (e.g., "relationship_type").
+        allow_reserved: Accept reserved keywords. Only safe when the caller
+            backtick-quotes the identifier.
 
     Returns:
         The validated string (unchanged).
@@ -48,7 +52,7 @@ def validate_cypher_identifier(value: str, label: str = "identifier") -> str:
             f"Must match pattern [A-Za-z_][A-Za-z0-9_]*"
         )
 
-    if value.upper() in _CYPHER_RESERVED_WORDS:
+    if not allow_reserved and value.upper() in _CYPHER_RESERVED_WORDS:
         raise ValueError(
             f"Cypher {label} must not be a reserved keyword: {value!r}"
         )
@@ -0,0 +1,166 @@
+"""Concurrent worker pool for event bus consumers.
+
+A queue consumer hands every delivery to ``ConsumerPool.submit``. The pool
+spreads deliveries over ``concurrency`` workers, each with its own FIFO
+partition:
+
+- Deliveries with an ordering key always land in the same partition, so
+  events sharing a key are handled one at a time, in arrival order.
+- Deliveries without a key go to the shortest partition.
+
+Handlers take one event, or a list of events when the pool batches
+(``batch_size > 1``). A delivery is acked once its handler call succeeds
+and rejected (dead-lettered) when it fails.
+
+Deliveries are duck-typed: anything with async ``ack()`` and
+``reject(requeue=False)`` works, which keeps the pool independent of the
+AMQP client.
+"""
+
+import asyncio
+import inspect
+import logging
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional, Tuple
+
+from domain.event import KnowledgeEvent
+
+logger = logging.getLogger(__name__)
+
+OrderingKey = Callable[[KnowledgeEvent], Optional[str]]
+
+
+@dataclass
+class ConsumerStats:
+    """Delivery counters of one pool."""
+    processed: int = 0
+    failed: int = 0
+    batches: int = 0
+    max_batch_size: int = 0
+
+
+@dataclass
+class _Partition:
+    queue: asyncio.Queue = field(default_factory=asyncio.Queue)
+    task: Optional[asyncio.Task] = None
+
+
+class ConsumerPool:
+    """Per-queue worker pool with per-key ordering and optional batching."""
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable,
+        concurrency: int = 1,
+        ordering_key: Optional[OrderingKey] = None,
+        batch_size: int = 1,
+        batch_timeout: float = 0.05,
+    ):
+        """
+        Initialize consumer pool.
+
+        Args:
+            name: Pool name for logs (usually the queue name)
+            handler: Callable taking a KnowledgeEvent, or a list of them when
+                ``batch_size > 1``; sync or async
+            concurrency: Number of workers
+            ordering_key: Maps an event to its ordering key (None: unordered)
+            batch_size: Maximum events per handler call
+            batch_timeout: Seconds a worker waits to fill a batch
+        """
+        if concurrency < 1 or batch_size < 1:
+            raise ValueError("concurrency and batch_size must be at least 1")
+        self.name = name
+        self.handler = handler
+        self.concurrency = concurrency
+        self.ordering_key = ordering_key
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.stats = ConsumerStats()
+        self._partitions: List[_Partition] = []
+
+    def start(self) -> None:
+        """Start the workers."""
+        if self._partitions:
+            return
+        self._partitions = [_Partition() for _ in range(self.concurrency)]
+        for index, partition in enumerate(self._partitions):
+            partition.task = asyncio.create_task(self._work(partition), name=f"{self.name}-worker-{index}")
+
+    async def stop(self, drain: bool = True) -> None:
+        """
+        Stop the workers.
+
+        Args:
+            drain: Finish the deliveries already submitted first. Without
+                draining they stay unacked and the broker redelivers them.
+        """
+        if drain:
+            await asyncio.gather(*(p.queue.join() for p in self._partitions))
+        for partition in self._partitions:
+            partition.task.cancel()
+        await asyncio.gather(*(p.task for p in self._partitions), return_exceptions=True)
+        self._partitions = []
+
+    async def submit(self, event: KnowledgeEvent, delivery: Any) -> None:
+        """Queue a decoded delivery for its partition."""
+        if not self._partitions:
+            raise RuntimeError(f"Consumer pool {self.name} is not running")
+        await self._partitions[self._partition_for(event)].queue.put((event, delivery))
+
+    def pending(self) -> int:
+        """Deliveries queued but not yet handled."""
+        return sum(p.queue.qsize() for p in self._partitions)
+
+    def _partition_for(self, event: KnowledgeEvent) -> int:
+        key = self.ordering_key(event) if self.ordering_key else None
+        if key is not None:
+            # Stable across processes, unlike hash() of a str
+            return zlib.crc32(str(key).encode()) % self.concurrency
+        sizes = [p.queue.qsize() for p in self._partitions]
+        return sizes.index(min(sizes))
+
+    async def _work(self, partition: _Partition) -> None:
+        while True:
+            items = [await partition.queue.get()]
+            if self.batch_size > 1:
+                await self._fill_batch(partition.queue, items)
+            try:
+                await self._handle(items)
+            finally:
+                for _ in items:
+                    partition.queue.task_done()
+
+    async def _fill_batch(self, queue: asyncio.Queue, items: List[Tuple[KnowledgeEvent, Any]]) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_timeout
+        while len(items) < self.batch_size:
+            if not queue.empty():
+                items.append(queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            try:
+                items.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                return
+
+    async def _handle(self, items: List[Tuple[KnowledgeEvent, Any]]) -> None:
+        events = [event for event, _ in items]
+        try:
+            result = self.handler(events if self.batch_size > 1 else events[0])
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            self.stats.failed += len(items)
+            logger.error(f"Error handling {len(items)} event(s) from {self.name}: {e}")
+            # Rejected messages go to the dead letter exchange
+            await asyncio.gather(*(d.reject(requeue=False) for _, d in items), return_exceptions=True)
+            return
+        self.stats.processed += len(items)
+        self.stats.batches += 1
+        self.stats.max_batch_size = max(self.stats.max_batch_size, len(items))
+        await asyncio.gather(*(d.ack() for _, d in items), return_exceptions=True)
@@ -3,8 +3,7 @@
 import asyncio
 import json
 import logging
-from typing import Any, Callable, Dict, List, Optional
-from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import aio_pika
 from aio_pika import connect_robust, Message, DeliveryMode
@@ -12,6 +11,8 @@ from aio_pika.patterns import RPC
 
 from domain.event import KnowledgeEvent
 from application.event_bus import EventBus
+from infrastructure.event_bus.consumer_pool import ConsumerPool, OrderingKey
+from infrastructure.event_bus.serialization import decode_event, get_event_serializer
 
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,15 @@ class RabbitMQEventBus(EventBus):
     - Dead letter queue for failed messages
     - RPC pattern for request-response
     - Automatic reconnection on failures
+
+    Throughput settings (the defaults keep the original behavior):
+    - ``concurrency``: workers per queue; ``ordering_key`` keeps events
+      sharing a key in order on one worker
+    - ``prefetch_count``: unacked deliveries per channel, should cover
+      ``concurrency`` (times the batch size for batch subscribers)
+    - ``serializer``: "json", "orjson", "msgpack" or "auto"
+    - ``confirm_batch_size``: publishes awaiting broker confirms at once
+      in ``publish_batch``
     """
 
     def __init__(
@@ -36,12 +46,22 @@ class RabbitMQEventBus(EventBus):
         queue_prefix: str = "kg_",
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        prefetch_count: int = 10,
+        concurrency: int = 1,
+        ordering_key: Optional[OrderingKey] = None,
+        serializer: str = "json",
+        confirm_batch_size: int = 256,
     ):
         self.connection_url = connection_url
         self.exchange_name = exchange_name
         self.queue_prefix = queue_prefix
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.prefetch_count = prefetch_count
+        self.concurrency = concurrency
+        self.ordering_key = ordering_key
+        self.serializer = get_event_serializer(serializer)
+        self.confirm_batch_size = confirm_batch_size
         
         # Connection and channel management
         self.connection: Optional[aio_pika.Connection] = None
@@ -50,12 +70,14 @@ class RabbitMQEventBus(EventBus):
         
         # Local handlers for backward compatibility
         self._local_handlers: Dict[str, List[Callable]] = {}
+        self._local_batch_handlers: Dict[str, List[Callable]] = {}
         
         # RPC support
         self.rpc: Optional[RPC] = None
         
-        # Consumer tasks
+        # Consumer tasks and their worker pools
         self._consumer_tasks: List[asyncio.Task] = []
+        self._consumer_pools: List[ConsumerPool] = []
         self._is_connected = False
 
     async def connect(self) -> None:
@@ -65,10 +87,11 @@ class RabbitMQEventBus(EventBus):
             
             # Connect to RabbitMQ
             self.connection = await connect_robust(self.connection_url)
-            self.channel = await self.connection.channel()
+            # Confirm mode: publishes resolve once the broker has the message
+            self.channel = await self.connection.channel(publisher_confirms=True)
             
             # Set QoS for better performance
-            await self.channel.set_qos(prefetch_count=10)
+            await self.channel.set_qos(prefetch_count=self.prefetch_count)
             
             # Declare exchange
             self.exchange = await self.channel.declare_exchange(
@@ -99,6 +122,12 @@ class RabbitMQEventBus(EventBus):
                         await task
                     except asyncio.CancelledError:
                         pass
+            self._consumer_tasks = []
+
+            # Finish deliveries already handed to workers while acks can still be sent
+            for pool in self._consumer_pools:
+                await pool.stop()
+            self._consumer_pools = []
             
             # Close channel and connection
             if self.channel:
@@ -120,28 +149,12 @@ class RabbitMQEventBus(EventBus):
             return
         
         try:
-            # Convert event to JSON
-            event_data = asdict(event)
-            message_body = json.dumps(event_data, default=str).encode()
-            
-            # Create message with persistent delivery
-            message = Message(
-                body=message_body,
-                delivery_mode=DeliveryMode.PERSISTENT,
-                content_type="application/json",
-                headers={
-                    "event_type": event.action,
-                    "role": event.role.value,
-                    "timestamp": str(event.timestamp) if hasattr(event, 'timestamp') else None
-                }
-            )
-            
             # Determine routing key
             if routing_key is None:
                 routing_key = event.action
             
             # Publish to exchange
-            await self.exchange.publish(message, routing_key=routing_key)
+            await self.exchange.publish(self._message(event), routing_key=routing_key)
             
             logger.debug(f"Published event {event.action} with routing key {routing_key}")
             
@@ -150,6 +163,18 @@ class RabbitMQEventBus(EventBus):
             # Fallback to local handlers
             await self._publish_local(event)
 
+    def _message(self, event: KnowledgeEvent) -> Message:
+        """Build a persistent message for an event."""
+        return Message(
+            body=self.serializer.encode(event),
+            delivery_mode=DeliveryMode.PERSISTENT,
+            content_type=self.serializer.content_type,
+            headers={
+                "event_type": event.action,
+                "role": event.role.value,
+            }
+        )
+
     async def subscribe(self, event_type: str, handler: Callable) -> None:
         """Subscribe to events of a specific type."""
         # Register local handler for backward compatibility
@@ -161,7 +186,32 @@ class RabbitMQEventBus(EventBus):
         if self._is_connected:
             await self._subscribe_rabbitmq(event_type, handler)
 
-    async def _subscribe_rabbitmq(self, event_type: str, handler: Callable) -> None:
+    async def subscribe_batch(
+        self,
+        event_type: str,
+        handler: Callable[[List[KnowledgeEvent]], Any],
+        batch_size: int = 100,
+        batch_timeout: float = 0.05,
+    ) -> None:
+        """
+        Subscribe a handler that takes lists of events.
+
+        Each worker collects up to ``batch_size`` deliveries, waiting at most
+        ``batch_timeout`` seconds for a batch to fill. The whole batch is
+        acked when the handler returns and dead-lettered when it raises.
+        """
+        self._local_batch_handlers.setdefault(event_type, []).append(handler)
+
+        if self._is_connected:
+            await self._subscribe_rabbitmq(event_type, handler, batch_size, batch_timeout)
+
+    async def _subscribe_rabbitmq(
+        self,
+        event_type: str,
+        handler: Callable,
+        batch_size: int = 1,
+        batch_timeout: float = 0.05,
+    ) -> None:
         """Subscribe to RabbitMQ queue for specific event type."""
         try:
             # Create queue for this event type
@@ -178,9 +228,19 @@ class RabbitMQEventBus(EventBus):
             # Bind queue to exchange with routing key
             await queue.bind(self.exchange, event_type)
             
-            # Start consuming messages
+            # Start the workers, then feed them from the queue
+            pool = ConsumerPool(
+                queue_name,
+                handler,
+                concurrency=self.concurrency,
+                ordering_key=self.ordering_key,
+                batch_size=batch_size,
+                batch_timeout=batch_timeout,
+            )
+            pool.start()
+            self._consumer_pools.append(pool)
             consumer_task = asyncio.create_task(
-                self._consume_messages(queue, handler, event_type)
+                self._consume_messages(queue, pool)
             )
             self._consumer_tasks.append(consumer_task)
             
@@ -189,30 +249,23 @@ class RabbitMQEventBus(EventBus):
         except Exception as e:
             logger.error(f"Failed to subscribe to RabbitMQ for {event_type}: {e}")
 
-    async def _consume_messages(self, queue: aio_pika.Queue, handler: Callable, event_type: str) -> None:
-        """Consume messages from a queue."""
+    async def _consume_messages(self, queue: aio_pika.Queue, pool: ConsumerPool) -> None:
+        """Decode deliveries from a queue and hand them to its worker pool."""
         try:
             async with queue.iterator() as queue_iter:
                 async for message in queue_iter:
-                    async with message.process():
-                        try:
-                            # Parse event from message
-                            event_data = json.loads(message.body.decode())
-                            event = KnowledgeEvent(**event_data)
-                            
-                            # Call handler
-                            if asyncio.iscoroutinefunction(handler):
-                                await handler(event)
-                            else:
-                                handler(event)
-                                
-                            logger.debug(f"Processed event {event.action} from queue {queue.name}")
-                            
-                        except Exception as e:
-                            logger.error(f"Error processing message from queue {queue.name}: {e}")
-                            # Message will be rejected and sent to dead letter queue
-                            await message.reject(requeue=False)
+                    try:
+                        event = decode_event(message.body, message.content_type)
+                    except Exception as e:
+                        logger.error(f"Undecodable message on queue {queue.name}: {e}")
+                        # Message will be rejected and sent to dead letter queue
+                        await message.reject(requeue=False)
+                        continue
+                    # The pool acks or rejects once the handler has run
+                    await pool.submit(event, message)
                             
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             logger.error(f"Error consuming from queue {queue.name}: {e}")
 
@@ -227,28 +280,51 @@ class RabbitMQEventBus(EventBus):
                     handler(event)
             except Exception as e:
                 logger.error(f"Error in local handler for {event.action}: {e}")
+        for handler in self._local_batch_handlers.get(event.action, []):
+            try:
+                result = handler([event])
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Error in local batch handler for {event.action}: {e}")
 
     async def publish_batch(self, events: List[KnowledgeEvent], routing_key: Optional[str] = None) -> None:
-        """Publish multiple events in a batch."""
+        """
+        Publish multiple events with pipelined publisher confirms.
+
+        Up to ``confirm_batch_size`` publishes are in flight at once and each
+        window is awaited until the broker has confirmed every message in it,
+        instead of a channel transaction's round trip per batch plus
+        serialized publishes. Events the broker did not confirm fall back to
+        local handlers, like a failed ``publish``.
+        """
         if not self._is_connected:
             logger.warning("Not connected to RabbitMQ, falling back to local handlers")
             for event in events:
                 await self._publish_local(event)
             return
-        
-        try:
-            # Use transaction for batch publishing
-            async with self.channel.transaction():
-                for event in events:
-                    await self.publish(event, routing_key)
-                    
-            logger.info(f"Published batch of {len(events)} events")
-            
-        except Exception as e:
-            logger.error(f"Failed to publish batch: {e}")
+
+        failed: List[Tuple[KnowledgeEvent, BaseException]] = []
+        for start in range(0, len(events), self.confirm_batch_size):
+            window = events[start:start + self.confirm_batch_size]
+            results = await asyncio.gather(
+                *(
+                    self.exchange.publish(self._message(event), routing_key=routing_key or event.action)
+                    for event in window
+                ),
+                return_exceptions=True,
+            )
+            failed.extend(
+                (event, result) for event, result in zip(window, results) if isinstance(result, BaseException)
+            )
+
+        if failed:
+            logger.error(f"Failed to publish {len(failed)} of {len(events)} events: {failed[0][1]}")
             # Fallback to local handlers
-            for event in events:
+            for event, _ in failed:
                 await self._publish_local(event)
+        else:
+            logger.info(f"Published batch of {len(events)} events")
 
     async def call_rpc(self, method: str, payload: Dict[str, Any], timeout: float = 30.0) -> Dict[str, Any]:
         """Make an RPC call using RabbitMQ."""
@@ -326,7 +402,18 @@ class RabbitMQEventBus(EventBus):
                     "status": "healthy",
                     "connection": "connected",
                     "channel": "open",
-                    "exchange": self.exchange_name
+                    "exchange": self.exchange_name,
+                    "serializer": self.serializer.name,
+                    "consumers": {
+                        pool.name: {
+                            "concurrency": pool.concurrency,
+                            "batch_size": pool.batch_size,
+                            "pending": pool.pending(),
+                            "processed": pool.stats.processed,
+                            "failed": pool.stats.failed,
+                        }
+                        for pool in self._consumer_pools
+                    },
                 }
             else:
                 return {"status": "unhealthy", "error": "Connection or channel closed"}
@@ -0,0 +1,124 @@
+"""Wire formats for knowledge events on the distributed event bus.
+
+Events are encoded from a flat ``{"action", "data", "role"}`` mapping rather
+than ``dataclasses.asdict`` (which deep-copies ``data``). Decoding picks the
+format from the message content type, so consumers keep accepting events
+from producers that still publish the legacy JSON format during a rollout.
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+from domain.event import KnowledgeEvent
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional format
+    msgpack = None
+
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+
+def event_to_dict(event: KnowledgeEvent) -> Dict[str, Any]:
+    """Flat, serializable view of an event."""
+    return {"action": event.action, "data": event.data, "role": event.role.value}
+
+
+def event_from_dict(payload: Dict[str, Any]) -> KnowledgeEvent:
+    """Rebuild an event from its serialized mapping."""
+    return KnowledgeEvent(action=payload["action"], data=payload["data"], role=payload["role"])
+
+
+class EventSerializer:
+    """Standard-library JSON (the original wire format)."""
+
+    name = "json"
+    content_type = JSON_CONTENT_TYPE
+
+    def dumps(self, payload: Any) -> bytes:
+        return json.dumps(payload, default=str).encode()
+
+    def loads(self, body: bytes) -> Any:
+        return json.loads(body)
+
+    def encode(self, event: KnowledgeEvent) -> bytes:
+        return self.dumps(event_to_dict(event))
+
+    def decode(self, body: bytes) -> KnowledgeEvent:
+        return event_from_dict(self.loads(body))
+
+
+class OrjsonEventSerializer(EventSerializer):
+    """JSON via orjson: same wire format, several times faster."""
+
+    name = "orjson"
+
+    def dumps(self, payload: Any) -> bytes:
+        return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, body: bytes) -> Any:
+        return orjson.loads(body)
+
+
+class MsgpackEventSerializer(EventSerializer):
+    """MessagePack: compact binary encoding."""
+
+    name = "msgpack"
+    content_type = MSGPACK_CONTENT_TYPE
+
+    def dumps(self, payload: Any) -> bytes:
+        return msgpack.packb(payload, default=str, use_bin_type=True)
+
+    def loads(self, body: bytes) -> Any:
+        return msgpack.unpackb(body, raw=False, strict_map_key=False)
+
+
+def get_event_serializer(name: str = "json") -> EventSerializer:
+    """
+    Return the serializer registered under ``name``.
+
+    ``"auto"`` picks the fastest JSON encoder available, keeping the wire
+    format readable by every existing consumer.
+
+    Raises:
+        ValueError: For unknown names or serializers whose library is missing
+    """
+    if name == "auto":
+        name = "orjson" if orjson is not None else "json"
+    if name == "json":
+        return EventSerializer()
+    if name == "orjson":
+        if orjson is None:
+            raise ValueError("orjson serializer requested but orjson is not installed")
+        return OrjsonEventSerializer()
+    if name == "msgpack":
+        if msgpack is None:
+            raise ValueError("msgpack serializer requested but msgpack is not installed")
+        return MsgpackEventSerializer()
+    raise ValueError(f"Unknown event serializer: {name}")
+
+
+# Decoders by content type; JSON bodies are read with the fastest parser
+_DECODERS: Dict[str, EventSerializer] = {JSON_CONTENT_TYPE: get_event_serializer("auto")}
+if msgpack is not None:
+    _DECODERS[MSGPACK_CONTENT_TYPE] = MsgpackEventSerializer()
+
+
+def decode_event(body: bytes, content_type: Optional[str]) -> KnowledgeEvent:
+    """
+    Decode an event in whichever format its content type names.
+
+    Raises:
+        ValueError: For content types no installed serializer can read
+    """
+    decoder = _DECODERS.get(content_type or JSON_CONTENT_TYPE)
+    if decoder is None:
+        raise ValueError(f"Unsupported event content type: {content_type}")
+    return decoder.decode(body)
@@ -3,10 +3,40 @@
 This backend connects to a FalkorDB instance to store knowledge graph data.
 """
 
-from typing import Any, Dict, List, Optional
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
 from falkordb import FalkorDB
 
-from domain.kg_backends import KnowledgeGraphBackend
+from domain.kg_backends import DEFAULT_BULK_BATCH_SIZE, KnowledgeGraphBackend, iter_batches
+
+
+def _split_entity_id(entity_id: str) -> Tuple[str, str]:
+    """Split a ``label:id`` entity identifier into ``(label, id)``."""
+    if ":" in entity_id:
+        label, real_id = entity_id.split(":", 1)
+        return label, real_id
+    return "Entity", entity_id
+
+
+def _serialize_properties(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert property values into types FalkorDB can store."""
+    import json
+
+    props = {}
+    for key, value in properties.items():
+        if value is None:
+            continue
+        elif isinstance(value, (dict, list)):
+            # Convert complex types to JSON strings
+            props[key] = json.dumps(value)
+        elif hasattr(value, 'value'): # Handle Enum
+            props[key] = str(value.value)
+        elif isinstance(value, (str, int, float, bool)):
+            props[key] = value
+        else:
+            # Convert other types to strings
+            props[key] = str(value)
+    return props
 
 
 class FalkorBackend(KnowledgeGraphBackend):
@@ -41,47 +71,12 @@ class FalkorBackend(KnowledgeGraphBackend):
 
     async def add_entity(self, entity_id: str, properties: Dict[str, Any]) -> None:
         """Add or update an entity (node) in the graph."""
-        import json
         import asyncio
         
         # In FalkorDB/Cypher, we typically use labels. 
         # We'll assume the entity_id format "label:id" or just use a generic Entity label if not specified.
-        
-        label = "Entity"
-        real_id = entity_id
-        
-        if ":" in entity_id:
-            parts = entity_id.split(":", 1)
-            label = parts[0]
-            real_id = parts[1]
-            
-        # Prepare properties - flatten and convert complex types
-        props = {}
-        props["id"] = real_id
-        props["_full_id"] = entity_id
-        
-        # Flatten properties dict and convert complex types to JSON strings
-        # Special handling: if 'properties' key exists and is a dict, flatten it into the main props
-        # This is to handle Pydantic models that have a 'properties' field (like ODIN models)
-        
-        flat_properties = properties.copy()
-        if "properties" in flat_properties and isinstance(flat_properties["properties"], dict):
-            nested_props = flat_properties.pop("properties")
-            flat_properties.update(nested_props)
-            
-        for key, value in flat_properties.items():
-            if value is None:
-                continue
-            elif isinstance(value, (dict, list)):
-                # Convert complex types to JSON strings
-                props[key] = json.dumps(value)
-            elif hasattr(value, 'value'): # Handle Enum
-                props[key] = str(value.value)
-            elif isinstance(value, (str, int, float, bool)):
-                props[key] = value
-            else:
-                # Convert other types to strings
-                props[key] = str(value)
+        label, real_id = _split_entity_id(entity_id)
+        props = self._entity_properties(entity_id, real_id, properties)
         
         # Construct MERGE query
         query = f"""
@@ -110,36 +105,13 @@ class FalkorBackend(KnowledgeGraphBackend):
         properties: Dict[str, Any],
     ) -> None:
         """Add a relationship between two entities."""
-        import json
         import asyncio
         
-        source_label = "Entity"
-        source_real_id = source_id
-        if ":" in source_id:
-            parts = source_id.split(":", 1)
-            source_label = parts[0]
-            source_real_id = parts[1]
-            
-        target_label = "Entity"
-        target_real_id = target_id
-        if ":" in target_id:
-            parts = target_id.split(":", 1)
-            target_label = parts[0]
-            target_real_id = parts[1]
+        source_label, source_real_id = _split_entity_id(source_id)
+        target_label, target_real_id = _split_entity_id(target_id)
         
         # Flatten properties and convert complex types
-        props = {}
-        for key, value in properties.items():
-            if value is None:
-                continue
-            elif isinstance(value, (dict, list)):
-                props[key] = json.dumps(value)
-            elif hasattr(value, 'value'): # Handle Enum
-                props[key] = str(value.value)
-            elif isinstance(value, (str, int, float, bool)):
-                props[key] = value
-            else:
-                props[key] = str(value)
+        props = _serialize_properties(properties)
             
         query = f"""
         MATCH (s:{source_label} {{id: $source_id}})
@@ -168,6 +140,103 @@ class FalkorBackend(KnowledgeGraphBackend):
             "rel_type": relationship_type
         })
 
+    @staticmethod
+    def _entity_properties(entity_id: str, real_id: str, properties: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the stored property map for an entity."""
+        # Flatten properties dict and convert complex types to JSON strings
+        # Special handling: if 'properties' key exists and is a dict, flatten it into the main props
+        # This is to handle Pydantic models that have a 'properties' field (like ODIN models)
+        flat_properties = properties.copy()
+        if "properties" in flat_properties and isinstance(flat_properties["properties"], dict):
+            nested_props = flat_properties.pop("properties")
+            flat_properties.update(nested_props)
+
+        props = {"id": real_id, "_full_id": entity_id}
+        props.update(_serialize_properties(flat_properties))
+        return props
+
+    async def add_entities_bulk(
+        self,
+        entities: List[Dict[str, Any]],
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    ) -> Dict[str, Any]:
+        """Add many entities with one UNWIND query per label.
+
+        Labels are derived from the ``label:id`` entity ID convention used by
+        :meth:`add_entity`; a row's ``labels`` key is ignored.
+        """
+        import asyncio
+
+        groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for row in entities:
+            label, real_id = _split_entity_id(row["id"])
+            groups[label].append({
+                "id": real_id,
+                "props": self._entity_properties(row["id"], real_id, row.get("properties", {})),
+            })
+
+        loop = asyncio.get_event_loop()
+        batches = []
+        for label, rows in groups.items():
+            query = f"""
+            UNWIND $rows AS row
+            MERGE (n:{label} {{id: row.id}})
+            SET n += row.props
+            """
+            for batch in iter_batches(rows, batch_size):
+                await loop.run_in_executor(None, lambda: self.graph.query(query, {"rows": batch}))
+                self._history.extend(
+                    {"type": "entity", "id": row["id"], "label": label} for row in batch
+                )
+                batches.append({"group": label, "rows": len(batch)})
+
+        return {"rows": len(entities), "batches": batches}
+
+    async def add_relationships_bulk(
+        self,
+        relationships: List[Dict[str, Any]],
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    ) -> Dict[str, Any]:
+        """Add many relationships with one UNWIND query per endpoint labels and type."""
+        import asyncio
+
+        groups: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = defaultdict(list)
+        for row in relationships:
+            source_label, source_real_id = _split_entity_id(row["source_id"])
+            target_label, target_real_id = _split_entity_id(row["target_id"])
+            groups[(source_label, row["type"], target_label)].append({
+                "source_id": source_real_id,
+                "target_id": target_real_id,
+                "props": _serialize_properties(row.get("properties", {})),
+            })
+
+        loop = asyncio.get_event_loop()
+        batches = []
+        for (source_label, rel_type, target_label), rows in groups.items():
+            query = f"""
+            UNWIND $rows AS row
+            MATCH (s:{source_label} {{id: row.source_id}})
+            MATCH (t:{target_label} {{id: row.target_id}})
+            MERGE (s)-[r:{rel_type}]->(t)
+            SET r += row.props
+            """
+            for batch in iter_batches(rows, batch_size):
+                await loop.run_in_executor(None, lambda: self.graph.query(query, {"rows": batch}))
+                self._history.extend(
+                    {
+                        "type": "relationship",
+                        "source": row["source_id"],
+                        "source_label": source_label,
+                        "target": row["target_id"],
+                        "target_label": target_label,
+                        "rel_type": rel_type,
+                    }
+                    for row in batch
+                )
+                batches.append({"group": rel_type, "rows": len(batch)})
+
+        return {"rows": len(relationships), "batches": batches}
+
     async def rollback(self) -> None:
         """Rollback the last operation."""
         import asyncio
@@ -3,33 +3,78 @@
 This backend stores nodes and edges in dictionaries.  It is primarily
 intended for unit testing and local development where a real graph
 database is unnecessary or unavailable.
+
+Besides the forward adjacency lists exposed as ``edges`` it maintains
+secondary indexes so fixture-sized graphs (tens of thousands of nodes)
+stay fast:
+
+- reverse adjacency (target -> sources) for ``list_relationships(target_id=...)``
+- a per-relationship-type index of source nodes
+- label and property indexes for :meth:`find_entities`
+
+Stored property dicts and edge lists are never mutated while a snapshot
+returned by :meth:`query` may still reference them (copy-on-write), so
+snapshots are cheap and stay consistent without ``copy.deepcopy``.
 """
 
-from typing import Any, Dict, List, Tuple
+from collections import Counter
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
 
 from domain.kg_backends import KnowledgeGraphBackend
 
+# Properties indexed by default for find_entities()
+DEFAULT_INDEXED_PROPERTIES = ("name", "type", "layer")
+
+# Undo log opcodes
+_UNDO_ENTITY = 0
+_UNDO_EDGE = 1
+
+
+def _index_key(value: Any) -> Optional[Hashable]:
+    """Return ``value`` if it can key a property index, else None."""
+    if value is None:
+        return None
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    return value
+
 
 class InMemoryGraphBackend(KnowledgeGraphBackend):
     """A simple graph backend that stores data in memory."""
 
-    def __init__(self) -> None:
+    def __init__(self, indexed_properties: Iterable[str] = DEFAULT_INDEXED_PROPERTIES) -> None:
         # Each node is keyed by its ID and stores a properties dict
         self.nodes: Dict[str, Dict[str, Any]] = {}
         # Edges keyed by source ID; each entry is a list of tuples
         # (relationship_type, target_id, properties)
         self.edges: Dict[str, List[Tuple[str, str, Dict[str, Any]]]] = {}
-        # History stack for rudimentary rollback support
-        self._history: List[Tuple[str, Any]] = []
+        # Reverse adjacency: target ID -> Counter of source IDs with edges to it
+        self._incoming: Dict[str, Counter] = {}
+        # Relationship type -> Counter of source IDs with edges of that type
+        self._by_type: Dict[str, Counter] = {}
+        # Label -> node IDs, and property -> value -> node IDs
+        self._by_label: Dict[str, Set[str]] = {}
+        self._by_property: Dict[str, Dict[Hashable, Set[str]]] = {
+            name: {} for name in indexed_properties
+        }
+        # Undo log for rollback: (_UNDO_ENTITY, entity_id, previous_props) or
+        # (_UNDO_EDGE, source_id). Each entry is undone in O(1).
+        self._history: List[Tuple[Any, ...]] = []
+        # Copy-on-write bookkeeping: the last snapshot handed out by query()
+        # and the edge lists written since then (safe to mutate in place)
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._owned_edge_lists: Set[str] = set()
 
     async def add_entity(self, entity_id: str, properties: Dict[str, Any], labels: List[str] = None) -> None:
         # Overwrite existing properties if the entity already exists
         props = dict(properties)
         if labels:
             props["labels"] = labels
-        self.nodes[entity_id] = props
-        # Record history for rollback
-        self._history.append(("entity", entity_id))
+        # Record the previous state so rollback restores it exactly
+        self._history.append((_UNDO_ENTITY, entity_id, self.nodes.get(entity_id)))
+        self._set_node(entity_id, props)
 
     async def add_relationship(
         self,
@@ -38,43 +83,106 @@ class InMemoryGraphBackend(KnowledgeGraphBackend):
         target_id: str,
         properties: Dict[str, Any],
     ) -> None:
-        self.edges.setdefault(source_id, []).append((relationship_type, target_id, dict(properties)))
-        self._history.append(("edge", (source_id, target_id)))
+        edges_list = self._writable_edges(source_id)
+        edges_list.append((relationship_type, target_id, dict(properties)))
+        self._incoming.setdefault(target_id, Counter())[source_id] += 1
+        self._by_type.setdefault(relationship_type, Counter())[source_id] += 1
+        self._history.append((_UNDO_EDGE, source_id))
 
     async def rollback(self) -> None:
-        """Rollback the last entity or relationship addition."""
+        """Undo the last entity or relationship addition in O(1).
+
+        Rolling back an entity write restores the entity's previous
+        properties, or removes it if it did not exist before.
+        """
         if not self._history:
             return
-        kind, info = self._history.pop()
-        if kind == "entity":
-            # Remove entity and any outgoing edges
-            self.nodes.pop(info, None)
-            self.edges.pop(info, None)
-        elif kind == "edge":
-            source_id, target_id = info
-            if source_id in self.edges:
-                # Remove the last edge that matches the target
-                edges_list = self.edges[source_id]
-                for i in range(len(edges_list) - 1, -1, -1):
-                    _, tgt, _ = edges_list[i]
-                    if tgt == target_id:
-                        edges_list.pop(i)
-                        break
-                if not edges_list:
-                    del self.edges[source_id]
-
-    async def query(self, query: str) -> Dict[str, Any]:
+        entry = self._history.pop()
+        if entry[0] == _UNDO_ENTITY:
+            _, entity_id, previous = entry
+            self._set_node(entity_id, previous)
+        else:
+            source_id = entry[1]
+            # Undo is LIFO, so the edge to remove is the last one appended
+            edges_list = self._writable_edges(source_id)
+            rel_type, target_id, _ = edges_list.pop()
+            if not edges_list:
+                del self.edges[source_id]
+                self._owned_edge_lists.discard(source_id)
+            self._decrement(self._incoming, target_id, source_id)
+            self._decrement(self._by_type, rel_type, source_id)
+
+    async def query(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Return a snapshot of the in‑memory graph.
 
         The query string is ignored; this backend returns its entire state.
+        Snapshots share property dicts and edge lists with the backend, which
+        copies them before its next write instead of deep-copying on every
+        read. Treat the returned structure as read-only.
         """
-        # Return deep copies to prevent external mutation
-        import copy
+        if self._snapshot is None:
+            self._snapshot = {
+                "nodes": dict(self.nodes),
+                "edges": dict(self.edges),
+            }
+            self._owned_edge_lists.clear()
+        return self._snapshot
 
-        return {
-            "nodes": copy.deepcopy(self.nodes),
-            "edges": {k: copy.deepcopy(v) for k, v in self.edges.items()},
-        }
+    async def get_entity(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        """Get an entity in the same shape as ``Neo4jBackend.get_entity``."""
+        props = self.nodes.get(entity_id)
+        if props is None:
+            return None
+        return {"id": entity_id, "properties": props, "labels": list(props.get("labels", []))}
+
+    async def find_entities(
+        self,
+        label: Optional[str] = None,
+        **properties: Any,
+    ) -> List[Dict[str, Any]]:
+        """Find entities by label and/or exact property values.
+
+        Indexed properties and labels are answered from the secondary
+        indexes; other properties are checked against the narrowed set.
+
+        Args:
+            label: Optional label the entity must carry
+            **properties: Property values the entity must match exactly
+
+        Returns:
+            Entities in the same shape as :meth:`get_entity`
+        """
+        candidates: Optional[Set[str]] = None
+        if label is not None:
+            candidates = set(self._by_label.get(label, ()))
+        for name, value in properties.items():
+            index = self._by_property.get(name)
+            key = _index_key(value)
+            if index is None or key is None:
+                continue
+            ids = index.get(key, set())
+            candidates = set(ids) if candidates is None else candidates & ids
+
+        if candidates is None:
+            candidates = set(self.nodes)
+
+        results = []
+        for entity_id in candidates:
+            props = self.nodes[entity_id]
+            if all(props.get(name) == value for name, value in properties.items()):
+                results.append(await self.get_entity(entity_id))
+        return results
+
+    def add_property_index(self, name: str) -> None:
+        """Start indexing property ``name`` (existing nodes are indexed immediately)."""
+        if name in self._by_property:
+            return
+        index: Dict[Hashable, Set[str]] = {}
+        for entity_id, props in self.nodes.items():
+            key = _index_key(props.get(name))
+            if key is not None:
+                index.setdefault(key, set()).add(entity_id)
+        self._by_property[name] = index
 
     async def list_relationships(
         self,
@@ -82,25 +190,96 @@ class InMemoryGraphBackend(KnowledgeGraphBackend):
         target_id: str = None,
         relationship_type: str = None
     ) -> List[Dict[str, Any]]:
-        """List relationships matching criteria."""
+        """List relationships matching criteria.
+
+        Candidate source nodes come from the forward, reverse or type index
+        (whichever filter is given) instead of scanning every edge.
+        """
+        if source_id:
+            sources: Iterable[str] = [source_id] if source_id in self.edges else []
+        elif target_id:
+            sources = list(self._incoming.get(target_id, ()))
+        elif relationship_type:
+            sources = list(self._by_type.get(relationship_type, ()))
+        else:
+            sources = list(self.edges)
+
         results = []
-        
-        for src, edges in self.edges.items():
-            if source_id and src != source_id:
-                continue
-                
-            for rel_type, tgt, props in edges:
+        for src in sources:
+            for rel_type, tgt, props in self.edges.get(src, ()):
                 if target_id and tgt != target_id:
                     continue
-                
+
                 if relationship_type and rel_type != relationship_type:
                     continue
-                    
+
                 results.append({
                     "source": src,
                     "target": tgt,
                     "type": rel_type,
                     "properties": props
                 })
-        
+
         return results
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _set_node(self, entity_id: str, props: Optional[Dict[str, Any]]) -> None:
+        """Replace (or remove, if ``props`` is None) a node and update indexes."""
+        previous = self.nodes.get(entity_id)
+        if previous is not None:
+            self._unindex_node(entity_id, previous)
+        if props is None:
+            self.nodes.pop(entity_id, None)
+        else:
+            # Property dicts are replaced, never mutated, so snapshots stay valid
+            self.nodes[entity_id] = props
+            self._index_node(entity_id, props)
+        self._snapshot = None
+
+    def _index_node(self, entity_id: str, props: Dict[str, Any]) -> None:
+        for label in props.get("labels") or ():
+            self._by_label.setdefault(label, set()).add(entity_id)
+        for name, index in self._by_property.items():
+            key = _index_key(props.get(name))
+            if key is not None:
+                index.setdefault(key, set()).add(entity_id)
+
+    def _unindex_node(self, entity_id: str, props: Dict[str, Any]) -> None:
+        for label in props.get("labels") or ():
+            ids = self._by_label.get(label)
+            if ids is not None:
+                ids.discard(entity_id)
+                if not ids:
+                    del self._by_label[label]
+        for name, index in self._by_property.items():
+            key = _index_key(props.get(name))
+            ids = index.get(key) if key is not None else None
+            if ids is not None:
+                ids.discard(entity_id)
+                if not ids:
+                    del index[key]
+
+    def _writable_edges(self, source_id: str) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """Return ``source_id``'s edge list, copying it first if a snapshot shares it."""
+        self._snapshot = None
+        edges_list = self.edges.get(source_id)
+        if edges_list is None:
+            edges_list = self.edges[source_id] = []
+        elif source_id not in self._owned_edge_lists:
+            edges_list = self.edges[source_id] = list(edges_list)
+        self._owned_edge_lists.add(source_id)
+        return edges_list
+
+    @staticmethod
+    def _decrement(index: Dict[str, Counter], key: str, source_id: str) -> None:
+        counter = index.get(key)
+        if counter is None:
+            return
+        counter[source_id] -= 1
+        if counter[source_id] <= 0:
+            del counter[source_id]
+            if not counter:
+                del index[key]
@@ -12,11 +12,21 @@ Enhanced with 4-layer Knowledge Graph architecture support:
 """
 
 import logging
+import time
+from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from enum import Enum
 from neo4j import AsyncGraphDatabase
-from domain.kg_backends import KnowledgeGraphBackend
+from domain.kg_backends import DEFAULT_BULK_BATCH_SIZE, KnowledgeGraphBackend, iter_batches
+from infrastructure.cypher_utils import validate_cypher_identifier
+from infrastructure.node_identity import (
+    IDENTITY_LABEL,
+    IDENTITY_SCHEMA,
+    NAME_SEARCH_SCHEMA,
+    SET_NAME_KEY,
+    NodeLabelResolver,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +50,66 @@ LAYER_REQUIREMENTS = {
 }
 
 
+# Promotion criteria over node ``n`` per source layer, used by the paginated
+# candidate scan (same rules as get_promotion_candidates)
+PROMOTION_CRITERIA = {
+    "PERCEPTION": """
+        n.layer = 'PERCEPTION'
+        AND n.name IS NOT NULL
+        AND (n.status IS NULL OR n.status IN ['pending_validation', 'active'])
+        AND (
+            coalesce(n.confidence, 0) >= $threshold
+            OR coalesce(n.validation_count, 0) >= 3
+            OR n.ontology_codes IS NOT NULL
+        )
+    """,
+    "SEMANTIC": """
+        n.layer = 'SEMANTIC'
+        AND n.name IS NOT NULL
+        AND (
+            coalesce(n.confidence, 0) >= $threshold
+            OR COUNT { (n)<--(other {layer: 'SEMANTIC'}) } >= 5
+        )
+    """,
+}
+
+# In-place promotion of a batch of nodes plus one LayerTransition audit node
+# each. Nodes no longer at ``from_layer`` (promoted by someone else since the
+# scan read them) are left alone.
+PROMOTE_BATCH_QUERY = """
+UNWIND $rows AS row
+MATCH (n:{label} {{id: row.entity_id}})
+WHERE coalesce(n.layer, 'PERCEPTION') = row.from_layer
+SET n += row.properties
+SET n.layer = row.to_layer,
+    n.layer_assigned_at = datetime(),
+    n.previous_layer = row.from_layer,
+    n.promotion_timestamp = datetime(),
+    n.status = 'active'
+CREATE (t:LayerTransition {{
+    transition_id: row.transition_id,
+    entity_id: row.entity_id,
+    from_layer: row.from_layer,
+    to_layer: row.to_layer,
+    status: 'completed',
+    completed_at: datetime(),
+    trigger_type: $trigger_type,
+    new_entity_id: row.entity_id
+}})
+RETURN row.entity_id AS entity_id, row.transition_id AS transition_id
+"""
+
+
+def _validate_label(label: str) -> str:
+    """Validate a label or relationship type before backtick interpolation."""
+    return validate_cypher_identifier(label, "label", allow_reserved=True)
+
+
+def _quote_label(label: str) -> str:
+    """Backtick-quote a label read back from the database."""
+    return "`" + label.replace("`", "``") + "`"
+
+
 class Neo4jBackend(KnowledgeGraphBackend):
     """Neo4j backend for persistent knowledge graph storage."""
 
@@ -58,6 +128,8 @@ class Neo4jBackend(KnowledgeGraphBackend):
         self.password = password
         self.database = database
         self._driver = None
+        # Remembers which label/property locates a node so lookups stay index-backed
+        self._labels = NodeLabelResolver()
 
     async def _get_driver(self):
         """Get or create Neo4j driver."""
@@ -84,22 +156,22 @@ class Neo4jBackend(KnowledgeGraphBackend):
         """
         driver = await self._get_driver()
         
-        # Build label string (e.g., ":Entity:BusinessConcept:Concept")
-        if labels:
-            label_str = ":Entity:" + ":".join(labels)
-        else:
-            label_str = ":Entity"
-        
-        # Create Cypher query to merge entity with dynamic labels
-        # We need to use APOC or a two-step query because labels can't be parameterized
+        # Merge on the identity label only so the Entity.id uniqueness constraint
+        # backs the lookup, then add the extra labels (e.g. ":BusinessConcept:Concept").
+        # Labels can't be parameterized, so they are validated and interpolated.
+        extra_labels = "".join(f":`{_validate_label(label)}`" for label in labels or [])
+        set_labels = f"SET n{extra_labels}" if extra_labels else ""
         query = f"""
-        MERGE (n{label_str} {{id: $entity_id}})
+        MERGE (n:Entity {{id: $entity_id}})
+        {set_labels}
         SET n += $properties
+        {SET_NAME_KEY}
         RETURN n
         """
         
         async with driver.session(database=self.database) as session:
             await session.run(query, entity_id=entity_id, properties=properties)
+        self._labels.remember(entity_id, IDENTITY_LABEL)
 
     async def add_relationship(
         self,
@@ -110,8 +182,9 @@ class Neo4jBackend(KnowledgeGraphBackend):
     ) -> None:
         """Add a relationship between two entities.
 
-        Matches existing nodes by ID (regardless of label) and creates the relationship.
-        Falls back to creating Entity nodes if nodes don't exist.
+        Matches existing nodes by ID through their resolved label (``:Entity`` for
+        nodes written by this backend) and creates the relationship. Falls back
+        to creating Entity nodes if nodes don't exist.
 
         Args:
             source_id: Source entity ID
@@ -124,44 +197,308 @@ class Neo4jBackend(KnowledgeGraphBackend):
         # Sanitize relationship type (replace special chars)
         safe_rel_type = relationship_type.replace(":", "_").replace(" ", "_").upper()
 
-        # MATCH existing nodes by ID (regardless of their label) instead of creating new Entity nodes
-        # This fixes the issue where relationships were created between Entity nodes
-        # instead of the actual ConversationSession/Message nodes
-        query = f"""
-        MATCH (source {{id: $source_id}})
-        MATCH (target {{id: $target_id}})
-        MERGE (source)-[r:`{safe_rel_type}`]->(target)
-        SET r += $properties
-        RETURN r
-        """
-
         async with driver.session(database=self.database) as session:
-            result = await session.run(query,
+            # Resolve each endpoint's label so both MERGEs are index-backed; nodes
+            # that don't exist yet are created as Entity nodes (legacy behavior)
+            node_labels = await self._resolve_id_labels(session, [source_id, target_id])
+            if source_id not in node_labels or target_id not in node_labels:
+                logger.warning(f"Nodes not found for relationship {source_id} -> {target_id}, creating Entity nodes")
+
+            source_label = _quote_label(node_labels.get(source_id, IDENTITY_LABEL))
+            target_label = _quote_label(node_labels.get(target_id, IDENTITY_LABEL))
+            query = f"""
+            MERGE (source:{source_label} {{id: $source_id}})
+            MERGE (target:{target_label} {{id: $target_id}})
+            MERGE (source)-[r:`{safe_rel_type}`]->(target)
+            SET r += $properties
+            RETURN r
+            """
+            await session.run(query,
                             source_id=source_id,
                             target_id=target_id,
                             properties=properties)
-            records = [r async for r in result]
 
-            # If no nodes found, fall back to creating Entity nodes (legacy behavior)
-            if not records:
-                logger.warning(f"Nodes not found for relationship {source_id} -> {target_id}, creating Entity nodes")
-                fallback_query = f"""
-                MERGE (source:Entity {{id: $source_id}})
-                MERGE (target:Entity {{id: $target_id}})
-                MERGE (source)-[r:`{safe_rel_type}`]->(target)
-                SET r += $properties
-                RETURN r
+        for node_id in (source_id, target_id):
+            if node_id not in node_labels:
+                self._labels.remember(node_id, IDENTITY_LABEL)
+
+    async def add_entities_bulk(
+        self,
+        entities: List[Dict[str, Any]],
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    ) -> Dict[str, Any]:
+        """Add or update many entities with one UNWIND statement per label set.
+
+        Rows are grouped by their label set (labels cannot be parameterized),
+        split into batches of ``batch_size`` and written inside a single
+        managed write transaction, so a failure leaves nothing half-written.
+
+        Args:
+            entities: Rows with ``id``, ``properties`` and optional ``labels``
+            batch_size: Maximum number of rows per UNWIND statement
+
+        Returns:
+            Write statistics: total ``rows``, ``elapsed_ms`` and one entry per
+            batch in ``batches`` with its label group and write counters.
+        """
+        groups: Dict[tuple, List[Dict[str, Any]]] = defaultdict(list)
+        for row in entities:
+            labels = tuple(row.get("labels") or ())
+            groups[labels].append({"id": row["id"], "properties": row.get("properties", {})})
+
+        statements = []
+        for labels, rows in groups.items():
+            extra_labels = "".join(f":`{_validate_label(label)}`" for label in labels)
+            set_labels = f"SET n{extra_labels}" if extra_labels else ""
+            query = f"""
+            UNWIND $rows AS row
+            MERGE (n:Entity {{id: row.id}})
+            {set_labels}
+            SET n += row.properties
+            {SET_NAME_KEY}
+            """
+            group_name = ":".join((IDENTITY_LABEL,) + labels)
+            for batch in iter_batches(rows, batch_size):
+                statements.append((group_name, query, {"rows": batch}))
+
+        stats = await self._run_bulk_write(statements, total_rows=len(entities))
+        for row in entities:
+            self._labels.remember(row["id"], IDENTITY_LABEL)
+        return stats
+
+    async def add_relationships_bulk(
+        self,
+        relationships: List[Dict[str, Any]],
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    ) -> Dict[str, Any]:
+        """Add many relationships with one UNWIND statement per relationship type.
+
+        Mirrors :meth:`add_relationship`: endpoint labels are resolved up front
+        (in one round trip for uncached IDs) and endpoints that don't exist are
+        created as ``:Entity`` nodes.
+
+        Args:
+            relationships: Rows with ``source_id``, ``type``, ``target_id``
+                and optional ``properties``
+            batch_size: Maximum number of rows per UNWIND statement
+
+        Returns:
+            Write statistics in the same shape as :meth:`add_entities_bulk`.
+        """
+        if not relationships:
+            return await self._run_bulk_write([], total_rows=0)
+
+        driver = await self._get_driver()
+        endpoint_ids = [row[key] for row in relationships for key in ("source_id", "target_id")]
+        async with driver.session(database=self.database) as session:
+            node_labels = await self._resolve_id_labels(session, endpoint_ids)
+
+        missing = {node_id for node_id in endpoint_ids if node_id not in node_labels}
+        if missing:
+            logger.warning(f"{len(missing)} relationship endpoints not found, creating Entity nodes")
+
+        groups: Dict[tuple, List[Dict[str, Any]]] = defaultdict(list)
+        for row in relationships:
+            safe_rel_type = row["type"].replace(":", "_").replace(" ", "_").upper()
+            key = (
+                safe_rel_type,
+                node_labels.get(row["source_id"], IDENTITY_LABEL),
+                node_labels.get(row["target_id"], IDENTITY_LABEL),
+            )
+            groups[key].append({
+                "source_id": row["source_id"],
+                "target_id": row["target_id"],
+                "properties": row.get("properties", {}),
+            })
+
+        statements = []
+        for (rel_type, source_label, target_label), rows in groups.items():
+            _validate_label(rel_type)
+            query = f"""
+            UNWIND $rows AS row
+            MERGE (source:{_quote_label(source_label)} {{id: row.source_id}})
+            MERGE (target:{_quote_label(target_label)} {{id: row.target_id}})
+            MERGE (source)-[r:`{rel_type}`]->(target)
+            SET r += row.properties
+            """
+            for batch in iter_batches(rows, batch_size):
+                statements.append((rel_type, query, {"rows": batch}))
+
+        stats = await self._run_bulk_write(statements, total_rows=len(relationships))
+        for node_id in missing:
+            self._labels.remember(node_id, IDENTITY_LABEL)
+        return stats
+
+    async def _run_bulk_write(self, statements: List[tuple], total_rows: int) -> Dict[str, Any]:
+        """Execute prepared ``(group, query, params)`` UNWIND batches in one write transaction."""
+        driver = await self._get_driver()
+        batches: List[Dict[str, Any]] = []
+
+        async def work(tx):
+            # Managed transactions may be retried, so stats are rebuilt per attempt
+            batches.clear()
+            for group, query, params in statements:
+                started = time.perf_counter()
+                result = await tx.run(query, **params)
+                counters = (await result.consume()).counters
+                batches.append({
+                    "group": group,
+                    "rows": len(params["rows"]),
+                    "nodes_created": counters.nodes_created,
+                    "relationships_created": counters.relationships_created,
+                    "properties_set": counters.properties_set,
+                    "elapsed_ms": (time.perf_counter() - started) * 1000,
+                })
+
+        started = time.perf_counter()
+        if statements:
+            async with driver.session(database=self.database) as session:
+                await session.execute_write(work)
+
+        return {
+            "rows": total_rows,
+            "batches": list(batches),
+            "elapsed_ms": (time.perf_counter() - started) * 1000,
+        }
+
+    # ========================================
+    # Node identity resolution
+    # ========================================
+
+    async def _resolve_id_labels(self, session, node_ids: List[str]) -> Dict[str, str]:
+        """Map node IDs to a label that locates them by ``id``.
+
+        Cached IDs cost nothing; the rest are looked up through the
+        ``Entity.id`` constraint in one round trip. Only IDs still unresolved
+        after that (nodes written without the identity label) fall back to a
+        single label-less scan, and the label found is cached. IDs that scan
+        does not find either are marked missing and skip it next time.
+
+        Returns:
+            ``{node_id: label}`` for every ID that exists in the graph
+        """
+        resolved: Dict[str, str] = {}
+        pending = []
+        for node_id in dict.fromkeys(node_ids):
+            cached = self._labels.get(node_id, "id")
+            if cached:
+                resolved[node_id] = cached[0]
+            else:
+                pending.append(node_id)
+
+        if pending:
+            result = await session.run(
+                """
+                UNWIND $ids AS key
+                MATCH (n:Entity {id: key})
+                RETURN DISTINCT key
+                """,
+                ids=pending,
+            )
+            async for record in result:
+                resolved[record["key"]] = IDENTITY_LABEL
+                self._labels.remember(record["key"], IDENTITY_LABEL)
+            pending = [
+                node_id for node_id in pending
+                if node_id not in resolved and not self._labels.is_missing(node_id, "id")
+            ]
+
+        if pending:
+            result = await session.run(
                 """
-                await session.run(fallback_query,
-                                source_id=source_id,
-                                target_id=target_id,
-                                properties=properties)
+                MATCH (n)
+                WHERE n.id IN $ids
+                RETURN n.id AS key, head(labels(n)) AS label
+                """,
+                ids=pending,
+            )
+            async for record in result:
+                if record["label"] and record["key"] not in resolved:
+                    resolved[record["key"]] = record["label"]
+                    self._labels.remember(record["key"], record["label"])
+            for node_id in pending:
+                if node_id not in resolved:
+                    self._labels.remember_missing(node_id, "id")
+
+        return resolved
+
+    async def _resolve_node(self, session, entity_id: str) -> Optional[tuple]:
+        """Find the ``(label, property)`` that locates a node by id or name.
+
+        Prefers ``Entity.id``, then ``Entity.name`` (both indexed) and only
+        then scans for nodes without the identity label, e.g. DDA ``Table``
+        nodes identified by name. The answer is cached, and so is a miss, so
+        a key found nowhere is not scanned for again until the mark expires.
+        """
+        cached = self._labels.get(entity_id)
+        if cached:
+            return cached
+
+        result = await session.run(
+            """
+            OPTIONAL MATCH (a:Entity {id: $entity_id})
+            WITH a LIMIT 1
+            OPTIONAL MATCH (b:Entity {name: $entity_id})
+            WITH a, b LIMIT 1
+            RETURN a IS NOT NULL AS by_id, b IS NOT NULL AS by_name
+            """,
+            entity_id=entity_id,
+        )
+        record = await result.single()
+        if record and record["by_id"]:
+            location = (IDENTITY_LABEL, "id")
+        elif record and record["by_name"]:
+            location = (IDENTITY_LABEL, "name")
+        elif self._labels.is_missing(entity_id):
+            return None
+        else:
+            result = await session.run(
+                """
+                MATCH (n)
+                WHERE n.id = $entity_id OR n.name = $entity_id
+                RETURN head(labels(n)) AS label, coalesce(n.id = $entity_id, false) AS by_id
+                LIMIT 1
+                """,
+                entity_id=entity_id,
+            )
+            record = await result.single()
+            if not record or not record["label"]:
+                self._labels.remember_missing(entity_id)
+                return None
+            location = (record["label"], "id" if record["by_id"] else "name")
+
+        self._labels.remember(entity_id, *location)
+        return location
+
+    async def _run_on_node(self, session, entity_id: str, var: str, body: str, **params):
+        """Run ``MATCH (<var>:<label> {<prop>: $entity_id}) <body>`` and return the first record.
+
+        The node is located through :meth:`_resolve_node`. A cached location
+        that no longer matches (node deleted or relabelled elsewhere) is
+        dropped and resolved once more.
+        """
+        for _ in range(2):
+            was_cached = self._labels.get(entity_id) is not None
+            location = await self._resolve_node(session, entity_id)
+            if location is None:
+                return None
+
+            label, prop = location
+            query = f"MATCH ({var}:{_quote_label(label)} {{{prop}: $entity_id}})\n{body}"
+            result = await session.run(query, entity_id=entity_id, **params)
+            record = await result.single()
+            if record or not was_cached:
+                return record
+            self._labels.forget(entity_id)
+        return None
 
     async def get_entity(self, entity_id: str) -> Optional[Dict[str, Any]]:
         """Get entity by ID or name.
 
         Searches across all node types, matching by either id or name property.
         This allows finding DDA entities (Table, Column, etc.) which use name as identifier.
+        The lookup goes through the ``Entity`` identity indexes first; see
+        :meth:`_resolve_node`.
 
         Args:
             entity_id: Entity identifier (can be id or name)
@@ -171,17 +508,11 @@ class Neo4jBackend(KnowledgeGraphBackend):
         """
         driver = await self._get_driver()
 
-        # Search by both id and name to support different entity types
-        query = """
-        MATCH (n)
-        WHERE n.id = $entity_id OR n.name = $entity_id
-        RETURN n, labels(n) as labels
-        LIMIT 1
-        """
-
         async with driver.session(database=self.database) as session:
-            result = await session.run(query, entity_id=entity_id)
-            record = await result.single()
+            record = await self._run_on_node(
+                session, entity_id, "n",
+                "RETURN n, labels(n) as labels\nLIMIT 1",
+            )
 
             if record:
                 node = record["n"]
@@ -211,22 +542,13 @@ class Neo4jBackend(KnowledgeGraphBackend):
         """
         driver = await self._get_driver()
 
-        # Build SET clause dynamically for the properties
         # Use parameter binding for safety
-        query = """
-        MATCH (n)
-        WHERE n.id = $entity_id OR n.name = $entity_id
-        SET n += $properties
-        RETURN n
-        """
-
         async with driver.session(database=self.database) as session:
-            result = await session.run(
-                query,
-                entity_id=entity_id,
-                properties=properties
+            record = await self._run_on_node(
+                session, entity_id, "n",
+                f"SET n += $properties\n{SET_NAME_KEY}\nRETURN n",
+                properties=properties,
             )
-            record = await result.single()
 
             if record:
                 logger.debug(f"Updated entity {entity_id} with properties: {list(properties.keys())}")
@@ -417,8 +739,9 @@ class Neo4jBackend(KnowledgeGraphBackend):
         async with driver.session(database=self.database) as session:
             result = await session.run(query, entity_id=entity_id)
             record = await result.single()
-            
-            return record["deleted"] > 0 if record else False
+
+        self._labels.forget(entity_id)
+        return record["deleted"] > 0 if record else False
 
     async def delete_relationship(
         self, 
@@ -436,8 +759,6 @@ class Neo4jBackend(KnowledgeGraphBackend):
         Returns:
             True if deleted, False if not found
         """
-        from infrastructure.cypher_utils import validate_cypher_identifier
-
         validate_cypher_identifier(relationship_type, "relationship_type")
         driver = await self._get_driver()
 
@@ -576,11 +897,12 @@ class Neo4jBackend(KnowledgeGraphBackend):
         if create_version:
             # Create new versioned entity
             new_entity_id = f"{entity_id}_v{target_idx + 1}"
-            # Match by id or name to support all entity types (Entity, Table, Column, etc.)
+            # Source is matched by id or name to support all entity types (Entity, Table, Column, etc.).
+            # MERGE, since a repeated promotion to the same layer targets the same
+            # versioned ID and CREATE would violate the Entity.id uniqueness constraint.
+            var = "source"
             query = """
-            MATCH (source)
-            WHERE source.id = $entity_id OR source.name = $entity_id
-            CREATE (target:Entity {id: $new_entity_id})
+            MERGE (target:Entity {id: $new_entity_id})
             SET target = source,
                 target.id = $new_entity_id,
                 target.layer = $target_layer,
@@ -589,20 +911,18 @@ class Neo4jBackend(KnowledgeGraphBackend):
                 target.promotion_timestamp = datetime(),
                 target.status = 'active'
             SET target += $promotion_properties
-            CREATE (source)-[:PROMOTED_TO {
-                transition_id: $transition_id,
-                promoted_at: datetime(),
-                from_layer: $current_layer,
-                to_layer: $target_layer
-            }]->(target)
+            MERGE (source)-[promoted:PROMOTED_TO]->(target)
+            SET promoted.transition_id = $transition_id,
+                promoted.promoted_at = datetime(),
+                promoted.from_layer = $current_layer,
+                promoted.to_layer = $target_layer
             RETURN target, source
             """
         else:
             # Modify in place - search by id or name to support all entity types
             new_entity_id = entity_id
+            var = "n"
             query = """
-            MATCH (n)
-            WHERE n.id = $entity_id OR n.name = $entity_id
             SET n.layer = $target_layer,
                 n.layer_assigned_at = datetime(),
                 n.previous_layer = $current_layer,
@@ -613,21 +933,23 @@ class Neo4jBackend(KnowledgeGraphBackend):
             """
 
         async with driver.session(database=self.database) as session:
-            result = await session.run(
+            record = await self._run_on_node(
+                session,
+                entity_id,
+                var,
                 query,
-                entity_id=entity_id,
                 new_entity_id=new_entity_id,
                 target_layer=target_layer.value,
                 current_layer=current_layer,
                 promotion_properties=promotion_properties,
                 transition_id=transition_id
             )
-            record = await result.single()
 
             if not record:
                 raise ValueError(f"Failed to promote entity {entity_id}")
 
             target_node = record["target"]
+            self._labels.remember(new_entity_id, IDENTITY_LABEL)
 
             # Create transition audit record
             audit_query = """
@@ -763,6 +1085,150 @@ class Neo4jBackend(KnowledgeGraphBackend):
             records = await result.data()
             return records
 
+    async def iter_promotion_candidates(
+        self,
+        from_layer: str,
+        confidence_threshold: float = 0.85,
+        page_size: int = 1000,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream every promotion candidate of a layer in keyset-paginated pages.
+
+        Unlike :meth:`get_promotion_candidates` there is no overall limit.
+        Each page is one short read ordered by ID that resumes after the last
+        ID of the previous page. ``:Entity`` nodes come first and page through
+        the ``Entity.id`` index, so no page rescans what came before it. Nodes
+        without the identity label (e.g. DDA tables) follow, keyed by
+        ``coalesce(n.id, n.name)``; with no index on that key each of their
+        pages is a label-less scan, but no page holds more than
+        ``page_size`` rows in memory.
+
+        Args:
+            from_layer: Layer to scan (PERCEPTION or SEMANTIC)
+            confidence_threshold: Minimum confidence for promotion
+            page_size: Candidates per page
+
+        Yields:
+            Lists of candidates with ``id``, ``name``, ``layer``, ``labels``,
+            ``confidence``, ``validation_count`` and ``ontology_codes``
+        """
+        criteria = PROMOTION_CRITERIA.get(from_layer)
+        if criteria is None:
+            return
+
+        driver = await self._get_driver()
+        fields = """
+                   n.name AS name,
+                   n.layer AS layer,
+                   labels(n) AS labels,
+                   coalesce(n.confidence, 0) AS confidence,
+                   coalesce(n.validation_count, 0) AS validation_count,
+                   n.ontology_codes AS ontology_codes
+        """
+        queries = [
+            f"""
+            MATCH (n:{IDENTITY_LABEL}) WHERE n.id > $after AND {criteria}
+            RETURN n.id AS id, {fields}
+            ORDER BY id
+            LIMIT $page_size
+            """,
+            f"""
+            MATCH (n) WHERE NOT n:{IDENTITY_LABEL} AND {criteria}
+            WITH n, coalesce(n.id, n.name) AS id
+            WHERE id > $after
+            RETURN id, {fields}
+            ORDER BY id
+            LIMIT $page_size
+            """,
+        ]
+        for query in queries:
+            after = ""
+            while True:
+                async with driver.session(database=self.database) as session:
+                    result = await session.run(
+                        query, after=after, threshold=confidence_threshold, page_size=page_size
+                    )
+                    page = await result.data()
+                if not page:
+                    break
+                yield page
+                if len(page) < page_size:
+                    break
+                after = page[-1]["id"]
+
+    async def promote_entities_bulk(
+        self,
+        promotions: List[Dict[str, Any]],
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+        trigger_type: str = "batch",
+    ) -> Dict[str, Any]:
+        """Promote many entities in place with UNWIND batches.
+
+        Each batch updates its nodes and creates their ``LayerTransition``
+        audit records in one write transaction, so a failed batch leaves
+        nothing half-promoted and earlier batches stay committed. Node labels
+        are resolved up front in one round trip, as in
+        :meth:`add_relationships_bulk`.
+
+        Args:
+            promotions: Rows with ``entity_id``, ``from_layer``, ``to_layer``
+                and optional ``properties`` to set on the node
+            batch_size: Maximum number of rows per UNWIND statement
+            trigger_type: Recorded on the audit records
+
+        Returns:
+            ``promoted`` IDs with their audit records in ``transition_ids``,
+            ``skipped`` IDs (not found by ``id``; use
+            :meth:`promote_entity`, which also matches by name), ``failed``
+            IDs of batches whose transaction failed, ``batches`` and
+            ``elapsed_ms``. IDs in none of these were no longer at their
+            ``from_layer``.
+        """
+        started = time.perf_counter()
+        result: Dict[str, Any] = {"promoted": [], "transition_ids": {}, "skipped": [], "failed": [], "batches": 0}
+        if not promotions:
+            result["elapsed_ms"] = 0.0
+            return result
+
+        driver = await self._get_driver()
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        async def work(tx, query, rows):
+            records = await (await tx.run(query, rows=rows, trigger_type=trigger_type)).data()
+            return {record["entity_id"]: record["transition_id"] for record in records}
+
+        async with driver.session(database=self.database) as session:
+            node_labels = await self._resolve_id_labels(session, [p["entity_id"] for p in promotions])
+
+            groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+            for promotion in promotions:
+                entity_id = promotion["entity_id"]
+                label = node_labels.get(entity_id)
+                if label is None:
+                    result["skipped"].append(entity_id)
+                    continue
+                groups[label].append({
+                    "entity_id": entity_id,
+                    "from_layer": promotion["from_layer"],
+                    "to_layer": promotion["to_layer"],
+                    "properties": promotion.get("properties") or {},
+                    "transition_id": f"transition_{entity_id}_{stamp}",
+                })
+
+            for label, rows in groups.items():
+                query = PROMOTE_BATCH_QUERY.format(label=_quote_label(label))
+                for batch in iter_batches(rows, batch_size):
+                    result["batches"] += 1
+                    try:
+                        transitions = await session.execute_write(work, query, batch)
+                        result["promoted"].extend(transitions)
+                        result["transition_ids"].update(transitions)
+                    except Exception as e:
+                        logger.error(f"Failed to promote batch of {len(batch)} {label} nodes: {e}")
+                        result["failed"].extend(row["entity_id"] for row in batch)
+
+        result["elapsed_ms"] = (time.perf_counter() - started) * 1000
+        return result
+
     async def list_entities_by_layer(
         self,
         layer: KnowledgeLayer,
@@ -864,12 +1330,16 @@ class Neo4jBackend(KnowledgeGraphBackend):
     async def create_layer_indexes(self) -> List[str]:
         """Create required indexes for layer-based queries.
 
+        Also creates the node identity constraint and indexes (``Entity.id``
+        uniqueness, ``Entity.name``) that back id/name lookups, and the
+        ``name_lc``/full-text indexes that back case-insensitive name search.
+
         Returns:
             List of created/verified index names
         """
         driver = await self._get_driver()
 
-        indexes = [
+        indexes = IDENTITY_SCHEMA + NAME_SEARCH_SCHEMA + [
             ("idx_entity_layer", "CREATE INDEX idx_entity_layer IF NOT EXISTS FOR (n:Entity) ON (n.layer)"),
             ("idx_entity_confidence", "CREATE INDEX idx_entity_confidence IF NOT EXISTS FOR (n:Entity) ON (n.confidence)"),
             ("idx_entity_status", "CREATE INDEX idx_entity_status IF NOT EXISTS FOR (n:Entity) ON (n.status)"),
@@ -884,8 +1354,9 @@ class Neo4jBackend(KnowledgeGraphBackend):
                     created.append(name)
                     logger.info(f"Created/verified index: {name}")
                 except Exception as e:
-                    if "already exists" not in str(e).lower():
-                        logger.warning(f"Failed to create index {name}: {e}")
+                    # IF NOT EXISTS makes reruns a no-op, so every error is real,
+                    # e.g. duplicate IDs blocking the Entity.id uniqueness constraint
+                    logger.error(f"Failed to create index {name}: {e}")
 
         return created
 
@@ -0,0 +1,182 @@
+"""Node identity helpers for index-backed Neo4j lookups.
+
+Every node written through :class:`~infrastructure.neo4j_backend.Neo4jBackend`
+carries the shared ``:Entity`` identity label, and ``Entity.id`` is backed by a
+uniqueness constraint.  Lookups that used to match ``(n {id: $id})`` without a
+label (an all-nodes scan) instead hit that constraint's index.
+
+Some nodes are written by raw Cypher elsewhere (e.g. ``:Table``/``:Column`` from
+the DDA pipeline or ``:Message`` from chat history) and have no ``:Entity``
+label.  For those the backend falls back to a label-less lookup once and
+remembers the label it found in a :class:`NodeLabelResolver`, so repeated
+lookups stay label-scoped.
+
+Name lookups that need to be case-insensitive use the ``name_lc`` property
+(``toLower(trim(name))``), which the backend maintains on every write, so
+they can hit a range index instead of applying ``toLower`` to every node.
+Word-prefix search over medical entities goes through a full-text index.
+"""
+
+import re
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+# Label shared by every node written through the backend
+IDENTITY_LABEL = "Entity"
+
+# Constraints and indexes that back identity lookups: (name, statement)
+IDENTITY_SCHEMA: List[Tuple[str, str]] = [
+    (
+        "entity_id_unique",
+        "CREATE CONSTRAINT entity_id_unique IF NOT EXISTS FOR (n:Entity) REQUIRE n.id IS UNIQUE",
+    ),
+    ("idx_entity_name", "CREATE INDEX idx_entity_name IF NOT EXISTS FOR (n:Entity) ON (n.name)"),
+    ("idx_table_name", "CREATE INDEX idx_table_name IF NOT EXISTS FOR (n:Table) ON (n.name)"),
+    ("idx_column_name", "CREATE INDEX idx_column_name IF NOT EXISTS FOR (n:Column) ON (n.name)"),
+    ("idx_message_id", "CREATE INDEX idx_message_id IF NOT EXISTS FOR (n:Message) ON (n.id)"),
+]
+
+# Normalized, case-insensitive name property maintained on write
+NAME_KEY_PROPERTY = "name_lc"
+
+# Cypher fragment that refreshes ``name_lc`` on node ``n`` after its properties change
+SET_NAME_KEY = f"SET n.{NAME_KEY_PROPERTY} = toLower(trim(n.name))"
+
+# Full-text index used for word-prefix search over medical entities
+MEDICAL_ENTITY_SEARCH_INDEX = "medical_entity_search"
+
+# Indexes that back case-insensitive name lookups and search: (name, statement)
+NAME_SEARCH_SCHEMA: List[Tuple[str, str]] = [
+    (
+        "idx_entity_name_lc",
+        f"CREATE INDEX idx_entity_name_lc IF NOT EXISTS FOR (n:Entity) ON (n.{NAME_KEY_PROPERTY})",
+    ),
+    (
+        "idx_medical_entity_name_lc",
+        "CREATE INDEX idx_medical_entity_name_lc IF NOT EXISTS "
+        f"FOR (n:MedicalEntity) ON (n.{NAME_KEY_PROPERTY})",
+    ),
+    (
+        MEDICAL_ENTITY_SEARCH_INDEX,
+        f"CREATE FULLTEXT INDEX {MEDICAL_ENTITY_SEARCH_INDEX} IF NOT EXISTS "
+        "FOR (n:MedicalEntity) ON EACH [n.name, n.description] "
+        "OPTIONS {indexConfig: {`fulltext.analyzer`: 'standard-no-stop-words'}}",
+    ),
+]
+
+
+def name_key(name: str) -> str:
+    """Return the ``name_lc`` value for ``name`` (mirrors ``toLower(trim(name))``)."""
+    return name.strip().lower()
+
+
+def fulltext_prefix_query(term: str, field: Optional[str] = None) -> str:
+    """Build a Lucene query matching every word of ``term`` as a word prefix.
+
+    Stands in for ``toLower(x) CONTAINS toLower($term)`` on a full-text index:
+    each word becomes a ``word*`` prefix query and all words are required.
+    Prefix queries walk only the matching slice of the term dictionary, while
+    a leading wildcard (``*word*``) would visit every term in the index.
+
+    Results differ from ``CONTAINS`` where:
+
+    - a word must start a word of the property: ``diab`` finds "Diabetes"
+      but ``betes`` does not
+    - the words may appear in any order and need not be adjacent:
+      ``diabetes type`` finds "Type 2 Diabetes"
+    - punctuation only separates words: ``type-2`` matches "Type 2"
+
+    Args:
+        term: Free-text search term
+        field: Restrict matching to one indexed property (e.g. ``"name"``)
+
+    Returns:
+        Lucene query string, or an empty string if ``term`` has no words
+    """
+    words = re.findall(r"\w+", term.lower())
+    if not words:
+        return ""
+    clause = " AND ".join(f"{word}*" for word in words)
+    return f"{field}:({clause})" if field else clause
+
+
+class NodeLabelResolver:
+    """Bounded LRU cache mapping a node key to the label and property that find it.
+
+    A key is whatever callers pass as an entity identifier (an ``id`` or, for
+    DDA nodes, a ``name``).  The cached value is ``(label, property)`` so the
+    caller can build ``MATCH (n:`label` {property: $key})``.
+
+    Keys a lookup found nowhere are remembered as missing for ``miss_ttl``
+    seconds, so retrying them does not repeat the label-less scan.  Writes
+    through the backend call :meth:`remember`, which clears the mark.
+    """
+
+    def __init__(self, max_size: int = 100_000, miss_ttl: float = 300.0):
+        """Initialize the resolver.
+
+        Args:
+            max_size: Maximum number of keys to remember before evicting the
+                least recently used one
+            miss_ttl: Seconds a key stays marked as missing
+        """
+        self.max_size = max_size
+        self.miss_ttl = miss_ttl
+        self._entries: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+        self._missing: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+
+    def get(self, key: str, prop: Optional[str] = None) -> Optional[Tuple[str, str]]:
+        """Return the cached ``(label, property)`` for ``key``.
+
+        Args:
+            key: Node identifier
+            prop: If given, only return an entry resolved through this property
+
+        Returns:
+            Cached ``(label, property)`` or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None or (prop is not None and entry[1] != prop):
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def remember(self, key: str, label: str, prop: str = "id") -> None:
+        """Cache the label and property that locate ``key``."""
+        self._missing.pop(key, None)
+        self._entries[key] = (label, prop)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def remember_missing(self, key: str, prop: Optional[str] = None) -> None:
+        """Mark ``key`` as matching no node (through ``prop`` only, if given)."""
+        self._missing[key] = (prop, time.monotonic() + self.miss_ttl)
+        self._missing.move_to_end(key)
+        while len(self._missing) > self.max_size:
+            self._missing.popitem(last=False)
+
+    def is_missing(self, key: str, prop: Optional[str] = None) -> bool:
+        """Whether ``key`` was recently found nowhere (or nowhere through ``prop``)."""
+        entry = self._missing.get(key)
+        if entry is None:
+            return False
+        missing_prop, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._missing[key]
+            return False
+        return missing_prop is None or missing_prop == prop
+
+    def forget(self, key: str) -> None:
+        """Drop ``key`` from the cache (e.g. after the node was deleted)."""
+        self._entries.pop(key, None)
+        self._missing.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+        self._missing.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
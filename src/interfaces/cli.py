@@ -135,6 +135,7 @@ def ingest_doc(
     
     async def run_ingestion():
         from application.services.document_service import DocumentService
+        from application.services.dual_write_outbox import get_dual_write_outbox
         
         # Initialize knowledge management components
         kg_backend, _ = await bootstrap_knowledge_management()
@@ -151,6 +152,8 @@ def ingest_doc(
             kg_backend=kg_backend,
             chunk_size=chunk_size,
             db_session_factory=cli_db_session_factory,
+            # Queued for the API's outbox relay, which owns PostgreSQL delivery
+            outbox=get_dual_write_outbox(),
         )
         
         # Ingest the document
@@ -0,0 +1,133 @@
+"""Unit tests for streamed, batched layer promotion."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from application.jobs.promotion_scanner import PromotionScannerJob
+from application.services.automatic_layer_transition import AutomaticLayerTransitionService
+
+
+class FakeBulkBackend:
+    """Graph with paginated candidate scans and bulk promotion."""
+
+    def __init__(self, candidates, unmatched=()):
+        self.candidates = candidates
+        self.unmatched = set(unmatched)
+        self.bulk_calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.promote_entity = AsyncMock()
+        self.get_entity = AsyncMock(return_value=None)
+
+    async def iter_promotion_candidates(self, from_layer, confidence_threshold=0.85, page_size=1000):
+        rows = [c for c in self.candidates if c["layer"] == from_layer]
+        for start in range(0, len(rows), page_size):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            yield rows[start:start + page_size]
+
+    async def promote_entities_bulk(self, promotions, batch_size=1000, trigger_type="batch"):
+        self.bulk_calls.append(promotions)
+        promoted = [p["entity_id"] for p in promotions if p["entity_id"] not in self.unmatched]
+        return {
+            "promoted": promoted,
+            "transition_ids": {entity_id: f"transition_{entity_id}" for entity_id in promoted},
+            "skipped": [p["entity_id"] for p in promotions if p["entity_id"] in self.unmatched],
+            "failed": [],
+            "batches": 1,
+        }
+
+
+def _candidates(layer, count):
+    prefix = layer[0].lower()
+    return [
+        {"id": f"{prefix}{i}", "name": f"Entity {i}", "layer": layer, "confidence": 0.95, "labels": ["Entity"]}
+        for i in range(count)
+    ]
+
+
+def _service(backend):
+    return AutomaticLayerTransitionService(backend=backend, event_bus=AsyncMock())
+
+
+class TestBatchPromotion:
+
+    async def test_pages_are_promoted_in_bulk(self):
+        backend = FakeBulkBackend(_candidates("PERCEPTION", 5))
+        service = _service(backend)
+
+        promoted = 0
+        async for page in service.iter_promotion_candidates("PERCEPTION", page_size=2):
+            promoted += await service.promote_candidates(page, "PERCEPTION")
+
+        assert promoted == 5
+        assert [len(call) for call in backend.bulk_calls] == [2, 2, 1]
+        row = backend.bulk_calls[0][0]
+        assert (row["from_layer"], row["to_layer"]) == ("PERCEPTION", "SEMANTIC")
+        assert row["properties"]["domain"] == "medical"
+        assert "layer" not in row["properties"]
+        backend.promote_entity.assert_not_awaited()
+        assert service.stats["by_layer"]["PERCEPTION_TO_SEMANTIC"] == 5
+        assert service.stats["promotions_attempted"] == 5
+        event = service.event_bus.publish.await_args.args[0]
+        assert event.action == "layer_transition_completed"
+        assert event.data["transition_id"] == "transition_p4"
+
+    async def test_bulk_promotions_are_recorded_as_transitions(self):
+        backend = FakeBulkBackend(_candidates("PERCEPTION", 3))
+        service = _service(backend)
+
+        await service.promote_candidates(_candidates("PERCEPTION", 3), "PERCEPTION")
+
+        history = service._transition_service.transition_history
+        assert [record.transition_id for record in history] == ["transition_p0", "transition_p1", "transition_p2"]
+        assert {record.status.value for record in history} == {"completed"}
+        assert history[0].requested_by == "auto_promotion_service"
+        assert service._transition_service.get_layer_statistics()["completed"] == 3
+
+    async def test_unmatched_ids_fall_back_to_single_promotion(self):
+        backend = FakeBulkBackend(_candidates("PERCEPTION", 3), unmatched={"p1"})
+        service = _service(backend)
+        service._promote_entity = AsyncMock(return_value=None)
+
+        await service.promote_candidates(_candidates("PERCEPTION", 3), "PERCEPTION")
+
+        service._promote_entity.assert_awaited_once()
+        assert service._promote_entity.await_args.kwargs["entity_id"] == "p1"
+        assert service.stats["promotions_completed"] == 2
+
+    async def test_already_promoted_candidates_are_skipped(self):
+        backend = FakeBulkBackend([])
+        service = _service(backend)
+        page = _candidates("PERCEPTION", 2)
+        page[0]["layer"] = "SEMANTIC"
+
+        assert await service.promote_candidates(page, "PERCEPTION") == 1
+        assert [row["entity_id"] for row in backend.bulk_calls[0]] == ["p1"]
+
+
+class TestConcurrentScan:
+
+    async def test_layers_are_scanned_concurrently(self):
+        backend = FakeBulkBackend(_candidates("PERCEPTION", 3) + _candidates("SEMANTIC", 2))
+        scanner = PromotionScannerJob(transition_service=_service(backend))
+
+        results = await scanner.run_once()
+
+        assert results["perception_candidates"] == 3
+        assert results["semantic_candidates"] == 2
+        assert results["promotions"] == 5
+        assert backend.max_in_flight == 2
+
+    async def test_run_promotion_scan_streams_every_layer(self):
+        backend = FakeBulkBackend(_candidates("PERCEPTION", 3) + _candidates("SEMANTIC", 2))
+
+        results = await _service(backend).run_promotion_scan()
+
+        assert results["scanned_layers"] == ["PERCEPTION", "SEMANTIC"]
+        assert results["candidates_found"] == 5
+        assert results["promotions_executed"] == 5
+        semantic_rows = [row for call in backend.bulk_calls for row in call if row["from_layer"] == "SEMANTIC"]
+        assert {row["to_layer"] for row in semantic_rows} == {"REASONING"}
@@ -0,0 +1,130 @@
+"""Tests for the async cross-graph query builder.
+
+Covers:
+- Driver sharing (explicit driver or a backend's lazily created driver)
+- Query execution on the async driver
+- Parity of Cypher templates between the sync and async builders
+- Index-friendly case-insensitive matching (name_lc, full-text search)
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from application.services.cross_graph_query_builder import (
+    AsyncCrossGraphQueryBuilder,
+    CrossGraphQueryBuilder,
+)
+
+
+def _make_driver(records):
+    """Build a mock AsyncDriver whose sessions return ``records``."""
+    async def mock_aiter(self_iter):
+        for r in records:
+            yield r
+
+    mock_result = MagicMock()
+    mock_result.__aiter__ = mock_aiter
+
+    mock_session = AsyncMock()
+    mock_session.run.return_value = mock_result
+    mock_ctx = AsyncMock()
+    mock_ctx.__aenter__.return_value = mock_session
+    mock_ctx.__aexit__.return_value = False
+
+    driver = MagicMock()
+    driver.session = MagicMock(return_value=mock_ctx)
+    return driver, mock_session
+
+
+class TestAsyncCrossGraphQueryBuilder:
+    """Test query execution on a shared async driver."""
+
+    def test_requires_driver_or_backend(self):
+        with pytest.raises(ValueError):
+            AsyncCrossGraphQueryBuilder()
+
+    @pytest.mark.asyncio
+    async def test_uses_backend_driver_and_database(self):
+        driver, _ = _make_driver([{"name": "Diabetes"}])
+        backend = MagicMock()
+        backend.database = "medical"
+        backend._get_driver = AsyncMock(return_value=driver)
+        builder = AsyncCrossGraphQueryBuilder(backend=backend)
+
+        await builder.search_medical_entities("diab")
+        await builder.search_medical_entities("asth")
+
+        backend._get_driver.assert_awaited_once()
+        driver.session.assert_called_with(database="medical")
+
+    @pytest.mark.asyncio
+    async def test_search_returns_records_and_parameters(self):
+        driver, session = _make_driver([{"name": "Diabetes", "type": "Disease"}])
+        builder = AsyncCrossGraphQueryBuilder(driver=driver)
+
+        result = await builder.search_medical_entities("diab", entity_types=["Disease"])
+
+        assert result.records == [{"name": "Diabetes", "type": "Disease"}]
+        assert result.record_count == 1
+        assert result.parameters == {
+            "search_term": "diab",
+            "search_query": "diab*",
+            "entity_types": ["Disease"],
+        }
+        query, params = session.run.call_args.args
+        assert "m.type IN $entity_types" in query
+        assert params == result.parameters
+
+    @pytest.mark.asyncio
+    async def test_custom_query_defaults_to_empty_parameters(self):
+        driver, session = _make_driver([])
+        builder = AsyncCrossGraphQueryBuilder(driver=driver)
+
+        result = await builder.execute_custom_query("RETURN 1")
+
+        assert result.parameters == {}
+        assert session.run.call_args.args == ("RETURN 1", {})
+
+
+class TestQueryTemplateParity:
+    """Sync and async builders run identical Cypher."""
+
+    def test_sync_builder_uses_shared_templates(self):
+        with patch("application.services.cross_graph_query_builder.GraphDatabase"):
+            sync_builder = CrossGraphQueryBuilder(neo4j_uri="bolt://test")
+        async_builder = AsyncCrossGraphQueryBuilder(driver=MagicMock())
+
+        assert (
+            sync_builder._find_related_entities_query("Diabetes", ["TREATS"], 5)
+            == async_builder._find_related_entities_query("Diabetes", ["TREATS"], 5)
+        )
+
+
+class TestIndexFriendlyMatching:
+    """Case-insensitive lookups avoid wrapping indexed properties in functions."""
+
+    @pytest.fixture
+    def builder(self):
+        return AsyncCrossGraphQueryBuilder(driver=MagicMock())
+
+    def test_disease_lookup_uses_name_lc(self, builder):
+        query, params = builder._find_tables_for_disease_query("  Type 2 Diabetes")
+        assert "disease.name_lc = $disease_name_lc" in query
+        assert "toLower(disease.name)" not in query
+        assert params["disease_name_lc"] == "type 2 diabetes"
+
+    def test_search_uses_fulltext_index(self, builder):
+        query, params = builder._search_medical_entities_query("diab")
+        assert "db.index.fulltext.queryNodes('medical_entity_search', $search_query)" in query
+        assert "toLower" not in query
+        assert params["search_query"] == "diab*"
+
+    def test_column_lookup_searches_name_field_only(self, builder):
+        query, params = builder._find_columns_for_medical_concept_query("Asthma")
+        assert "YIELD node AS concept" in query
+        assert params["search_query"] == "name:(asthma*)"
+
+    def test_empty_search_term_matches_all_entities(self, builder):
+        query, params = builder._search_medical_entities_query("  ")
+        assert "MATCH (m:MedicalEntity)" in query
+        assert "search_query" not in params
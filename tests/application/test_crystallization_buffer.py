@@ -0,0 +1,188 @@
+"""Unit tests for the durable crystallization buffer and batched crystallization."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from application.services.crystallization_buffer import SEQ_KEY, CrystallizationBuffer
+from application.services.crystallization_service import (
+    CrystallizationConfig,
+    CrystallizationMode,
+    CrystallizationService,
+)
+from application.services.entity_resolver import EntityResolver
+from domain.event import KnowledgeEvent
+from domain.roles import Role
+
+
+class FakeGraph:
+    """Entity nodes keyed by ID, answering the crystallization queries."""
+
+    def __init__(self):
+        self.nodes = {}
+        self.exact_lookups = 0
+        self.down = False
+
+    def _check(self):
+        if self.down:
+            raise ConnectionError("Neo4j unavailable")
+
+    async def add_entity(self, entity_id, properties, labels=None):
+        self._check()
+        self.nodes[entity_id] = dict(properties)
+
+    async def query_raw(self, query, params=None):
+        self._check()
+        params = params or {}
+        if "UNWIND $names" in query:
+            self.exact_lookups += 1
+            rows = []
+            for name in params["names"]:
+                for node in self.nodes.values():
+                    if node["name"].strip().lower() == name and node["entity_type"] == params["entity_type"]:
+                        rows.append({"normalized_name": name, "id": node["id"], "name": node["name"],
+                                     "properties": node, "labels": ["Entity"]})
+                        break
+            return rows
+        if "SET n += $updates" in query:
+            self.nodes[params["entity_id"]].update(params["updates"])
+            return []
+        if params.get("entity_id") in self.nodes:
+            return [{"properties": self.nodes[params["entity_id"]]}]
+        return []
+
+
+@pytest.fixture
+def buffer(tmp_path):
+    buffer = CrystallizationBuffer(str(tmp_path / "buffer.sqlite3"))
+    yield buffer
+    buffer.close()
+
+
+def _service(graph, buffer=None, batch_threshold=1000):
+    return CrystallizationService(
+        neo4j_backend=graph,
+        entity_resolver=EntityResolver(backend=graph),
+        event_bus=AsyncMock(),
+        config=CrystallizationConfig(mode=CrystallizationMode.HYBRID, batch_threshold=batch_threshold),
+        buffer=buffer,
+    )
+
+
+def _episode(*names):
+    return KnowledgeEvent(
+        action="episode_added",
+        data={"episode_id": "ep1", "patient_id": "patient:1", "entities_extracted": list(names)},
+        role=Role.KNOWLEDGE_MANAGER,
+    )
+
+
+class TestCrystallizationBuffer:
+
+    def test_unacknowledged_mentions_survive_reopening(self, tmp_path):
+        path = str(tmp_path / "buffer.sqlite3")
+        buffer = CrystallizationBuffer(path)
+        stored = buffer.append([{"name": "Metformin"}, {"name": "Diabetes"}, {"name": "Aspirin"}])
+        assert buffer.ack(stored[:1]) == 1
+        buffer.close()
+
+        reopened = CrystallizationBuffer(path)
+
+        assert [m["name"] for m in reopened.pending()] == ["Diabetes", "Aspirin"]
+        assert all(SEQ_KEY in m for m in reopened.pending())
+        reopened.close()
+
+
+class TestDurableCrystallization:
+
+    async def test_buffered_mentions_are_replayed_after_a_crash(self, buffer):
+        graph = FakeGraph()
+        crashed = _service(graph, buffer)
+        await crashed._handle_episode_added(_episode("Metformin", "Diabetes"))
+        assert len(buffer) == 2 and not graph.nodes
+
+        restarted = _service(graph, buffer)
+        await restarted.start()
+        await restarted._replay_task
+        await restarted.stop()
+
+        assert sorted(node["name"] for node in graph.nodes.values()) == ["Diabetes", "Metformin"]
+        assert len(buffer) == 0
+        assert restarted.is_quiescent()
+
+    async def test_mentions_stay_buffered_while_the_graph_is_down(self, buffer):
+        graph = FakeGraph()
+        graph.down = True
+        service = _service(graph, buffer)
+        await service._handle_episode_added(_episode("Metformin", "Diabetes"))
+
+        result = await service._process_pending_batch()
+
+        assert result.entities_created == 0 and result.errors
+        assert len(buffer) == 2
+        assert [m["name"] for m in service._pending_entities] == ["Metformin", "Diabetes"]
+
+        graph.down = False
+        await service._process_pending_batch()
+
+        assert sorted(node["name"] for node in graph.nodes.values()) == ["Diabetes", "Metformin"]
+        assert len(buffer) == 0
+
+    async def test_event_driven_mentions_are_kept_when_creation_fails(self, buffer):
+        graph = FakeGraph()
+        graph.down = True
+        service = _service(graph, buffer)
+        service.config.mode = CrystallizationMode.EVENT_DRIVEN
+
+        await service._handle_episode_added(_episode("Metformin"))
+
+        assert len(buffer) == 1
+        assert not service.is_quiescent()
+
+    async def test_event_driven_retries_unresolved_mentions_on_the_next_event(self, buffer):
+        graph = FakeGraph()
+        graph.down = True
+        service = _service(graph, buffer)
+        service.config.mode = CrystallizationMode.EVENT_DRIVEN
+        await service._handle_episode_added(_episode("Metformin"))
+
+        graph.down = False
+        await service._handle_episode_added(_episode("Diabetes"))
+
+        assert sorted(node["name"] for node in graph.nodes.values()) == ["Diabetes", "Metformin"]
+        assert len(buffer) == 0
+        assert service.is_quiescent()
+
+
+class TestDeduplicatedCrystallization:
+
+    async def test_repeated_mentions_resolve_once_per_type(self):
+        graph = FakeGraph()
+        service = _service(graph)
+        mentions = [
+            {"name": f"  Drug {i % 20}", "entity_type": "Medication", "confidence": 0.7 + (i % 3) / 10}
+            for i in range(600)
+        ] + [{"name": f"SYMPTOM {i % 5}", "entity_type": "Symptom"} for i in range(400)]
+
+        result = await service.crystallize_entities(mentions, source="test")
+
+        assert graph.exact_lookups == 2
+        assert result.entities_processed == 1000
+        assert result.entities_created == 25
+        assert result.entities_deduplicated == 975
+        drug = next(node for node in graph.nodes.values() if node["name"] == "  Drug 0")
+        assert drug["observation_count"] == 30
+        assert drug["confidence"] == pytest.approx(0.9)
+
+    async def test_known_entities_are_merged_with_their_mention_count(self):
+        graph = FakeGraph()
+        service = _service(graph)
+        await service.crystallize_entities([{"name": "Metformin", "entity_type": "Medication"}])
+        existing_id = next(iter(graph.nodes))
+
+        result = await service.crystallize_entities(
+            [{"name": "metformin", "entity_type": "Medication"}] * 3, source="test"
+        )
+
+        assert (result.entities_created, result.entities_merged) == (0, 1)
+        assert graph.nodes[existing_id]["observation_count"] == 4
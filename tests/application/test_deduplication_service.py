@@ -1,9 +1,10 @@
 """Tests for DeduplicationService.
 
 Covers:
-- Duplicate detection (case-insensitive, same-type, exclude merged/structural)
+- Duplicate detection (case-insensitive, same-type, exclude merged/structural,
+  streamed key grouping, incremental mode)
 - Merge plan creation (winner selection by relationships, confidence)
-- Merge execution (relationship transfer, audit trail)
+- Merge execution (batched transactions, chain resolution, resumption)
 """
 
 import pytest
@@ -11,6 +12,7 @@ from unittest.mock import AsyncMock, MagicMock
 from application.services.deduplication_service import (
     DeduplicationService,
     DuplicatePair,
+    MergePlan,
 )
 
 
@@ -90,46 +92,403 @@ class TestCreateMergePlan:
 
 
 class TestDetectDuplicatesQuery:
-    """Test that the detection query is well-formed."""
+    """Test that the detection queries are well-formed."""
 
-    def test_query_uses_case_insensitive_match(self):
-        from application.services.deduplication_service import DETECT_DUPLICATES_QUERY
-        assert "toLower" in DETECT_DUPLICATES_QUERY
+    def test_stream_query_normalizes_name_key(self):
+        from application.services.deduplication_service import STREAM_ENTITY_KEYS_QUERY
+        assert "toLower(trim(n.name)) END AS name_key" in STREAM_ENTITY_KEYS_QUERY
 
-    def test_query_excludes_merged_entities(self):
-        from application.services.deduplication_service import DETECT_DUPLICATES_QUERY
-        assert "_merged_into" in DETECT_DUPLICATES_QUERY
+    def test_stream_query_is_ordered_by_group(self):
+        from application.services.deduplication_service import STREAM_ENTITY_KEYS_QUERY
+        assert "ORDER BY type, name_key" in STREAM_ENTITY_KEYS_QUERY
 
-    def test_query_excludes_structural_entities(self):
-        from application.services.deduplication_service import DETECT_DUPLICATES_QUERY
-        assert "_is_structural" in DETECT_DUPLICATES_QUERY
+    def test_name_key_is_guarded_against_non_string_names(self):
+        from application.services.deduplication_service import (
+            CHANGED_ENTITY_KEYS_QUERY,
+            MATCH_ENTITY_KEYS_QUERY,
+            STREAM_ENTITY_KEYS_QUERY,
+        )
+        for query in (STREAM_ENTITY_KEYS_QUERY, CHANGED_ENTITY_KEYS_QUERY, MATCH_ENTITY_KEYS_QUERY):
+            assert query.count("toLower(trim(n.name))") == query.count(
+                "CASE WHEN n.name IS :: STRING THEN toLower(trim(n.name)) END"
+            )
+
+    def test_stream_query_has_no_cartesian_match(self):
+        from application.services.deduplication_service import STREAM_ENTITY_KEYS_QUERY
+        assert "(a), (b)" not in STREAM_ENTITY_KEYS_QUERY
+        assert STREAM_ENTITY_KEYS_QUERY.count("MATCH") == 1
+
+    def test_queries_exclude_merged_structural_and_dismissed(self):
+        from application.services.deduplication_service import (
+            CHANGED_ENTITY_KEYS_QUERY,
+            MATCH_ENTITY_KEYS_QUERY,
+            STREAM_ENTITY_KEYS_QUERY,
+        )
+        for query in (STREAM_ENTITY_KEYS_QUERY, CHANGED_ENTITY_KEYS_QUERY, MATCH_ENTITY_KEYS_QUERY):
+            assert "_merged_into" in query
+            assert "_is_structural" in query
+            assert "_dedup_skip" in query
+
+    def test_changed_query_selects_missing_or_stale_keys(self):
+        from application.services.deduplication_service import CHANGED_ENTITY_KEYS_QUERY
+        assert "n._dedup_key IS NULL" in CHANGED_ENTITY_KEYS_QUERY
+        assert "n._dedup_key <> CASE WHEN n.name IS :: STRING" in CHANGED_ENTITY_KEYS_QUERY
+
+    def test_match_query_uses_indexed_key_and_same_type(self):
+        from application.services.deduplication_service import MATCH_ENTITY_KEYS_QUERY
+        assert "(n:Entity {_dedup_key: key.name_key})" in MATCH_ENTITY_KEYS_QUERY
+        assert "n.type = key.type" in MATCH_ENTITY_KEYS_QUERY
+
+
+def _row(entity_id, name, entity_type="Drug", rel_count=0, stored_key=None):
+    return {
+        "id": entity_id,
+        "name": name,
+        "type": entity_type,
+        "name_key": name.strip().lower(),
+        "stored_key": stored_key,
+        "rel_count": rel_count,
+        "confidence": 0.5,
+    }
+
+
+class TestStreamingDetection:
+    """Test streamed, key-grouped duplicate detection."""
+
+    def _make_service(self, results_by_query, page_size=5000):
+        """Build a service whose driver returns canned rows per query."""
+        from application.services import deduplication_service as module
+
+        calls = []
+
+        def make_result(records):
+            async def mock_aiter(self_iter):
+                for r in records:
+                    mock_record = MagicMock()
+                    mock_record.data.return_value = r
+                    yield mock_record
+
+            mock_result = MagicMock()
+            mock_result.__aiter__ = mock_aiter
+            return mock_result
+
+        async def run(query, params=None):
+            calls.append((query, params))
+            for name, records in results_by_query.items():
+                if query == getattr(module, name):
+                    return make_result(records)
+            return make_result([])
 
-    def test_query_matches_same_type_only(self):
-        from application.services.deduplication_service import DETECT_DUPLICATES_QUERY
-        assert "a.type = b.type" in DETECT_DUPLICATES_QUERY
+        mock_session = AsyncMock()
+        mock_session.run.side_effect = run
+        mock_ctx = AsyncMock()
+        mock_ctx.__aenter__.return_value = mock_session
+        mock_ctx.__aexit__.return_value = False
+        driver = MagicMock()
+        driver.session = MagicMock(return_value=mock_ctx)
+        return DeduplicationService(driver, page_size=page_size), calls
 
-    def test_query_excludes_dismissed_entities(self):
-        from application.services.deduplication_service import DETECT_DUPLICATES_QUERY
-        assert "_dedup_skip" in DETECT_DUPLICATES_QUERY
+    @pytest.mark.asyncio
+    async def test_full_scan_pairs_every_member_of_a_group(self):
+        service, _ = self._make_service({
+            # Rows arrive ordered by (type, name_key)
+            "STREAM_ENTITY_KEYS_QUERY": [
+                _row("e1", "Aspirin", rel_count=3),
+                _row("e3", " aspirin "),
+                _row("e4", "ASPIRIN"),
+                _row("e2", "Metformin"),
+                _row("e5", "aspirin", entity_type="Treatment"),
+            ],
+        }, page_size=2)
+
+        pairs = await service.detect_duplicates()
+
+        assert [(p.entity_a_id, p.entity_b_id) for p in pairs] == [
+            ("e1", "e3"), ("e1", "e4"), ("e3", "e4"),
+        ]
+        assert pairs[0].a_relationship_count == 3
+        assert all(p.entity_type == "Drug" for p in pairs)
+
+    @pytest.mark.asyncio
+    async def test_dry_run_does_not_record_keys(self):
+        service, calls = self._make_service({
+            "STREAM_ENTITY_KEYS_QUERY": [_row("e1", "Aspirin"), _row("e2", "aspirin")],
+        })
+
+        await service.detect_duplicates()
+
+        from application.services.deduplication_service import RECORD_ENTITY_KEYS_QUERY
+        assert not any(query == RECORD_ENTITY_KEYS_QUERY for query, _ in calls)
+
+    @pytest.mark.asyncio
+    async def test_record_keys_writes_only_stale_keys(self):
+        service, calls = self._make_service({
+            "STREAM_ENTITY_KEYS_QUERY": [
+                _row("e1", "Aspirin", stored_key="aspirin"),
+                _row("e2", "Metformin"),
+            ],
+        })
+
+        await service.detect_duplicates(record_keys=True)
+
+        from application.services.deduplication_service import RECORD_ENTITY_KEYS_QUERY
+        writes = [params for query, params in calls if query == RECORD_ENTITY_KEYS_QUERY]
+        assert writes == [{"rows": [{"id": "e2", "name_key": "metformin"}]}]
+
+    @pytest.mark.asyncio
+    async def test_keys_of_duplicates_are_left_for_the_merge(self):
+        service, calls = self._make_service({
+            "STREAM_ENTITY_KEYS_QUERY": [
+                _row("e1", "Aspirin"),
+                _row("e2", "aspirin"),
+                _row("e3", "Metformin"),
+            ],
+        }, page_size=1)
+
+        await service.detect_duplicates(record_keys=True)
+
+        from application.services.deduplication_service import RECORD_ENTITY_KEYS_QUERY
+        written = [row["id"] for query, params in calls if query == RECORD_ENTITY_KEYS_QUERY
+                   for row in params["rows"]]
+        assert written == ["e3"]
+
+    @pytest.mark.asyncio
+    async def test_incremental_records_only_unpaired_changes(self):
+        service, calls = self._make_service({
+            "CHANGED_ENTITY_KEYS_QUERY": [_row("new1", "aspirin"), _row("new2", "Ibuprofen")],
+            "MATCH_ENTITY_KEYS_QUERY": [_row("old1", "Aspirin", stored_key="aspirin")],
+        })
+
+        await service.detect_duplicates(incremental=True, record_keys=True)
+
+        from application.services.deduplication_service import RECORD_ENTITY_KEYS_QUERY
+        writes = [params for query, params in calls if query == RECORD_ENTITY_KEYS_QUERY]
+        assert writes == [{"rows": [{"id": "new2", "name_key": "ibuprofen"}]}]
+
+    @pytest.mark.asyncio
+    async def test_incremental_pairs_changed_with_recorded_entities(self):
+        service, calls = self._make_service({
+            "CHANGED_ENTITY_KEYS_QUERY": [_row("new1", "aspirin"), _row("new2", "Ibuprofen")],
+            "MATCH_ENTITY_KEYS_QUERY": [
+                _row("old1", "Aspirin", stored_key="aspirin"),
+                _row("old2", "ASPIRIN", stored_key="aspirin"),
+            ],
+        })
+
+        pairs = await service.detect_duplicates(incremental=True)
+
+        # old1/old2 were already checked together, so only pairs with new1 are new
+        assert [(p.entity_a_id, p.entity_b_id) for p in pairs] == [
+            ("old1", "new1"), ("old2", "new1"),
+        ]
+        from application.services.deduplication_service import MATCH_ENTITY_KEYS_QUERY
+        lookups = [params for query, params in calls if query == MATCH_ENTITY_KEYS_QUERY]
+        assert {k["name_key"] for k in lookups[0]["keys"]} == {"aspirin", "ibuprofen"}
 
 
 class TestMergeExecution:
     """Test merge execution queries are well-formed."""
 
-    def test_mark_merged_sets_audit_fields(self):
-        from application.services.deduplication_service import MARK_MERGED_QUERY
-        assert "_merged_into" in MARK_MERGED_QUERY
-        assert "_merged_date" in MARK_MERGED_QUERY
-        assert "_dedup_batch" in MARK_MERGED_QUERY
+    def test_finalize_sets_audit_fields(self):
+        from application.services.deduplication_service import FINALIZE_MERGES_QUERY
+        assert "_merged_into" in FINALIZE_MERGES_QUERY
+        assert "_merged_date" in FINALIZE_MERGES_QUERY
+        assert "_dedup_batch" in FINALIZE_MERGES_QUERY
+        assert "CREATE (:DedupMerge" in FINALIZE_MERGES_QUERY
+
+    def test_finalize_records_winner_key(self):
+        from application.services.deduplication_service import FINALIZE_MERGES_QUERY
+        assert "winner._dedup_key = CASE WHEN winner.name IS :: STRING" in FINALIZE_MERGES_QUERY
 
     def test_delete_only_marked_entities(self):
-        from application.services.deduplication_service import DELETE_LOSER_QUERY
-        assert "_merged_into IS NOT NULL" in DELETE_LOSER_QUERY
+        from application.services.deduplication_service import FINALIZE_MERGES_QUERY
+        assert "_merged_into IS NOT NULL" in FINALIZE_MERGES_QUERY
+
+    def test_finalize_requires_existing_winner(self):
+        from application.services.deduplication_service import FINALIZE_MERGES_QUERY
+        assert "MATCH (winner:Entity {id: m.winner_id})" in FINALIZE_MERGES_QUERY
 
     def test_transfer_skips_duplicate_relationships(self):
         from application.services.deduplication_service import TRANSFER_INCOMING_RELS_QUERY
         assert "NOT EXISTS" in TRANSFER_INCOMING_RELS_QUERY
 
+    def test_transfer_queries_are_batched(self):
+        from application.services.deduplication_service import (
+            TRANSFER_INCOMING_RELS_QUERY,
+            TRANSFER_OUTGOING_RELS_QUERY,
+        )
+        for query in (TRANSFER_INCOMING_RELS_QUERY, TRANSFER_OUTGOING_RELS_QUERY):
+            assert "UNWIND $merges AS m" in query
+            assert "CALL {" in query
+
+
+def _plan(winner_id, loser_id):
+    return MergePlan(
+        winner_id=winner_id, winner_name=winner_id.upper(),
+        loser_id=loser_id, loser_name=loser_id.upper(),
+        entity_type="Drug", rationale="test",
+    )
+
+
+class TestResolveMergeChains:
+    """Test flattening of overlapping pairwise merge plans."""
+
+    def test_loser_merged_once(self):
+        merges = DeduplicationService.resolve_merge_chains([_plan("a", "c"), _plan("b", "c")])
+        assert [(m.winner_id, m.loser_id) for m in merges] == [("a", "c")]
+
+    def test_loser_of_earlier_plan_redirects_to_its_winner(self):
+        merges = DeduplicationService.resolve_merge_chains([_plan("a", "b"), _plan("b", "c")])
+        assert [(m.winner_id, m.loser_id) for m in merges] == [("a", "b"), ("a", "c")]
+        assert merges[1].winner_name == "A"
+
+    def test_winner_absorbed_later_moves_its_losers(self):
+        merges = DeduplicationService.resolve_merge_chains([_plan("a", "b"), _plan("c", "a")])
+        assert [(m.winner_id, m.loser_id) for m in merges] == [("c", "b"), ("c", "a")]
+
+    def test_cycle_is_dropped(self):
+        merges = DeduplicationService.resolve_merge_chains([_plan("a", "b"), _plan("b", "a")])
+        assert [(m.winner_id, m.loser_id) for m in merges] == [("a", "b")]
+
+
+class TestPackMergeBatches:
+    """Test batch packing for concurrent merge transactions."""
+
+    def test_winner_groups_are_not_split_across_batches(self):
+        merges = [_plan("a", "a1"), _plan("b", "b1"), _plan("a", "a2"), _plan("c", "c1")]
+        batches = DeduplicationService._pack_merge_batches(merges, batch_size=3)
+        assert [[m.loser_id for m in batch] for batch in batches] == [["a1", "a2", "b1"], ["c1"]]
+
+    def test_oversized_group_gets_own_batches(self):
+        merges = [_plan("a", f"a{i}") for i in range(5)] + [_plan("b", "b1")]
+        batches = DeduplicationService._pack_merge_batches(merges, batch_size=2)
+        assert [len(batch) for batch in batches] == [2, 2, 1, 1]
+
+
+class TestBatchedMerge:
+    """Test transactional, resumable merge execution."""
+
+    def _make_service(self, completed_losers=(), fail_on=None):
+        """Build a service whose transactions report every merge as applied."""
+        from application.services import deduplication_service as module
+
+        def make_result(records):
+            async def mock_aiter(self_iter):
+                for r in records:
+                    yield r
+
+            mock_result = MagicMock()
+            mock_result.__aiter__ = mock_aiter
+            return mock_result
+
+        async def session_run(query, params=None):
+            if query == module.COMPLETED_MERGES_QUERY:
+                return make_result([{"loser_id": loser} for loser in completed_losers])
+            return make_result([])
+
+        async def tx_run(query, params):
+            merges = params["merges"]
+            if fail_on and any(m["loser_id"] == fail_on for m in merges):
+                raise RuntimeError("boom")
+            if query == module.FINALIZE_MERGES_QUERY:
+                return make_result([{"loser_id": m["loser_id"]} for m in merges])
+            return make_result([{"loser_id": m["loser_id"], "transferred": 1} for m in merges])
+
+        tx = MagicMock()
+        tx.run = AsyncMock(side_effect=tx_run)
+
+        async def execute_write(work):
+            return await work(tx)
+
+        mock_session = AsyncMock()
+        mock_session.run.side_effect = session_run
+        mock_session.execute_write.side_effect = execute_write
+        mock_ctx = AsyncMock()
+        mock_ctx.__aenter__.return_value = mock_session
+        mock_ctx.__aexit__.return_value = False
+        driver = MagicMock()
+        driver.session = MagicMock(return_value=mock_ctx)
+        return DeduplicationService(driver, merge_batch_size=2), tx
+
+    @pytest.mark.asyncio
+    async def test_merges_are_batched_and_summarized(self):
+        service, tx = self._make_service()
+        progress = []
+
+        summary = await service.execute_merge(
+            [_plan("a", "a1"), _plan("b", "b1"), _plan("c", "c1")],
+            batch_id="run1",
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        assert summary.total_merged == 3
+        assert summary.total_relationships_transferred == 6
+        assert summary.batch_id == "run1"
+        # Two batches, three statements each
+        assert tx.run.await_count == 6
+        assert len(progress) == 2
+        assert progress[-1] == (3, 3)
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_committed_merges(self):
+        service, tx = self._make_service(completed_losers=["a1"])
+
+        summary = await service.execute_merge(
+            [_plan("a", "a1"), _plan("b", "b1")], batch_id="run1"
+        )
+
+        assert summary.skipped == 1
+        assert [d["loser"] for d in summary.details] == ["b1"]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_reported_not_raised(self):
+        service, _ = self._make_service(fail_on="c1")
+
+        summary = await service.execute_merge(
+            [_plan("a", "a1"), _plan("b", "b1"), _plan("c", "c1")], batch_id="run1"
+        )
+
+        assert summary.total_merged == 2
+        assert summary.failures == [{"losers": ["c1"], "error": "boom"}]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_still_advances_progress(self):
+        service, _ = self._make_service(fail_on="c1")
+        progress = []
+
+        await service.execute_merge(
+            [_plan("a", "a1"), _plan("b", "b1"), _plan("c", "c1")],
+            batch_id="run1",
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        assert len(progress) == 2
+        assert max(progress) == (3, 3)
+
+    @pytest.mark.asyncio
+    async def test_batches_sharing_an_entity_do_not_overlap(self):
+        import asyncio
+
+        service, _ = self._make_service()
+        active: set[str] = set()
+        overlaps = []
+
+        async def apply(batch, batch_id, database):
+            ids = {m.winner_id for m in batch} | {m.loser_id for m in batch}
+            overlaps.extend(active & ids)
+            active.update(ids)
+            await asyncio.sleep(0.01)
+            active.difference_update(ids)
+            return {m.loser_id: 0 for m in batch}, {m.loser_id for m in batch}
+
+        service._apply_merge_batch = apply
+        summary = await service.execute_merge(
+            [_plan("a", f"a{i}") for i in range(5)] + [_plan("b", "b1")], batch_id="run1"
+        )
+
+        assert summary.total_merged == 6
+        assert overlaps == []
+
 
 class TestCrossTypeDetection:
     """Test cross-type duplicate detection logic."""
@@ -209,3 +568,7 @@ class TestDismissEntities:
         from application.services.deduplication_service import UNDISMISS_ENTITIES_QUERY
         assert "REMOVE" in UNDISMISS_ENTITIES_QUERY
         assert "_dedup_skip" in UNDISMISS_ENTITIES_QUERY
+
+    def test_undismiss_query_clears_recorded_key(self):
+        from application.services.deduplication_service import UNDISMISS_ENTITIES_QUERY
+        assert "_dedup_key" in UNDISMISS_ENTITIES_QUERY
@@ -0,0 +1,118 @@
+"""Unit tests for DocumentTracker."""
+
+import json
+import os
+
+import pytest
+
+from application.services.document_tracker import DocumentTracker
+
+
+@pytest.fixture
+def pdf_dir(tmp_path):
+    pdf_dir = tmp_path / "PDFs"
+    (pdf_dir / "ibd").mkdir(parents=True)
+    (pdf_dir / "ibd" / "crohns.pdf").write_bytes(b"%PDF-1.4 crohns")
+    (pdf_dir / "overview.pdf").write_bytes(b"%PDF-1.4 overview")
+    return pdf_dir
+
+
+def _tracker(tmp_path, pdf_dir, name="tracking.sqlite3"):
+    return DocumentTracker(
+        tracking_file=tmp_path / name,
+        pdf_directory=pdf_dir,
+        markdown_directory=tmp_path / "markdown",
+    )
+
+
+class TestDocumentTracker:
+
+    def test_scan_registers_documents(self, tmp_path, pdf_dir):
+        tracker = _tracker(tmp_path, pdf_dir)
+
+        records = tracker.scan_pdf_directory()
+
+        assert [(r.filename, r.category) for r in records] == [
+            ("crohns.pdf", "ibd"),
+            ("overview.pdf", "general"),
+        ]
+        assert tracker.get_categories() == ["general", "ibd"]
+        assert tracker.get_statistics()["not_started"] == 2
+
+    def test_updates_persist_one_record(self, tmp_path, pdf_dir):
+        tracker = _tracker(tmp_path, pdf_dir)
+        record = tracker.scan_pdf_directory()[0]
+
+        tracker.update_document(record.id, status="completed", entity_count=7)
+
+        reopened = _tracker(tmp_path, pdf_dir)
+        assert reopened.get_document(record.id).status == "completed"
+        assert reopened.get_document_by_filename("crohns.pdf").entity_count == 7
+        assert [r.filename for r in reopened.list_documents(status="not_started")] == ["overview.pdf"]
+        assert reopened.get_statistics()["total_entities"] == 7
+
+    def test_unknown_fields_are_rejected(self, tmp_path, pdf_dir):
+        tracker = _tracker(tmp_path, pdf_dir)
+        record = tracker.scan_pdf_directory()[0]
+
+        with pytest.raises(ValueError):
+            tracker.update_document(record.id, colour="red")
+
+    def test_changed_since_reports_new_and_modified_pdfs(self, tmp_path, pdf_dir):
+        tracker = _tracker(tmp_path, pdf_dir)
+        records, cursor = tracker.changed_since(0)
+        assert len(records) == 2
+        for record in records:
+            tracker.update_document(record.id, status="completed")
+
+        # Status changes alone do not show up as changes
+        assert tracker.changed_since(cursor) == ([], cursor)
+
+        crohns = pdf_dir / "ibd" / "crohns.pdf"
+        crohns.write_bytes(b"%PDF-1.4 crohns, second edition")
+        stat = crohns.stat()
+        os.utime(crohns, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        (pdf_dir / "uc.pdf").write_bytes(b"%PDF-1.4 uc")
+        tracker.refresh(force=True)
+
+        changed, new_cursor = tracker.changed_since(cursor)
+
+        assert sorted(r.filename for r in changed) == ["crohns.pdf", "uc.pdf"]
+        assert {r.status for r in changed} == {"not_started"}
+        assert new_cursor > cursor
+        assert tracker.get_document_by_filename("overview.pdf").status == "completed"
+
+    def test_deleted_pdfs_are_removed(self, tmp_path, pdf_dir):
+        tracker = _tracker(tmp_path, pdf_dir)
+        tracker.scan_pdf_directory()
+
+        (pdf_dir / "overview.pdf").unlink()
+
+        assert [r.filename for r in tracker.scan_pdf_directory()] == ["crohns.pdf"]
+
+    def test_reads_reuse_recent_scan(self, tmp_path, pdf_dir):
+        tracker = _tracker(tmp_path, pdf_dir)
+        tracker.list_documents()
+
+        (pdf_dir / "uc.pdf").write_bytes(b"%PDF-1.4 uc")
+
+        assert len(tracker.list_documents()) == 2
+        assert tracker.refresh(force=True) == 1
+        assert len(tracker.list_documents()) == 3
+
+    def test_imports_legacy_json(self, tmp_path, pdf_dir):
+        legacy = _tracker(tmp_path, pdf_dir, name="legacy.sqlite3")
+        data = {r.id: r.to_dict() for r in legacy.scan_pdf_directory()}
+        first = next(iter(data))
+        data[first]["status"] = "completed"
+        (tmp_path / "tracking.json").write_text(json.dumps(data))
+
+        tracker = _tracker(tmp_path, pdf_dir, name="tracking.json")
+
+        assert tracker.tracking_file == tmp_path / "tracking.sqlite3"
+        assert tracker.get_document(first).status == "completed"
+        records, cursor = tracker.changed_since(0)
+        assert len(records) == 2
+        # Adopting fingerprints for imported records is not a change
+        tracker.refresh(force=True)
+        assert tracker.changed_since(cursor) == ([], cursor)
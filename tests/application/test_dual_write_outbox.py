@@ -0,0 +1,193 @@
+"""Unit tests for the dual-write outbox and its relay."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+
+from application.services.dual_write_health_service import DualWriteHealthService
+from application.services.dual_write_outbox import (
+    FEEDBACK_INSERT,
+    MESSAGE_INSERT,
+    SESSION_CREATE,
+    SESSION_UPDATE,
+    DualWriteOutbox,
+    OutboxRelay,
+    submit_change,
+)
+
+
+class FakePostgres:
+    """Records applied batches; keys listed in ``poison`` make a batch fail."""
+
+    def __init__(self, poison=()):
+        self.poison = set(poison)
+        self.batches = []
+        self.sessions = 0
+
+    @asynccontextmanager
+    async def session(self):
+        self.sessions += 1
+        yield object()
+
+    def handler(self, kind):
+        async def apply(session, payloads):
+            if any(p["id"] in self.poison for p in payloads):
+                raise RuntimeError("constraint violation")
+            self.batches.append((kind, [p["id"] for p in payloads]))
+        return apply
+
+    def handlers(self):
+        return {kind: self.handler(kind) for kind in (SESSION_CREATE, MESSAGE_INSERT, FEEDBACK_INSERT, SESSION_UPDATE)}
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    outbox = DualWriteOutbox(str(tmp_path / "outbox.sqlite3"))
+    yield outbox
+    outbox.close()
+
+
+def _relay(outbox, pg, **kwargs):
+    return OutboxRelay(outbox, pg.session, handlers=pg.handlers(), base_delay=0.0, **kwargs)
+
+
+class TestDualWriteOutbox:
+
+    async def test_drain_groups_by_kind_in_dependency_order(self, outbox):
+        outbox.append(MESSAGE_INSERT, "m1", {"id": "m1"})
+        outbox.append(SESSION_CREATE, "s1", {"id": "s1"})
+        outbox.append(MESSAGE_INSERT, "m2", {"id": "m2"})
+        pg = FakePostgres()
+
+        delivered = await _relay(outbox, pg).drain_once()
+
+        assert delivered == 3
+        assert pg.batches == [(SESSION_CREATE, ["s1"]), (MESSAGE_INSERT, ["m1", "m2"])]
+        assert len(outbox) == 0
+        stats = outbox.stats()["sessions"]
+        assert stats["delivered"] == 3
+        assert stats["pending"] == 0
+
+    async def test_latest_change_per_key_wins(self, outbox):
+        outbox.append(SESSION_UPDATE, "s1:title", {"id": "s1", "title": "First"})
+        outbox.append(SESSION_UPDATE, "s1:title", {"id": "s1", "title": "Second"})
+        applied = []
+
+        async def update(session, payloads):
+            applied.extend(p["title"] for p in payloads)
+
+        relay = OutboxRelay(outbox, FakePostgres().session, handlers={SESSION_UPDATE: update})
+        assert await relay.drain_once() == 2
+        assert applied == ["Second"]
+
+    async def test_failed_batch_isolates_poison_record(self, outbox):
+        for key in ("f1", "f2", "f3"):
+            outbox.append(FEEDBACK_INSERT, key, {"id": key})
+        pg = FakePostgres(poison={"f2"})
+
+        delivered = await _relay(outbox, pg, max_attempts=2).drain_once()
+
+        assert delivered == 2
+        assert sorted(ids[0] for _, ids in pg.batches) == ["f1", "f3"]
+        assert outbox.stats()["feedback"]["retrying"] == 1
+
+        # Second failure reaches max_attempts and dead-letters the record
+        await _relay(outbox, pg, max_attempts=2).drain_once()
+        assert outbox.stats()["feedback"]["dead"] == 1
+        assert len(outbox) == 0
+
+        pg.poison.clear()
+        assert outbox.requeue_dead("feedback") == 1
+        assert await _relay(outbox, pg).drain_once() == 1
+
+    async def test_retry_backoff_delays_next_claim(self, outbox):
+        outbox.append(FEEDBACK_INSERT, "f1", {"id": "f1"})
+        pg = FakePostgres(poison={"f1"})
+        relay = OutboxRelay(outbox, pg.session, handlers=pg.handlers(), base_delay=60.0)
+
+        await relay.drain_once()
+
+        assert outbox.claim(10) == []
+        assert outbox.stats()["feedback"]["pending"] == 1
+
+    async def test_stop_drains_pending_changes(self, outbox):
+        pg = FakePostgres()
+        relay = _relay(outbox, pg, poll_interval=60.0)
+        await relay.start()
+        outbox.append(SESSION_CREATE, "s1", {"id": "s1"})
+
+        await relay.stop()
+
+        assert pg.batches == [(SESSION_CREATE, ["s1"])]
+
+    async def test_submit_change_queues_without_touching_postgres(self, outbox):
+        pg = FakePostgres()
+
+        assert await submit_change(outbox, pg.session, SESSION_CREATE, "s1", {"id": "s1"})
+
+        assert pg.sessions == 0
+        assert len(outbox) == 1
+
+    def test_claimed_records_are_leased_to_one_claimer(self, outbox):
+        for key in ("s1", "s2", "s3"):
+            outbox.append(SESSION_CREATE, key, {"id": key})
+        other = DualWriteOutbox(outbox.path)
+
+        first = outbox.claim(2)
+        second = other.claim(10)
+
+        assert [r.key for r in first] == ["s1", "s2"]
+        assert [r.key for r in second] == ["s3"]
+        assert other.claim(10) == []
+        other.close()
+
+    def test_expired_lease_is_claimed_again(self, outbox):
+        outbox.append(SESSION_CREATE, "s1", {"id": "s1"})
+        outbox.claim(10, lease_seconds=-1)
+
+        assert [r.key for r in outbox.claim(10)] == ["s1"]
+
+    def test_failed_record_keeps_no_lease(self, outbox):
+        outbox.append(FEEDBACK_INSERT, "f1", {"id": "f1"})
+        records = outbox.claim(10)
+        outbox.retry(records, "boom", max_attempts=5, base_delay=0.0, max_delay=0.0)
+
+        assert [r.key for r in outbox.claim(10)] == ["f1"]
+
+    def test_unknown_kind_is_rejected(self, outbox):
+        with pytest.raises(ValueError):
+            outbox.append("session.rename", "s1", {})
+
+
+class TestDualWriteHealthService:
+
+    @pytest.fixture(autouse=True)
+    def flags(self):
+        with patch(
+            "application.services.dual_write_health_service.dual_write_enabled", return_value=True
+        ), patch(
+            "application.services.dual_write_health_service.is_flag_enabled", return_value=False
+        ):
+            yield
+
+    async def test_empty_outbox_is_synced(self, outbox):
+        health = await DualWriteHealthService(outbox, relay_running=True).get_health()
+
+        assert health["status"] == "healthy"
+        assert {dt["sync_status"] for dt in health["data_types"].values()} == {"synced"}
+
+    async def test_lag_and_dead_letters_are_reported(self, outbox):
+        outbox.append(MESSAGE_INSERT, "m1", {"id": "m1"})
+        outbox.append(FEEDBACK_INSERT, "f1", {"id": "f1"})
+        [_, feedback] = outbox.claim(10)
+        outbox.retry([feedback], "boom", max_attempts=1, base_delay=0.0, max_delay=0.0)
+
+        service = DualWriteHealthService(outbox, relay_running=True, lag_warning_seconds=-1)
+        health = await service.get_health()
+
+        assert health["data_types"]["sessions"]["sync_status"] == "minor_drift"
+        assert health["data_types"]["sessions"]["pending"] == 1
+        assert health["data_types"]["feedback"]["sync_status"] == "out_of_sync"
+        assert health["status"] == "warning"
+        assert any("dead-lettered" in issue for issue in health["sync_issues"])
@@ -0,0 +1,120 @@
+"""Unit tests for EmbeddingPipeline and EmbeddingCache."""
+
+import asyncio
+
+import pytest
+
+from application.services.embedding_pipeline import (
+    EmbeddingCache,
+    EmbeddingPipeline,
+    HashEmbedder,
+)
+
+
+class RateLimitError(Exception):
+    """Stands in for ``openai.RateLimitError`` (matched by class name)."""
+
+    status_code = 429
+
+
+class RecordingEmbedder(HashEmbedder):
+    """HashEmbedder that records batches and can fail the first calls."""
+
+    def __init__(self, failures=0, error=RateLimitError):
+        super().__init__(dim=8)
+        self.batches = []
+        self.failures = failures
+        self.error = error
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def embed_batch(self, texts):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self.failures:
+                self.failures -= 1
+                raise self.error("slow down")
+            self.batches.append(list(texts))
+            return await super().embed_batch(texts)
+        finally:
+            self.in_flight -= 1
+
+
+class TestEmbeddingPipeline:
+
+    async def test_batches_and_preserves_order(self):
+        embedder = RecordingEmbedder()
+        pipeline = EmbeddingPipeline(embedder, batch_size=3, max_concurrency=2)
+        texts = [f"chunk {i}" for i in range(10)]
+
+        vectors = await pipeline.embed(texts)
+
+        assert vectors == [embedder.embed_one(t) for t in texts]
+        assert sorted(len(b) for b in embedder.batches) == [1, 3, 3, 3]
+        assert embedder.max_in_flight == 2
+
+    async def test_identical_texts_embedded_once(self):
+        embedder = RecordingEmbedder()
+        pipeline = EmbeddingPipeline(embedder)
+
+        vectors = await pipeline.embed(["same", "other", "same"])
+
+        assert vectors[0] == vectors[2]
+        assert sum(len(b) for b in embedder.batches) == 2
+
+    async def test_cache_serves_reingest(self, tmp_path):
+        cache_path = str(tmp_path / "cache.sqlite3")
+        texts = ["alpha", "beta"]
+        first = RecordingEmbedder()
+        await EmbeddingPipeline(first, cache=EmbeddingCache(cache_path)).embed(texts)
+
+        second = RecordingEmbedder()
+        pipeline = EmbeddingPipeline(second, cache=EmbeddingCache(cache_path))
+        vectors = await pipeline.embed(texts + ["gamma"])
+
+        assert second.batches == [["gamma"]]
+        assert pipeline.stats["cache_hits"] == 2
+        assert vectors[0] == pytest.approx(first.embed_one("alpha"))
+
+    async def test_cache_is_keyed_by_model(self, tmp_path):
+        cache = EmbeddingCache(str(tmp_path / "cache.sqlite3"))
+        await EmbeddingPipeline(HashEmbedder(dim=4), cache=cache).embed(["alpha"])
+
+        embedder = RecordingEmbedder()
+        await EmbeddingPipeline(embedder, cache=cache).embed(["alpha"])
+
+        assert embedder.batches == [["alpha"]]
+        assert len(cache) == 2
+
+    async def test_retries_rate_limited_batches(self):
+        embedder = RecordingEmbedder(failures=2)
+        pipeline = EmbeddingPipeline(embedder, base_delay=0.001)
+
+        vectors = await pipeline.embed(["alpha"])
+
+        assert vectors == [embedder.embed_one("alpha")]
+        assert pipeline.stats["retries"] == 2
+
+    async def test_gives_up_after_max_retries(self):
+        pipeline = EmbeddingPipeline(RecordingEmbedder(failures=5), max_retries=2, base_delay=0.001)
+
+        with pytest.raises(RateLimitError):
+            await pipeline.embed(["alpha"])
+
+    async def test_does_not_retry_permanent_errors(self):
+        embedder = RecordingEmbedder(failures=1, error=ValueError)
+        pipeline = EmbeddingPipeline(embedder, base_delay=0.001)
+
+        with pytest.raises(ValueError):
+            await pipeline.embed(["alpha"])
+        assert pipeline.stats["retries"] == 0
+
+    async def test_query_embedding_skips_cache(self, tmp_path):
+        cache = EmbeddingCache(str(tmp_path / "cache.sqlite3"))
+        pipeline = EmbeddingPipeline(HashEmbedder(), cache=cache)
+
+        await pipeline.embed_one("what treats crohn's?", use_cache=False)
+
+        assert len(cache) == 0
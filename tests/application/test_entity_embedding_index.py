@@ -0,0 +1,76 @@
+"""Unit tests for EntityEmbeddingIndex."""
+
+import numpy as np
+import pytest
+
+from application.services.entity_embedding_index import EntityEmbeddingIndex
+
+
+@pytest.fixture
+def index():
+    index = EntityEmbeddingIndex(initial_capacity=2)
+    index.add(
+        "Medication",
+        ["m1", "m2", "m3"],
+        ["aspirin", "ibuprofen", "metformin"],
+        [[1.0, 0.0], [0.8, 0.6], [0.0, 3.0]],
+    )
+    return index
+
+
+class TestEntityEmbeddingIndex:
+
+    def test_search_returns_top_k_by_cosine(self, index):
+        results = index.search("Medication", [2.0, 0.0], threshold=0.5, top_k=5)
+
+        assert [(r[0], r[1]) for r in results] == [("m1", "aspirin"), ("m2", "ibuprofen")]
+        assert results[0][2] == pytest.approx(1.0)
+        assert results[1][2] == pytest.approx(0.8)
+
+    def test_search_limits_results(self, index):
+        results = index.search("Medication", [1.0, 1.0], top_k=1)
+
+        assert [r[0] for r in results] == ["m2"]
+
+    def test_search_filters_before_limiting(self, index):
+        results = index.search("Medication", [1.0, 0.0], top_k=1, allowed={"m2", "m3"})
+
+        assert [r[0] for r in results] == ["m2"]
+
+    def test_types_are_separate(self, index):
+        assert index.search("Diagnosis", [1.0, 0.0]) == []
+        index.add("Diagnosis", ["d1"], ["aspirin"], [[1.0, 0.0]])
+
+        assert [r[0] for r in index.search("Diagnosis", [1.0, 0.0])] == ["d1"]
+        assert len(index) == 4
+
+    def test_add_replaces_existing_row(self, index):
+        index.add("Medication", ["m3"], ["metformin xr"], [[1.0, 0.0]])
+
+        assert len(index) == 3
+        assert index.contains("Medication", "m3", "metformin xr")
+        assert not index.contains("Medication", "m3", "metformin")
+        assert {r[0] for r in index.search("Medication", [1.0, 0.0], threshold=0.99)} == {"m1", "m3"}
+
+    def test_remove_keeps_remaining_rows_searchable(self, index):
+        assert index.remove("m1") is True
+        assert index.remove("m1") is False
+
+        results = {r[0]: r[2] for r in index.search("Medication", [0.0, 1.0])}
+        assert set(results) == {"m2", "m3"}
+        assert results["m3"] == pytest.approx(1.0)
+
+    def test_rejects_misaligned_input(self, index):
+        with pytest.raises(ValueError):
+            index.add("Medication", ["m4", "m5"], ["a", "b"], [[1.0, 0.0]])
+
+    def test_large_matrix_search(self):
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(20_000, 32))
+        index = EntityEmbeddingIndex()
+        index.add("Entity", [f"e{i}" for i in range(20_000)], [f"n{i}" for i in range(20_000)], vectors)
+
+        results = index.search("Entity", vectors[1234], threshold=0.0, top_k=3)
+
+        assert results[0][0] == "e1234"
+        assert len(results) == 3
@@ -8,6 +8,8 @@ from application.services.entity_resolver import (
     EntityMatch,
     ResolutionResult
 )
+from domain.event import KnowledgeEvent
+from domain.roles import Role
 
 # Check if rapidfuzz is available
 try:
@@ -21,7 +23,7 @@ except ImportError:
 def mock_backend():
     """Mock knowledge graph backend."""
     backend = AsyncMock()
-    backend.query = AsyncMock(return_value=[])
+    backend.query_raw = AsyncMock(return_value=[])
     return backend
 
 
@@ -74,7 +76,7 @@ class TestEntityResolverExactMatch:
     @pytest.mark.asyncio
     async def test_exact_match_found(self, resolver, mock_backend, sample_entities):
         """Test exact match when entity exists."""
-        mock_backend.query.return_value = sample_entities
+        mock_backend.query_raw.return_value = sample_entities
 
         result = await resolver.resolve_entity(
             "Customer",
@@ -92,7 +94,7 @@ class TestEntityResolverExactMatch:
     @pytest.mark.asyncio
     async def test_exact_match_case_insensitive(self, resolver, mock_backend, sample_entities):
         """Test exact match is case insensitive."""
-        mock_backend.query.return_value = sample_entities
+        mock_backend.query_raw.return_value = sample_entities
 
         result = await resolver.resolve_entity(
             "customer",  # lowercase
@@ -106,7 +108,7 @@ class TestEntityResolverExactMatch:
     @pytest.mark.asyncio
     async def test_exact_match_not_found(self, resolver, mock_backend, sample_entities):
         """Test exact match when no entity matches."""
-        mock_backend.query.return_value = sample_entities
+        mock_backend.query_raw.return_value = sample_entities
 
         result = await resolver.resolve_entity(
             "Vendor",
@@ -127,7 +129,7 @@ class TestEntityResolverFuzzyMatch:
     @pytest.mark.skipif(not RAPIDFUZZ_AVAILABLE, reason="rapidfuzz not installed")
     async def test_fuzzy_match_typo(self, resolver, mock_backend, sample_entities):
         """Test fuzzy match catches typos."""
-        mock_backend.query.return_value = sample_entities
+        mock_backend.query_raw.return_value = sample_entities
 
         result = await resolver.resolve_entity(
             "Custmer",  # Typo
@@ -143,7 +145,7 @@ class TestEntityResolverFuzzyMatch:
     @pytest.mark.skipif(not RAPIDFUZZ_AVAILABLE, reason="rapidfuzz not installed")
     async def test_fuzzy_match_threshold(self, resolver, mock_backend, sample_entities):
         """Test fuzzy match respects threshold."""
-        mock_backend.query.return_value = sample_entities
+        mock_backend.query_raw.return_value = sample_entities
 
         result = await resolver.resolve_entity(
             "Xyz",  # Very different
@@ -157,7 +159,7 @@ class TestEntityResolverFuzzyMatch:
     @pytest.mark.asyncio
     async def test_fuzzy_match_without_rapidfuzz(self, resolver, mock_backend, sample_entities):
         """Test fuzzy match gracefully handles missing rapidfuzz."""
-        mock_backend.query.return_value = sample_entities
+        mock_backend.query_raw.return_value = sample_entities
 
         # Hide rapidfuzz from sys.modules temporarily
         import sys
@@ -188,36 +190,84 @@ class TestEntityResolverFuzzyMatch:
                 del sys.modules['rapidfuzz']
 
 
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not RAPIDFUZZ_AVAILABLE, reason="rapidfuzz not installed")
+    async def test_fuzzy_match_scores_only_blocked_candidates(self, mock_backend):
+        """Test n-gram blocking narrows candidates before scoring."""
+        entities = [{"id": f"e{i}", "name": f"Customs {i}", "properties": {}} for i in range(50)]
+        entities.append({"id": "target", "name": "Customer", "properties": {}})
+        resolver = EntityResolver(backend=mock_backend, max_fuzzy_candidates=5)
+
+        with patch("rapidfuzz.process.extract", wraps=__import__("rapidfuzz").process.extract) as extract:
+            matches = resolver._fuzzy_match("Custmer", entities, "BusinessConcept")
+
+        assert [m.entity_id for m in matches] == ["target"]
+        assert len(extract.call_args.args[1]) == 5
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not RAPIDFUZZ_AVAILABLE, reason="rapidfuzz not installed")
+    async def test_fuzzy_index_drops_deleted_entities(self, resolver, mock_backend, sample_entities):
+        """Test merged-away entities leave the fuzzy index without a full re-sync."""
+        mock_backend.query_raw.return_value = sample_entities
+        await resolver.resolve_entity("Custmer", "BusinessConcept", strategy=ResolutionStrategy.FUZZY_MATCH)
+
+        await resolver.merge_entities("concept:customer", "concept:client")
+        result = await resolver.resolve_entity("Custmer", "BusinessConcept", strategy=ResolutionStrategy.FUZZY_MATCH)
+
+        assert result.matches == []
+        assert resolver._fuzzy_index.keys("BusinessConcept") == {"concept:client", "concept:product"}
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not RAPIDFUZZ_AVAILABLE, reason="rapidfuzz not installed")
+    async def test_registered_entity_is_fuzzy_matchable(self, resolver, mock_backend, sample_entities):
+        """Test entities written after the first match are indexed one by one."""
+        mock_backend.query_raw.return_value = sample_entities
+        await resolver.resolve_entity("Custmer", "BusinessConcept", strategy=ResolutionStrategy.FUZZY_MATCH)
+
+        resolver.register_entity("concept:vendor", "Vendor", "BusinessConcept")
+        result = await resolver.resolve_entity("Vendr", "BusinessConcept", strategy=ResolutionStrategy.FUZZY_MATCH)
+
+        assert [m.entity_id for m in result.matches] == ["concept:vendor"]
+
+
+def _fake_encoder(vectors=None):
+    """Embedding model mock returning one vector per input text."""
+    vectors = vectors or {}
+    model = MagicMock()
+    model.encode.side_effect = lambda texts, **kwargs: [
+        vectors.get(text, [0.1] * 384) for text in texts
+    ]
+    return model
+
+
 class TestEntityResolverEmbeddingMatch:
     """Test embedding-based semantic matching."""
 
     @pytest.mark.asyncio
     async def test_embedding_match_similar(self, resolver, mock_backend, sample_entities):
         """Test embedding match finds semantically similar entities."""
-        mock_backend.query.return_value = sample_entities
-
-        # Mock embedding model
-        mock_model = MagicMock()
-        mock_model.encode.return_value = [[0.1] * 384]  # Fake embedding
-        resolver._embedding_model = mock_model
-
-        # Mock cosine_similarity in sklearn.metrics.pairwise
-        with patch('sklearn.metrics.pairwise.cosine_similarity') as mock_cosine:
-            mock_cosine.return_value = [[0.95]]
+        mock_backend.query_raw.return_value = sample_entities
+        resolver._embedding_model = _fake_encoder({
+            "Client": [1.0, 0.0, 0.0],
+            "Customer": [0.95, 0.05, 0.0],
+            "Product": [0.0, 1.0, 0.0],
+        })
 
-            await resolver.resolve_entity(
-                "Client",
-                "BusinessConcept",
-                strategy=ResolutionStrategy.EMBEDDING_SIMILARITY
-            )
+        result = await resolver.resolve_entity(
+            "Client",
+            "BusinessConcept",
+            strategy=ResolutionStrategy.EMBEDDING_SIMILARITY
+        )
 
-            # Since we mocked high similarity, should find matches
-            # Note: actual matching depends on real embeddings
+        assert [m.entity_id for m in result.matches] == ["concept:client", "concept:customer"]
+        assert result.matches[0].similarity_score == pytest.approx(1.0)
+        assert result.matches[0].strategy == ResolutionStrategy.EMBEDDING_SIMILARITY
+        assert result.matches[0].properties["domain"] == "sales"
 
     @pytest.mark.asyncio
     async def test_embedding_match_without_model(self, resolver, mock_backend, sample_entities):
         """Test embedding match handles missing model gracefully."""
-        mock_backend.query.return_value = sample_entities
+        mock_backend.query_raw.return_value = sample_entities
 
         # Force model to None by patching the property
         resolver._embedding_model = None
@@ -236,26 +286,181 @@ class TestEntityResolverEmbeddingMatch:
     @pytest.mark.asyncio
     async def test_embedding_cache(self, resolver, mock_backend, sample_entities):
         """Test embedding caching works."""
-        mock_backend.query.return_value = sample_entities
+        mock_backend.query_raw.return_value = sample_entities
+        resolver._embedding_model = _fake_encoder()
 
-        # Mock embedding model
-        mock_model = MagicMock()
-        mock_model.encode.return_value = [[0.1] * 384]  # Fake embedding
-        resolver._embedding_model = mock_model
+        await resolver.resolve_entity(
+            "Customer",
+            "BusinessConcept",
+            strategy=ResolutionStrategy.EMBEDDING_SIMILARITY
+        )
 
-        # Mock cosine_similarity
-        with patch('sklearn.metrics.pairwise.cosine_similarity') as mock_cosine:
-            mock_cosine.return_value = [[0.95]]
+        # Cache should be populated
+        assert len(resolver._embedding_cache) == 3
 
-            # First call
+    @pytest.mark.asyncio
+    async def test_candidates_encoded_in_one_batch_and_reused(self, resolver, mock_backend, sample_entities):
+        """Test candidate misses are batch-encoded once and reused afterwards."""
+        mock_backend.query_raw.return_value = sample_entities
+        model = _fake_encoder()
+        resolver._embedding_model = model
+
+        for name in ("Customer", "Client"):
             await resolver.resolve_entity(
-                "Customer",
+                name,
                 "BusinessConcept",
                 strategy=ResolutionStrategy.EMBEDDING_SIMILARITY
             )
 
-            # Cache should be populated
-            assert len(resolver._embedding_cache) > 0
+        encoded = [call.args[0] for call in model.encode.call_args_list]
+        # One batch for the candidates, then only the query names
+        assert encoded == [["Customer", "Client", "Product"], ["Customer"], ["Client"]]
+
+    @pytest.mark.asyncio
+    async def test_renamed_entity_is_reencoded(self, resolver, mock_backend, sample_entities):
+        """Test an entity whose name changed gets a fresh embedding."""
+        mock_backend.query_raw.return_value = sample_entities
+        model = _fake_encoder()
+        resolver._embedding_model = model
+        await resolver.resolve_entity("Customer", "BusinessConcept", strategy=ResolutionStrategy.EMBEDDING_SIMILARITY)
+
+        model.encode.reset_mock()
+        resolver.register_entity("concept:customer", "Buyer", "BusinessConcept")
+
+        assert model.encode.call_args_list[0].args[0] == ["Buyer"]
+        assert resolver._embedding_cache.contains("BusinessConcept", "concept:customer", "Buyer")
+
+    @pytest.mark.asyncio
+    async def test_stale_rows_do_not_crowd_out_top_k(self, mock_backend, sample_entities):
+        """Test rows of entities that are no longer candidates are skipped before top-k."""
+        mock_backend.query_raw.return_value = sample_entities
+        resolver = EntityResolver(backend=mock_backend, max_embedding_matches=1)
+        resolver._embedding_model = _fake_encoder({
+            "Client": [1.0, 0.0, 0.0],
+            "Customer": [0.95, 0.05, 0.0],
+            "Product": [0.0, 1.0, 0.0],
+        })
+        await resolver._get_existing_entities("BusinessConcept", {})
+        resolver._embedding_cache.add("BusinessConcept", ["concept:deleted"], ["Client"], [[1.0, 0.0, 0.0]])
+
+        result = await resolver.resolve_entity(
+            "Client",
+            "BusinessConcept",
+            strategy=ResolutionStrategy.EMBEDDING_SIMILARITY
+        )
+
+        assert [m.entity_id for m in result.matches] == ["concept:client"]
+
+    @pytest.mark.asyncio
+    async def test_merge_removes_source_embedding(self, resolver, sample_entities):
+        """Test merged-away entities leave the embedding matrix."""
+        resolver._embedding_model = _fake_encoder()
+        await resolver._embedding_match("Customer", sample_entities, "BusinessConcept")
+
+        await resolver.merge_entities("concept:client", "concept:customer")
+
+        assert len(resolver._embedding_cache) == 2
+        assert not resolver._embedding_cache.contains("BusinessConcept", "concept:client")
+
+    def test_register_entity_indexes_new_entity(self, resolver):
+        """Test newly created entities can be added to the matrix directly."""
+        resolver._embedding_model = _fake_encoder()
+
+        resolver.register_entity("concept:buyer", "Buyer", "BusinessConcept")
+
+        assert resolver._embedding_cache.contains("BusinessConcept", "concept:buyer", "Buyer")
+
+
+class TestEntityResolverCandidateRetrieval:
+    """Test loading of existing entities."""
+
+    @pytest.mark.asyncio
+    async def test_pages_through_all_entities(self, mock_backend):
+        """Test candidates are not capped at a single page."""
+        entities = [{"id": f"e{i:03d}", "name": f"Entity {i}", "properties": {}} for i in range(25)]
+
+        async def paged_query(query, params):
+            remaining = [e for e in entities if e["id"] > params["after_id"]]
+            return remaining[:params["page_size"]]
+
+        mock_backend.query_raw.side_effect = paged_query
+        resolver = EntityResolver(backend=mock_backend, candidate_page_size=10)
+
+        result = await resolver._get_existing_entities("BusinessConcept", {})
+
+        assert [e["id"] for e in result] == [e["id"] for e in entities]
+        assert mock_backend.query_raw.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_stops_when_backend_ignores_cursor(self, mock_backend, sample_entities):
+        """Test a backend that ignores paging parameters cannot loop forever."""
+        mock_backend.query_raw.return_value = sample_entities
+        resolver = EntityResolver(backend=mock_backend, candidate_page_size=3)
+
+        result = await resolver._get_existing_entities("BusinessConcept", {})
+
+        assert mock_backend.query_raw.await_count == 2
+        assert len(result) == 3
+
+    @pytest.mark.asyncio
+    async def test_candidates_loaded_once_per_type(self, resolver, mock_backend, sample_entities):
+        """Test later resolutions are answered without reading the graph again."""
+        mock_backend.query_raw.return_value = sample_entities
+
+        for name in ("Customer", "Client", "Vendor"):
+            await resolver.resolve_entity(name, "BusinessConcept", strategy=ResolutionStrategy.EXACT_MATCH)
+
+        assert mock_backend.query_raw.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_load_is_retried(self, resolver, mock_backend, sample_entities):
+        """Test a failed read is not cached as an empty type."""
+        mock_backend.query_raw.side_effect = [Exception("Database error"), sample_entities]
+
+        assert await resolver._get_existing_entities("BusinessConcept", {}) == []
+        assert len(await resolver._get_existing_entities("BusinessConcept", {})) == 3
+
+    @pytest.mark.asyncio
+    async def test_candidates_read_as_records_not_graph(self, mock_backend, sample_entities):
+        """Test candidates come from query_raw, not the nodes/edges shape of query()."""
+        mock_backend.query = AsyncMock(return_value={"nodes": {}, "edges": {}})
+        mock_backend.query_raw.return_value = sample_entities
+        resolver = EntityResolver(backend=mock_backend)
+
+        result = await resolver._get_existing_entities("BusinessConcept", {})
+
+        assert [e["id"] for e in result] == [e["id"] for e in sample_entities]
+        mock_backend.query.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invalid_type_label_is_not_queried(self, resolver, mock_backend):
+        """Test an entity type that is not a valid label never reaches the query."""
+        result = await resolver._get_existing_entities("Concept) DETACH DELETE (n", {})
+
+        assert result == []
+        mock_backend.query_raw.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_writes_keep_loaded_candidates_current(self, resolver, mock_backend, sample_entities):
+        """Test registered, merged and evented writes update the loaded candidates."""
+        mock_backend.query_raw.return_value = sample_entities
+        await resolver._get_existing_entities("BusinessConcept", {})
+
+        resolver.register_entity("concept:buyer", "Buyer", "BusinessConcept")
+        await resolver.merge_entities("concept:client", "concept:customer")
+        await resolver._handle_entity_written(KnowledgeEvent(
+            action="create_entity",
+            data={"id": "concept:vendor", "properties": {"name": "Vendor"}, "labels": ["BusinessConcept"]},
+            role=Role.DATA_ENGINEER,
+        ))
+        await resolver._handle_entity_deleted(KnowledgeEvent(
+            action="delete_entity", data={"id": "concept:product"}, role=Role.DATA_ENGINEER,
+        ))
+
+        entities = await resolver._get_existing_entities("BusinessConcept", {})
+
+        assert sorted(e["id"] for e in entities) == ["concept:buyer", "concept:customer", "concept:vendor"]
+        assert mock_backend.query_raw.await_count == 1
 
 
 class TestEntityResolverHybridMatch:
@@ -264,7 +469,7 @@ class TestEntityResolverHybridMatch:
     @pytest.mark.asyncio
     async def test_hybrid_exact_match_priority(self, resolver, mock_backend, sample_entities):
         """Test hybrid strategy prioritizes exact matches."""
-        mock_backend.query.return_value = sample_entities
+        mock_backend.query_raw.return_value = sample_entities
 
         result = await resolver.resolve_entity(
             "Customer",
@@ -279,7 +484,7 @@ class TestEntityResolverHybridMatch:
     @pytest.mark.asyncio
     async def test_hybrid_weighted_combination(self, resolver, mock_backend, sample_entities):
         """Test hybrid strategy combines scores correctly."""
-        mock_backend.query.return_value = sample_entities
+        mock_backend.query_raw.return_value = sample_entities
 
         result = await resolver.resolve_entity(
             "Custmer",  # Typo - will match fuzzy but not exact
@@ -411,7 +616,7 @@ class TestEntityResolverIntegration:
                 "properties": {"description": "A client", "domain": "sales"}
             }
         ]
-        mock_backend.query.return_value = existing_entities
+        mock_backend.query_raw.return_value = existing_entities
 
         # Test with variation
         result = await resolver.resolve_entity(
@@ -428,7 +633,7 @@ class TestEntityResolverIntegration:
     @pytest.mark.asyncio
     async def test_no_existing_entities(self, resolver, mock_backend):
         """Test resolution when no entities exist."""
-        mock_backend.query.return_value = []
+        mock_backend.query_raw.return_value = []
 
         result = await resolver.resolve_entity(
             "NewConcept",
@@ -444,7 +649,7 @@ class TestEntityResolverIntegration:
     async def test_error_handling(self, resolver, mock_backend):
         """Test error handling in resolution."""
         # Simulate backend error
-        mock_backend.query.side_effect = Exception("Database error")
+        mock_backend.query_raw.side_effect = Exception("Database error")
 
         result = await resolver.resolve_entity(
             "Customer",
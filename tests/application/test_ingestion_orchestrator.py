@@ -0,0 +1,163 @@
+"""Unit tests for IngestionOrchestrator."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from application.services.document_tracker import DocumentTracker
+from application.services.ingestion_orchestrator import IngestionOrchestrator
+from application.services.neo4j_pdf_ingestion import ExtractionResult
+
+
+class FakeService:
+    """Extraction and persistence stand-in that records concurrency."""
+
+    def __init__(self, fail_on=(), write_delay=0.0):
+        self.fail_on = set(fail_on)
+        self.write_delay = write_delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.writes_in_flight = 0
+        self.max_writes_in_flight = 0
+        self.written = []
+
+    async def extract_knowledge(self, markdown, document):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if document.filename in self.fail_on:
+                raise RuntimeError("LLM unavailable")
+            return ExtractionResult(
+                document=document,
+                entities=[{"name": markdown.split()[0]}],
+                relationships=[],
+                extraction_time_seconds=0.01,
+            )
+        finally:
+            self.in_flight -= 1
+
+    async def persist_to_neo4j(self, result):
+        self.writes_in_flight += 1
+        self.max_writes_in_flight = max(self.max_writes_in_flight, self.writes_in_flight)
+        await asyncio.sleep(self.write_delay)
+        self.writes_in_flight -= 1
+        self.written.append(result.document.filename)
+        return {"entities_added": len(result.entities), "relationships_added": 0}
+
+
+conversions = []
+
+
+def fake_convert(path, converter_name):
+    conversions.append(Path(path).name)
+    return f"{Path(path).stem} converted with {converter_name}"
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    pdf_dir = tmp_path / "PDFs"
+    (pdf_dir / "ibd").mkdir(parents=True)
+    for i in range(6):
+        (pdf_dir / "ibd" / f"paper{i}.pdf").write_bytes(b"%PDF-1.4")
+    conversions.clear()
+    return DocumentTracker(
+        tracking_file=tmp_path / "tracking.json",
+        pdf_directory=pdf_dir,
+        markdown_directory=tmp_path / "markdown",
+    )
+
+
+def _orchestrator(tracker, service, **kwargs):
+    return IngestionOrchestrator(
+        service, tracker, conversion_workers=2, converter_name="fake", convert_fn=fake_convert, **kwargs
+    )
+
+
+async def _run(orchestrator, **kwargs):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        return await orchestrator.run(executor=executor, **kwargs)
+
+
+class TestIngestionOrchestrator:
+
+    async def test_ingests_all_documents(self, corpus):
+        service = FakeService()
+
+        report = await _run(_orchestrator(corpus, service, extraction_concurrency=3))
+
+        assert len(report.results) == 6
+        assert not report.failures
+        assert sorted(service.written) == [f"paper{i}.pdf" for i in range(6)]
+        assert service.max_in_flight <= 3
+        assert service.max_writes_in_flight == 1
+        records = corpus.list_documents()
+        assert {r.status for r in records} == {"completed"}
+        assert all(r.entity_count == 1 for r in records)
+        assert (corpus.markdown_directory / "paper0.md").read_text() == "paper0 converted with fake"
+        assert report.stages["convert"].completed == 6
+        assert report.stages["write"].completed == 6
+
+    async def test_resumes_from_tracker_status(self, corpus):
+        await _run(_orchestrator(corpus, FakeService()), max_documents=2)
+
+        service = FakeService()
+        report = await _run(_orchestrator(corpus, service))
+
+        assert report.skipped == 2
+        assert len(service.written) == 4
+
+    async def test_reuses_saved_markdown(self, corpus):
+        await _run(_orchestrator(corpus, FakeService()))
+        corpus.update_documents({r.id: {"status": "not_started"} for r in corpus.list_documents()})
+        conversions.clear()
+
+        report = await _run(_orchestrator(corpus, FakeService()))
+
+        assert conversions == []
+        assert len(report.results) == 6
+
+    async def test_failures_are_isolated_and_tracked(self, corpus):
+        service = FakeService(fail_on={"paper3.pdf"})
+
+        report = await _run(_orchestrator(corpus, service))
+
+        assert len(report.results) == 5
+        [(doc_id, error)] = report.failures.items()
+        assert error == "extract: LLM unavailable"
+        record = corpus.get_document(doc_id)
+        assert record.status == "failed"
+        assert record.error_message == "extract: LLM unavailable"
+
+        retry = await _run(_orchestrator(corpus, FakeService()), retry_failed=False)
+        assert retry.results == []
+
+    async def test_slow_writer_applies_backpressure(self, corpus):
+        service = FakeService(write_delay=0.02)
+
+        report = await _run(_orchestrator(corpus, service, queue_size=1, extraction_concurrency=1))
+
+        assert len(report.results) == 6
+        assert report.stages["write"].max_queue_depth <= 1
+        assert report.stages["extract"].max_queue_depth <= 1
+
+    async def test_since_cursor_limits_run_to_changed_pdfs(self, corpus):
+        first = await _run(_orchestrator(corpus, FakeService()))
+        (corpus.pdf_directory / "ibd" / "paper6.pdf").write_bytes(b"%PDF-1.4")
+        corpus.update_documents({r.id: {"status": "not_started"} for r in corpus.list_documents()})
+
+        service = FakeService()
+        report = await _run(_orchestrator(corpus, service), since=first.cursor)
+
+        assert service.written == ["paper6.pdf"]
+        assert report.cursor > first.cursor
+
+    async def test_truncated_run_keeps_the_cursor(self, corpus):
+        partial = await _run(_orchestrator(corpus, FakeService()), max_documents=2)
+
+        assert partial.cursor == 0
+        service = FakeService()
+        await _run(_orchestrator(corpus, service), since=partial.cursor)
+        assert len(service.written) == 4
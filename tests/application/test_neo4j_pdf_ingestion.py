@@ -0,0 +1,139 @@
+"""Unit tests for Neo4jPDFIngestionService batched persistence."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+from application.services import neo4j_pdf_ingestion as module
+from application.services.neo4j_pdf_ingestion import (
+    ExtractionResult,
+    Neo4jPDFIngestionService,
+    PDFDocument,
+)
+
+
+def _make_service(write_batch_size=1000, fail_on_label=None):
+    """Build a service around a mock async driver that echoes batch sizes."""
+    calls = []
+
+    async def tx_run(query, params):
+        calls.append((query, params))
+        if fail_on_label and f"`{fail_on_label}`" in query:
+            raise RuntimeError("boom")
+        result = MagicMock()
+        written = len(params["rows"]) if "rows" in params else 0
+        result.single = AsyncMock(return_value={"written": written})
+        return result
+
+    tx = MagicMock()
+    tx.run = AsyncMock(side_effect=tx_run)
+
+    async def execute_write(work):
+        return await work(tx)
+
+    session = AsyncMock()
+    session.execute_write.side_effect = execute_write
+    ctx = AsyncMock()
+    ctx.__aenter__.return_value = session
+    ctx.__aexit__.return_value = False
+    driver = MagicMock()
+    driver.session = MagicMock(return_value=ctx)
+
+    # Skip __init__: it builds a PDF converter and an OpenAI client
+    service = Neo4jPDFIngestionService.__new__(Neo4jPDFIngestionService)
+    service.driver = driver
+    service.write_batch_size = write_batch_size
+    service._indexes_ensured = False
+    return service, session, calls
+
+
+def _result(entities, relationships):
+    document = PDFDocument(
+        path=Path("PDFs/ibd/guide.pdf"), filename="guide.pdf", category="ibd", size_bytes=10
+    )
+    return ExtractionResult(
+        document=document,
+        entities=entities,
+        relationships=relationships,
+        extraction_time_seconds=0.1,
+    )
+
+
+ENTITIES = [
+    {"name": "Inflammatory Bowel Disease", "type": "Disease", "confidence": 0.9},
+    {"name": "Crohn's Disease", "type": "Disease"},
+    {"name": "Infliximab", "type": "Drug"},
+    {"name": "Adalimumab", "type": "Drug"},
+    {"name": "TNF", "type": "Protein"},
+]
+
+
+class TestPersistToNeo4j:
+
+    async def test_entities_are_batched_per_label(self):
+        service, session, calls = _make_service(write_batch_size=1)
+
+        stats = await service.persist_to_neo4j(_result(ENTITIES, []))
+
+        entity_calls = [(q, p) for q, p in calls if "ExtractedEntity:`" in q]
+        labels = sorted(q.split("ExtractedEntity:`")[1].split("`")[0] for q, _ in entity_calls)
+        assert labels == ["Disease", "Disease", "Drug", "Drug", "Protein"]
+        assert stats["entities_added"] == 5
+        assert stats["rows_written"] == 5
+        assert stats["rows_per_second"] > 0
+        # Document + chunk in one statement, indexes created once per service
+        assert calls[0][0] == module.MERGE_DOCUMENT_QUERY
+        assert session.run.await_count == len(module.INGESTION_INDEX_QUERIES)
+
+        await service.persist_to_neo4j(_result(ENTITIES, []))
+        assert session.run.await_count == len(module.INGESTION_INDEX_QUERIES)
+
+    async def test_relationships_resolve_names_and_abbreviations(self):
+        service, _, calls = _make_service()
+        relationships = [
+            {"source": "Infliximab", "target": "IBD", "type": "TREATS"},
+            {"source": "adalimumab", "target": "tnf", "type": "INHIBITS"},
+            {"source": "Infliximab", "target": "Unknown Thing", "type": "TREATS"},
+        ]
+
+        stats = await service.persist_to_neo4j(_result(ENTITIES, relationships))
+
+        [(_, params)] = [(q, p) for q, p in calls if q == module.MERGE_LINKS_QUERY]
+        assert params["rows"] == [
+            {
+                "source_id": "extracted:infliximab",
+                "target_id": "extracted:inflammatory_bowel_disease",
+                "type": "TREATS",
+                "description": "",
+            },
+            {
+                "source_id": "extracted:adalimumab",
+                "target_id": "extracted:tnf",
+                "type": "INHIBITS",
+                "description": "",
+            },
+        ]
+        assert stats["relationships_added"] == 2
+        assert stats["relationships_skipped"] == 1
+
+    async def test_failed_batch_does_not_stop_others(self):
+        service, _, _ = _make_service(fail_on_label="Drug")
+
+        stats = await service.persist_to_neo4j(_result(ENTITIES, []))
+
+        assert stats["failed_batches"] == 1
+        assert stats["entities_added"] == 3
+
+    async def test_failed_index_creation_is_retried(self):
+        service, session, _ = _make_service()
+        session.run.side_effect = [RuntimeError("unavailable")] + [None] * 20
+
+        await service.persist_to_neo4j(_result(ENTITIES, []))
+        assert not service._indexes_ensured
+
+        await service.persist_to_neo4j(_result(ENTITIES, []))
+        assert service._indexes_ensured
+
+    def test_reverse_abbreviation_index(self):
+        by_name = Neo4jPDFIngestionService.ABBREVIATIONS_BY_NAME
+        assert by_name["inflammatory bowel disease"] == ["IBD"]
+        assert "IL" in by_name["interleukin"]
@@ -0,0 +1,46 @@
+"""Unit tests for NGramBlockingIndex."""
+
+import pytest
+
+from application.services.ngram_blocking_index import NGramBlockingIndex, ngrams
+
+
+@pytest.fixture
+def index():
+    index = NGramBlockingIndex(max_candidates=2)
+    index.add("Medication", "m1", "metformin")
+    index.add("Medication", "m2", "metoprolol")
+    index.add("Medication", "m3", "aspirin")
+    index.add("Diagnosis", "d1", "metformin toxicity")
+    return index
+
+
+class TestNGramBlockingIndex:
+
+    def test_ngrams_pad_short_text(self):
+        assert ngrams("ab") == {"  a", " ab", "ab "}
+
+    def test_candidates_ranked_by_overlap(self, index):
+        assert list(index.candidates("Medication", "metformn")) == ["m1", "m2"]
+
+    def test_candidates_respect_limit_and_block(self, index):
+        assert list(index.candidates("Medication", "metformin", limit=1)) == ["m1"]
+        assert list(index.candidates("Diagnosis", "metformin")) == ["d1"]
+        assert index.candidates("Allergy", "metformin") == {}
+
+    def test_no_shared_grams_no_candidates(self, index):
+        assert index.candidates("Medication", "xyz") == {}
+
+    def test_add_replaces_text(self, index):
+        index.add("Medication", "m3", "metformin xr")
+
+        assert index.text("Medication", "m3") == "metformin xr"
+        assert index.candidates("Medication", "asp") == {}
+        assert len(index) == 4
+
+    def test_remove(self, index):
+        assert index.remove("m1") is True
+        assert index.remove("m1") is False
+
+        assert "m1" not in index.candidates("Medication", "metformin")
+        assert index.keys("Medication") == {"m2", "m3"}
@@ -0,0 +1,170 @@
+"""Unit tests for the patient context cache and its use by PatientMemoryService."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from application.services.patient_context_cache import PatientContextCache
+
+
+class FakeRedis:
+    """The subset of redis.asyncio used by the cache, backed by a dict."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+
+class TestPatientContextCache:
+
+    async def test_invalidate_retires_cached_context(self):
+        cache = PatientContextCache()
+        version = await cache.version("p1")
+        await cache.put("p1", version, "context")
+
+        assert await cache.get("p1", version) == "context"
+
+        await cache.invalidate("p1")
+
+        new_version = await cache.version("p1")
+        assert new_version == version + 1
+        assert await cache.get("p1", new_version) is None
+        assert cache.stats()["hits"] == 1
+
+    async def test_context_built_across_a_write_is_never_served(self):
+        cache = PatientContextCache()
+        version = await cache.version("p1")
+        # A mutator commits while the context is being built
+        await cache.invalidate("p1")
+        await cache.put("p1", version, "stale")
+
+        assert await cache.get("p1", await cache.version("p1")) is None
+
+    async def test_lru_eviction_and_ttl(self):
+        cache = PatientContextCache(max_entries=2)
+        for pid in ("p1", "p2", "p3"):
+            await cache.put(pid, 0, pid)
+
+        assert await cache.get("p1", 0) is None
+        assert await cache.get("p3", 0) == "p3"
+
+        expired = PatientContextCache(ttl_seconds=0)
+        await expired.put("p1", 0, "context")
+        assert await expired.get("p1", 0) is None
+
+
+@pytest.fixture
+def patient_memory():
+    pytest.importorskip("mem0")
+    pytest.importorskip("redis")
+    from application.services.patient_memory_service import PatientMemoryService
+
+    mem0 = MagicMock()
+    mem0.get_all.return_value = {"results": [
+        {"memory": "Patient reports abdominal pain", "created_at": datetime.now().isoformat()},
+    ]}
+    neo4j = AsyncMock()
+    neo4j.query_raw.return_value = [{
+        "p": {"id": "p1"},
+        "diagnoses": [],
+        "medications": [],
+        "allergies": ["penicillin"],
+        "procedures": [],
+        "medical_devices": [],
+    }]
+    return PatientMemoryService(mem0, neo4j, AsyncMock())
+
+
+class TestPatientMemoryServiceCaching:
+
+    async def test_repeat_reads_skip_backends(self, patient_memory):
+        first = await patient_memory.get_patient_context("p1")
+        second = await patient_memory.get_patient_context("p1")
+
+        assert second is first
+        assert patient_memory.mem0.get_all.call_count == 1
+        assert patient_memory.neo4j.query_raw.await_count == 1
+
+    async def test_mutators_invalidate(self, patient_memory):
+        await patient_memory.get_patient_context("p1")
+
+        await patient_memory.add_allergy("p1", "latex", "rash")
+        await patient_memory.get_patient_context("p1")
+        await patient_memory.get_patient_context("p2")
+
+        assert patient_memory.mem0.get_all.call_count == 3
+
+    async def test_failed_mutator_still_invalidates(self, patient_memory):
+        await patient_memory.get_patient_context("p1")
+        patient_memory.neo4j.add_entity.side_effect = RuntimeError("neo4j down")
+
+        with pytest.raises(RuntimeError):
+            await patient_memory.add_diagnosis("p1", "Crohn's disease")
+        await patient_memory.get_patient_context("p1")
+
+        assert patient_memory.mem0.get_all.call_count == 2
+
+    async def test_redis_tier_shares_contexts_and_versions(self, patient_memory):
+        redis = FakeRedis()
+        patient_memory.context_cache = PatientContextCache(redis=redis)
+        built = await patient_memory.get_patient_context("p1")
+
+        # A second worker with a cold in-process tier reads through Redis
+        other = PatientContextCache(redis=redis)
+        shared = await other.get("p1", await other.version("p1"))
+        assert shared.allergies == built.allergies
+        assert isinstance(shared.last_updated, datetime)
+
+        await patient_memory.add_allergy("p1", "latex", "rash")
+        assert await other.get("p1", await other.version("p1")) is None
+
+    async def test_context_without_mem0_is_not_cached(self, patient_memory):
+        from infrastructure.async_mem0_client import Mem0TimeoutError
+
+        patient_memory.memories = AsyncMock()
+        patient_memory.memories.get_all.side_effect = Mem0TimeoutError("slow")
+
+        context = await patient_memory.get_patient_context("p1")
+        await patient_memory.get_patient_context("p1")
+
+        assert context.allergies == ["penicillin"]
+        assert context.mem0_memories == []
+        assert patient_memory.neo4j.query_raw.await_count == 2
+
+    async def test_message_is_logged_when_mem0_times_out(self, patient_memory):
+        from application.services.patient_memory_service import ConversationMessage
+
+        landed = threading.Event()
+
+        def slow_add(*args, **kwargs):
+            time.sleep(0.1)
+            landed.set()
+
+        patient_memory.mem0.add.side_effect = slow_add
+        patient_memory.memories.write_timeout_seconds = 0.01
+        patient_memory.redis.get_session.return_value = None
+
+        await patient_memory.store_message(
+            ConversationMessage("user", "My knee hurts", datetime.now(), "p1", "session:1")
+        )
+
+        assert patient_memory.neo4j.add_entity.await_args.kwargs["labels"] == ["Message"]
+        # Context rebuilt while the timed-out add is still running is retired once it lands
+        await patient_memory.get_patient_context("p1")
+        await asyncio.to_thread(landed.wait, 1)
+        await asyncio.sleep(0.01)
+        await patient_memory.get_patient_context("p1")
+        assert patient_memory.mem0.get_all.call_count == 2
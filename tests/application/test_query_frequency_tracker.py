@@ -0,0 +1,143 @@
+"""Unit tests for QueryFrequencyTracker and batched query tracking."""
+
+from unittest.mock import AsyncMock
+
+from application.services.automatic_layer_transition import (
+    AutomaticLayerTransitionService,
+    PromotionThresholds,
+)
+from application.services.query_frequency_tracker import (
+    FLUSH_QUERY_STATE,
+    LOAD_QUERY_STATE,
+    QueryFrequencyTracker,
+)
+from domain.event import KnowledgeEvent
+from domain.roles import Role
+
+
+class FakeGraph:
+    """Entity nodes keyed by ID, answering the tracker's two queries."""
+
+    def __init__(self, layers):
+        self.nodes = {entity_id: {"layer": layer} for entity_id, layer in layers.items()}
+        self.loads = 0
+        self.flushes = 0
+
+    async def query_raw(self, query, params):
+        if query == LOAD_QUERY_STATE:
+            self.loads += 1
+            return [{"id": key, **self.nodes[key]} for key in params["ids"] if key in self.nodes]
+        if query == FLUSH_QUERY_STATE:
+            self.flushes += 1
+            written = [row for row in params["rows"] if row["id"] in self.nodes]
+            for row in written:
+                self.nodes[row["id"]].update({k: v for k, v in row.items() if k != "id"})
+            return [{"id": row["id"]} for row in written]
+        raise AssertionError(f"unexpected query: {query}")
+
+
+def _query_event(*entity_ids, cache_hit=True):
+    return KnowledgeEvent(
+        action="query_executed",
+        data={"entities_involved": list(entity_ids), "cache_hit": cache_hit},
+        role=Role.KNOWLEDGE_MANAGER,
+    )
+
+
+def _service(graph, max_entries=100):
+    event_bus = AsyncMock()
+    return AutomaticLayerTransitionService(
+        backend=graph,
+        event_bus=event_bus,
+        thresholds=PromotionThresholds(reasoning_query_frequency=3),
+        query_tracker=QueryFrequencyTracker(graph, max_entries=max_entries, flush_interval_seconds=3600),
+    )
+
+
+class TestQueryFrequencyTracker:
+
+    def test_memory_is_bounded(self):
+        tracker = QueryFrequencyTracker(backend=None, max_entries=10)
+
+        for i in range(1000):
+            tracker.record(tracker.get_or_create(f"e{i}"), cache_hit=True)
+
+        assert len(tracker) == 10
+        assert "e999" in tracker and "e0" not in tracker
+        assert tracker.get_statistics()["evictions"] == 990
+
+    async def test_evicted_counts_are_flushed_and_reloaded(self):
+        graph = FakeGraph({f"e{i}": "REASONING" for i in range(5)})
+        tracker = QueryFrequencyTracker(graph, max_entries=2)
+
+        for _ in range(2):
+            for i in range(5):
+                tracker.record(tracker.get_or_create(f"e{i}"), cache_hit=False)
+        assert await tracker.flush() == 5
+        assert graph.flushes == 1
+
+        states = await tracker.load_states(["e0", "missing"])
+        resumed = tracker.get_or_create("e0", states["e0"])
+
+        assert list(states) == ["e0"]
+        assert resumed.query_count == 2
+        assert resumed.cache_misses == 2
+        assert resumed.first_query_at is not None
+
+    async def test_nodes_without_entity_label_use_backend_lookup(self):
+        graph = FakeGraph({})
+        table = {"name": "patients", "layer": "REASONING", "query_count": 4}
+        graph.get_entity = AsyncMock(
+            side_effect=lambda key: {"id": key, "properties": table} if key == "patients" else None
+        )
+        graph.update_entity_properties = AsyncMock(return_value=True)
+        tracker = QueryFrequencyTracker(graph)
+
+        states = await tracker.load_states(["patients", "missing"])
+        tracker.record(tracker.get_or_create("patients", states["patients"]), cache_hit=True)
+        assert await tracker.flush() == 1
+
+        assert list(states) == ["patients"]
+        assert states["patients"]["layer"] == "REASONING"
+        entity_id, properties = graph.update_entity_properties.await_args.args
+        assert (entity_id, properties["query_count"]) == ("patients", 5)
+
+    async def test_failed_flush_keeps_changes(self):
+        graph = FakeGraph({"e1": "REASONING"})
+        graph.query_raw = AsyncMock(side_effect=ConnectionError("down"))
+        tracker = QueryFrequencyTracker(graph)
+        tracker.record(tracker.get_or_create("e1"), cache_hit=True)
+
+        assert await tracker.flush() == 0
+        assert tracker.get_statistics()["pending"] == 1
+
+
+class TestBatchedQueryTracking:
+
+    async def test_one_lookup_per_event(self):
+        graph = FakeGraph({"r1": "REASONING", "r2": "REASONING", "s1": "SEMANTIC"})
+        service = _service(graph)
+
+        await service._handle_query_executed(_query_event("r1", "r2", "s1", "unknown"))
+        await service._handle_query_executed(_query_event("r1", {"id": "r2", "layer": "REASONING"}))
+
+        assert graph.loads == 2
+        assert "r1" in service._query_trackers and "s1" not in service._query_trackers
+        assert service._get_or_create_tracker("r2").query_count == 2
+
+    async def test_promotion_decision_survives_restart(self):
+        graph = FakeGraph({"r1": "REASONING"})
+        before = _service(graph)
+        for _ in range(2):
+            await before._handle_query_executed(_query_event({"id": "r1", "layer": "REASONING"}))
+        await before.flush_query_counts()
+
+        after = _service(graph)
+        after._promote_entity = AsyncMock()
+        graph.get_entity = AsyncMock(return_value={"id": "r1", "properties": graph.nodes["r1"]})
+        await after._handle_query_executed(_query_event({"id": "r1", "layer": "REASONING"}))
+
+        after._promote_entity.assert_awaited_once()
+        assert "3 queries" in after._promote_entity.await_args.kwargs["reason"]
+        await after.flush_query_counts()
+        assert graph.nodes["r1"]["query_count"] == 0
@@ -0,0 +1,121 @@
+"""Unit tests for TextChunker and StreamingTextChunker."""
+
+import pytest
+
+from application.services.text_chunker import (
+    StreamingTextChunker,
+    TextChunker,
+    estimate_tokens,
+    iter_file_blocks,
+)
+
+
+def _document(paragraphs=40):
+    return "\n\n".join(
+        f"# Section {i}\n\nCrohn's disease is treated with infliximab. " * 3 for i in range(paragraphs)
+    )
+
+
+@pytest.fixture
+def chunker():
+    return StreamingTextChunker(max_tokens=40, overlap_tokens=10, token_counter=estimate_tokens)
+
+
+class TestTextChunker:
+
+    def test_chunk_ids_and_sequence(self):
+        chunks = TextChunker(chunk_size=200, chunk_overlap=20).chunk_text(_document(5), doc_id="doc:x")
+
+        assert [c.id for c in chunks] == [f"doc:x_chunk_{i}" for i in range(len(chunks))]
+        assert all(c.metadata["total_chunks"] == len(chunks) for c in chunks)
+
+
+class TestStreamingTextChunker:
+
+    def test_offsets_are_exact_for_repeated_text(self, chunker):
+        text = _document()
+
+        chunks = list(chunker.iter_chunks(text, doc_id="doc:x"))
+
+        assert len(chunks) > 10
+        for chunk in chunks:
+            assert text[chunk.start_char:chunk.end_char] == chunk.text
+        assert [c.sequence for c in chunks] == list(range(len(chunks)))
+
+    def test_chunks_respect_token_limit(self, chunker):
+        chunks = list(chunker.iter_chunks(_document()))
+
+        assert max(estimate_tokens(c.text) for c in chunks) <= 40
+        assert all(c.metadata["token_count"] <= 40 for c in chunks)
+
+    def test_consecutive_chunks_overlap(self, chunker):
+        chunks = list(chunker.iter_chunks(_document()))
+
+        for previous, current in zip(chunks, chunks[1:]):
+            assert current.start_char < previous.end_char
+            assert current.start_char > previous.start_char
+
+    def test_covers_whole_document(self, chunker):
+        text = _document()
+        chunks = list(chunker.iter_chunks(text))
+
+        assert chunks[0].start_char == 0
+        assert chunks[-1].end_char == len(text.rstrip())
+        for previous, current in zip(chunks, chunks[1:]):
+            assert not text[previous.end_char:current.start_char].strip()
+
+    def test_block_stream_matches_whole_string(self, chunker):
+        text = _document()
+        blocks = [text[i:i + 37] for i in range(0, len(text), 37)]
+
+        streamed = list(chunker.iter_chunks(blocks))
+
+        assert [(c.start_char, c.text) for c in streamed] == [
+            (c.start_char, c.text) for c in chunker.iter_chunks(text)
+        ]
+
+    def test_text_without_separators_is_split_by_tokens(self):
+        chunker = StreamingTextChunker(max_tokens=5, overlap_tokens=0, token_counter=len)
+        text = "x" * 23
+
+        chunks = list(chunker.iter_chunks(text))
+
+        assert [len(c.text) for c in chunks] == [5, 5, 5, 5, 3]
+        assert "".join(c.text for c in chunks) == text
+
+    def test_buffer_is_bounded_without_blank_lines(self):
+        chunker = StreamingTextChunker(
+            max_tokens=20, overlap_tokens=0, token_counter=estimate_tokens, max_buffer_chars=100
+        )
+        consumed = []
+
+        def blocks():
+            for i in range(1000):
+                consumed.append(i)
+                yield f"line {i} without a blank line\n"
+
+        first = next(chunker.iter_chunks(blocks()))
+
+        assert first.text.startswith("line 0")
+        assert len(consumed) < 10
+
+    def test_file_chunks_handle_multibyte_boundaries(self, tmp_path, chunker):
+        text = "Enfermedad de Crohn: inflamación crónica — ñandú. " * 200
+        path = tmp_path / "doc.md"
+        path.write_text(text, encoding="utf-8")
+
+        assert "".join(iter_file_blocks(str(path), block_size=7)) == text
+        chunks = list(chunker.iter_file_chunks(str(path), doc_id="doc:x", block_size=7))
+        for chunk in chunks:
+            assert text[chunk.start_char:chunk.end_char] == chunk.text
+
+    def test_empty_input(self, tmp_path, chunker):
+        path = tmp_path / "empty.md"
+        path.write_text("")
+
+        assert list(chunker.iter_chunks("")) == []
+        assert list(chunker.iter_file_chunks(str(path))) == []
+
+    def test_rejects_overlap_not_below_limit(self):
+        with pytest.raises(ValueError):
+            StreamingTextChunker(max_tokens=10, overlap_tokens=10)
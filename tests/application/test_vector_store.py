@@ -0,0 +1,187 @@
+"""Unit tests for SegmentedVectorStore."""
+
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+faiss = pytest.importorskip("faiss")
+
+from application.services.vector_store import SegmentedVectorStore
+
+
+def _vectors(n, dim=8, seed=0):
+    return np.random.default_rng(seed).normal(size=(n, dim)).astype("float32")
+
+
+def _add(store, doc_id, vectors, source=None):
+    ids = [f"{doc_id}_chunk_{i}" for i in range(len(vectors))]
+    store.add_document(doc_id, ids, [f"text {i}" for i in ids], vectors, source=source)
+    return ids
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SegmentedVectorStore(str(tmp_path / "store"), merge_factor=100, compact_dead_ratio=1.0)
+    yield store
+    store.close()
+
+
+class TestSegmentedVectorStore:
+
+    def test_search_spans_segments(self, store):
+        a, b = _vectors(5, seed=1), _vectors(5, seed=2)
+        ids_a = _add(store, "doc:a", a)
+        ids_b = _add(store, "doc:b", b)
+
+        assert store.segment_count == 2
+        assert store.search(a[3], top_k=1)[0].chunk_id == ids_a[3]
+        hit = store.search(b[0], top_k=1)[0]
+        assert hit.chunk_id == ids_b[0]
+        assert hit.doc_id == "doc:b"
+        assert hit.text == f"text {ids_b[0]}"
+        assert hit.distance == pytest.approx(0.0, abs=1e-5)
+
+    def test_reingest_replaces_previous_vectors(self, store):
+        old = _vectors(4, seed=1)
+        _add(store, "doc:v1", old, source="/docs/guide.pdf")
+        new = _vectors(3, seed=2)
+        new_ids = _add(store, "doc:v2", new, source="/docs/guide.pdf")
+
+        assert len(store) == 3
+        results = store.search(old[0], top_k=10)
+        assert {hit.chunk_id for hit in results} == set(new_ids)
+
+    def test_delete_document(self, store):
+        _add(store, "doc:a", _vectors(3, seed=1))
+        ids_b = _add(store, "doc:b", _vectors(3, seed=2))
+
+        assert store.delete_document("doc:a") == 3
+        assert store.delete_document("doc:a") == 0
+        assert {hit.chunk_id for hit in store.search(_vectors(1)[0], top_k=10)} == set(ids_b)
+        assert store.chunk_ids("doc:a") == []
+
+    def test_tombstones_do_not_crowd_out_live_rows(self, store):
+        vectors = _vectors(20, seed=1)
+        _add(store, "doc:a", vectors)
+        _add(store, "doc:b", vectors[:1] + 100)
+        store.delete_document("doc:a")
+
+        results = store.search(vectors[0], top_k=1)
+
+        assert [hit.doc_id for hit in results] == ["doc:b"]
+
+    def test_compaction_keeps_live_vectors(self, store):
+        a, b = _vectors(6, seed=1), _vectors(6, seed=2)
+        _add(store, "doc:a", a)
+        ids_b = _add(store, "doc:b", b)
+        store.delete_document("doc:a")
+
+        store.compact()
+
+        assert store.segment_count == 1
+        assert len(store) == 6
+        assert [store.search(v, top_k=1)[0].chunk_id for v in b] == ids_b
+        assert len([f for f in os.listdir(store.path) if f.endswith(".npy")]) == 1
+
+    def test_small_segments_merge_without_rewriting_large_ones(self, tmp_path):
+        store = SegmentedVectorStore(str(tmp_path / "store"), merge_factor=3)
+        _add(store, "doc:large", _vectors(9, seed=99))
+        large = set(store._segments)
+        for i in range(2):
+            _add(store, f"doc:{i}", _vectors(1, seed=i))
+        assert store.segment_count == 3
+
+        _add(store, "doc:2", _vectors(1, seed=2))
+
+        assert store.segment_count == 2
+        assert large <= set(store._segments)
+        assert len(store) == 12
+        store.close()
+
+    def test_merges_cascade_up_the_tiers(self, tmp_path):
+        store = SegmentedVectorStore(str(tmp_path / "store"), merge_factor=3)
+        for i in range(9):
+            _add(store, f"doc:{i}", _vectors(1, seed=i))
+
+        assert store.segment_count == 1
+        assert len(store) == 9
+        store.close()
+
+    def test_mostly_dead_segment_is_rewritten_alone(self, tmp_path):
+        store = SegmentedVectorStore(str(tmp_path / "store"), merge_factor=100)
+        _add(store, "doc:a", _vectors(4, seed=1))
+        other = set(store._segments)
+        vectors = _vectors(2, seed=2)
+        ids = _add(store, "doc:b", np.vstack([vectors, _vectors(4, seed=3)]))
+        # Re-owning most of doc:b's chunks leaves its segment mostly dead
+        store.add_document("doc:c", ids[2:], ["c"] * 4, _vectors(4, seed=4))
+
+        assert other <= set(store._segments)
+        assert all(segment.dead == 0 for segment in store._segments.values())
+        assert [store.search(v, top_k=1)[0].chunk_id for v in vectors] == ids[:2]
+        store.close()
+
+    def test_reopen_from_disk(self, tmp_path):
+        path = str(tmp_path / "store")
+        vectors = _vectors(5)
+        store = SegmentedVectorStore(path)
+        ids = _add(store, "doc:a", vectors)
+        store.close()
+
+        reopened = SegmentedVectorStore(path)
+
+        assert len(reopened) == 5
+        assert reopened.search(vectors[2], top_k=1)[0].chunk_id == ids[2]
+        assert reopened.get_text(ids[2]) == f"text {ids[2]}"
+        reopened.close()
+
+    def test_orphan_segment_files_are_removed(self, tmp_path):
+        path = str(tmp_path / "store")
+        store = SegmentedVectorStore(path)
+        _add(store, "doc:a", _vectors(2))
+        store.close()
+        open(os.path.join(path, "seg-000099.index"), "wb").close()
+
+        reopened = SegmentedVectorStore(path)
+
+        assert not os.path.exists(os.path.join(path, "seg-000099.index"))
+        assert len(reopened) == 2
+        reopened.close()
+
+    def test_skips_segments_of_other_dimension(self, store):
+        _add(store, "doc:small", _vectors(3, dim=4))
+        ids = _add(store, "doc:large", _vectors(3, dim=8))
+
+        assert {hit.chunk_id for hit in store.search(_vectors(1, dim=8)[0], top_k=10)} == set(ids)
+
+    @pytest.mark.parametrize("index_type", ["ivf", "hnsw"])
+    def test_approximate_index_types(self, tmp_path, index_type):
+        store = SegmentedVectorStore(str(tmp_path / "store"), index_type=index_type, ivf_nprobe=64)
+        vectors = _vectors(400, dim=16)
+        ids = _add(store, "doc:a", vectors)
+
+        assert store.search(vectors[7], top_k=1)[0].chunk_id == ids[7]
+        store.close()
+
+    def test_rejects_misaligned_input(self, store):
+        with pytest.raises(ValueError):
+            store.add_document("doc:a", ["c1", "c2"], ["t1"], _vectors(2))
+
+    def test_import_legacy_index(self, tmp_path, store):
+        vectors = _vectors(4)
+        legacy = faiss.IndexFlatL2(8)
+        legacy.add(vectors)
+        chunk_ids = ["doc:a_chunk_0", "doc:a_chunk_1", "doc:b_chunk_0", "doc:b_chunk_1"]
+        index_file, meta_file = str(tmp_path / "old.index"), str(tmp_path / "old.meta")
+        faiss.write_index(legacy, index_file)
+        with open(meta_file, "wb") as f:
+            pickle.dump({"chunk_ids": chunk_ids, "chunk_store": {c: c.upper() for c in chunk_ids}}, f)
+
+        assert store.import_legacy(index_file, meta_file) == 4
+
+        assert store.chunk_ids("doc:b") == ["doc:b_chunk_0", "doc:b_chunk_1"]
+        assert store.search(vectors[2], top_k=1)[0].text == "DOC:B_CHUNK_0"
+        assert not os.path.exists(index_file)
+        assert os.path.exists(f"{index_file}.migrated")
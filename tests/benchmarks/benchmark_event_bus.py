@@ -0,0 +1,216 @@
+"""Event Bus Benchmark: serializers and consumer concurrency.
+
+Measures the two halves of the distributed event bus throughput:
+
+Serialization:  Encode + decode rate of a representative knowledge event
+                for every installed serializer (json, orjson, msgpack).
+Consumption:    Events per second through a ``ConsumerPool`` whose handler
+                waits ~1 ms per event (a database write), at concurrency 1
+                (the original sequential consumer) and at higher concurrency.
+
+Neither half needs a broker, so the benchmark runs anywhere.
+
+Usage:
+    uv run pytest tests/benchmarks/benchmark_event_bus.py -v -s
+    uv run python tests/benchmarks/benchmark_event_bus.py [events] [concurrency]
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+DEFAULT_SERIALIZATION_EVENTS = 20_000
+DEFAULT_CONSUMED_EVENTS = 2_000
+DEFAULT_CONCURRENCY = 8
+HANDLER_LATENCY_SECONDS = 0.001
+
+# ---------------------------------------------------------------------------
+# Data structures
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class SerializerResult:
+    """Round-trip rate of one serializer."""
+
+    name: str
+    content_type: str
+    payload_bytes: int
+    events_per_second: float
+
+
+@dataclass
+class ConsumerResult:
+    """Throughput of a consumer pool at one concurrency level."""
+
+    concurrency: int
+    events: int
+    elapsed_seconds: float
+    events_per_second: float
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _sample_event(index: int):
+    from domain.event import KnowledgeEvent
+    from domain.roles import Role
+
+    return KnowledgeEvent(
+        action="create_entity",
+        data={
+            "id": f"bench:entity:{index}",
+            "patient_id": f"bench:patient:{index % 50}",
+            "labels": ["Medication", "Entity"],
+            "properties": {
+                "name": "metformin",
+                "dosage": "500mg",
+                "frequency": "twice daily",
+                "confidence": 0.92,
+                "layer": "SEMANTIC",
+            },
+        },
+        role=Role.DATA_ENGINEER,
+    )
+
+
+class _Delivery:
+    async def ack(self):
+        pass
+
+    async def reject(self, requeue=False):
+        pass
+
+
+def _bench_serializer(name: str, count: int) -> SerializerResult:
+    from infrastructure.event_bus.serialization import decode_event, get_event_serializer
+
+    serializer = get_event_serializer(name)
+    events = [_sample_event(i) for i in range(count)]
+    start = time.perf_counter()
+    for event in events:
+        decode_event(serializer.encode(event), serializer.content_type)
+    elapsed = time.perf_counter() - start
+    return SerializerResult(
+        name=name,
+        content_type=serializer.content_type,
+        payload_bytes=len(serializer.encode(events[0])),
+        events_per_second=round(count / elapsed),
+    )
+
+
+async def _bench_consumer(concurrency: int, count: int) -> ConsumerResult:
+    from infrastructure.event_bus.consumer_pool import ConsumerPool
+
+    async def handler(event):
+        await asyncio.sleep(HANDLER_LATENCY_SECONDS)
+
+    pool = ConsumerPool("bench", handler, concurrency=concurrency, ordering_key=lambda e: e.data["patient_id"])
+    pool.start()
+    events = [_sample_event(i) for i in range(count)]
+    start = time.perf_counter()
+    for event in events:
+        await pool.submit(event, _Delivery())
+    await pool.stop()
+    elapsed = time.perf_counter() - start
+    return ConsumerResult(concurrency, count, round(elapsed, 3), round(count / elapsed))
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+
+async def run_benchmark(
+    serialization_events: int = DEFAULT_SERIALIZATION_EVENTS,
+    consumed_events: int = DEFAULT_CONSUMED_EVENTS,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> Dict[str, Any]:
+    """Time serializer round trips and consumer pool throughput.
+
+    Args:
+        serialization_events: Events encoded and decoded per serializer.
+        consumed_events: Events pushed through each consumer pool.
+        concurrency: Worker count compared against the sequential consumer.
+
+    Returns:
+        Dict with the configuration, serializer results and consumer results.
+    """
+    serializers: List[SerializerResult] = []
+    for name in ("json", "orjson", "msgpack"):
+        try:
+            result = _bench_serializer(name, serialization_events)
+        except ValueError:
+            logger.info("Skipping %s serializer (not installed)", name)
+            continue
+        serializers.append(result)
+        logger.info("%s: %d events/s, %d bytes", name, result.events_per_second, result.payload_bytes)
+
+    consumers: List[ConsumerResult] = []
+    for workers in sorted({1, concurrency}):
+        result = await _bench_consumer(workers, consumed_events)
+        consumers.append(result)
+        logger.info("concurrency %d: %d events/s", workers, result.events_per_second)
+
+    return {
+        "config": {
+            "serialization_events": serialization_events,
+            "consumed_events": consumed_events,
+            "concurrency": concurrency,
+            "handler_latency_ms": HANDLER_LATENCY_SECONDS * 1000,
+        },
+        "serializers": [asdict(r) for r in serializers],
+        "consumers": [asdict(r) for r in consumers],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Pytest entry point
+# ---------------------------------------------------------------------------
+
+
+import pytest  # noqa: E402
+
+
+@pytest.mark.asyncio
+@pytest.mark.benchmark
+async def test_benchmark_event_bus():
+    """Run the event bus benchmark as a pytest test.
+
+    Set RUN_BENCHMARKS=1 to enable it.
+    """
+    if not os.getenv("RUN_BENCHMARKS"):
+        pytest.skip("RUN_BENCHMARKS not set")
+
+    report = await run_benchmark()
+
+    by_concurrency = {r["concurrency"]: r for r in report["consumers"]}
+    assert by_concurrency[DEFAULT_CONCURRENCY]["events_per_second"] > by_concurrency[1]["events_per_second"]
+
+
+# ---------------------------------------------------------------------------
+# CLI entry point
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    import sys
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+
+    cli_events = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CONSUMED_EVENTS
+    cli_concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_CONCURRENCY
+
+    report = asyncio.run(run_benchmark(consumed_events=cli_events, concurrency=cli_concurrency))
+    print(json.dumps(report, indent=2))
@@ -0,0 +1,245 @@
+"""Name Lookup Benchmark: function-wrapped vs indexed case-insensitive matching.
+
+Seeds a synthetic graph of ``:MedicalEntity`` nodes through
+``Neo4jBackend.add_entities_bulk`` (which maintains ``name_lc``) and compares
+query latency for two lookup shapes:
+
+Equality:   ``toLower(n.name) = toLower($name)`` (legacy, scans every node)
+            vs ``n.name_lc = $name_lc`` (``idx_medical_entity_name_lc``).
+Substring:  ``toLower(n.name) CONTAINS ... OR toLower(n.description) CONTAINS ...``
+            (legacy) vs ``AsyncCrossGraphQueryBuilder.search_medical_entities``
+            (``medical_entity_search`` full-text index).
+
+Requires a running Neo4j (``NEO4J_URI``/``NEO4J_USERNAME``/``NEO4J_PASSWORD``).
+Benchmark nodes use the ``bench:`` ID prefix and are removed afterwards.
+
+Usage:
+    uv run pytest tests/benchmarks/benchmark_name_lookup.py -v -s
+    uv run python tests/benchmarks/benchmark_name_lookup.py [node_count] [lookup_count]
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+ID_PREFIX = "bench:"
+DEFAULT_NODE_COUNT = 100_000
+DEFAULT_LOOKUP_COUNT = 200
+
+SYLLABLES = ["car", "dio", "neu", "ro", "gas", "tro", "hep", "ati", "tis", "osis", "pul", "mo", "nary", "derm"]
+
+LEGACY_EQUALITY_QUERY = """
+MATCH (n:MedicalEntity)
+WHERE toLower(n.name) = toLower($name)
+RETURN n.name AS name
+"""
+
+INDEXED_EQUALITY_QUERY = """
+MATCH (n:MedicalEntity)
+WHERE n.name_lc = $name_lc
+RETURN n.name AS name
+"""
+
+LEGACY_SEARCH_QUERY = """
+MATCH (m:MedicalEntity)
+WHERE (toLower(m.name) CONTAINS toLower($search_term)
+   OR toLower(m.description) CONTAINS toLower($search_term))
+RETURN m.name AS name
+ORDER BY m.name
+LIMIT 50
+"""
+
+# ---------------------------------------------------------------------------
+# Data structures
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class LookupResult:
+    """Latency distribution of a single lookup shape."""
+
+    name: str
+    lookups: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _entity_name(rng: random.Random, i: int) -> str:
+    word = "".join(rng.choice(SYLLABLES) for _ in range(3))
+    return f"{word.capitalize()} Syndrome {i}"
+
+
+async def _seed_nodes(backend, node_count: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    names = [_entity_name(rng, i) for i in range(node_count)]
+    rows = [
+        {
+            "id": f"{ID_PREFIX}{i}",
+            "properties": {"name": name, "type": "Disease", "description": f"Synthetic condition {i}"},
+            "labels": ["MedicalEntity", "BenchNode"],
+        }
+        for i, name in enumerate(names)
+    ]
+    await backend.add_entities_bulk(rows, batch_size=5_000)
+    return names
+
+
+async def _cleanup(backend) -> None:
+    while True:
+        records = await backend.query_raw(
+            """
+            MATCH (n:Entity)
+            WHERE n.id STARTS WITH $prefix
+            WITH n LIMIT 10000
+            DETACH DELETE n
+            RETURN count(*) AS deleted
+            """,
+            {"prefix": ID_PREFIX},
+        )
+        if not records or records[0]["deleted"] == 0:
+            break
+
+
+async def _time_lookups(
+    name: str,
+    terms: List[str],
+    lookup: Callable[[str], Awaitable[Any]],
+) -> LookupResult:
+    latencies = []
+    for term in terms:
+        start = time.perf_counter()
+        await lookup(term)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return LookupResult(
+        name=name,
+        lookups=len(terms),
+        mean_ms=round(statistics.fmean(latencies), 2),
+        p50_ms=round(latencies[len(latencies) // 2], 2),
+        p95_ms=round(latencies[int(len(latencies) * 0.95) - 1], 2),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+
+async def run_benchmark(
+    node_count: int = DEFAULT_NODE_COUNT,
+    lookup_count: int = DEFAULT_LOOKUP_COUNT,
+    seed: int = 42,
+) -> Dict[str, Any]:
+    """Seed a synthetic graph and time each name lookup shape.
+
+    Args:
+        node_count: Number of synthetic ``:MedicalEntity`` nodes to create.
+        lookup_count: Lookups timed per shape.
+        seed: Random seed for names and lookup terms.
+
+    Returns:
+        Dict with the configuration and one result per lookup shape.
+    """
+    from application.services.cross_graph_query_builder import AsyncCrossGraphQueryBuilder
+    from infrastructure.neo4j_backend import create_neo4j_backend
+    from infrastructure.node_identity import name_key
+
+    backend = await create_neo4j_backend()
+    builder = AsyncCrossGraphQueryBuilder(backend=backend)
+    try:
+        await backend.create_layer_indexes()
+        logger.info("Seeding %d nodes", node_count)
+        names = await _seed_nodes(backend, node_count, seed)
+        await backend.query_raw("CALL db.awaitIndexes(300)", {})
+
+        rng = random.Random(seed + 1)
+        exact_terms = [rng.choice(names).upper() for _ in range(lookup_count)]
+        search_terms = [rng.choice(names).split()[0][2:7] for _ in range(lookup_count)]
+
+        results = [
+            await _time_lookups(
+                "equality_legacy_tolower", exact_terms,
+                lambda t: backend.query_raw(LEGACY_EQUALITY_QUERY, {"name": t}),
+            ),
+            await _time_lookups(
+                "equality_name_lc_index", exact_terms,
+                lambda t: backend.query_raw(INDEXED_EQUALITY_QUERY, {"name_lc": name_key(t)}),
+            ),
+            await _time_lookups(
+                "search_legacy_contains", search_terms,
+                lambda t: backend.query_raw(LEGACY_SEARCH_QUERY, {"search_term": t}),
+            ),
+            await _time_lookups(
+                "search_fulltext_index", search_terms,
+                lambda t: builder.search_medical_entities(t),
+            ),
+        ]
+        for result in results:
+            logger.info("%s: p50 %.2f ms, p95 %.2f ms", result.name, result.p50_ms, result.p95_ms)
+    finally:
+        await _cleanup(backend)
+        await backend.close()
+
+    return {
+        "config": {"node_count": node_count, "lookup_count": lookup_count, "seed": seed},
+        "results": [asdict(r) for r in results],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Pytest entry point
+# ---------------------------------------------------------------------------
+
+
+import pytest  # noqa: E402
+
+
+@pytest.mark.asyncio
+@pytest.mark.benchmark
+async def test_benchmark_name_lookup():
+    """Run the name lookup benchmark as a pytest test.
+
+    Requires NEO4J_URI pointing at a disposable Neo4j instance.
+    """
+    if not os.getenv("NEO4J_URI"):
+        pytest.skip("NEO4J_URI not set")
+
+    node_count = int(os.getenv("BENCHMARK_NODE_COUNT", DEFAULT_NODE_COUNT))
+    report = await run_benchmark(node_count=node_count)
+
+    by_name = {r["name"]: r for r in report["results"]}
+    assert by_name["equality_name_lc_index"]["p50_ms"] < by_name["equality_legacy_tolower"]["p50_ms"]
+
+
+# ---------------------------------------------------------------------------
+# CLI entry point
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    import sys
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+
+    nodes = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_NODE_COUNT
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_LOOKUP_COUNT
+
+    report = asyncio.run(run_benchmark(node_count=nodes, lookup_count=lookups))
+    print(json.dumps(report, indent=2))
@@ -0,0 +1,220 @@
+"""Node Lookup Benchmark: label-less vs label-scoped relationship inserts.
+
+Seeds a synthetic graph of ``:Entity`` nodes and compares relationship
+insertion throughput for three write paths:
+
+Legacy:     One ``MATCH (source {id: ...})`` per relationship without a label
+            (the pre-identity-subsystem query; an all-nodes scan per endpoint).
+Per-call:   ``Neo4jBackend.add_relationship`` (label-scoped, constraint-backed).
+Bulk:       ``Neo4jBackend.add_relationships_bulk`` (UNWIND batches).
+
+Requires a running Neo4j (``NEO4J_URI``/``NEO4J_USERNAME``/``NEO4J_PASSWORD``).
+Benchmark nodes use the ``bench:`` ID prefix and are removed afterwards.
+
+Usage:
+    uv run pytest tests/benchmarks/benchmark_node_lookup.py -v -s
+    uv run python tests/benchmarks/benchmark_node_lookup.py [node_count] [relationship_count]
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+ID_PREFIX = "bench:"
+DEFAULT_NODE_COUNT = 100_000
+DEFAULT_RELATIONSHIP_COUNT = 2_000
+
+LEGACY_RELATIONSHIP_QUERY = """
+MATCH (source {id: $source_id})
+MATCH (target {id: $target_id})
+MERGE (source)-[r:`BENCH_LINK`]->(target)
+SET r += $properties
+RETURN r
+"""
+
+# ---------------------------------------------------------------------------
+# Data structures
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class WritePathResult:
+    """Throughput of a single relationship write path."""
+
+    name: str
+    relationships: int
+    seconds: float
+
+    @property
+    def per_second(self) -> float:
+        return self.relationships / self.seconds if self.seconds else 0.0
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _relationship_rows(node_count: int, count: int, seed: int) -> List[Dict[str, Any]]:
+    """Pick ``count`` random node pairs from the seeded graph."""
+    rng = random.Random(seed)
+    return [
+        {
+            "source_id": f"{ID_PREFIX}{rng.randrange(node_count)}",
+            "type": "BENCH_LINK",
+            "target_id": f"{ID_PREFIX}{rng.randrange(node_count)}",
+            "properties": {"weight": i},
+        }
+        for i in range(count)
+    ]
+
+
+async def _seed_nodes(backend, node_count: int) -> None:
+    rows = [
+        {"id": f"{ID_PREFIX}{i}", "properties": {"name": f"bench node {i}"}, "labels": ["BenchNode"]}
+        for i in range(node_count)
+    ]
+    await backend.add_entities_bulk(rows, batch_size=5_000)
+
+
+async def _cleanup(backend) -> None:
+    while True:
+        records = await backend.query_raw(
+            """
+            MATCH (n:Entity)
+            WHERE n.id STARTS WITH $prefix
+            WITH n LIMIT 10000
+            DETACH DELETE n
+            RETURN count(*) AS deleted
+            """,
+            {"prefix": ID_PREFIX},
+        )
+        if not records or records[0]["deleted"] == 0:
+            break
+
+
+async def _time_legacy(backend, rows: List[Dict[str, Any]]) -> WritePathResult:
+    driver = await backend._get_driver()
+    start = time.perf_counter()
+    async with driver.session(database=backend.database) as session:
+        for row in rows:
+            result = await session.run(
+                LEGACY_RELATIONSHIP_QUERY,
+                source_id=row["source_id"],
+                target_id=row["target_id"],
+                properties=row["properties"],
+            )
+            await result.consume()
+    return WritePathResult("legacy_label_less", len(rows), time.perf_counter() - start)
+
+
+async def _time_per_call(backend, rows: List[Dict[str, Any]]) -> WritePathResult:
+    backend._labels.clear()
+    start = time.perf_counter()
+    for row in rows:
+        await backend.add_relationship(row["source_id"], row["type"], row["target_id"], row["properties"])
+    return WritePathResult("label_scoped_per_call", len(rows), time.perf_counter() - start)
+
+
+async def _time_bulk(backend, rows: List[Dict[str, Any]]) -> WritePathResult:
+    backend._labels.clear()
+    start = time.perf_counter()
+    await backend.add_relationships_bulk(rows)
+    return WritePathResult("label_scoped_bulk", len(rows), time.perf_counter() - start)
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+
+async def run_benchmark(
+    node_count: int = DEFAULT_NODE_COUNT,
+    relationship_count: int = DEFAULT_RELATIONSHIP_COUNT,
+    seed: int = 42,
+) -> Dict[str, Any]:
+    """Seed a synthetic graph and time each relationship write path.
+
+    Args:
+        node_count: Number of synthetic ``:Entity`` nodes to create.
+        relationship_count: Relationships written by each write path.
+        seed: Random seed for endpoint selection.
+
+    Returns:
+        Dict with the configuration and one result per write path.
+    """
+    from infrastructure.neo4j_backend import create_neo4j_backend
+
+    backend = await create_neo4j_backend()
+    try:
+        await backend.create_layer_indexes()
+        logger.info("Seeding %d nodes", node_count)
+        await _seed_nodes(backend, node_count)
+
+        results = []
+        for offset, timer in enumerate((_time_legacy, _time_per_call, _time_bulk)):
+            # Different seeds so each path MERGEs fresh relationships
+            rows = _relationship_rows(node_count, relationship_count, seed + offset)
+            result = await timer(backend, rows)
+            logger.info("%s: %.1f rels/s", result.name, result.per_second)
+            results.append(result)
+    finally:
+        await _cleanup(backend)
+        await backend.close()
+
+    return {
+        "config": {"node_count": node_count, "relationship_count": relationship_count, "seed": seed},
+        "results": [{**asdict(r), "per_second": round(r.per_second, 1)} for r in results],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Pytest entry point
+# ---------------------------------------------------------------------------
+
+
+import pytest  # noqa: E402
+
+
+@pytest.mark.asyncio
+@pytest.mark.benchmark
+async def test_benchmark_node_lookup():
+    """Run the node lookup benchmark as a pytest test.
+
+    Requires NEO4J_URI pointing at a disposable Neo4j instance.
+    """
+    if not os.getenv("NEO4J_URI"):
+        pytest.skip("NEO4J_URI not set")
+
+    node_count = int(os.getenv("BENCHMARK_NODE_COUNT", DEFAULT_NODE_COUNT))
+    report = await run_benchmark(node_count=node_count)
+
+    by_name = {r["name"]: r for r in report["results"]}
+    assert by_name["label_scoped_bulk"]["per_second"] > by_name["legacy_label_less"]["per_second"]
+
+
+# ---------------------------------------------------------------------------
+# CLI entry point
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    import sys
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+
+    nodes = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_NODE_COUNT
+    relationships = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_RELATIONSHIP_COUNT
+
+    report = asyncio.run(run_benchmark(node_count=nodes, relationship_count=relationships))
+    print(json.dumps(report, indent=2))
@@ -0,0 +1,274 @@
+"""Patient Record Benchmark: OPTIONAL MATCH fan-out vs per-category subqueries.
+
+Seeds synthetic chronic patients with long medical histories and compares
+the two ways of reading a full patient record:
+
+Fan-out:     Five chained ``OPTIONAL MATCH`` clauses followed by
+             ``collect(DISTINCT ...)`` (the pre-subquery query). The
+             intermediate row count is the product of the five list sizes.
+Subqueries:  ``PATIENT_RECORD_QUERY`` - one aggregating ``CALL {}`` per
+             category, so every category is read once.
+
+Both queries must return the same record; the benchmark checks that before
+reporting latencies.
+
+Requires a running Neo4j (``NEO4J_URI``/``NEO4J_USERNAME``/``NEO4J_PASSWORD``).
+Benchmark nodes use the ``bench:`` ID prefix and are removed afterwards.
+
+Usage:
+    uv run pytest tests/benchmarks/benchmark_patient_record.py -v -s
+    uv run python tests/benchmarks/benchmark_patient_record.py [diagnoses] [medications]
+"""
+
+import asyncio
+import json
+import logging
+import os
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+ID_PREFIX = "bench:"
+DEFAULT_PATIENT_COUNT = 3
+DEFAULT_DIAGNOSES = 300
+DEFAULT_MEDICATIONS = 300
+DEFAULT_ALLERGIES = 5
+DEFAULT_PROCEDURES = 5
+DEFAULT_DEVICES = 2
+
+FAN_OUT_QUERY = """
+MATCH (p:Patient {id: $patient_id})
+OPTIONAL MATCH (p)-[:HAS_DIAGNOSIS]->(dx:Diagnosis)
+OPTIONAL MATCH (p)-[:CURRENT_MEDICATION]->(med:Medication)
+    WHERE med.status IS NULL OR med.status = 'active'
+OPTIONAL MATCH (p)-[:HAS_ALLERGY]->(allergy:Allergy)
+OPTIONAL MATCH (p)-[:HAS_PROCEDURE]->(proc:Procedure)
+OPTIONAL MATCH (p)-[:HAS_DEVICE]->(device:MedicalDevice)
+RETURN
+    p,
+    collect(DISTINCT dx) as diagnoses,
+    collect(DISTINCT med) as medications,
+    collect(DISTINCT allergy.substance) as allergies,
+    collect(DISTINCT proc) as procedures,
+    collect(DISTINCT device) as medical_devices
+"""
+
+# (relationship type, label, count attribute) per record category
+CATEGORIES = (
+    ("HAS_DIAGNOSIS", "Diagnosis", "diagnoses"),
+    ("CURRENT_MEDICATION", "Medication", "medications"),
+    ("HAS_ALLERGY", "Allergy", "allergies"),
+    ("HAS_PROCEDURE", "Procedure", "procedures"),
+    ("HAS_DEVICE", "MedicalDevice", "devices"),
+)
+
+# ---------------------------------------------------------------------------
+# Data structures
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class RecordShape:
+    """Number of related nodes per category for each synthetic patient."""
+
+    diagnoses: int = DEFAULT_DIAGNOSES
+    medications: int = DEFAULT_MEDICATIONS
+    allergies: int = DEFAULT_ALLERGIES
+    procedures: int = DEFAULT_PROCEDURES
+    devices: int = DEFAULT_DEVICES
+
+    @property
+    def fan_out_rows(self) -> int:
+        """Intermediate rows produced by the chained OPTIONAL MATCHes."""
+        rows = 1
+        for _, _, attribute in CATEGORIES:
+            rows *= max(1, getattr(self, attribute))
+        return rows
+
+
+@dataclass
+class QueryResult:
+    """Latency of one read query over all synthetic patients."""
+
+    name: str
+    runs: int
+    median_ms: float
+    max_ms: float
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _properties(label: str, index: int) -> Dict[str, Any]:
+    if label == "Diagnosis":
+        return {"condition": f"condition {index}", "status": "active", "recorded_at": "2024-01-01T00:00:00"}
+    if label == "Medication":
+        return {"name": f"medication {index}", "dosage": "10mg", "frequency": "daily", "status": "active"}
+    if label == "Allergy":
+        return {"substance": f"substance {index}", "severity": "moderate"}
+    if label == "Procedure":
+        return {"name": f"procedure {index}", "status": "completed"}
+    return {"name": f"device {index}", "status": "active"}
+
+
+async def _seed_patients(backend, patient_count: int, shape: RecordShape) -> List[str]:
+    patient_ids = [f"{ID_PREFIX}patient:{i}" for i in range(patient_count)]
+    entities = [{"id": pid, "properties": {"consent_given": True}, "labels": ["Patient"]} for pid in patient_ids]
+    relationships = []
+    for p, pid in enumerate(patient_ids):
+        for rel_type, label, attribute in CATEGORIES:
+            for i in range(getattr(shape, attribute)):
+                node_id = f"{ID_PREFIX}{label.lower()}:{p}:{i}"
+                entities.append({"id": node_id, "properties": _properties(label, i), "labels": [label]})
+                relationships.append({"source_id": pid, "type": rel_type, "target_id": node_id})
+    await backend.add_entities_bulk(entities, batch_size=5_000)
+    await backend.add_relationships_bulk(relationships, batch_size=5_000)
+    return patient_ids
+
+
+async def _cleanup(backend) -> None:
+    while True:
+        records = await backend.query_raw(
+            """
+            MATCH (n:Entity)
+            WHERE n.id STARTS WITH $prefix
+            WITH n LIMIT 10000
+            DETACH DELETE n
+            RETURN count(*) AS deleted
+            """,
+            {"prefix": ID_PREFIX},
+        )
+        if not records or records[0]["deleted"] == 0:
+            break
+
+
+def _normalize(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Order-independent view of a patient record for equality checks."""
+    normalized = {}
+    for key in ("diagnoses", "medications", "procedures", "medical_devices"):
+        normalized[key] = sorted(node.get("id") for node in record[key] if node)
+    normalized["allergies"] = sorted(a for a in record["allergies"] if a)
+    return normalized
+
+
+async def _time_query(backend, name: str, query: str, patient_ids: List[str], runs: int) -> QueryResult:
+    timings = []
+    for _ in range(runs):
+        for patient_id in patient_ids:
+            start = time.perf_counter()
+            await backend.query_raw(query, {"patient_id": patient_id})
+            timings.append((time.perf_counter() - start) * 1000)
+    return QueryResult(name, len(timings), round(statistics.median(timings), 2), round(max(timings), 2))
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+
+async def run_benchmark(
+    patient_count: int = DEFAULT_PATIENT_COUNT,
+    shape: Optional[RecordShape] = None,
+    runs: int = 3,
+) -> Dict[str, Any]:
+    """Seed synthetic chronic patients and time both patient record queries.
+
+    Args:
+        patient_count: Number of synthetic patients.
+        shape: Related nodes per category for every patient.
+        runs: Timed reads per patient and query.
+
+    Returns:
+        Dict with the configuration and one result per query.
+    """
+    from infrastructure.neo4j_backend import create_neo4j_backend
+    from application.services.patient_memory_service import PATIENT_RECORD_QUERY
+
+    shape = shape or RecordShape()
+
+    backend = await create_neo4j_backend()
+    try:
+        await backend.create_layer_indexes()
+        logger.info("Seeding %d patients (%d fan-out rows each)", patient_count, shape.fan_out_rows)
+        patient_ids = await _seed_patients(backend, patient_count, shape)
+
+        for patient_id in patient_ids:
+            [fan_out] = await backend.query_raw(FAN_OUT_QUERY, {"patient_id": patient_id})
+            [subqueries] = await backend.query_raw(PATIENT_RECORD_QUERY, {"patient_id": patient_id})
+            if _normalize(fan_out) != _normalize(subqueries):
+                raise AssertionError(f"Patient record queries disagree for {patient_id}")
+
+        results = [
+            await _time_query(backend, "optional_match_fan_out", FAN_OUT_QUERY, patient_ids, runs),
+            await _time_query(backend, "call_subqueries", PATIENT_RECORD_QUERY, patient_ids, runs),
+        ]
+        for result in results:
+            logger.info("%s: median %.1f ms, max %.1f ms", result.name, result.median_ms, result.max_ms)
+    finally:
+        await _cleanup(backend)
+        await backend.close()
+
+    return {
+        "config": {
+            "patient_count": patient_count,
+            **asdict(shape),
+            "fan_out_rows_per_patient": shape.fan_out_rows,
+            "runs": runs,
+        },
+        "results": [asdict(r) for r in results],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Pytest entry point
+# ---------------------------------------------------------------------------
+
+
+import pytest  # noqa: E402
+
+
+@pytest.mark.asyncio
+@pytest.mark.benchmark
+async def test_benchmark_patient_record():
+    """Run the patient record benchmark as a pytest test.
+
+    Requires NEO4J_URI pointing at a disposable Neo4j instance.
+    """
+    if not os.getenv("NEO4J_URI"):
+        pytest.skip("NEO4J_URI not set")
+
+    shape = RecordShape(
+        diagnoses=int(os.getenv("BENCHMARK_DIAGNOSES", DEFAULT_DIAGNOSES)),
+        medications=int(os.getenv("BENCHMARK_MEDICATIONS", DEFAULT_MEDICATIONS)),
+    )
+    report = await run_benchmark(shape=shape)
+
+    by_name = {r["name"]: r for r in report["results"]}
+    assert by_name["call_subqueries"]["median_ms"] < by_name["optional_match_fan_out"]["median_ms"]
+
+
+# ---------------------------------------------------------------------------
+# CLI entry point
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    import sys
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+
+    cli_shape = RecordShape(
+        diagnoses=int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DIAGNOSES,
+        medications=int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_MEDICATIONS,
+    )
+
+    report = asyncio.run(run_benchmark(shape=cli_shape))
+    print(json.dumps(report, indent=2))
@@ -0,0 +1,190 @@
+"""Chunker Benchmark: in-memory TextChunker vs StreamingTextChunker.
+
+Builds a synthetic Markdown file (or uses ``BENCHMARK_MARKDOWN_PATH``) and
+measures throughput and peak Python memory for:
+
+In-memory:  read the whole file, ``TextChunker.chunk_text`` (character sizing,
+            offsets recovered with ``str.find``).
+Streaming:  ``StreamingTextChunker.iter_file_chunks`` (memory-mapped blocks,
+            token sizing, exact offsets).
+
+The synthetic document repeats paragraphs drawn from ``markdown_output/`` when
+that directory exists, otherwise a built-in medical paragraph.
+
+Usage:
+    uv run pytest tests/benchmarks/benchmark_text_chunker.py -v -s
+    uv run python tests/benchmarks/benchmark_text_chunker.py [size_mb]
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+DEFAULT_SIZE_MB = 50
+MARKDOWN_DIR = Path(__file__).parent.parent.parent / "markdown_output"
+
+FALLBACK_PARAGRAPH = (
+    "## Treatment\n\nCrohn's disease is a chronic inflammatory bowel disease. "
+    "First-line induction therapy includes corticosteroids; anti-TNF agents such as "
+    "infliximab and adalimumab are used for moderate to severe disease.\n\n"
+)
+
+# ---------------------------------------------------------------------------
+# Data structures
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ChunkerResult:
+    """Throughput and memory of a single chunker run."""
+
+    name: str
+    chunks: int
+    seconds: float
+    mb_per_second: float
+    peak_memory_mb: float
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _sample_text() -> str:
+    if MARKDOWN_DIR.exists():
+        files = sorted(MARKDOWN_DIR.glob("*.md"))[:5]
+        text = "".join(f.read_text(encoding="utf-8", errors="ignore") for f in files)
+        if text.strip():
+            return text
+    return FALLBACK_PARAGRAPH * 50
+
+
+def _write_document(path: str, size_mb: int) -> int:
+    sample = _sample_text().encode("utf-8")
+    target = size_mb * 1024 * 1024
+    written = 0
+    with open(path, "wb") as f:
+        while written < target:
+            f.write(sample)
+            written += len(sample)
+    return written
+
+
+def _measure(name: str, size_bytes: int, run: Callable[[], Iterable[Any]]) -> ChunkerResult:
+    # Timed and memory-profiled separately: tracemalloc slows allocation-heavy code
+    start = time.perf_counter()
+    chunks = sum(1 for _ in run())
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    for _ in run():
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return ChunkerResult(
+        name=name,
+        chunks=chunks,
+        seconds=round(seconds, 3),
+        mb_per_second=round(size_bytes / 1024 / 1024 / seconds, 2),
+        peak_memory_mb=round(peak / 1024 / 1024, 1),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+
+def run_benchmark(size_mb: int = DEFAULT_SIZE_MB, path: Optional[str] = None) -> Dict[str, Any]:
+    """Chunk the same document with both chunkers.
+
+    Args:
+        size_mb: Size of the synthetic document when ``path`` is not given.
+        path: Existing Markdown file to chunk instead.
+
+    Returns:
+        Dict with the configuration and one result per chunker.
+    """
+    from application.services.text_chunker import StreamingTextChunker, TextChunker
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if path is None:
+            path = os.path.join(tmp, "document.md")
+            size_bytes = _write_document(path, size_mb)
+        else:
+            size_bytes = os.path.getsize(path)
+
+        def in_memory():
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+            return TextChunker(chunk_size=1500, chunk_overlap=300).chunk_text(text, doc_id="bench")
+
+        streaming = StreamingTextChunker(max_tokens=384, overlap_tokens=64)
+
+        results = [
+            _measure("in_memory_text_chunker", size_bytes, in_memory),
+            _measure(
+                "streaming_text_chunker", size_bytes,
+                lambda: streaming.iter_file_chunks(path, doc_id="bench"),
+            ),
+        ]
+    for result in results:
+        logger.info(
+            "%s: %.2f MB/s, peak %.1f MB", result.name, result.mb_per_second, result.peak_memory_mb
+        )
+
+    return {
+        "config": {"size_bytes": size_bytes, "path": path},
+        "results": [asdict(r) for r in results],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Pytest entry point
+# ---------------------------------------------------------------------------
+
+
+import pytest  # noqa: E402
+
+
+@pytest.mark.benchmark
+def test_benchmark_text_chunker():
+    """Run the chunker benchmark as a pytest test.
+
+    Uses a small document by default; set BENCHMARK_CHUNKER_MB to scale it.
+    """
+    size_mb = int(os.getenv("BENCHMARK_CHUNKER_MB", 8))
+    report = run_benchmark(size_mb=size_mb, path=os.getenv("BENCHMARK_MARKDOWN_PATH"))
+
+    by_name = {r["name"]: r for r in report["results"]}
+    assert by_name["streaming_text_chunker"]["chunks"] > 0
+    assert (
+        by_name["streaming_text_chunker"]["peak_memory_mb"]
+        < by_name["in_memory_text_chunker"]["peak_memory_mb"]
+    )
+
+
+# ---------------------------------------------------------------------------
+# CLI entry point
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    import sys
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE_MB
+    report = run_benchmark(size_mb=size, path=os.getenv("BENCHMARK_MARKDOWN_PATH"))
+    print(json.dumps(report, indent=2))
@@ -0,0 +1,103 @@
+"""Unit tests for AsyncMem0Client."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from infrastructure.async_mem0_client import AsyncMem0Client, Mem0TimeoutError
+
+
+class SlowMem0:
+    """Synchronous Mem0 stand-in whose calls block their thread."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.get_all_calls = 0
+        self.threads = set()
+        self.memories = []
+
+    def get_all(self, user_id, limit=100):
+        self.get_all_calls += 1
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        return {"results": [{"memory": m, "user_id": user_id} for m in self.memories[:limit]]}
+
+    def add(self, content, user_id, metadata=None):
+        time.sleep(self.delay)
+        self.memories.append(content)
+        return {"results": [{"memory": content}]}
+
+
+class TestAsyncMem0Client:
+
+    async def test_calls_do_not_block_the_event_loop(self):
+        mem0 = SlowMem0(delay=0.2)
+        client = AsyncMem0Client(mem0)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        await client.get_all(user_id="p1")
+        task.cancel()
+
+        assert ticks > 5
+        assert all(name.startswith("mem0") for name in mem0.threads)
+
+    async def test_concurrent_get_all_is_coalesced(self):
+        mem0 = SlowMem0()
+        client = AsyncMem0Client(mem0)
+
+        results = await asyncio.gather(*(client.get_all(user_id="p1", limit=30) for _ in range(5)))
+        await client.get_all(user_id="p2", limit=30)
+
+        assert mem0.get_all_calls == 2
+        assert all(r is results[0] for r in results)
+        stats = client.stats()["operations"]["get_all"]
+        assert stats["calls"] == 2
+        assert stats["coalesced"] == 4
+        assert client.stats()["in_flight"] == 0
+
+    async def test_reads_after_a_write_do_not_join_older_calls(self):
+        mem0 = SlowMem0(delay=0.1)
+        client = AsyncMem0Client(mem0)
+
+        before = asyncio.create_task(client.get_all(user_id="p1"))
+        await asyncio.sleep(0)
+        await client.add("Patient reports knee pain", user_id="p1")
+        after = await client.get_all(user_id="p1")
+
+        assert mem0.get_all_calls == 2
+        assert [m["memory"] for m in after["results"]] == ["Patient reports knee pain"]
+        await before
+
+    async def test_timeout(self):
+        client = AsyncMem0Client(SlowMem0(delay=0.2), read_timeout_seconds=0.01)
+
+        with pytest.raises(Mem0TimeoutError):
+            await client.get_all(user_id="p1")
+
+        assert client.stats()["operations"]["get_all"]["timeouts"] == 1
+
+    async def test_timed_out_write_notifies_listeners_when_it_lands(self):
+        mem0 = SlowMem0(delay=0.1)
+        client = AsyncMem0Client(mem0, write_timeout_seconds=0.01)
+        finished = asyncio.Event()
+
+        async def listener(user_id):
+            assert mem0.memories == ["Patient reports knee pain"]
+            finished.set()
+
+        client.on_write_finished(listener)
+        with pytest.raises(Mem0TimeoutError):
+            await client.add("Patient reports knee pain", user_id="p1")
+        generation = client._generations["p1"]
+
+        await asyncio.wait_for(finished.wait(), 1)
+        assert client._generations["p1"] > generation
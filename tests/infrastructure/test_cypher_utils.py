@@ -80,6 +80,13 @@ class TestValidateCypherIdentifier:
                 "ASSOCIATED_WITH`]->(t) DETACH DELETE t WITH 1 as x//"
             )
 
+    def test_reserved_word_allowed_when_quoted(self):
+        assert validate_cypher_identifier("Order", allow_reserved=True) == "Order"
+
+    def test_allow_reserved_still_rejects_backtick(self):
+        with pytest.raises(ValueError, match="Must match pattern"):
+            validate_cypher_identifier("Order`", allow_reserved=True)
+
 
 class TestDeleteRelationshipValidation:
     """Tests that delete_relationship rejects malicious input.
@@ -0,0 +1,243 @@
+"""Unit tests for the event bus serializers, consumer pool and throughput mode."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from domain.event import KnowledgeEvent
+from domain.roles import Role
+from infrastructure.event_bus.consumer_pool import ConsumerPool
+from infrastructure.event_bus.serialization import decode_event, get_event_serializer
+
+
+def _event(i, patient="p1"):
+    return KnowledgeEvent(action="create_entity", data={"id": f"e{i}", "patient": patient}, role=Role.DATA_ENGINEER)
+
+
+class FakeDelivery:
+    """An AMQP delivery as seen by consumers."""
+
+    def __init__(self, body=b"", content_type="application/json"):
+        self.body = body
+        self.content_type = content_type
+        self.acked = False
+        self.rejected = False
+
+    async def ack(self):
+        self.acked = True
+
+    async def reject(self, requeue=False):
+        self.rejected = True
+
+
+class TestSerialization:
+
+    @pytest.mark.parametrize("name", ["json", "auto", "orjson", "msgpack"])
+    def test_round_trip(self, name):
+        try:
+            serializer = get_event_serializer(name)
+        except ValueError:
+            pytest.skip(f"{name} not installed")
+        event = _event(1)
+
+        decoded = decode_event(serializer.encode(event), serializer.content_type)
+
+        assert decoded == event
+
+    def test_reads_legacy_asdict_payloads(self):
+        body = b'{"action": "create_entity", "data": {"id": "e1"}, "role": "data_engineer"}'
+
+        assert decode_event(body, "application/json").role is Role.DATA_ENGINEER
+
+    def test_unknown_serializer(self):
+        with pytest.raises(ValueError):
+            get_event_serializer("pickle")
+
+
+class TestConsumerPool:
+
+    async def test_events_sharing_a_key_stay_in_order(self):
+        seen = []
+
+        async def handler(event):
+            # Later events finish faster, which would reorder unordered work
+            await asyncio.sleep(0.001 * (10 - int(event.data["id"][1:]) % 10))
+            seen.append((event.data["patient"], event.data["id"]))
+
+        pool = ConsumerPool("q", handler, concurrency=4, ordering_key=lambda e: e.data["patient"])
+        pool.start()
+        deliveries = []
+        for i in range(20):
+            delivery = FakeDelivery()
+            deliveries.append(delivery)
+            await pool.submit(_event(i, patient=f"p{i % 3}"), delivery)
+        await pool.stop()
+
+        for patient in ("p0", "p1", "p2"):
+            ids = [int(i[1:]) for p, i in seen if p == patient]
+            assert ids == sorted(ids)
+        assert all(d.acked for d in deliveries)
+        assert pool.stats.processed == 20
+
+    async def test_workers_run_concurrently(self):
+        running = 0
+        peak = 0
+
+        async def handler(event):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        pool = ConsumerPool("q", handler, concurrency=4)
+        pool.start()
+        for i in range(8):
+            await pool.submit(_event(i), FakeDelivery())
+        await pool.stop()
+
+        assert peak == 4
+
+    async def test_batches_and_dead_letters_failed_batches(self):
+        batches = []
+
+        def handler(events):
+            batches.append(len(events))
+            if any(e.data["id"] == "e7" for e in events):
+                raise RuntimeError("constraint violation")
+
+        pool = ConsumerPool("q", handler, batch_size=5, batch_timeout=0.01)
+        pool.start()
+        deliveries = [FakeDelivery() for _ in range(12)]
+        for i, delivery in enumerate(deliveries):
+            await pool.submit(_event(i), delivery)
+        await pool.stop()
+
+        assert batches == [5, 5, 2]
+        assert [d.rejected for d in deliveries] == [False] * 5 + [True] * 5 + [False] * 2
+        assert pool.stats.failed == 5
+        assert pool.stats.max_batch_size == 5
+
+
+# ---------------------------------------------------------------------------
+# In-process AMQP stand-in
+# ---------------------------------------------------------------------------
+
+
+class FakeExchange:
+
+    def __init__(self, broker):
+        self.broker = broker
+        self.published = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def publish(self, message, routing_key):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)  # broker confirm round trip
+        self.in_flight -= 1
+        if routing_key in self.broker.nack_keys:
+            raise RuntimeError("nacked")
+        self.published += 1
+        for queue in self.broker.bindings.get(routing_key, []):
+            queue.messages.put_nowait(FakeDelivery(message.body, message.content_type))
+
+
+class FakeQueue:
+
+    def __init__(self, name):
+        self.name = name
+        self.messages = asyncio.Queue()
+
+    async def bind(self, exchange, routing_key):
+        exchange.broker.bindings.setdefault(routing_key, []).append(self)
+
+    def iterator(self):
+        queue = self
+
+        class _Iterator:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                return await queue.messages.get()
+
+        return _Iterator()
+
+
+class FakeBroker:
+
+    def __init__(self):
+        self.bindings = {}
+        self.nack_keys = set()
+        self.exchange = FakeExchange(self)
+        self.channel = AsyncMock()
+        self.channel.is_closed = False
+        self.channel.declare_exchange.return_value = self.exchange
+        self.channel.declare_queue.side_effect = lambda name, **kwargs: FakeQueue(name)
+        self.connection = AsyncMock()
+        self.connection.is_closed = False
+        self.connection.channel.return_value = self.channel
+
+
+async def _until(condition, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0.005)
+
+
+@pytest.fixture
+async def bus():
+    pytest.importorskip("aio_pika")
+    from infrastructure.event_bus import rabbitmq_event_bus as module
+
+    broker = FakeBroker()
+    with patch.object(module, "connect_robust", AsyncMock(return_value=broker.connection)), \
+            patch.object(module.RPC, "create", AsyncMock()):
+        bus = module.RabbitMQEventBus(concurrency=4, prefetch_count=64, confirm_batch_size=16)
+        await bus.connect()
+        bus.broker = broker
+        yield bus
+        await bus.disconnect()
+
+
+class TestRabbitMQThroughputMode:
+
+    async def test_publish_batch_pipelines_confirms(self, bus):
+        received = []
+        await bus.subscribe("create_entity", AsyncMock(side_effect=received.append))
+
+        await bus.publish_batch([_event(i) for i in range(40)])
+
+        assert bus.broker.exchange.published == 40
+        assert bus.broker.exchange.max_in_flight == 16
+        await _until(lambda: len(received) == 40)
+
+    async def test_unconfirmed_events_fall_back_to_local_handlers(self, bus):
+        local = AsyncMock()
+        bus._local_handlers["create_entity"] = [local]
+        bus.broker.nack_keys.add("rejected")
+
+        await bus.publish_batch([_event(1), _event(2)], routing_key="rejected")
+
+        assert local.await_count == 2
+
+    async def test_batch_subscribers_receive_lists(self, bus):
+        batches = []
+        await bus.subscribe_batch("create_entity", batches.append, batch_size=10, batch_timeout=0.01)
+
+        await bus.publish_batch([_event(i) for i in range(25)])
+
+        await _until(lambda: sum(len(b) for b in batches) == 25)
+        assert max(len(b) for b in batches) > 1
+        health = await bus.health_check()
+        assert health["consumers"]["kg_create_entity"]["processed"] == 25
@@ -0,0 +1,141 @@
+"""Unit tests for Neo4jBackend bulk UNWIND writes using a mocked driver."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from infrastructure.neo4j_backend import Neo4jBackend
+
+
+class _FakeResult:
+    def __init__(self, records=None):
+        self._records = records or []
+        counters = MagicMock(nodes_created=len(self._records), relationships_created=0, properties_set=0)
+        self._summary = MagicMock(counters=counters)
+
+    def __aiter__(self):
+        async def gen():
+            for record in self._records:
+                yield record
+        return gen()
+
+    async def consume(self):
+        return self._summary
+
+
+def _backend_with_tx(run_side_effect, session_run_side_effect=None):
+    tx = MagicMock()
+    tx.run = AsyncMock(side_effect=run_side_effect)
+
+    session = MagicMock()
+    session.run = AsyncMock(side_effect=session_run_side_effect or (lambda *a, **kw: _FakeResult()))
+
+    async def execute_write(work):
+        return await work(tx)
+
+    session.execute_write = execute_write
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+
+    driver = MagicMock()
+    driver.session.return_value = session
+
+    backend = Neo4jBackend("bolt://unused", "neo4j", "password")
+    backend._driver = driver
+    return backend, tx
+
+
+@pytest.mark.asyncio
+async def test_entities_grouped_by_label_set_and_batched():
+    backend, tx = _backend_with_tx(lambda *args, **kwargs: _FakeResult())
+
+    rows = [{"id": f"c{i}", "properties": {"n": i}, "labels": ["Chunk"]} for i in range(5)]
+    rows.append({"id": "d1", "properties": {}, "labels": ["Document"]})
+
+    stats = await backend.add_entities_bulk(rows, batch_size=2)
+
+    assert stats["rows"] == 6
+    assert [(b["group"], b["rows"]) for b in stats["batches"]] == [
+        ("Entity:Chunk", 2), ("Entity:Chunk", 2), ("Entity:Chunk", 1), ("Entity:Document", 1),
+    ]
+    first_query = tx.run.call_args_list[0].args[0]
+    assert "UNWIND $rows AS row" in first_query
+    assert "MERGE (n:Entity {id: row.id})" in first_query
+    assert "SET n:`Chunk`" in first_query
+    assert backend._labels.get("c0") == ("Entity", "id")
+
+
+@pytest.mark.asyncio
+async def test_entities_reject_unsafe_labels():
+    backend, tx = _backend_with_tx(lambda *args, **kwargs: _FakeResult())
+
+    with pytest.raises(ValueError):
+        await backend.add_entities_bulk([{"id": "x", "properties": {}, "labels": ["Bad`Label"]}])
+    tx.run.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_relationships_grouped_by_resolved_endpoint_labels():
+    def session_run(query, **params):
+        if "MATCH (n:Entity {id: key})" in query:
+            return _FakeResult([{"key": "a"}, {"key": "b"}])
+        # Label-less fallback only sees the IDs the identity index missed
+        assert params["ids"] == ["m1", "missing"]
+        return _FakeResult([{"key": "m1", "label": "Message"}])
+
+    backend, tx = _backend_with_tx(lambda *args, **kwargs: _FakeResult(), session_run)
+
+    stats = await backend.add_relationships_bulk([
+        {"source_id": "a", "type": "mentions", "target_id": "b"},
+        {"source_id": "a", "type": "mentions", "target_id": "m1"},
+        {"source_id": "a", "type": "mentions", "target_id": "missing"},
+    ])
+
+    assert stats["rows"] == 3
+    assert [(b["group"], b["rows"]) for b in stats["batches"]] == [("MENTIONS", 2), ("MENTIONS", 1)]
+    queries = [call.args[0] for call in tx.run.call_args_list]
+    assert "MERGE (target:`Entity` {id: row.target_id})" in queries[0]
+    assert "MERGE (target:`Message` {id: row.target_id})" in queries[1]
+    assert backend._labels.get("missing") == ("Entity", "id")
+
+
+@pytest.mark.asyncio
+async def test_relationships_skip_label_scan_for_missing_ids():
+    seen = []
+
+    def session_run(query, **params):
+        seen.append(params["ids"])
+        return _FakeResult([{"key": "a"}] if "MATCH (n:Entity {id: key})" in query else [])
+
+    backend, _ = _backend_with_tx(lambda *args, **kwargs: _FakeResult(), session_run)
+    backend._labels.remember_missing("gone", "id")
+
+    await backend._resolve_id_labels(backend._driver.session(), ["a", "gone", "new"])
+    await backend._resolve_id_labels(backend._driver.session(), ["new"])
+
+    assert seen == [["a", "gone", "new"], ["new"], ["new"]]
+    assert backend._labels.is_missing("new", "id")
+
+
+@pytest.mark.asyncio
+async def test_relationships_skip_lookup_for_cached_endpoints():
+    backend, tx = _backend_with_tx(lambda *args, **kwargs: _FakeResult())
+    backend._labels.remember("a", "Entity")
+    backend._labels.remember("b", "Entity")
+
+    await backend.add_relationships_bulk([{"source_id": "a", "type": "KNOWS", "target_id": "b"}])
+
+    backend._driver.session.return_value.run.assert_not_called()
+    assert tx.run.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_empty_bulk_write_skips_driver():
+    backend = Neo4jBackend("bolt://unused", "neo4j", "password")
+    backend._driver = MagicMock()
+
+    stats = await backend.add_entities_bulk([])
+
+    assert stats["rows"] == 0
+    assert stats["batches"] == []
+    backend._driver.session.assert_not_called()
@@ -0,0 +1,174 @@
+"""Tests for label-scoped node identity resolution in Neo4jBackend."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from infrastructure.neo4j_backend import Neo4jBackend
+from infrastructure.node_identity import (
+    IDENTITY_SCHEMA,
+    MEDICAL_ENTITY_SEARCH_INDEX,
+    NAME_SEARCH_SCHEMA,
+    NodeLabelResolver,
+    fulltext_prefix_query,
+    name_key,
+)
+
+
+class _Result:
+    def __init__(self, record=None):
+        self._record = record
+
+    async def single(self):
+        return self._record
+
+
+def _backend(run):
+    session = MagicMock()
+    session.run = AsyncMock(side_effect=run)
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    driver = MagicMock()
+    driver.session.return_value = session
+
+    backend = Neo4jBackend("bolt://unused", "neo4j", "password")
+    backend._driver = driver
+    return backend, session
+
+
+class TestNodeLabelResolver:
+    def test_remember_and_get(self):
+        resolver = NodeLabelResolver()
+        resolver.remember("t1", "Table", "name")
+        assert resolver.get("t1") == ("Table", "name")
+        assert resolver.get("t1", "id") is None
+
+    def test_evicts_least_recently_used(self):
+        resolver = NodeLabelResolver(max_size=2)
+        resolver.remember("a", "Entity")
+        resolver.remember("b", "Entity")
+        resolver.get("a")
+        resolver.remember("c", "Entity")
+        assert resolver.get("b") is None
+        assert resolver.get("a") is not None
+        assert len(resolver) == 2
+
+    def test_missing_keys_expire_and_clear_on_remember(self):
+        resolver = NodeLabelResolver(miss_ttl=60)
+        resolver.remember_missing("a")
+        resolver.remember_missing("b", "id")
+        assert resolver.is_missing("a") and resolver.is_missing("a", "id")
+        assert resolver.is_missing("b", "id") and not resolver.is_missing("b")
+
+        resolver.remember("a", "Entity")
+        assert not resolver.is_missing("a")
+        assert not NodeLabelResolver(miss_ttl=-1).is_missing("a")
+
+    def test_identity_schema_has_unique_constraint(self):
+        names = [name for name, _ in IDENTITY_SCHEMA]
+        assert "entity_id_unique" in names
+
+
+class TestNameKeys:
+    def test_name_key_matches_cypher_normalization(self):
+        assert name_key("  Type 2 Diabetes ") == "type 2 diabetes"
+
+    def test_name_search_schema_has_range_and_fulltext_indexes(self):
+        statements = dict(NAME_SEARCH_SCHEMA)
+        assert "ON (n.name_lc)" in statements["idx_medical_entity_name_lc"]
+        assert "FULLTEXT INDEX" in statements[MEDICAL_ENTITY_SEARCH_INDEX]
+        assert "standard-no-stop-words" in statements[MEDICAL_ENTITY_SEARCH_INDEX]
+
+    def test_fulltext_query_requires_every_word_as_prefix(self):
+        assert fulltext_prefix_query("Type-2 DIAB") == "type* AND 2* AND diab*"
+
+    def test_fulltext_query_scoped_to_field(self):
+        assert fulltext_prefix_query("asth", field="name") == "name:(asth*)"
+
+    def test_fulltext_query_strips_lucene_syntax(self):
+        assert fulltext_prefix_query('a:b OR "c"') == "a* AND b* AND or* AND c*"
+        assert fulltext_prefix_query("?!") == ""
+
+
+class TestNeo4jBackendLookups:
+    @pytest.mark.asyncio
+    async def test_get_entity_uses_identity_index(self):
+        node = {"id": "e1", "name": "Diabetes"}
+
+        def run(query, **params):
+            if "OPTIONAL MATCH (a:Entity" in query:
+                return _Result({"by_id": True, "by_name": False})
+            assert query.startswith("MATCH (n:`Entity` {id: $entity_id})")
+            return _Result({"n": node, "labels": ["Entity"]})
+
+        backend, session = _backend(run)
+        entity = await backend.get_entity("e1")
+
+        assert entity["id"] == "e1"
+        assert all("WHERE n.id = $entity_id OR" not in c.args[0] for c in session.run.call_args_list)
+
+        # Second lookup hits the resolver cache and skips the resolution query
+        session.run.reset_mock()
+        await backend.get_entity("e1")
+        assert session.run.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_entity_falls_back_to_label_scan_for_dda_nodes(self):
+        def run(query, **params):
+            if "OPTIONAL MATCH (a:Entity" in query:
+                return _Result({"by_id": False, "by_name": False})
+            if "WHERE n.id = $entity_id OR n.name = $entity_id" in query:
+                return _Result({"label": "Table", "by_id": False})
+            assert query.startswith("MATCH (n:`Table` {name: $entity_id})")
+            return _Result({"n": {"name": "orders"}, "labels": ["Table"]})
+
+        backend, _ = _backend(run)
+        entity = await backend.get_entity("orders")
+
+        assert entity["id"] == "orders"
+        assert backend._labels.get("orders") == ("Table", "name")
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_entry_is_resolved_again(self):
+        calls = []
+
+        def run(query, **params):
+            calls.append(query)
+            if "OPTIONAL MATCH (a:Entity" in query:
+                return _Result({"by_id": True, "by_name": False})
+            if query.startswith("MATCH (n:`Message`"):
+                return _Result(None)
+            return _Result({"n": {"id": "x"}})
+
+        backend, _ = _backend(run)
+        backend._labels.remember("x", "Message")
+
+        assert await backend.update_entity_properties("x", {"a": 1}) is True
+        assert backend._labels.get("x") == ("Entity", "id")
+
+    @pytest.mark.asyncio
+    async def test_missing_entity_returns_none(self):
+        def run(query, **params):
+            if "OPTIONAL MATCH (a:Entity" in query:
+                return _Result({"by_id": False, "by_name": False})
+            return _Result(None)
+
+        backend, _ = _backend(run)
+        assert await backend.get_entity("nope") is None
+        assert backend._labels.get("nope") is None
+
+    @pytest.mark.asyncio
+    async def test_missing_entity_is_scanned_for_once(self):
+        calls = []
+
+        def run(query, **params):
+            calls.append(query)
+            if "OPTIONAL MATCH (a:Entity" in query:
+                return _Result({"by_id": False, "by_name": False})
+            return _Result(None)
+
+        backend, _ = _backend(run)
+        assert await backend.get_entity("nope") is None
+        assert await backend.get_entity("nope") is None
+
+        assert sum("WHERE n.id = $entity_id OR" in query for query in calls) == 1
@@ -332,6 +332,14 @@ class TestPromotionScannerJob:
         service._promote_entity = AsyncMock(return_value=MagicMock(
             status=TransitionStatus.COMPLETED
         ))
+
+        async def iter_promotion_candidates(layer):
+            candidates = await service.scan_for_promotion_candidates(layer)
+            if candidates:
+                yield candidates
+
+        service.iter_promotion_candidates = iter_promotion_candidates
+        service.promote_candidates = AsyncMock(side_effect=lambda page, layer, reason: len(page))
         return service
 
     @pytest.fixture
@@ -43,6 +43,7 @@ class TestEntityResolver:
         """Create a mock Neo4j backend."""
         backend = AsyncMock()
         backend.query = AsyncMock(return_value={"rows": [], "nodes": {}})
+        backend.query_raw = AsyncMock(return_value=[])
         backend.get_entity = AsyncMock(return_value=None)
         backend.update_entity_properties = AsyncMock(return_value=True)
         return backend
@@ -89,15 +90,12 @@ class TestEntityResolver:
     @pytest.mark.asyncio
     async def test_find_existing_exact_match(self, resolver, mock_backend):
         """Test finding entity with exact match."""
-        mock_backend.query.return_value = {
-            "rows": [{
-                "id": "entity_123",
-                "name": "Metformin",
-                "properties": {"dikw_layer": "PERCEPTION"},
-                "labels": ["Entity", "Medication"],
-            }],
-            "nodes": {},
-        }
+        mock_backend.query_raw.return_value = [{
+            "id": "entity_123",
+            "name": "Metformin",
+            "properties": {"dikw_layer": "PERCEPTION"},
+            "labels": ["Entity", "Medication"],
+        }]
 
         match = await resolver.find_existing_for_crystallization(
             name="Metformin",
@@ -109,18 +107,77 @@ class TestEntityResolver:
         assert match.match_type == "exact"
         assert match.similarity_score == 1.0
 
+    @pytest.mark.asyncio
+    async def test_find_existing_fuzzy_match_beyond_first_page(self, mock_backend):
+        """Test fuzzy crystallization matching searches every entity of the type."""
+        rows = [
+            {"id": f"entity_{i:04d}", "name": f"Drug {i}", "entity_type": "Medication",
+             "layer": "PERCEPTION", "confidence": 0.7, "observation_count": 1}
+            for i in range(120)
+        ]
+        rows.append({"id": "entity_9999", "name": "Metformin", "entity_type": "Medication",
+                     "layer": "SEMANTIC", "confidence": 0.9, "observation_count": 4})
+
+        async def query_raw(cypher, params=None):
+            if "after_id" not in (params or {}):
+                return []  # exact match query
+            page = [r for r in rows if r["id"] > params["after_id"]]
+            return page[:params["page_size"]]
+
+        mock_backend.query_raw = AsyncMock(side_effect=query_raw)
+        resolver = EntityResolver(backend=mock_backend, candidate_page_size=50)
+
+        match = await resolver.find_existing_for_crystallization(
+            name="Metformine",
+            entity_type="drug",
+        )
+
+        assert match.found
+        assert match.match_type == "fuzzy"
+        assert match.entity_id == "entity_9999"
+        assert match.entity_data["layer"] == "SEMANTIC"
+
+        # Names are loaded once; later lookups are answered from the index
+        calls = mock_backend.query_raw.await_count
+        await resolver.find_existing_for_crystallization(name="Metformin", entity_type="drug")
+        assert mock_backend.query_raw.await_count == calls + 1
+
+    @pytest.mark.asyncio
+    async def test_failed_block_load_is_retried(self, resolver, mock_backend):
+        """Test a failed name load does not leave an empty block marked as loaded."""
+        mock_backend.query_raw = AsyncMock(side_effect=ConnectionError("Neo4j unavailable"))
+
+        await resolver._find_similar_for_crystallization("Metformin", entity_type="Medication")
+
+        assert "Medication" not in resolver._crystallization_loaded
+
+    @pytest.mark.asyncio
+    async def test_registered_entity_is_fuzzy_matchable(self, resolver, mock_backend):
+        """Test entities created after loading are matched without reloading."""
+        await resolver.find_existing_for_crystallization(name="Aspirin", entity_type="Medication")
+
+        resolver.register_entity(
+            "perception_1", "Metformin", "Medication",
+            {"entity_type": "Medication", "dikw_layer": "PERCEPTION", "confidence": 0.8},
+        )
+        match = await resolver.find_existing_for_crystallization(
+            name="Metformine",
+            entity_type="Medication",
+        )
+
+        assert match.found
+        assert match.entity_id == "perception_1"
+
     @pytest.mark.asyncio
     async def test_merge_for_crystallization(self, resolver, mock_backend):
         """Test merging entity data during crystallization."""
-        mock_backend.query.return_value = {
-            "rows": [{
-                "properties": {
-                    "name": "Metformin",
-                    "confidence": 0.8,
-                    "observation_count": 2,
-                }
-            }],
-        }
+        mock_backend.query_raw.return_value = [{
+            "properties": {
+                "name": "Metformin",
+                "confidence": 0.8,
+                "observation_count": 2,
+            }
+        }]
 
         result = await resolver.merge_for_crystallization(
             existing_id="entity_123",
@@ -159,6 +216,18 @@ class TestCrystallizationService:
             return_value=MergeResult(success=True, entity_id="merged_123", observation_count=2)
         )
         resolver.normalize_entity_type = MagicMock(side_effect=lambda x: x.title())
+        resolver.normalize_entity_name = MagicMock(side_effect=lambda x: x.strip().lower())
+        resolver.register_entity = MagicMock()
+
+        async def find_batch(names, entity_type, layer="PERCEPTION"):
+            return {
+                name.strip().lower(): await resolver.find_existing_for_crystallization(
+                    name=name, entity_type=entity_type, layer=layer
+                )
+                for name in names
+            }
+
+        resolver.find_existing_for_crystallization_batch = AsyncMock(side_effect=find_batch)
         return resolver
 
     @pytest.fixture
@@ -340,6 +340,8 @@ class TestEvaluationEndpointsIntegration:
         mock.redis.get_session = AsyncMock(return_value=None)
         mock.mem0 = MagicMock()
         mock.mem0.get_all = MagicMock(return_value={"results": []})
+        mock.memories = AsyncMock()
+        mock.memories.get_all = AsyncMock(return_value={"results": []})
         return mock
 
     @pytest.fixture
@@ -1,5 +1,6 @@
 """Tests for the application event bus."""
 
+import asyncio
 import unittest
 import os
 import sys
@@ -10,7 +11,7 @@ _SRC_PATH = os.path.abspath(os.path.join(_TEST_DIR, "..", "src"))
 if _SRC_PATH not in sys.path:
     sys.path.insert(0, _SRC_PATH)
 
-from application.event_bus import EventBus  # noqa: E402
+from application.event_bus import BACKGROUND, DeliveryPolicy, EventBus  # noqa: E402
 from domain.event import KnowledgeEvent  # noqa: E402
 from domain.roles import Role  # noqa: E402
 
@@ -23,8 +24,105 @@ class TestEventBus(unittest.IsolatedAsyncioTestCase):
         async def handler(event: KnowledgeEvent) -> None:
             handled.append(event)
 
-        bus.subscribe("create_entity", handler)
+        await bus.subscribe("create_entity", handler)
         event = KnowledgeEvent(action="create_entity", data={"id": "n"}, role=Role.DATA_ARCHITECT)
         await bus.publish(event)
         self.assertEqual(len(handled), 1)
         self.assertEqual(handled[0].data["id"], "n")
+
+    async def test_handlers_run_concurrently(self) -> None:
+        bus = EventBus()
+        running = []
+        peak = []
+
+        async def handler(event: KnowledgeEvent) -> None:
+            running.append(event)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+
+        for _ in range(3):
+            await bus.subscribe("create_entity", handler)
+        await bus.publish(_event())
+        self.assertEqual(max(peak), 3)
+
+    async def test_handler_failure_is_isolated(self) -> None:
+        bus = EventBus()
+        handled = []
+
+        async def failing(event: KnowledgeEvent) -> None:
+            raise RuntimeError("boom")
+
+        async def handler(event: KnowledgeEvent) -> None:
+            handled.append(event)
+
+        await bus.subscribe("create_entity", failing)
+        await bus.subscribe("create_entity", handler)
+        await bus.publish(_event())
+
+        self.assertEqual(len(handled), 1)
+        stats = bus.stats()
+        self.assertEqual(stats[f"create_entity:{failing.__qualname__}"]["failed"], 1)
+        self.assertEqual(stats[f"create_entity:{handler.__qualname__}"]["delivered"], 1)
+
+    async def test_background_handler_does_not_block_publisher(self) -> None:
+        bus = EventBus(policies={"create_entity": BACKGROUND})
+        release = asyncio.Event()
+        handled = []
+
+        async def slow(event: KnowledgeEvent) -> None:
+            await release.wait()
+            handled.append(event.data["id"])
+
+        await bus.subscribe("create_entity", slow)
+        for i in range(3):
+            await asyncio.wait_for(bus.publish(_event(str(i))), timeout=1)
+        self.assertEqual(handled, [])
+        self.assertEqual(bus.stats()[f"create_entity:{slow.__qualname__}"]["queue_depth"], 2)
+
+        release.set()
+        await bus.close()
+        self.assertEqual(handled, ["0", "1", "2"])
+
+    async def test_drop_policies(self) -> None:
+        for overflow, expected in (("drop_newest", ["0", "1"]), ("drop_oldest", ["0", "2"])):
+            bus = EventBus()
+            release = asyncio.Event()
+            handled = []
+
+            async def slow(event: KnowledgeEvent) -> None:
+                await release.wait()
+                handled.append(event.data["id"])
+
+            policy = DeliveryPolicy(background=True, max_queue_size=1, overflow=overflow)
+            await bus.subscribe("create_entity", slow, policy)
+            await bus.publish(_event("0"))
+            await asyncio.sleep(0)  # worker takes event 0, the queue holds one more
+            await bus.publish(_event("1"))
+            await bus.publish(_event("2"))
+
+            release.set()
+            await bus.close()
+            self.assertEqual(handled, expected, overflow)
+            self.assertEqual(bus.stats()[f"create_entity:{slow.__qualname__}"]["dropped"], 1)
+
+    async def test_block_policy_applies_backpressure(self) -> None:
+        bus = EventBus()
+        release = asyncio.Event()
+
+        async def slow(event: KnowledgeEvent) -> None:
+            await release.wait()
+
+        await bus.subscribe("create_entity", slow, DeliveryPolicy(background=True, max_queue_size=1))
+        await bus.publish(_event("0"))
+        await asyncio.sleep(0)
+        await bus.publish(_event("1"))
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(bus.publish(_event("2")), timeout=0.05)
+
+        release.set()
+        await bus.close()
+
+
+def _event(entity_id: str = "n") -> KnowledgeEvent:
+    return KnowledgeEvent(action="create_entity", data={"id": entity_id}, role=Role.DATA_ARCHITECT)
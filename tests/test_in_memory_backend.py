@@ -41,3 +41,86 @@ class TestInMemoryGraphBackend(unittest.IsolatedAsyncioTestCase):
         # Rollback again should remove e1
         await backend.rollback()
         self.assertNotIn("e1", backend.nodes)
+
+    async def test_bulk_writes_use_default_batching(self) -> None:
+        backend = InMemoryGraphBackend()
+        stats = await backend.add_entities_bulk(
+            [
+                {"id": "a", "properties": {"name": "A"}, "labels": ["Chunk"]},
+                {"id": "b", "properties": {"name": "B"}},
+                {"id": "c", "properties": {"name": "C"}},
+            ],
+            batch_size=2,
+        )
+        self.assertEqual(stats["rows"], 3)
+        self.assertEqual([b["rows"] for b in stats["batches"]], [2, 1])
+        self.assertEqual(backend.nodes["a"]["labels"], ["Chunk"])
+
+        rel_stats = await backend.add_relationships_bulk(
+            [{"source_id": "a", "type": "KNOWS", "target_id": "b", "properties": {"w": 1}}]
+        )
+        self.assertEqual(rel_stats["rows"], 1)
+        self.assertEqual(backend.edges["a"][0], ("KNOWS", "b", {"w": 1}))
+
+    async def test_rollback_restores_previous_properties(self) -> None:
+        backend = InMemoryGraphBackend()
+        await backend.add_entity("e1", {"name": "old"})
+        await backend.add_entity("e1", {"name": "new"})
+        await backend.rollback()
+        self.assertEqual(backend.nodes["e1"]["name"], "old")
+        self.assertEqual([e["id"] for e in await backend.find_entities(name="old")], ["e1"])
+        self.assertEqual(await backend.find_entities(name="new"), [])
+
+    async def test_rollback_relationship_updates_indexes(self) -> None:
+        backend = InMemoryGraphBackend()
+        await backend.add_relationship("a", "KNOWS", "b", {})
+        await backend.add_relationship("a", "LIKES", "b", {})
+        await backend.rollback()
+        self.assertEqual(backend.edges["a"], [("KNOWS", "b", {})])
+        self.assertEqual(await backend.list_relationships(relationship_type="LIKES"), [])
+        await backend.rollback()
+        self.assertNotIn("a", backend.edges)
+        self.assertEqual(await backend.list_relationships(target_id="b"), [])
+
+    async def test_list_relationships_by_target_and_type(self) -> None:
+        backend = InMemoryGraphBackend()
+        await backend.add_relationship("a", "KNOWS", "c", {})
+        await backend.add_relationship("b", "KNOWS", "c", {})
+        await backend.add_relationship("b", "LIKES", "d", {})
+
+        incoming = await backend.list_relationships(target_id="c")
+        self.assertEqual(sorted(r["source"] for r in incoming), ["a", "b"])
+        likes = await backend.list_relationships(relationship_type="LIKES")
+        self.assertEqual([(r["source"], r["target"]) for r in likes], [("b", "d")])
+        both = await backend.list_relationships(target_id="c", relationship_type="LIKES")
+        self.assertEqual(both, [])
+
+    async def test_find_entities_by_label_and_property(self) -> None:
+        backend = InMemoryGraphBackend()
+        await backend.add_entity("d1", {"name": "Doc", "layer": "PERCEPTION"}, labels=["Document"])
+        await backend.add_entity("c1", {"name": "Chunk", "layer": "PERCEPTION"}, labels=["Chunk"])
+        await backend.add_entity("c2", {"name": "Chunk", "layer": "SEMANTIC"}, labels=["Chunk"])
+
+        chunks = await backend.find_entities(label="Chunk", layer="PERCEPTION")
+        self.assertEqual([e["id"] for e in chunks], ["c1"])
+
+        backend.add_property_index("custom")
+        await backend.add_entity("x", {"custom": 7})
+        self.assertEqual([e["id"] for e in await backend.find_entities(custom=7)], ["x"])
+
+    async def test_query_snapshot_is_copy_on_write(self) -> None:
+        backend = InMemoryGraphBackend()
+        await backend.add_entity("n1", {"name": "first"})
+        await backend.add_relationship("n1", "KNOWS", "n2", {})
+
+        snapshot = await backend.query("")
+        self.assertIs(await backend.query(""), snapshot)
+
+        await backend.add_entity("n1", {"name": "second"})
+        await backend.add_relationship("n1", "KNOWS", "n3", {})
+
+        self.assertEqual(snapshot["nodes"]["n1"]["name"], "first")
+        self.assertEqual(len(snapshot["edges"]["n1"]), 1)
+        fresh = await backend.query("")
+        self.assertEqual(fresh["nodes"]["n1"]["name"], "second")
+        self.assertEqual(len(fresh["edges"]["n1"]), 2)
@@ -343,3 +343,96 @@ class TestNeurosymbolicServiceInitialization:
             assert hasattr(service.neurosymbolic_service, "backend")
             assert hasattr(service.neurosymbolic_service, "reasoning_engine")
             assert hasattr(service.neurosymbolic_service, "confidence_propagator")
+
+
+class TestConcurrentRetrieval:
+    """Test the concurrent retrieval stage of IntelligentChatService.query."""
+
+    @pytest.fixture
+    def service(
+        self,
+        mock_openai,
+        mock_neo4j,
+        mock_document_service,
+        mock_rag_service,
+        mock_validation_engine
+    ):
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            service = IntelligentChatService(
+                openai_api_key="test-key",
+                enable_conversational_layer=False,
+                retrieval_timeouts={"documents": 0.05}
+            )
+        service._extract_entities = AsyncMock(return_value=["diabetes"])
+        service._retrieve_medical_knowledge = AsyncMock(
+            return_value={"entities": [{"name": "diabetes"}], "relationships": []}
+        )
+        service._retrieve_data_context = AsyncMock(return_value={"tables": [], "columns": []})
+        service._retrieve_cross_graph_links = AsyncMock(return_value=[])
+        return service
+
+    @pytest.mark.asyncio
+    async def test_sources_run_concurrently(self, service):
+        import asyncio
+        import time
+
+        async def slow(*args, **kwargs):
+            await asyncio.sleep(0.1)
+            return {"tables": [], "columns": []}
+
+        async def slow_links(*args, **kwargs):
+            await asyncio.sleep(0.1)
+            return []
+
+        service._retrieve_data_context = slow
+        service._retrieve_cross_graph_links = slow_links
+
+        started = time.perf_counter()
+        retrieval = await service._retrieve_context("What is diabetes?", patient_id=None)
+
+        assert time.perf_counter() - started < 0.18
+        assert retrieval["medical_context"]["entities"] == [{"name": "diabetes"}]
+
+    @pytest.mark.asyncio
+    async def test_timed_out_source_degrades_to_empty(self, service):
+        import asyncio
+
+        async def hanging(question):
+            await asyncio.sleep(10)
+
+        service._retrieve_documents = hanging
+
+        retrieval = await service._retrieve_context("What is diabetes?", patient_id=None)
+
+        assert retrieval["document_chunks"] == []
+        assert retrieval["entities"] == ["diabetes"]
+        statuses = {t.source: t.status for t in retrieval["timings"]}
+        assert statuses["documents"] == "timeout"
+        assert statuses["medical_knowledge"] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_patient_diagnoses_feed_graph_retrieval(self, service):
+        service.patient_memory = MagicMock()
+        service.patient_memory.get_patient_context = AsyncMock(return_value=MagicMock(
+            diagnoses=[{"condition": "hypertension"}], medications=[], allergies=[]
+        ))
+        service._retrieve_documents = AsyncMock(return_value=[])
+
+        retrieval = await service._retrieve_context("Can I take ibuprofen?", patient_id="p1")
+
+        assert retrieval["entities"] == ["diabetes", "hypertension"]
+        service._retrieve_medical_knowledge.assert_awaited_once_with(
+            ["diabetes", "hypertension"], "Can I take ibuprofen?"
+        )
+
+    @pytest.mark.asyncio
+    async def test_latencies_recorded_in_reasoning_trail(self, service):
+        service._retrieve_documents = AsyncMock(return_value=[])
+        service._apply_reasoning = AsyncMock(return_value={"provenance": ["Query Strategy: x"]})
+        service._validate_facts = AsyncMock(return_value={})
+        service._generate_answer = AsyncMock(return_value="answer")
+
+        response = await service.query("What is diabetes?")
+
+        assert any(line.startswith("Retrieval documents:") for line in response.reasoning_trail)
+        assert "Query Strategy: x" in response.reasoning_trail